@@ -8,17 +8,65 @@
 import math
 import re
 
+from OOMAnalyserGFPTables import GFP_TABLES
+
 DEBUG = False
 """Show additional information during the development cycle"""
 
 VERSION = "0.6.0 (devel)"
 """Version number"""
 
+profile_memory_usage = None
+"""
+Function w/o arguments returning the currently allocated memory in bytes
+
+OOMAnalyserProfiler measures the allocations per stage only if this function is set e.g. to a wrapper around
+tracemalloc.get_traced_memory(). It's not available in the browser.
+
+@see: OOMAnalyserProfiler
+"""
+
+numpy = None
+"""
+NumPy module or None
+
+NumPy is optional and only used to calculate the buddyinfo metrics in Python. It's not available in the browser.
+
+@see: calc_buddyinfo_metrics()
+"""
+
 # __pragma__ ('skip')
+import time
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 # MOC objects to satisfy statical checker and imports in unit tests
 js_undefined = 0
 
 
+class performance:
+    @staticmethod
+    def now():
+        """
+        Return a high resolution timestamp in milliseconds like the browser Performance API
+
+        @rtype: float
+        """
+        return time.perf_counter() * 1000
+
+    @staticmethod
+    def mark(name):
+        """
+        Create a named timestamp in the browser's performance timeline
+
+        @type name: str
+        """
+        pass
+
+
 class classList:
     def add(self, *args, **kwargs):
         pass
@@ -132,6 +180,25 @@ class OOMEntityType:
     manual = 2
 
 
+class OOMConstraintType:
+    """Enum for the constraint of the OOM"""
+
+    unknown = 0
+    """Constraint not identified"""
+
+    none = 1
+    """System-wide OOM"""
+
+    cpuset = 2
+    """OOM limited to the memory nodes of a cpuset"""
+
+    memory_policy = 3
+    """OOM limited to the memory nodes of a NUMA memory policy"""
+
+    memcg = 4
+    """OOM limited to a memory cgroup"""
+
+
 class OOMMemoryAllocFailureType:
     """Enum to store the results why the memory allocation could have failed"""
 
@@ -154,6 +221,22 @@ class OOMMemoryAllocFailureType:
     """"high order" requests don't trigger OOM"""
 
 
+class OOMMemoryPressureType:
+    """Enum to store if the memory shortage is limited to some NUMA nodes"""
+
+    unknown = 0
+    """Missing watermark information or requested zone"""
+
+    no_shortage = 1
+    """No node is below the min watermark in the requested zone"""
+
+    node_local = 2
+    """Some nodes are below the min watermark in the requested zone e.g. due to a nodemask or cpuset"""
+
+    all_nodes = 3
+    """All nodes are below the min watermark in the requested zone"""
+
+
 def is_visible(element):
     return element.offsetWidth > 0 and element.offsetHeight > 0
 
@@ -270,10 +353,16 @@ class BaseKernelConfig:
             r"oom_score_adj=(?P<trigger_proc_oomscore>\d+)",
             True,
         ),
+        # sed cpuset=/ mems_allowed=0-1
+        # oom-kill:constraint=CONSTRAINT_NONE,nodemask=(null),cpuset=/,mems_allowed=0,global_oom,...
+        "Memory nodes allowed by cpuset": (
+            r"[ ,]mems_allowed=(?P<trigger_proc_mems_allowed>[\d-]+(?:,[\d-]+)*)",
+            False,
+        ),
         "Trigger process and kernel version": (
             r"^CPU: \d+ PID: (?P<trigger_proc_pid>\d+) "
             r"Comm: .* (Not tainted|Tainted:.*) "
-            r"(?P<kernel_version>\d[\w.-]+) (?:#\d) (?P<distribution>\w+ \w+).+",
+            r"(?P<kernel_version>\d[\w.-]+) #\d+\S*( (?P<distribution>\w+ \w+).*)?",
             True,
         ),
         # split caused by a limited number of iterations during converting PY regex into JS regex
@@ -297,8 +386,9 @@ class BaseKernelConfig:
             r"(?:\n)"
             r" +mapped:(?P<mapped_pages>\d+) shmem:(?P<shmem_pages>\d+) pagetables:(?P<pagetables_pages>\d+) bounce:(?P<bounce_pages>\d+)"
             r"(?:\n)"
-            r" +kernel_misc_reclaimable:(?P<kernel_misc_reclaimable>\d+)"
-            r"(?:\n)"
+            # introduced in 4.20
+            r"( +kernel_misc_reclaimable:(?P<kernel_misc_reclaimable>\d+)"
+            r"(?:\n))?"
             r" +free:(?P<free_pages>\d+) free_pcp:(?P<free_pcp_pages>\d+) free_cma:(?P<free_cma_pages>\d+)",
             True,
         ),
@@ -348,8 +438,8 @@ class BaseKernelConfig:
             True,
         ),
         "Process killed by OOM": (
-            r"^Out of memory: Kill process (?P<killed_proc_pid>\d+) \((?P<killed_proc_name>[\S ]+)\) "
-            r"score (?P<killed_proc_score>\d+) or sacrifice child",
+            r"^(Out of memory|Memory cgroup out of memory): Kill process (?P<killed_proc_pid>\d+) "
+            r"\((?P<killed_proc_name>[\S ]+)\) score (?P<killed_proc_score>\d+) or sacrifice child",
             True,
         ),
         "Details of process killed by OOM": (
@@ -359,6 +449,26 @@ class BaseKernelConfig:
             r"file-rss:(?P<killed_proc_file_rss_kb>\d+)kB, shmem-rss:(?P<killed_proc_shmem_rss_kb>\d+)kB.*",
             True,
         ),
+        # Source: mm/memcontrol.c:mem_cgroup_print_oom_info()
+        "Memory cgroup": (
+            r"^Task in (?P<memcg_task>\S+) killed as a result of limit of (?P<memcg_name>\S+)",
+            False,
+        ),
+        "Memory cgroup usage": (
+            r"^memory: usage (?P<memcg_usage_kb>\d+)kB, limit (?P<memcg_limit_kb>\d+)kB, "
+            r"failcnt (?P<memcg_failcnt>\d+)",
+            True,
+        ),
+        "Memory cgroup swap usage": (
+            r"^(?P<memcg_swap_counter>memory\+swap|swap): usage (?P<memcg_swap_usage_kb>\d+)kB, "
+            r"limit (?P<memcg_swap_limit_kb>\d+)kB, failcnt (?P<memcg_swap_failcnt>\d+)",
+            False,
+        ),
+        "Memory cgroup kernel memory usage": (
+            r"^kmem: usage (?P<memcg_kmem_usage_kb>\d+)kB, limit (?P<memcg_kmem_limit_kb>\d+)kB, "
+            r"failcnt (?P<memcg_kmem_failcnt>\d+)",
+            False,
+        ),
     }
     """
     RE pattern to extract information from OOM.
@@ -379,6 +489,38 @@ class BaseKernelConfig:
     :see: EXTRACT_PATTERN
     """
 
+    EXTRACT_PATTERN_GLOBAL_ONLY = [
+        "Overall Mem-Info (part 1)",
+        "Overall Mem-Info (part 2)",
+        "Available memory chunks",
+        "Memory watermarks",
+        "Page cache",
+        "Swap usage information",
+        "Page information",
+    ]
+    """
+    Names of the patterns in EXTRACT_PATTERN that are not part of a memory cgroup OOM
+
+    The kernel shows the memory usage of the memory cgroup instead of the system
+    memory.
+
+    :type: List(str)
+    :see: EXTRACT_PATTERN_MEMCG_ONLY
+    """
+
+    EXTRACT_PATTERN_MEMCG_ONLY = [
+        "Memory cgroup",
+        "Memory cgroup usage",
+        "Memory cgroup swap usage",
+        "Memory cgroup kernel memory usage",
+    ]
+    """
+    Names of the patterns in EXTRACT_PATTERN that are only part of a memory cgroup OOM
+
+    :type: List(str)
+    :see: EXTRACT_PATTERN_GLOBAL_ONLY
+    """
+
     # NOTE: These flags are automatically extracted from a gfp.h file.
     #       Please do not change them manually!
     GFP_FLAGS = {
@@ -469,6 +611,20 @@ class BaseKernelConfig:
     Source: include/linux/gpf.h
 
     @note : This list os probably a mixture of different kernel versions - be carefully
+    @note: Derived kernel configurations don't repeat this dict. They declare
+           their changes in GFP_FLAGS_DELTA instead.
+    """
+
+    GFP_FLAGS_DELTA = {}
+    """
+    Changes of the GFP flags compared to the parent kernel configuration
+
+    New and changed flags contain the new definition, removed flags are set to
+    None. The full GFP_FLAGS of an instance will be created from the flags of
+    BaseKernelConfig and the changes of all classes in between.
+
+    @type: Dict(str, dict|None)
+    @see: _gfp_materialise(), OOMAnalyserGenerate.py
     """
 
     gfp_reverse_lookup = []
@@ -483,22 +639,6 @@ class BaseKernelConfig:
     @see: _gfp_create_reverse_lookup()
     """
 
-    MAX_ORDER = -1
-    """
-    The kernel memory allocator divides physically contiguous memory
-    blocks into "zones", where each zone is a power of two number of
-    pages.  This option selects the largest power of two that the kernel
-    keeps in the memory allocator.
-
-    This config option is actually maximum order plus one. For example,
-    a value of 11 means that the largest free memory block is 2^10 pages.
-
-    The value will be calculated dynamically based on the numbers of
-    orders in OOMAnalyser._extract_buddyinfo().
-
-    @see: OOMAnalyser._extract_buddyinfo().
-    """
-
     pstable_items = [
         "pid",
         "uid",
@@ -518,6 +658,15 @@ class BaseKernelConfig:
     Requests with order > PAGE_ALLOC_COSTLY_ORDER will never trigger the OOM-killer to satisfy the request.
     """
 
+    PAGE_COUNTER_MAX_KB = 9007199254740928
+    """
+    Memory cgroup limits greater or equal to this value are unlimited
+
+    The kernel shows PAGE_COUNTER_MAX (LONG_MAX / PAGE_SIZE pages) as limit of
+    unlimited memory cgroups e.g. 9007199254740988kB with 4kB pages. This value
+    is the one for 64kB pages.
+    """
+
     pstable_html = [
         "PID",
         "UID",
@@ -537,6 +686,9 @@ class BaseKernelConfig:
     pstable_non_ints = ["pid", "name", "notes"]
     """Columns that are not converted to an integer"""
 
+    pstable_pgtables_bytes = False
+    """The process table contains pgtables_bytes instead of nr_ptes_pages"""
+
     pstable_start = "[ pid ]"
     """
     Pattern to find the start of the process table
@@ -544,6 +696,23 @@ class BaseKernelConfig:
     :type: str
     """
 
+    oom_badness_admin_bonus = True
+    """
+    Reduce the OOM badness score of privileged processes by 3%
+
+    The kernel checks for CAP_SYS_ADMIN. The process table doesn't show
+    capabilities, therefore processes of UID 0 get the bonus.
+
+    @see: oom_badness()
+    """
+
+    oom_badness_min_points = 1
+    """
+    Minimum OOM badness score of a killable process or None w/o minimum
+
+    @see: oom_badness()
+    """
+
     release = (3, 10, "")
     """
     Kernel release with this configuration
@@ -557,17 +726,88 @@ class BaseKernelConfig:
     @type: (int, int, str)
     """
 
+    REC_CALL_TRACE_FRAME = re.compile(
+        r"^(\[<?[0-9a-f]+>?\]\s+)*(?P<unreliable>\? )?(?P<symbol>[\w.]+)"
+        r"\+(?P<offset>0x[0-9a-f]+)/0x[0-9a-f]+( \[(?P<module>\w+)\])?"
+    )
+    """
+    RE to extract a single frame of the call trace
+
+    Older kernels prefix the frame with the address in brackets. Frames with a
+    leading question mark are unreliable. The module name is only given for
+    functions in loadable modules.
+
+    Source: arch/x86/kernel/dumpstack.c:printk_stack_address()
+    """
+
     REC_FREE_MEMORY_CHUNKS = re.compile(
         "Node (?P<node>\d+) (?P<zone>DMA|DMA32|Normal): (?P<zone_usage>.*) = (?P<total_free_kb_per_node>\d+)kB"
     )
     """RE to extract free memory chunks of a memory zone"""
 
+    REC_HUGEPAGES = re.compile(
+        r"^Node (?P<node>\d+) hugepages_total=(?P<total>\d+) hugepages_free=(?P<free>\d+) "
+        r"hugepages_surp=(?P<surp>\d+) hugepages_size=(?P<size_kb>\d+)kB"
+    )
+    """
+    RE to extract the huge page pool of a NUMA node and huge page size
+
+    Source: mm/hugetlb.c:hugetlb_show_meminfo_node()
+    """
+
+    hugepages_start = "hugepages_total="
+    """
+    Pattern to find the start of the huge page pools
+
+    :type: str
+    """
+
+    memcg_stats_start = "Memory cgroup stats for "
+    """
+    Pattern to find the start of the memory cgroup statistics
+
+    :type: str
+    """
+
+    REC_MEMCG_OOM = re.compile(r"^Memory cgroup out of memory: ", re.MULTILINE)
+    """RE to identify an OOM limited to a memory cgroup"""
+
+    REC_MEMCG_STAT = re.compile(r"^(?P<name>\w+) (?P<value>\d+)$")
+    """
+    RE to match a single line of the memory cgroup statistics
+
+    The statistics are printed in the format of memory.stat with one counter
+    per line.
+
+    Source: mm/memcontrol.c:memory_stat_format()
+    """
+
+    REC_MEMCG_STATS_INLINE = re.compile(
+        r"^Memory cgroup stats for (?P<memcg>.*?):(?P<stats>( \w+:\d+KB)*)$"
+    )
+    """
+    RE to match the first line of the memory cgroup statistics incl. inline counters
+
+    Older kernels print all counters of a memory cgroup in a single line.
+
+    Source: mm/memcontrol.c:mem_cgroup_print_oom_info()
+    """
+
     REC_OOM_BEGIN = re.compile(r"invoked oom-killer:", re.MULTILINE)
     """RE to match the first line of an OOM block"""
 
     REC_OOM_END = re.compile(r"^Killed process \d+", re.MULTILINE)
     """RE to match the last line of an OOM block"""
 
+    REC_OOM_CONSTRAINT = re.compile(
+        r"^oom-kill:constraint=CONSTRAINT_(?P<constraint>\w+),", re.MULTILINE
+    )
+    """
+    RE to extract the OOM constraint
+
+    Source: mm/oom_kill.c:dump_oom_summary()
+    """
+
     REC_PAGE_SIZE = re.compile("Node 0 DMA: \d+\*(?P<page_size>\d+)kB")
     """RE to extract the page size from buddyinfo DMA zone"""
 
@@ -578,19 +818,35 @@ class BaseKernelConfig:
     """Match content of process table"""
 
     REC_WATERMARK = re.compile(
-        "Node (?P<node>\d+) (?P<zone>DMA|DMA32|Normal) "
-        "free:(?P<free>\d+)kB "
-        "min:(?P<min>\d+)kB "
-        "low:(?P<low>\d+)kB "
-        "high:(?P<high>\d+)kB "
-        ".*"
+        "^Node (?P<node>\d+) (?P<zone>DMA|DMA32|Normal) (?P<counters>free:.+)$"
     )
     """
-    RE to extract watermark information in a memory zone
+    RE to find the line with the watermarks and all other counters of a memory zone
+
+    The counters are tokenised by parse_zone_counters().
 
     Source: mm/page_alloc.c:__show_free_areas()
     """
 
+    REC_SLAB_LINE = re.compile(
+        r"^\s*(?P<name>\S+)\s+(?P<used_kb>\d+)KB\s+(?P<total_kb>\d+)KB\s*$"
+    )
+    """
+    RE to match a cache line of the unreclaimable slab info
+
+    Source: mm/slab_common.c:dump_unreclaimable_slab()
+    """
+
+    slab_unreclaimable_start = "Unreclaimable slab info:"
+    """
+    Pattern to find the start of the unreclaimable slab info
+
+    The kernel prints this section since 4.15, if the unreclaimable slab
+    caches use more memory than all user processes.
+
+    :type: str
+    """
+
     watermark_start = "Node 0 DMA free:"
     """
     Pattern to find the start of the memory watermark information
@@ -625,11 +881,67 @@ class BaseKernelConfig:
         if self.EXTRACT_PATTERN_OVERLAY:
             self.EXTRACT_PATTERN.update(self.EXTRACT_PATTERN_OVERLAY)
 
-        self._gfp_calc_all_values()
-        self.gfp_reverse_lookup = self._gfp_create_reverse_lookup()
+        self._gfp_materialise()
+        if not self._gfp_load_precomputed():
+            self._gfp_calc_all_values()
+            self.gfp_reverse_lookup = self._gfp_create_reverse_lookup()
 
         self._check_mandatory_gfp_flags()
 
+    def _gfp_materialise(self):
+        """
+        Create the full GFP_FLAGS of this instance from the base flags and all deltas
+
+        The deltas are applied from the oldest to the newest kernel configuration
+        along the class hierarchy. The flags are sorted by name to get the same
+        order of flags with identical values in gfp_reverse_lookup in every
+        configuration.
+        """
+        classes = []
+        cls = self.__class__
+        while cls is not BaseKernelConfig:
+            classes.insert(0, cls)
+            cls = cls.__bases__[0]
+
+        flags = {}
+        # __pragma__ ('jsiter')
+        for flag in BaseKernelConfig.GFP_FLAGS:
+            flags[flag] = BaseKernelConfig.GFP_FLAGS[flag]["value"]
+        # __pragma__ ('nojsiter')
+        for cls in classes:
+            delta = cls.GFP_FLAGS_DELTA
+            # __pragma__ ('jsiter')
+            for flag in delta:
+                if delta[flag] is None:
+                    if flag in flags:
+                        del flags[flag]
+                else:
+                    flags[flag] = delta[flag]["value"]
+            # __pragma__ ('nojsiter')
+
+        self.GFP_FLAGS = {}
+        for flag in sorted(flags.keys()):
+            self.GFP_FLAGS[flag] = {"value": flags[flag]}
+
+    def _gfp_load_precomputed(self):
+        """
+        Load the GFP flag values and the reverse lookup list generated at build time
+
+        @return: True if precomputed values for this configuration exist
+        @rtype: bool
+        @see: GFP_TABLES, OOMAnalyserGenerate.py
+        """
+        name = self.__class__.__name__
+        if name not in GFP_TABLES:
+            return False
+        values, reverse_lookup = GFP_TABLES[name]
+        # __pragma__ ('jsiter')
+        for flag in values:
+            self.GFP_FLAGS[flag]["_value"] = values[flag]
+        # __pragma__ ('nojsiter')
+        self.gfp_reverse_lookup = reverse_lookup[:]
+        return True
+
     def _gfp_calc_all_values(self):
         """
         Calculate decimal values for all GFP flags and store in in GFP_FLAGS[<flag>]["_value"]
@@ -724,6 +1036,38 @@ class BaseKernelConfig:
         res.extend(modifier)
         return res
 
+    def oom_badness(self, process, adj_factor, page_size_kb):
+        """
+        Return the OOM badness score of a process or None if it's unkillable
+
+        The code in this function is similar to mm/oom_kill.c:oom_badness()
+
+        @param dict process: Process of the process table with integer values
+        @param int adj_factor: Total pages of RAM and swap divided by 1000
+        @param int page_size_kb: Page size in kB
+        @rtype: int|None
+        """
+        oom_score_adj = process["oom_score_adj"]
+        if oom_score_adj == -1000:
+            return None
+
+        if self.pstable_pgtables_bytes:
+            pgtables_pages = process["pgtables_bytes"] // (page_size_kb * 1024)
+        else:
+            pgtables_pages = process["nr_ptes_pages"]
+        points = process["rss_pages"] + pgtables_pages + process["swapents_pages"]
+
+        if self.oom_badness_admin_bonus and process["uid"] == 0:
+            points -= (points * 3) // 100
+
+        # normalise to oom_score_adj units
+        points += oom_score_adj * adj_factor
+
+        min_points = self.oom_badness_min_points
+        if min_points is not None and points < min_points:
+            return min_points
+        return points
+
     def _check_mandatory_gfp_flags(self):
         """
         Check existance of mandatory flags used in
@@ -748,181 +1092,38 @@ class KernelConfig_3_10(BaseKernelConfig):
     name = "Configuration for Linux kernel 3.10 or later"
     release = (3, 10, "")
 
+
+class KernelConfig_3_10_EL7(KernelConfig_3_10):
+    # Supported changes:
+    #  * update GFP flags
+
+    name = "Configuration for RHEL 7 / CentOS 7 specific Linux kernel (3.10)"
+    release = (3, 10, ".el7.")
+
     # NOTE: These flags are automatically extracted from a gfp.h file.
     #       Please do not change them manually!
-    GFP_FLAGS = {
+    GFP_FLAGS_DELTA = {
         #
         #
         # Useful GFP flag combinations:
-        "GFP_ATOMIC": {"value": "__GFP_HIGH"},
-        "GFP_HIGHUSER": {
-            "value": "__GFP_WAIT | __GFP_IO | __GFP_FS | __GFP_HARDWALL | __GFP_HIGHMEM"
-        },
-        "GFP_HIGHUSER_MOVABLE": {
-            "value": "__GFP_WAIT | __GFP_IO | __GFP_FS | __GFP_HARDWALL | __GFP_HIGHMEM | __GFP_MOVABLE"
-        },
-        "GFP_IOFS": {"value": "__GFP_IO | __GFP_FS"},
-        "GFP_KERNEL": {"value": "__GFP_WAIT | __GFP_IO | __GFP_FS"},
-        "GFP_NOFS": {"value": "__GFP_WAIT | __GFP_IO"},
-        "GFP_NOIO": {"value": "__GFP_WAIT"},
-        "GFP_NOWAIT": {"value": "GFP_ATOMIC & ~__GFP_HIGH"},
-        "GFP_TEMPORARY": {
-            "value": "__GFP_WAIT | __GFP_IO | __GFP_FS | __GFP_RECLAIMABLE"
-        },
-        "GFP_TRANSHUGE": {
-            "value": "GFP_HIGHUSER_MOVABLE | __GFP_COMP | __GFP_NOMEMALLOC | __GFP_NORETRY | __GFP_NOWARN | __GFP_NO_KSWAPD"
-        },
-        "GFP_USER": {"value": "__GFP_WAIT | __GFP_IO | __GFP_FS | __GFP_HARDWALL"},
+        "GFP_KERNEL_ACCOUNT": {"value": "GFP_KERNEL | __GFP_ACCOUNT"},
         #
         #
         # Modifier, mobility and placement hints:
-        "__GFP_COLD": {"value": "___GFP_COLD"},
-        "__GFP_COMP": {"value": "___GFP_COMP"},
-        "__GFP_DMA": {"value": "___GFP_DMA"},
-        "__GFP_DMA32": {"value": "___GFP_DMA32"},
-        "__GFP_FS": {"value": "___GFP_FS"},
-        "__GFP_HARDWALL": {"value": "___GFP_HARDWALL"},
-        "__GFP_HIGH": {"value": "___GFP_HIGH"},
-        "__GFP_HIGHMEM": {"value": "___GFP_HIGHMEM"},
-        "__GFP_IO": {"value": "___GFP_IO"},
-        "__GFP_KMEMCG": {"value": "___GFP_KMEMCG"},
-        "__GFP_MEMALLOC": {"value": "___GFP_MEMALLOC"},
-        "__GFP_MOVABLE": {"value": "___GFP_MOVABLE"},
-        "__GFP_NOFAIL": {"value": "___GFP_NOFAIL"},
-        "__GFP_NOMEMALLOC": {"value": "___GFP_NOMEMALLOC"},
-        "__GFP_NORETRY": {"value": "___GFP_NORETRY"},
-        "__GFP_NOTRACK": {"value": "___GFP_NOTRACK"},
-        "__GFP_NOTRACK_FALSE_POSITIVE": {"value": "__GFP_NOTRACK"},
-        "__GFP_NOWARN": {"value": "___GFP_NOWARN"},
-        "__GFP_NO_KSWAPD": {"value": "___GFP_NO_KSWAPD"},
-        "__GFP_OTHER_NODE": {"value": "___GFP_OTHER_NODE"},
-        "__GFP_RECLAIMABLE": {"value": "___GFP_RECLAIMABLE"},
-        "__GFP_REPEAT": {"value": "___GFP_REPEAT"},
-        "__GFP_WAIT": {"value": "___GFP_WAIT"},
-        "__GFP_WRITE": {"value": "___GFP_WRITE"},
-        "__GFP_ZERO": {"value": "___GFP_ZERO"},
+        "__GFP_ACCOUNT": {"value": "___GFP_ACCOUNT"},
         #
         #
         # Plain integer GFP bitmasks (for internal use only):
-        "___GFP_DMA": {"value": 0x01},
-        "___GFP_HIGHMEM": {"value": 0x02},
-        "___GFP_DMA32": {"value": 0x04},
-        "___GFP_MOVABLE": {"value": 0x08},
-        "___GFP_WAIT": {"value": 0x10},
-        "___GFP_HIGH": {"value": 0x20},
-        "___GFP_IO": {"value": 0x40},
-        "___GFP_FS": {"value": 0x80},
-        "___GFP_COLD": {"value": 0x100},
-        "___GFP_NOWARN": {"value": 0x200},
-        "___GFP_REPEAT": {"value": 0x400},
-        "___GFP_NOFAIL": {"value": 0x800},
-        "___GFP_NORETRY": {"value": 0x1000},
-        "___GFP_MEMALLOC": {"value": 0x2000},
-        "___GFP_COMP": {"value": 0x4000},
-        "___GFP_ZERO": {"value": 0x8000},
-        "___GFP_NOMEMALLOC": {"value": 0x10000},
-        "___GFP_HARDWALL": {"value": 0x20000},
-        "___GFP_RECLAIMABLE": {"value": 0x80000},
-        "___GFP_KMEMCG": {"value": 0x100000},
-        "___GFP_NOTRACK": {"value": 0x200000},
-        "___GFP_NO_KSWAPD": {"value": 0x400000},
-        "___GFP_OTHER_NODE": {"value": 0x800000},
-        "___GFP_WRITE": {"value": 0x1000000},
+        "___GFP_ACCOUNT": {"value": 0x100000},
+        #
+        #
+        # Removed flags:
+        "__GFP_KMEMCG": None,
+        "___GFP_KMEMCG": None,
     }
 
-
-class KernelConfig_3_10_EL7(KernelConfig_3_10):
-    # Supported changes:
-    #  * update GFP flags
-
-    name = "Configuration for RHEL 7 / CentOS 7 specific Linux kernel (3.10)"
-    release = (3, 10, ".el7.")
-
-    # NOTE: These flags are automatically extracted from a gfp.h file.
-    #       Please do not change them manually!
-    GFP_FLAGS = {
-        #
-        #
-        # Useful GFP flag combinations:
-        "GFP_ATOMIC": {"value": "__GFP_HIGH"},
-        "GFP_HIGHUSER": {
-            "value": "__GFP_WAIT | __GFP_IO | __GFP_FS | __GFP_HARDWALL | __GFP_HIGHMEM"
-        },
-        "GFP_HIGHUSER_MOVABLE": {
-            "value": "__GFP_WAIT | __GFP_IO | __GFP_FS | __GFP_HARDWALL | __GFP_HIGHMEM | __GFP_MOVABLE"
-        },
-        "GFP_IOFS": {"value": "__GFP_IO | __GFP_FS"},
-        "GFP_KERNEL": {"value": "__GFP_WAIT | __GFP_IO | __GFP_FS"},
-        "GFP_KERNEL_ACCOUNT": {"value": "GFP_KERNEL | __GFP_ACCOUNT"},
-        "GFP_NOFS": {"value": "__GFP_WAIT | __GFP_IO"},
-        "GFP_NOIO": {"value": "__GFP_WAIT"},
-        "GFP_NOWAIT": {"value": "GFP_ATOMIC & ~__GFP_HIGH"},
-        "GFP_TEMPORARY": {
-            "value": "__GFP_WAIT | __GFP_IO | __GFP_FS | __GFP_RECLAIMABLE"
-        },
-        "GFP_TRANSHUGE": {
-            "value": "GFP_HIGHUSER_MOVABLE | __GFP_COMP | __GFP_NOMEMALLOC | __GFP_NORETRY | __GFP_NOWARN | __GFP_NO_KSWAPD"
-        },
-        "GFP_USER": {"value": "__GFP_WAIT | __GFP_IO | __GFP_FS | __GFP_HARDWALL"},
-        #
-        #
-        # Modifier, mobility and placement hints:
-        "__GFP_ACCOUNT": {"value": "___GFP_ACCOUNT"},
-        "__GFP_COLD": {"value": "___GFP_COLD"},
-        "__GFP_COMP": {"value": "___GFP_COMP"},
-        "__GFP_DMA": {"value": "___GFP_DMA"},
-        "__GFP_DMA32": {"value": "___GFP_DMA32"},
-        "__GFP_FS": {"value": "___GFP_FS"},
-        "__GFP_HARDWALL": {"value": "___GFP_HARDWALL"},
-        "__GFP_HIGH": {"value": "___GFP_HIGH"},
-        "__GFP_HIGHMEM": {"value": "___GFP_HIGHMEM"},
-        "__GFP_IO": {"value": "___GFP_IO"},
-        "__GFP_MEMALLOC": {"value": "___GFP_MEMALLOC"},
-        "__GFP_MOVABLE": {"value": "___GFP_MOVABLE"},
-        "__GFP_NOFAIL": {"value": "___GFP_NOFAIL"},
-        "__GFP_NOMEMALLOC": {"value": "___GFP_NOMEMALLOC"},
-        "__GFP_NORETRY": {"value": "___GFP_NORETRY"},
-        "__GFP_NOTRACK": {"value": "___GFP_NOTRACK"},
-        "__GFP_NOTRACK_FALSE_POSITIVE": {"value": "__GFP_NOTRACK"},
-        "__GFP_NOWARN": {"value": "___GFP_NOWARN"},
-        "__GFP_NO_KSWAPD": {"value": "___GFP_NO_KSWAPD"},
-        "__GFP_OTHER_NODE": {"value": "___GFP_OTHER_NODE"},
-        "__GFP_RECLAIMABLE": {"value": "___GFP_RECLAIMABLE"},
-        "__GFP_REPEAT": {"value": "___GFP_REPEAT"},
-        "__GFP_WAIT": {"value": "___GFP_WAIT"},
-        "__GFP_WRITE": {"value": "___GFP_WRITE"},
-        "__GFP_ZERO": {"value": "___GFP_ZERO"},
-        #
-        #
-        # Plain integer GFP bitmasks (for internal use only):
-        "___GFP_DMA": {"value": 0x01},
-        "___GFP_HIGHMEM": {"value": 0x02},
-        "___GFP_DMA32": {"value": 0x04},
-        "___GFP_MOVABLE": {"value": 0x08},
-        "___GFP_WAIT": {"value": 0x10},
-        "___GFP_HIGH": {"value": 0x20},
-        "___GFP_IO": {"value": 0x40},
-        "___GFP_FS": {"value": 0x80},
-        "___GFP_COLD": {"value": 0x100},
-        "___GFP_NOWARN": {"value": 0x200},
-        "___GFP_REPEAT": {"value": 0x400},
-        "___GFP_NOFAIL": {"value": 0x800},
-        "___GFP_NORETRY": {"value": 0x1000},
-        "___GFP_MEMALLOC": {"value": 0x2000},
-        "___GFP_COMP": {"value": 0x4000},
-        "___GFP_ZERO": {"value": 0x8000},
-        "___GFP_NOMEMALLOC": {"value": 0x10000},
-        "___GFP_HARDWALL": {"value": 0x20000},
-        "___GFP_RECLAIMABLE": {"value": 0x80000},
-        "___GFP_ACCOUNT": {"value": 0x100000},
-        "___GFP_NOTRACK": {"value": 0x200000},
-        "___GFP_NO_KSWAPD": {"value": 0x400000},
-        "___GFP_OTHER_NODE": {"value": 0x800000},
-        "___GFP_WRITE": {"value": 0x1000000},
-    }
-
-    def __init__(self):
-        super().__init__()
+    def __init__(self):
+        super().__init__()
 
 
 class KernelConfig_3_16(KernelConfig_3_10):
@@ -934,82 +1135,12 @@ class KernelConfig_3_16(KernelConfig_3_10):
 
     # NOTE: These flags are automatically extracted from a gfp.h file.
     #       Please do not change them manually!
-    GFP_FLAGS = {
-        #
-        #
-        # Useful GFP flag combinations:
-        "GFP_ATOMIC": {"value": "__GFP_HIGH"},
-        "GFP_HIGHUSER": {
-            "value": "__GFP_WAIT | __GFP_IO | __GFP_FS | __GFP_HARDWALL | __GFP_HIGHMEM"
-        },
-        "GFP_HIGHUSER_MOVABLE": {
-            "value": "__GFP_WAIT | __GFP_IO | __GFP_FS | __GFP_HARDWALL | __GFP_HIGHMEM | __GFP_MOVABLE"
-        },
-        "GFP_IOFS": {"value": "__GFP_IO | __GFP_FS"},
-        "GFP_KERNEL": {"value": "__GFP_WAIT | __GFP_IO | __GFP_FS"},
-        "GFP_NOFS": {"value": "__GFP_WAIT | __GFP_IO"},
-        "GFP_NOIO": {"value": "__GFP_WAIT"},
-        "GFP_NOWAIT": {"value": "GFP_ATOMIC & ~__GFP_HIGH"},
-        "GFP_TEMPORARY": {
-            "value": "__GFP_WAIT | __GFP_IO | __GFP_FS | __GFP_RECLAIMABLE"
-        },
-        "GFP_TRANSHUGE": {
-            "value": "GFP_HIGHUSER_MOVABLE | __GFP_COMP | __GFP_NOMEMALLOC | __GFP_NORETRY | __GFP_NOWARN | __GFP_NO_KSWAPD"
-        },
-        "GFP_USER": {"value": "__GFP_WAIT | __GFP_IO | __GFP_FS | __GFP_HARDWALL"},
-        #
-        #
-        # Modifier, mobility and placement hints:
-        "__GFP_COLD": {"value": "___GFP_COLD"},
-        "__GFP_COMP": {"value": "___GFP_COMP"},
-        "__GFP_DMA": {"value": "___GFP_DMA"},
-        "__GFP_DMA32": {"value": "___GFP_DMA32"},
-        "__GFP_FS": {"value": "___GFP_FS"},
-        "__GFP_HARDWALL": {"value": "___GFP_HARDWALL"},
-        "__GFP_HIGH": {"value": "___GFP_HIGH"},
-        "__GFP_HIGHMEM": {"value": "___GFP_HIGHMEM"},
-        "__GFP_IO": {"value": "___GFP_IO"},
-        "__GFP_MEMALLOC": {"value": "___GFP_MEMALLOC"},
-        "__GFP_MOVABLE": {"value": "___GFP_MOVABLE"},
-        "__GFP_NOFAIL": {"value": "___GFP_NOFAIL"},
-        "__GFP_NOMEMALLOC": {"value": "___GFP_NOMEMALLOC"},
-        "__GFP_NORETRY": {"value": "___GFP_NORETRY"},
-        "__GFP_NOTRACK": {"value": "___GFP_NOTRACK"},
-        "__GFP_NOTRACK_FALSE_POSITIVE": {"value": "__GFP_NOTRACK"},
-        "__GFP_NOWARN": {"value": "___GFP_NOWARN"},
-        "__GFP_NO_KSWAPD": {"value": "___GFP_NO_KSWAPD"},
-        "__GFP_OTHER_NODE": {"value": "___GFP_OTHER_NODE"},
-        "__GFP_RECLAIMABLE": {"value": "___GFP_RECLAIMABLE"},
-        "__GFP_REPEAT": {"value": "___GFP_REPEAT"},
-        "__GFP_WAIT": {"value": "___GFP_WAIT"},
-        "__GFP_WRITE": {"value": "___GFP_WRITE"},
-        "__GFP_ZERO": {"value": "___GFP_ZERO"},
+    GFP_FLAGS_DELTA = {
         #
         #
-        # Plain integer GFP bitmasks (for internal use only):
-        "___GFP_DMA": {"value": 0x01},
-        "___GFP_HIGHMEM": {"value": 0x02},
-        "___GFP_DMA32": {"value": 0x04},
-        "___GFP_MOVABLE": {"value": 0x08},
-        "___GFP_WAIT": {"value": 0x10},
-        "___GFP_HIGH": {"value": 0x20},
-        "___GFP_IO": {"value": 0x40},
-        "___GFP_FS": {"value": 0x80},
-        "___GFP_COLD": {"value": 0x100},
-        "___GFP_NOWARN": {"value": 0x200},
-        "___GFP_REPEAT": {"value": 0x400},
-        "___GFP_NOFAIL": {"value": 0x800},
-        "___GFP_NORETRY": {"value": 0x1000},
-        "___GFP_MEMALLOC": {"value": 0x2000},
-        "___GFP_COMP": {"value": 0x4000},
-        "___GFP_ZERO": {"value": 0x8000},
-        "___GFP_NOMEMALLOC": {"value": 0x10000},
-        "___GFP_HARDWALL": {"value": 0x20000},
-        "___GFP_RECLAIMABLE": {"value": 0x80000},
-        "___GFP_NOTRACK": {"value": 0x200000},
-        "___GFP_NO_KSWAPD": {"value": 0x400000},
-        "___GFP_OTHER_NODE": {"value": 0x800000},
-        "___GFP_WRITE": {"value": 0x1000000},
+        # Removed flags:
+        "__GFP_KMEMCG": None,
+        "___GFP_KMEMCG": None,
     }
 
 
@@ -1022,78 +1153,12 @@ class KernelConfig_3_19(KernelConfig_3_16):
 
     # NOTE: These flags are automatically extracted from a gfp.h file.
     #       Please do not change them manually!
-    GFP_FLAGS = {
+    GFP_FLAGS_DELTA = {
         #
         #
         # Useful GFP flag combinations:
-        "GFP_ATOMIC": {"value": "__GFP_HIGH"},
         "GFP_HIGHUSER": {"value": "GFP_USER | __GFP_HIGHMEM"},
         "GFP_HIGHUSER_MOVABLE": {"value": "GFP_HIGHUSER | __GFP_MOVABLE"},
-        "GFP_IOFS": {"value": "__GFP_IO | __GFP_FS"},
-        "GFP_KERNEL": {"value": "__GFP_WAIT | __GFP_IO | __GFP_FS"},
-        "GFP_NOFS": {"value": "__GFP_WAIT | __GFP_IO"},
-        "GFP_NOIO": {"value": "__GFP_WAIT"},
-        "GFP_NOWAIT": {"value": "GFP_ATOMIC & ~__GFP_HIGH"},
-        "GFP_TEMPORARY": {
-            "value": "__GFP_WAIT | __GFP_IO | __GFP_FS | __GFP_RECLAIMABLE"
-        },
-        "GFP_TRANSHUGE": {
-            "value": "GFP_HIGHUSER_MOVABLE | __GFP_COMP | __GFP_NOMEMALLOC | __GFP_NORETRY | __GFP_NOWARN | __GFP_NO_KSWAPD"
-        },
-        "GFP_USER": {"value": "__GFP_WAIT | __GFP_IO | __GFP_FS | __GFP_HARDWALL"},
-        #
-        #
-        # Modifier, mobility and placement hints:
-        "__GFP_COLD": {"value": "___GFP_COLD"},
-        "__GFP_COMP": {"value": "___GFP_COMP"},
-        "__GFP_DMA": {"value": "___GFP_DMA"},
-        "__GFP_DMA32": {"value": "___GFP_DMA32"},
-        "__GFP_FS": {"value": "___GFP_FS"},
-        "__GFP_HARDWALL": {"value": "___GFP_HARDWALL"},
-        "__GFP_HIGH": {"value": "___GFP_HIGH"},
-        "__GFP_HIGHMEM": {"value": "___GFP_HIGHMEM"},
-        "__GFP_IO": {"value": "___GFP_IO"},
-        "__GFP_MEMALLOC": {"value": "___GFP_MEMALLOC"},
-        "__GFP_MOVABLE": {"value": "___GFP_MOVABLE"},
-        "__GFP_NOFAIL": {"value": "___GFP_NOFAIL"},
-        "__GFP_NOMEMALLOC": {"value": "___GFP_NOMEMALLOC"},
-        "__GFP_NORETRY": {"value": "___GFP_NORETRY"},
-        "__GFP_NOTRACK": {"value": "___GFP_NOTRACK"},
-        "__GFP_NOTRACK_FALSE_POSITIVE": {"value": "__GFP_NOTRACK"},
-        "__GFP_NOWARN": {"value": "___GFP_NOWARN"},
-        "__GFP_NO_KSWAPD": {"value": "___GFP_NO_KSWAPD"},
-        "__GFP_OTHER_NODE": {"value": "___GFP_OTHER_NODE"},
-        "__GFP_RECLAIMABLE": {"value": "___GFP_RECLAIMABLE"},
-        "__GFP_REPEAT": {"value": "___GFP_REPEAT"},
-        "__GFP_WAIT": {"value": "___GFP_WAIT"},
-        "__GFP_WRITE": {"value": "___GFP_WRITE"},
-        "__GFP_ZERO": {"value": "___GFP_ZERO"},
-        #
-        #
-        # Plain integer GFP bitmasks (for internal use only):
-        "___GFP_DMA": {"value": 0x01},
-        "___GFP_HIGHMEM": {"value": 0x02},
-        "___GFP_DMA32": {"value": 0x04},
-        "___GFP_MOVABLE": {"value": 0x08},
-        "___GFP_WAIT": {"value": 0x10},
-        "___GFP_HIGH": {"value": 0x20},
-        "___GFP_IO": {"value": 0x40},
-        "___GFP_FS": {"value": 0x80},
-        "___GFP_COLD": {"value": 0x100},
-        "___GFP_NOWARN": {"value": 0x200},
-        "___GFP_REPEAT": {"value": 0x400},
-        "___GFP_NOFAIL": {"value": 0x800},
-        "___GFP_NORETRY": {"value": 0x1000},
-        "___GFP_MEMALLOC": {"value": 0x2000},
-        "___GFP_COMP": {"value": 0x4000},
-        "___GFP_ZERO": {"value": 0x8000},
-        "___GFP_NOMEMALLOC": {"value": 0x10000},
-        "___GFP_HARDWALL": {"value": 0x20000},
-        "___GFP_RECLAIMABLE": {"value": 0x80000},
-        "___GFP_NOTRACK": {"value": 0x200000},
-        "___GFP_NO_KSWAPD": {"value": 0x400000},
-        "___GFP_OTHER_NODE": {"value": 0x800000},
-        "___GFP_WRITE": {"value": 0x1000000},
     }
 
 
@@ -1106,906 +1171,275 @@ class KernelConfig_4_1(KernelConfig_3_19):
 
     # NOTE: These flags are automatically extracted from a gfp.h file.
     #       Please do not change them manually!
-    GFP_FLAGS = {
-        #
-        #
-        # Useful GFP flag combinations:
-        "GFP_ATOMIC": {"value": "__GFP_HIGH"},
-        "GFP_HIGHUSER": {"value": "GFP_USER | __GFP_HIGHMEM"},
-        "GFP_HIGHUSER_MOVABLE": {"value": "GFP_HIGHUSER | __GFP_MOVABLE"},
-        "GFP_IOFS": {"value": "__GFP_IO | __GFP_FS"},
-        "GFP_KERNEL": {"value": "__GFP_WAIT | __GFP_IO | __GFP_FS"},
-        "GFP_NOFS": {"value": "__GFP_WAIT | __GFP_IO"},
-        "GFP_NOIO": {"value": "__GFP_WAIT"},
-        "GFP_NOWAIT": {"value": "GFP_ATOMIC & ~__GFP_HIGH"},
-        "GFP_TEMPORARY": {
-            "value": "__GFP_WAIT | __GFP_IO | __GFP_FS | __GFP_RECLAIMABLE"
-        },
-        "GFP_TRANSHUGE": {
-            "value": "GFP_HIGHUSER_MOVABLE | __GFP_COMP | __GFP_NOMEMALLOC | __GFP_NORETRY | __GFP_NOWARN | __GFP_NO_KSWAPD"
-        },
-        "GFP_USER": {"value": "__GFP_WAIT | __GFP_IO | __GFP_FS | __GFP_HARDWALL"},
+    GFP_FLAGS_DELTA = {
         #
         #
         # Modifier, mobility and placement hints:
-        "__GFP_COLD": {"value": "___GFP_COLD"},
-        "__GFP_COMP": {"value": "___GFP_COMP"},
-        "__GFP_DMA": {"value": "___GFP_DMA"},
-        "__GFP_DMA32": {"value": "___GFP_DMA32"},
-        "__GFP_FS": {"value": "___GFP_FS"},
-        "__GFP_HARDWALL": {"value": "___GFP_HARDWALL"},
-        "__GFP_HIGH": {"value": "___GFP_HIGH"},
-        "__GFP_HIGHMEM": {"value": "___GFP_HIGHMEM"},
-        "__GFP_IO": {"value": "___GFP_IO"},
-        "__GFP_MEMALLOC": {"value": "___GFP_MEMALLOC"},
-        "__GFP_MOVABLE": {"value": "___GFP_MOVABLE"},
-        "__GFP_NOACCOUNT": {"value": "___GFP_NOACCOUNT"},
-        "__GFP_NOFAIL": {"value": "___GFP_NOFAIL"},
-        "__GFP_NOMEMALLOC": {"value": "___GFP_NOMEMALLOC"},
-        "__GFP_NORETRY": {"value": "___GFP_NORETRY"},
-        "__GFP_NOTRACK": {"value": "___GFP_NOTRACK"},
-        "__GFP_NOTRACK_FALSE_POSITIVE": {"value": "__GFP_NOTRACK"},
-        "__GFP_NOWARN": {"value": "___GFP_NOWARN"},
-        "__GFP_NO_KSWAPD": {"value": "___GFP_NO_KSWAPD"},
-        "__GFP_OTHER_NODE": {"value": "___GFP_OTHER_NODE"},
-        "__GFP_RECLAIMABLE": {"value": "___GFP_RECLAIMABLE"},
-        "__GFP_REPEAT": {"value": "___GFP_REPEAT"},
-        "__GFP_WAIT": {"value": "___GFP_WAIT"},
-        "__GFP_WRITE": {"value": "___GFP_WRITE"},
-        "__GFP_ZERO": {"value": "___GFP_ZERO"},
-        #
-        #
-        # Plain integer GFP bitmasks (for internal use only):
-        "___GFP_DMA": {"value": 0x01},
-        "___GFP_HIGHMEM": {"value": 0x02},
-        "___GFP_DMA32": {"value": 0x04},
-        "___GFP_MOVABLE": {"value": 0x08},
-        "___GFP_WAIT": {"value": 0x10},
-        "___GFP_HIGH": {"value": 0x20},
-        "___GFP_IO": {"value": 0x40},
-        "___GFP_FS": {"value": 0x80},
-        "___GFP_COLD": {"value": 0x100},
-        "___GFP_NOWARN": {"value": 0x200},
-        "___GFP_REPEAT": {"value": 0x400},
-        "___GFP_NOFAIL": {"value": 0x800},
-        "___GFP_NORETRY": {"value": 0x1000},
-        "___GFP_MEMALLOC": {"value": 0x2000},
-        "___GFP_COMP": {"value": 0x4000},
-        "___GFP_ZERO": {"value": 0x8000},
-        "___GFP_NOMEMALLOC": {"value": 0x10000},
-        "___GFP_HARDWALL": {"value": 0x20000},
-        "___GFP_RECLAIMABLE": {"value": 0x80000},
-        "___GFP_NOACCOUNT": {"value": 0x100000},
-        "___GFP_NOTRACK": {"value": 0x200000},
-        "___GFP_NO_KSWAPD": {"value": 0x400000},
-        "___GFP_OTHER_NODE": {"value": 0x800000},
-        "___GFP_WRITE": {"value": 0x1000000},
-    }
-
-
-class KernelConfig_4_4(KernelConfig_4_1):
-    # Supported changes:
-    #  * update GFP flags
-
-    name = "Configuration for Linux kernel 4.4 or later"
-    release = (4, 4, "")
-
-    # NOTE: These flags are automatically extracted from a gfp.h file.
-    #       Please do not change them manually!
-    GFP_FLAGS = {
-        #
-        #
-        # Useful GFP flag combinations:
-        "GFP_ATOMIC": {"value": "__GFP_HIGH | __GFP_ATOMIC | __GFP_KSWAPD_RECLAIM"},
-        "GFP_HIGHUSER": {"value": "GFP_USER | __GFP_HIGHMEM"},
-        "GFP_HIGHUSER_MOVABLE": {"value": "GFP_HIGHUSER | __GFP_MOVABLE"},
-        "GFP_KERNEL": {"value": "__GFP_RECLAIM | __GFP_IO | __GFP_FS"},
-        "GFP_NOFS": {"value": "__GFP_RECLAIM | __GFP_IO"},
-        "GFP_NOIO": {"value": "__GFP_RECLAIM"},
-        "GFP_NOWAIT": {"value": "__GFP_KSWAPD_RECLAIM"},
-        "GFP_TEMPORARY": {
-            "value": "__GFP_RECLAIM | __GFP_IO | __GFP_FS | __GFP_RECLAIMABLE"
-        },
-        "GFP_TRANSHUGE": {
-            "value": "GFP_HIGHUSER_MOVABLE | __GFP_COMP | __GFP_NOMEMALLOC | __GFP_NORETRY | __GFP_NOWARN & ~__GFP_KSWAPD_RECLAIM"
-        },
-        "GFP_USER": {"value": "__GFP_RECLAIM | __GFP_IO | __GFP_FS | __GFP_HARDWALL"},
-        #
-        #
-        # Modifier, mobility and placement hints:
-        "__GFP_ATOMIC": {"value": "___GFP_ATOMIC"},
-        "__GFP_COLD": {"value": "___GFP_COLD"},
-        "__GFP_COMP": {"value": "___GFP_COMP"},
-        "__GFP_DIRECT_RECLAIM": {"value": "___GFP_DIRECT_RECLAIM"},
-        "__GFP_DMA": {"value": "___GFP_DMA"},
-        "__GFP_DMA32": {"value": "___GFP_DMA32"},
-        "__GFP_FS": {"value": "___GFP_FS"},
-        "__GFP_HARDWALL": {"value": "___GFP_HARDWALL"},
-        "__GFP_HIGH": {"value": "___GFP_HIGH"},
-        "__GFP_HIGHMEM": {"value": "___GFP_HIGHMEM"},
-        "__GFP_IO": {"value": "___GFP_IO"},
-        "__GFP_KSWAPD_RECLAIM": {"value": "___GFP_KSWAPD_RECLAIM"},
-        "__GFP_MEMALLOC": {"value": "___GFP_MEMALLOC"},
-        "__GFP_MOVABLE": {"value": "___GFP_MOVABLE"},
         "__GFP_NOACCOUNT": {"value": "___GFP_NOACCOUNT"},
-        "__GFP_NOFAIL": {"value": "___GFP_NOFAIL"},
-        "__GFP_NOMEMALLOC": {"value": "___GFP_NOMEMALLOC"},
-        "__GFP_NORETRY": {"value": "___GFP_NORETRY"},
-        "__GFP_NOTRACK": {"value": "___GFP_NOTRACK"},
-        "__GFP_NOTRACK_FALSE_POSITIVE": {"value": "__GFP_NOTRACK"},
-        "__GFP_NOWARN": {"value": "___GFP_NOWARN"},
-        "__GFP_OTHER_NODE": {"value": "___GFP_OTHER_NODE"},
-        "__GFP_RECLAIM": {"value": "___GFP_DIRECT_RECLAIM | ___GFP_KSWAPD_RECLAIM"},
-        "__GFP_RECLAIMABLE": {"value": "___GFP_RECLAIMABLE"},
-        "__GFP_REPEAT": {"value": "___GFP_REPEAT"},
-        "__GFP_WRITE": {"value": "___GFP_WRITE"},
-        "__GFP_ZERO": {"value": "___GFP_ZERO"},
-        #
-        #
-        # Plain integer GFP bitmasks (for internal use only):
-        "___GFP_DMA": {"value": 0x01},
-        "___GFP_HIGHMEM": {"value": 0x02},
-        "___GFP_DMA32": {"value": 0x04},
-        "___GFP_MOVABLE": {"value": 0x08},
-        "___GFP_RECLAIMABLE": {"value": 0x10},
-        "___GFP_HIGH": {"value": 0x20},
-        "___GFP_IO": {"value": 0x40},
-        "___GFP_FS": {"value": 0x80},
-        "___GFP_COLD": {"value": 0x100},
-        "___GFP_NOWARN": {"value": 0x200},
-        "___GFP_REPEAT": {"value": 0x400},
-        "___GFP_NOFAIL": {"value": 0x800},
-        "___GFP_NORETRY": {"value": 0x1000},
-        "___GFP_MEMALLOC": {"value": 0x2000},
-        "___GFP_COMP": {"value": 0x4000},
-        "___GFP_ZERO": {"value": 0x8000},
-        "___GFP_NOMEMALLOC": {"value": 0x10000},
-        "___GFP_HARDWALL": {"value": 0x20000},
-        "___GFP_ATOMIC": {"value": 0x80000},
-        "___GFP_NOACCOUNT": {"value": 0x100000},
-        "___GFP_NOTRACK": {"value": 0x200000},
-        "___GFP_DIRECT_RECLAIM": {"value": 0x400000},
-        "___GFP_OTHER_NODE": {"value": 0x800000},
-        "___GFP_WRITE": {"value": 0x1000000},
-        "___GFP_KSWAPD_RECLAIM": {"value": 0x2000000},
-    }
-
-
-class KernelConfig_4_5(KernelConfig_4_4):
-    # Supported changes:
-    #  * update GFP flags
-
-    name = "Configuration for Linux kernel 4.5 or later"
-    release = (4, 5, "")
-
-    # NOTE: These flags are automatically extracted from a gfp.h file.
-    #       Please do not change them manually!
-    GFP_FLAGS = {
-        #
-        #
-        # Useful GFP flag combinations:
-        "GFP_ATOMIC": {"value": "__GFP_HIGH | __GFP_ATOMIC | __GFP_KSWAPD_RECLAIM"},
-        "GFP_HIGHUSER": {"value": "GFP_USER | __GFP_HIGHMEM"},
-        "GFP_HIGHUSER_MOVABLE": {"value": "GFP_HIGHUSER | __GFP_MOVABLE"},
-        "GFP_KERNEL": {"value": "__GFP_RECLAIM | __GFP_IO | __GFP_FS"},
-        "GFP_KERNEL_ACCOUNT": {"value": "GFP_KERNEL | __GFP_ACCOUNT"},
-        "GFP_NOFS": {"value": "__GFP_RECLAIM | __GFP_IO"},
-        "GFP_NOIO": {"value": "__GFP_RECLAIM"},
-        "GFP_NOWAIT": {"value": "__GFP_KSWAPD_RECLAIM"},
-        "GFP_TEMPORARY": {
-            "value": "__GFP_RECLAIM | __GFP_IO | __GFP_FS | __GFP_RECLAIMABLE"
-        },
-        "GFP_TRANSHUGE": {
-            "value": "GFP_HIGHUSER_MOVABLE | __GFP_COMP | __GFP_NOMEMALLOC | __GFP_NORETRY | __GFP_NOWARN & ~__GFP_KSWAPD_RECLAIM"
-        },
-        "GFP_USER": {"value": "__GFP_RECLAIM | __GFP_IO | __GFP_FS | __GFP_HARDWALL"},
-        #
-        #
-        # Modifier, mobility and placement hints:
-        "__GFP_ACCOUNT": {"value": "___GFP_ACCOUNT"},
-        "__GFP_ATOMIC": {"value": "___GFP_ATOMIC"},
-        "__GFP_COLD": {"value": "___GFP_COLD"},
-        "__GFP_COMP": {"value": "___GFP_COMP"},
-        "__GFP_DIRECT_RECLAIM": {"value": "___GFP_DIRECT_RECLAIM"},
-        "__GFP_DMA": {"value": "___GFP_DMA"},
-        "__GFP_DMA32": {"value": "___GFP_DMA32"},
-        "__GFP_FS": {"value": "___GFP_FS"},
-        "__GFP_HARDWALL": {"value": "___GFP_HARDWALL"},
-        "__GFP_HIGH": {"value": "___GFP_HIGH"},
-        "__GFP_HIGHMEM": {"value": "___GFP_HIGHMEM"},
-        "__GFP_IO": {"value": "___GFP_IO"},
-        "__GFP_KSWAPD_RECLAIM": {"value": "___GFP_KSWAPD_RECLAIM"},
-        "__GFP_MEMALLOC": {"value": "___GFP_MEMALLOC"},
-        "__GFP_MOVABLE": {"value": "___GFP_MOVABLE"},
-        "__GFP_NOFAIL": {"value": "___GFP_NOFAIL"},
-        "__GFP_NOMEMALLOC": {"value": "___GFP_NOMEMALLOC"},
-        "__GFP_NORETRY": {"value": "___GFP_NORETRY"},
-        "__GFP_NOTRACK": {"value": "___GFP_NOTRACK"},
-        "__GFP_NOTRACK_FALSE_POSITIVE": {"value": "__GFP_NOTRACK"},
-        "__GFP_NOWARN": {"value": "___GFP_NOWARN"},
-        "__GFP_OTHER_NODE": {"value": "___GFP_OTHER_NODE"},
-        "__GFP_RECLAIM": {"value": "___GFP_DIRECT_RECLAIM | ___GFP_KSWAPD_RECLAIM"},
-        "__GFP_RECLAIMABLE": {"value": "___GFP_RECLAIMABLE"},
-        "__GFP_REPEAT": {"value": "___GFP_REPEAT"},
-        "__GFP_WRITE": {"value": "___GFP_WRITE"},
-        "__GFP_ZERO": {"value": "___GFP_ZERO"},
-        #
-        #
-        # Plain integer GFP bitmasks (for internal use only):
-        "___GFP_DMA": {"value": 0x01},
-        "___GFP_HIGHMEM": {"value": 0x02},
-        "___GFP_DMA32": {"value": 0x04},
-        "___GFP_MOVABLE": {"value": 0x08},
-        "___GFP_RECLAIMABLE": {"value": 0x10},
-        "___GFP_HIGH": {"value": 0x20},
-        "___GFP_IO": {"value": 0x40},
-        "___GFP_FS": {"value": 0x80},
-        "___GFP_COLD": {"value": 0x100},
-        "___GFP_NOWARN": {"value": 0x200},
-        "___GFP_REPEAT": {"value": 0x400},
-        "___GFP_NOFAIL": {"value": 0x800},
-        "___GFP_NORETRY": {"value": 0x1000},
-        "___GFP_MEMALLOC": {"value": 0x2000},
-        "___GFP_COMP": {"value": 0x4000},
-        "___GFP_ZERO": {"value": 0x8000},
-        "___GFP_NOMEMALLOC": {"value": 0x10000},
-        "___GFP_HARDWALL": {"value": 0x20000},
-        "___GFP_ATOMIC": {"value": 0x80000},
-        "___GFP_ACCOUNT": {"value": 0x100000},
-        "___GFP_NOTRACK": {"value": 0x200000},
-        "___GFP_DIRECT_RECLAIM": {"value": 0x400000},
-        "___GFP_OTHER_NODE": {"value": 0x800000},
-        "___GFP_WRITE": {"value": 0x1000000},
-        "___GFP_KSWAPD_RECLAIM": {"value": 0x2000000},
-    }
-
-
-class KernelConfig_4_6(KernelConfig_4_5):
-    # Supported changes:
-    #  * "mm, oom_reaper: report success/failure" (bc448e897b6d24aae32701763b8a1fe15d29fa26)
-    #  * update GFP flags
-
-    name = "Configuration for Linux kernel 4.6 or later"
-    release = (4, 6, "")
-
-    # NOTE: These flags are automatically extracted from a gfp.h file.
-    #       Please do not change them manually!
-    GFP_FLAGS = {
-        #
-        #
-        # Useful GFP flag combinations:
-        "GFP_ATOMIC": {"value": "__GFP_HIGH | __GFP_ATOMIC | __GFP_KSWAPD_RECLAIM"},
-        "GFP_HIGHUSER": {"value": "GFP_USER | __GFP_HIGHMEM"},
-        "GFP_HIGHUSER_MOVABLE": {"value": "GFP_HIGHUSER | __GFP_MOVABLE"},
-        "GFP_KERNEL": {"value": "__GFP_RECLAIM | __GFP_IO | __GFP_FS"},
-        "GFP_KERNEL_ACCOUNT": {"value": "GFP_KERNEL | __GFP_ACCOUNT"},
-        "GFP_NOFS": {"value": "__GFP_RECLAIM | __GFP_IO"},
-        "GFP_NOIO": {"value": "__GFP_RECLAIM"},
-        "GFP_NOWAIT": {"value": "__GFP_KSWAPD_RECLAIM"},
-        "GFP_TEMPORARY": {
-            "value": "__GFP_RECLAIM | __GFP_IO | __GFP_FS | __GFP_RECLAIMABLE"
-        },
-        "GFP_TRANSHUGE": {
-            "value": "GFP_HIGHUSER_MOVABLE | __GFP_COMP | __GFP_NOMEMALLOC | __GFP_NORETRY | __GFP_NOWARN & ~__GFP_RECLAIM"
-        },
-        "GFP_USER": {"value": "__GFP_RECLAIM | __GFP_IO | __GFP_FS | __GFP_HARDWALL"},
-        #
-        #
-        # Modifier, mobility and placement hints:
-        "__GFP_ACCOUNT": {"value": "___GFP_ACCOUNT"},
-        "__GFP_ATOMIC": {"value": "___GFP_ATOMIC"},
-        "__GFP_COLD": {"value": "___GFP_COLD"},
-        "__GFP_COMP": {"value": "___GFP_COMP"},
-        "__GFP_DIRECT_RECLAIM": {"value": "___GFP_DIRECT_RECLAIM"},
-        "__GFP_DMA": {"value": "___GFP_DMA"},
-        "__GFP_DMA32": {"value": "___GFP_DMA32"},
-        "__GFP_FS": {"value": "___GFP_FS"},
-        "__GFP_HARDWALL": {"value": "___GFP_HARDWALL"},
-        "__GFP_HIGH": {"value": "___GFP_HIGH"},
-        "__GFP_HIGHMEM": {"value": "___GFP_HIGHMEM"},
-        "__GFP_IO": {"value": "___GFP_IO"},
-        "__GFP_KSWAPD_RECLAIM": {"value": "___GFP_KSWAPD_RECLAIM"},
-        "__GFP_MEMALLOC": {"value": "___GFP_MEMALLOC"},
-        "__GFP_MOVABLE": {"value": "___GFP_MOVABLE"},
-        "__GFP_NOFAIL": {"value": "___GFP_NOFAIL"},
-        "__GFP_NOMEMALLOC": {"value": "___GFP_NOMEMALLOC"},
-        "__GFP_NORETRY": {"value": "___GFP_NORETRY"},
-        "__GFP_NOTRACK": {"value": "___GFP_NOTRACK"},
-        "__GFP_NOTRACK_FALSE_POSITIVE": {"value": "__GFP_NOTRACK"},
-        "__GFP_NOWARN": {"value": "___GFP_NOWARN"},
-        "__GFP_OTHER_NODE": {"value": "___GFP_OTHER_NODE"},
-        "__GFP_RECLAIM": {"value": "___GFP_DIRECT_RECLAIM | ___GFP_KSWAPD_RECLAIM"},
-        "__GFP_RECLAIMABLE": {"value": "___GFP_RECLAIMABLE"},
-        "__GFP_REPEAT": {"value": "___GFP_REPEAT"},
-        "__GFP_WRITE": {"value": "___GFP_WRITE"},
-        "__GFP_ZERO": {"value": "___GFP_ZERO"},
-        #
-        #
-        # Plain integer GFP bitmasks (for internal use only):
-        "___GFP_DMA": {"value": 0x01},
-        "___GFP_HIGHMEM": {"value": 0x02},
-        "___GFP_DMA32": {"value": 0x04},
-        "___GFP_MOVABLE": {"value": 0x08},
-        "___GFP_RECLAIMABLE": {"value": 0x10},
-        "___GFP_HIGH": {"value": 0x20},
-        "___GFP_IO": {"value": 0x40},
-        "___GFP_FS": {"value": 0x80},
-        "___GFP_COLD": {"value": 0x100},
-        "___GFP_NOWARN": {"value": 0x200},
-        "___GFP_REPEAT": {"value": 0x400},
-        "___GFP_NOFAIL": {"value": 0x800},
-        "___GFP_NORETRY": {"value": 0x1000},
-        "___GFP_MEMALLOC": {"value": 0x2000},
-        "___GFP_COMP": {"value": 0x4000},
-        "___GFP_ZERO": {"value": 0x8000},
-        "___GFP_NOMEMALLOC": {"value": 0x10000},
-        "___GFP_HARDWALL": {"value": 0x20000},
-        "___GFP_ATOMIC": {"value": 0x80000},
-        "___GFP_ACCOUNT": {"value": 0x100000},
-        "___GFP_NOTRACK": {"value": 0x200000},
-        "___GFP_DIRECT_RECLAIM": {"value": 0x400000},
-        "___GFP_OTHER_NODE": {"value": 0x800000},
-        "___GFP_WRITE": {"value": 0x1000000},
-        "___GFP_KSWAPD_RECLAIM": {"value": 0x2000000},
-    }
-
-    # The "oom_reaper" line is optionally
-    REC_OOM_END = re.compile(
-        r"^((Out of memory.*|Memory cgroup out of memory): Killed process \d+|oom_reaper:)",
-        re.MULTILINE,
-    )
-
-    def __init__(self):
-        super().__init__()
-
-
-class KernelConfig_4_8(KernelConfig_4_6):
-    # Supported changes:
-    #  * update GFP flags
-
-    name = "Configuration for Linux kernel 4.8 or later"
-    release = (4, 8, "")
-
-    # NOTE: These flags are automatically extracted from a gfp.h file.
-    #       Please do not change them manually!
-    GFP_FLAGS = {
-        #
-        #
-        # Useful GFP flag combinations:
-        "GFP_ATOMIC": {"value": "__GFP_HIGH | __GFP_ATOMIC | __GFP_KSWAPD_RECLAIM"},
-        "GFP_HIGHUSER": {"value": "GFP_USER | __GFP_HIGHMEM"},
-        "GFP_HIGHUSER_MOVABLE": {"value": "GFP_HIGHUSER | __GFP_MOVABLE"},
-        "GFP_KERNEL": {"value": "__GFP_RECLAIM | __GFP_IO | __GFP_FS"},
-        "GFP_KERNEL_ACCOUNT": {"value": "GFP_KERNEL | __GFP_ACCOUNT"},
-        "GFP_NOFS": {"value": "__GFP_RECLAIM | __GFP_IO"},
-        "GFP_NOIO": {"value": "__GFP_RECLAIM"},
-        "GFP_NOWAIT": {"value": "__GFP_KSWAPD_RECLAIM"},
-        "GFP_TEMPORARY": {
-            "value": "__GFP_RECLAIM | __GFP_IO | __GFP_FS | __GFP_RECLAIMABLE"
-        },
-        "GFP_TRANSHUGE": {"value": "GFP_TRANSHUGE_LIGHT | __GFP_DIRECT_RECLAIM"},
-        "GFP_TRANSHUGE_LIGHT": {
-            "value": "GFP_HIGHUSER_MOVABLE | __GFP_COMP | __GFP_NOMEMALLOC | __GFP_NOWARN & ~__GFP_RECLAIM"
-        },
-        "GFP_USER": {"value": "__GFP_RECLAIM | __GFP_IO | __GFP_FS | __GFP_HARDWALL"},
-        #
-        #
-        # Modifier, mobility and placement hints:
-        "__GFP_ACCOUNT": {"value": "___GFP_ACCOUNT"},
-        "__GFP_ATOMIC": {"value": "___GFP_ATOMIC"},
-        "__GFP_COLD": {"value": "___GFP_COLD"},
-        "__GFP_COMP": {"value": "___GFP_COMP"},
-        "__GFP_DIRECT_RECLAIM": {"value": "___GFP_DIRECT_RECLAIM"},
-        "__GFP_DMA": {"value": "___GFP_DMA"},
-        "__GFP_DMA32": {"value": "___GFP_DMA32"},
-        "__GFP_FS": {"value": "___GFP_FS"},
-        "__GFP_HARDWALL": {"value": "___GFP_HARDWALL"},
-        "__GFP_HIGH": {"value": "___GFP_HIGH"},
-        "__GFP_HIGHMEM": {"value": "___GFP_HIGHMEM"},
-        "__GFP_IO": {"value": "___GFP_IO"},
-        "__GFP_KSWAPD_RECLAIM": {"value": "___GFP_KSWAPD_RECLAIM"},
-        "__GFP_MEMALLOC": {"value": "___GFP_MEMALLOC"},
-        "__GFP_MOVABLE": {"value": "___GFP_MOVABLE"},
-        "__GFP_NOFAIL": {"value": "___GFP_NOFAIL"},
-        "__GFP_NOMEMALLOC": {"value": "___GFP_NOMEMALLOC"},
-        "__GFP_NORETRY": {"value": "___GFP_NORETRY"},
-        "__GFP_NOTRACK": {"value": "___GFP_NOTRACK"},
-        "__GFP_NOTRACK_FALSE_POSITIVE": {"value": "__GFP_NOTRACK"},
-        "__GFP_NOWARN": {"value": "___GFP_NOWARN"},
-        "__GFP_OTHER_NODE": {"value": "___GFP_OTHER_NODE"},
-        "__GFP_RECLAIM": {"value": "___GFP_DIRECT_RECLAIM | ___GFP_KSWAPD_RECLAIM"},
-        "__GFP_RECLAIMABLE": {"value": "___GFP_RECLAIMABLE"},
-        "__GFP_REPEAT": {"value": "___GFP_REPEAT"},
-        "__GFP_WRITE": {"value": "___GFP_WRITE"},
-        "__GFP_ZERO": {"value": "___GFP_ZERO"},
-        #
-        #
-        # Plain integer GFP bitmasks (for internal use only):
-        "___GFP_DMA": {"value": 0x01},
-        "___GFP_HIGHMEM": {"value": 0x02},
-        "___GFP_DMA32": {"value": 0x04},
-        "___GFP_MOVABLE": {"value": 0x08},
-        "___GFP_RECLAIMABLE": {"value": 0x10},
-        "___GFP_HIGH": {"value": 0x20},
-        "___GFP_IO": {"value": 0x40},
-        "___GFP_FS": {"value": 0x80},
-        "___GFP_COLD": {"value": 0x100},
-        "___GFP_NOWARN": {"value": 0x200},
-        "___GFP_REPEAT": {"value": 0x400},
-        "___GFP_NOFAIL": {"value": 0x800},
-        "___GFP_NORETRY": {"value": 0x1000},
-        "___GFP_MEMALLOC": {"value": 0x2000},
-        "___GFP_COMP": {"value": 0x4000},
-        "___GFP_ZERO": {"value": 0x8000},
-        "___GFP_NOMEMALLOC": {"value": 0x10000},
-        "___GFP_HARDWALL": {"value": 0x20000},
-        "___GFP_ATOMIC": {"value": 0x80000},
-        "___GFP_ACCOUNT": {"value": 0x100000},
-        "___GFP_NOTRACK": {"value": 0x200000},
-        "___GFP_DIRECT_RECLAIM": {"value": 0x400000},
-        "___GFP_OTHER_NODE": {"value": 0x800000},
-        "___GFP_WRITE": {"value": 0x1000000},
-        "___GFP_KSWAPD_RECLAIM": {"value": 0x2000000},
-    }
-
-
-class KernelConfig_4_9(KernelConfig_4_8):
-    # Supported changes:
-    #  * "mm: oom: deduplicate victim selection code for memcg and global oom" (7c5f64f84483bd13886348edda8b3e7b799a7fdb)
-
-    name = "Configuration for Linux kernel 4.9 or later"
-    release = (4, 9, "")
-
-    EXTRACT_PATTERN_OVERLAY_49 = {
-        "Details of process killed by OOM": (
-            r"^(Out of memory.*|Memory cgroup out of memory): Killed process \d+ \(.*\)"
-            r"(, UID \d+,)?"
-            r" total-vm:(?P<killed_proc_total_vm_kb>\d+)kB, anon-rss:(?P<killed_proc_anon_rss_kb>\d+)kB, "
-            r"file-rss:(?P<killed_proc_file_rss_kb>\d+)kB, shmem-rss:(?P<killed_proc_shmem_rss_kb>\d+)kB.*",
-            True,
-        ),
-    }
-
-    def __init__(self):
-        super().__init__()
-        self.EXTRACT_PATTERN.update(self.EXTRACT_PATTERN_OVERLAY_49)
-
-
-class KernelConfig_4_10(KernelConfig_4_9):
-    # Supported changes:
-    #  * update GFP flags
-
-    name = "Configuration for Linux kernel 4.10 or later"
-    release = (4, 10, "")
-
-    # NOTE: These flags are automatically extracted from a gfp.h file.
-    #       Please do not change them manually!
-    GFP_FLAGS = {
-        #
-        #
-        # Useful GFP flag combinations:
-        "GFP_ATOMIC": {"value": "__GFP_HIGH | __GFP_ATOMIC | __GFP_KSWAPD_RECLAIM"},
-        "GFP_HIGHUSER": {"value": "GFP_USER | __GFP_HIGHMEM"},
-        "GFP_HIGHUSER_MOVABLE": {"value": "GFP_HIGHUSER | __GFP_MOVABLE"},
-        "GFP_KERNEL": {"value": "__GFP_RECLAIM | __GFP_IO | __GFP_FS"},
-        "GFP_KERNEL_ACCOUNT": {"value": "GFP_KERNEL | __GFP_ACCOUNT"},
-        "GFP_NOFS": {"value": "__GFP_RECLAIM | __GFP_IO"},
-        "GFP_NOIO": {"value": "__GFP_RECLAIM"},
-        "GFP_NOWAIT": {"value": "__GFP_KSWAPD_RECLAIM"},
-        "GFP_TEMPORARY": {
-            "value": "__GFP_RECLAIM | __GFP_IO | __GFP_FS | __GFP_RECLAIMABLE"
-        },
-        "GFP_TRANSHUGE": {"value": "GFP_TRANSHUGE_LIGHT | __GFP_DIRECT_RECLAIM"},
-        "GFP_TRANSHUGE_LIGHT": {
-            "value": "GFP_HIGHUSER_MOVABLE | __GFP_COMP | __GFP_NOMEMALLOC | __GFP_NOWARN & ~__GFP_RECLAIM"
-        },
-        "GFP_USER": {"value": "__GFP_RECLAIM | __GFP_IO | __GFP_FS | __GFP_HARDWALL"},
-        #
-        #
-        # Modifier, mobility and placement hints:
-        "__GFP_ACCOUNT": {"value": "___GFP_ACCOUNT"},
-        "__GFP_ATOMIC": {"value": "___GFP_ATOMIC"},
-        "__GFP_COLD": {"value": "___GFP_COLD"},
-        "__GFP_COMP": {"value": "___GFP_COMP"},
-        "__GFP_DIRECT_RECLAIM": {"value": "___GFP_DIRECT_RECLAIM"},
-        "__GFP_DMA": {"value": "___GFP_DMA"},
-        "__GFP_DMA32": {"value": "___GFP_DMA32"},
-        "__GFP_FS": {"value": "___GFP_FS"},
-        "__GFP_HARDWALL": {"value": "___GFP_HARDWALL"},
-        "__GFP_HIGH": {"value": "___GFP_HIGH"},
-        "__GFP_HIGHMEM": {"value": "___GFP_HIGHMEM"},
-        "__GFP_IO": {"value": "___GFP_IO"},
-        "__GFP_KSWAPD_RECLAIM": {"value": "___GFP_KSWAPD_RECLAIM"},
-        "__GFP_MEMALLOC": {"value": "___GFP_MEMALLOC"},
-        "__GFP_MOVABLE": {"value": "___GFP_MOVABLE"},
-        "__GFP_NOFAIL": {"value": "___GFP_NOFAIL"},
-        "__GFP_NOMEMALLOC": {"value": "___GFP_NOMEMALLOC"},
-        "__GFP_NORETRY": {"value": "___GFP_NORETRY"},
-        "__GFP_NOTRACK": {"value": "___GFP_NOTRACK"},
-        "__GFP_NOTRACK_FALSE_POSITIVE": {"value": "__GFP_NOTRACK"},
-        "__GFP_NOWARN": {"value": "___GFP_NOWARN"},
-        "__GFP_RECLAIM": {"value": "___GFP_DIRECT_RECLAIM | ___GFP_KSWAPD_RECLAIM"},
-        "__GFP_RECLAIMABLE": {"value": "___GFP_RECLAIMABLE"},
-        "__GFP_REPEAT": {"value": "___GFP_REPEAT"},
-        "__GFP_WRITE": {"value": "___GFP_WRITE"},
-        "__GFP_ZERO": {"value": "___GFP_ZERO"},
-        #
-        #
-        # Plain integer GFP bitmasks (for internal use only):
-        "___GFP_DMA": {"value": 0x01},
-        "___GFP_HIGHMEM": {"value": 0x02},
-        "___GFP_DMA32": {"value": 0x04},
-        "___GFP_MOVABLE": {"value": 0x08},
-        "___GFP_RECLAIMABLE": {"value": 0x10},
-        "___GFP_HIGH": {"value": 0x20},
-        "___GFP_IO": {"value": 0x40},
-        "___GFP_FS": {"value": 0x80},
-        "___GFP_COLD": {"value": 0x100},
-        "___GFP_NOWARN": {"value": 0x200},
-        "___GFP_REPEAT": {"value": 0x400},
-        "___GFP_NOFAIL": {"value": 0x800},
-        "___GFP_NORETRY": {"value": 0x1000},
-        "___GFP_MEMALLOC": {"value": 0x2000},
-        "___GFP_COMP": {"value": 0x4000},
-        "___GFP_ZERO": {"value": 0x8000},
-        "___GFP_NOMEMALLOC": {"value": 0x10000},
-        "___GFP_HARDWALL": {"value": 0x20000},
-        "___GFP_ATOMIC": {"value": 0x80000},
-        "___GFP_ACCOUNT": {"value": 0x100000},
-        "___GFP_NOTRACK": {"value": 0x200000},
-        "___GFP_DIRECT_RECLAIM": {"value": 0x400000},
-        "___GFP_WRITE": {"value": 0x800000},
-        "___GFP_KSWAPD_RECLAIM": {"value": 0x1000000},
-    }
-
-
-class KernelConfig_4_12(KernelConfig_4_10):
-    # Supported changes:
-    #  * update GFP flags
-
-    name = "Configuration for Linux kernel 4.12 or later"
-    release = (4, 12, "")
-
-    # NOTE: These flags are automatically extracted from a gfp.h file.
-    #       Please do not change them manually!
-    GFP_FLAGS = {
-        #
-        #
-        # Useful GFP flag combinations:
-        "GFP_ATOMIC": {"value": "__GFP_HIGH | __GFP_ATOMIC | __GFP_KSWAPD_RECLAIM"},
-        "GFP_HIGHUSER": {"value": "GFP_USER | __GFP_HIGHMEM"},
-        "GFP_HIGHUSER_MOVABLE": {"value": "GFP_HIGHUSER | __GFP_MOVABLE"},
-        "GFP_KERNEL": {"value": "__GFP_RECLAIM | __GFP_IO | __GFP_FS"},
-        "GFP_KERNEL_ACCOUNT": {"value": "GFP_KERNEL | __GFP_ACCOUNT"},
-        "GFP_NOFS": {"value": "__GFP_RECLAIM | __GFP_IO"},
-        "GFP_NOIO": {"value": "__GFP_RECLAIM"},
-        "GFP_NOWAIT": {"value": "__GFP_KSWAPD_RECLAIM"},
-        "GFP_TEMPORARY": {
-            "value": "__GFP_RECLAIM | __GFP_IO | __GFP_FS | __GFP_RECLAIMABLE"
-        },
-        "GFP_TRANSHUGE": {"value": "GFP_TRANSHUGE_LIGHT | __GFP_DIRECT_RECLAIM"},
-        "GFP_TRANSHUGE_LIGHT": {
-            "value": "GFP_HIGHUSER_MOVABLE | __GFP_COMP | __GFP_NOMEMALLOC | __GFP_NOWARN & ~__GFP_RECLAIM"
-        },
-        "GFP_USER": {"value": "__GFP_RECLAIM | __GFP_IO | __GFP_FS | __GFP_HARDWALL"},
-        #
-        #
-        # Modifier, mobility and placement hints:
-        "__GFP_ACCOUNT": {"value": "___GFP_ACCOUNT"},
-        "__GFP_ATOMIC": {"value": "___GFP_ATOMIC"},
-        "__GFP_COLD": {"value": "___GFP_COLD"},
-        "__GFP_COMP": {"value": "___GFP_COMP"},
-        "__GFP_DIRECT_RECLAIM": {"value": "___GFP_DIRECT_RECLAIM"},
-        "__GFP_DMA": {"value": "___GFP_DMA"},
-        "__GFP_DMA32": {"value": "___GFP_DMA32"},
-        "__GFP_FS": {"value": "___GFP_FS"},
-        "__GFP_HARDWALL": {"value": "___GFP_HARDWALL"},
-        "__GFP_HIGH": {"value": "___GFP_HIGH"},
-        "__GFP_HIGHMEM": {"value": "___GFP_HIGHMEM"},
-        "__GFP_IO": {"value": "___GFP_IO"},
-        "__GFP_KSWAPD_RECLAIM": {"value": "___GFP_KSWAPD_RECLAIM"},
-        "__GFP_MEMALLOC": {"value": "___GFP_MEMALLOC"},
-        "__GFP_MOVABLE": {"value": "___GFP_MOVABLE"},
-        "__GFP_NOFAIL": {"value": "___GFP_NOFAIL"},
-        "__GFP_NOLOCKDEP": {"value": "___GFP_NOLOCKDEP"},
-        "__GFP_NOMEMALLOC": {"value": "___GFP_NOMEMALLOC"},
-        "__GFP_NORETRY": {"value": "___GFP_NORETRY"},
-        "__GFP_NOTRACK": {"value": "___GFP_NOTRACK"},
-        "__GFP_NOTRACK_FALSE_POSITIVE": {"value": "__GFP_NOTRACK"},
-        "__GFP_NOWARN": {"value": "___GFP_NOWARN"},
-        "__GFP_RECLAIM": {"value": "___GFP_DIRECT_RECLAIM | ___GFP_KSWAPD_RECLAIM"},
-        "__GFP_RECLAIMABLE": {"value": "___GFP_RECLAIMABLE"},
-        "__GFP_REPEAT": {"value": "___GFP_REPEAT"},
-        "__GFP_WRITE": {"value": "___GFP_WRITE"},
-        "__GFP_ZERO": {"value": "___GFP_ZERO"},
-        #
-        #
-        # Plain integer GFP bitmasks (for internal use only):
-        "___GFP_DMA": {"value": 0x01},
-        "___GFP_HIGHMEM": {"value": 0x02},
-        "___GFP_DMA32": {"value": 0x04},
-        "___GFP_MOVABLE": {"value": 0x08},
-        "___GFP_RECLAIMABLE": {"value": 0x10},
-        "___GFP_HIGH": {"value": 0x20},
-        "___GFP_IO": {"value": 0x40},
-        "___GFP_FS": {"value": 0x80},
-        "___GFP_COLD": {"value": 0x100},
-        "___GFP_NOWARN": {"value": 0x200},
-        "___GFP_REPEAT": {"value": 0x400},
-        "___GFP_NOFAIL": {"value": 0x800},
-        "___GFP_NORETRY": {"value": 0x1000},
-        "___GFP_MEMALLOC": {"value": 0x2000},
-        "___GFP_COMP": {"value": 0x4000},
-        "___GFP_ZERO": {"value": 0x8000},
-        "___GFP_NOMEMALLOC": {"value": 0x10000},
-        "___GFP_HARDWALL": {"value": 0x20000},
-        "___GFP_ATOMIC": {"value": 0x80000},
-        "___GFP_ACCOUNT": {"value": 0x100000},
-        "___GFP_NOTRACK": {"value": 0x200000},
-        "___GFP_DIRECT_RECLAIM": {"value": 0x400000},
-        "___GFP_WRITE": {"value": 0x800000},
-        "___GFP_KSWAPD_RECLAIM": {"value": 0x1000000},
-        "___GFP_NOLOCKDEP": {"value": 0x2000000},
-    }
-
-
-class KernelConfig_4_13(KernelConfig_4_12):
-    # Supported changes:
-    #  * update GFP flags
-
-    name = "Configuration for Linux kernel 4.13 or later"
-    release = (4, 13, "")
-
-    # NOTE: These flags are automatically extracted from a gfp.h file.
-    #       Please do not change them manually!
-    GFP_FLAGS = {
-        #
-        #
-        # Useful GFP flag combinations:
-        "GFP_ATOMIC": {"value": "__GFP_HIGH | __GFP_ATOMIC | __GFP_KSWAPD_RECLAIM"},
-        "GFP_HIGHUSER": {"value": "GFP_USER | __GFP_HIGHMEM"},
-        "GFP_HIGHUSER_MOVABLE": {"value": "GFP_HIGHUSER | __GFP_MOVABLE"},
-        "GFP_KERNEL": {"value": "__GFP_RECLAIM | __GFP_IO | __GFP_FS"},
-        "GFP_KERNEL_ACCOUNT": {"value": "GFP_KERNEL | __GFP_ACCOUNT"},
-        "GFP_NOFS": {"value": "__GFP_RECLAIM | __GFP_IO"},
-        "GFP_NOIO": {"value": "__GFP_RECLAIM"},
-        "GFP_NOWAIT": {"value": "__GFP_KSWAPD_RECLAIM"},
-        "GFP_TEMPORARY": {
-            "value": "__GFP_RECLAIM | __GFP_IO | __GFP_FS | __GFP_RECLAIMABLE"
-        },
-        "GFP_TRANSHUGE": {"value": "GFP_TRANSHUGE_LIGHT | __GFP_DIRECT_RECLAIM"},
-        "GFP_TRANSHUGE_LIGHT": {
-            "value": "GFP_HIGHUSER_MOVABLE | __GFP_COMP | __GFP_NOMEMALLOC | __GFP_NOWARN & ~__GFP_RECLAIM"
-        },
-        "GFP_USER": {"value": "__GFP_RECLAIM | __GFP_IO | __GFP_FS | __GFP_HARDWALL"},
-        #
-        #
-        # Modifier, mobility and placement hints:
-        "__GFP_ACCOUNT": {"value": "___GFP_ACCOUNT"},
-        "__GFP_ATOMIC": {"value": "___GFP_ATOMIC"},
-        "__GFP_COLD": {"value": "___GFP_COLD"},
-        "__GFP_COMP": {"value": "___GFP_COMP"},
-        "__GFP_DIRECT_RECLAIM": {"value": "___GFP_DIRECT_RECLAIM"},
-        "__GFP_DMA": {"value": "___GFP_DMA"},
-        "__GFP_DMA32": {"value": "___GFP_DMA32"},
-        "__GFP_FS": {"value": "___GFP_FS"},
-        "__GFP_HARDWALL": {"value": "___GFP_HARDWALL"},
-        "__GFP_HIGH": {"value": "___GFP_HIGH"},
-        "__GFP_HIGHMEM": {"value": "___GFP_HIGHMEM"},
-        "__GFP_IO": {"value": "___GFP_IO"},
-        "__GFP_KSWAPD_RECLAIM": {"value": "___GFP_KSWAPD_RECLAIM"},
-        "__GFP_MEMALLOC": {"value": "___GFP_MEMALLOC"},
-        "__GFP_MOVABLE": {"value": "___GFP_MOVABLE"},
-        "__GFP_NOFAIL": {"value": "___GFP_NOFAIL"},
-        "__GFP_NOLOCKDEP": {"value": "___GFP_NOLOCKDEP"},
-        "__GFP_NOMEMALLOC": {"value": "___GFP_NOMEMALLOC"},
-        "__GFP_NORETRY": {"value": "___GFP_NORETRY"},
-        "__GFP_NOTRACK": {"value": "___GFP_NOTRACK"},
-        "__GFP_NOTRACK_FALSE_POSITIVE": {"value": "__GFP_NOTRACK"},
-        "__GFP_NOWARN": {"value": "___GFP_NOWARN"},
-        "__GFP_RECLAIM": {"value": "___GFP_DIRECT_RECLAIM | ___GFP_KSWAPD_RECLAIM"},
-        "__GFP_RECLAIMABLE": {"value": "___GFP_RECLAIMABLE"},
-        "__GFP_RETRY_MAYFAIL": {"value": "___GFP_RETRY_MAYFAIL"},
-        "__GFP_WRITE": {"value": "___GFP_WRITE"},
-        "__GFP_ZERO": {"value": "___GFP_ZERO"},
         #
         #
         # Plain integer GFP bitmasks (for internal use only):
-        "___GFP_DMA": {"value": 0x01},
-        "___GFP_HIGHMEM": {"value": 0x02},
-        "___GFP_DMA32": {"value": 0x04},
-        "___GFP_MOVABLE": {"value": 0x08},
-        "___GFP_RECLAIMABLE": {"value": 0x10},
-        "___GFP_HIGH": {"value": 0x20},
-        "___GFP_IO": {"value": 0x40},
-        "___GFP_FS": {"value": 0x80},
-        "___GFP_COLD": {"value": 0x100},
-        "___GFP_NOWARN": {"value": 0x200},
-        "___GFP_RETRY_MAYFAIL": {"value": 0x400},
-        "___GFP_NOFAIL": {"value": 0x800},
-        "___GFP_NORETRY": {"value": 0x1000},
-        "___GFP_MEMALLOC": {"value": 0x2000},
-        "___GFP_COMP": {"value": 0x4000},
-        "___GFP_ZERO": {"value": 0x8000},
-        "___GFP_NOMEMALLOC": {"value": 0x10000},
-        "___GFP_HARDWALL": {"value": 0x20000},
-        "___GFP_ATOMIC": {"value": 0x80000},
-        "___GFP_ACCOUNT": {"value": 0x100000},
-        "___GFP_NOTRACK": {"value": 0x200000},
-        "___GFP_DIRECT_RECLAIM": {"value": 0x400000},
-        "___GFP_WRITE": {"value": 0x800000},
-        "___GFP_KSWAPD_RECLAIM": {"value": 0x1000000},
-        "___GFP_NOLOCKDEP": {"value": 0x2000000},
+        "___GFP_NOACCOUNT": {"value": 0x100000},
     }
 
 
-class KernelConfig_4_14(KernelConfig_4_13):
+class KernelConfig_4_4(KernelConfig_4_1):
     # Supported changes:
     #  * update GFP flags
 
-    name = "Configuration for Linux kernel 4.14 or later"
-    release = (4, 14, "")
+    name = "Configuration for Linux kernel 4.4 or later"
+    release = (4, 4, "")
 
     # NOTE: These flags are automatically extracted from a gfp.h file.
     #       Please do not change them manually!
-    GFP_FLAGS = {
+    GFP_FLAGS_DELTA = {
         #
         #
         # Useful GFP flag combinations:
         "GFP_ATOMIC": {"value": "__GFP_HIGH | __GFP_ATOMIC | __GFP_KSWAPD_RECLAIM"},
-        "GFP_HIGHUSER": {"value": "GFP_USER | __GFP_HIGHMEM"},
-        "GFP_HIGHUSER_MOVABLE": {"value": "GFP_HIGHUSER | __GFP_MOVABLE"},
         "GFP_KERNEL": {"value": "__GFP_RECLAIM | __GFP_IO | __GFP_FS"},
-        "GFP_KERNEL_ACCOUNT": {"value": "GFP_KERNEL | __GFP_ACCOUNT"},
         "GFP_NOFS": {"value": "__GFP_RECLAIM | __GFP_IO"},
         "GFP_NOIO": {"value": "__GFP_RECLAIM"},
         "GFP_NOWAIT": {"value": "__GFP_KSWAPD_RECLAIM"},
-        "GFP_TRANSHUGE": {"value": "GFP_TRANSHUGE_LIGHT | __GFP_DIRECT_RECLAIM"},
-        "GFP_TRANSHUGE_LIGHT": {
-            "value": "GFP_HIGHUSER_MOVABLE | __GFP_COMP | __GFP_NOMEMALLOC | __GFP_NOWARN & ~__GFP_RECLAIM"
+        "GFP_TEMPORARY": {
+            "value": "__GFP_RECLAIM | __GFP_IO | __GFP_FS | __GFP_RECLAIMABLE"
+        },
+        "GFP_TRANSHUGE": {
+            "value": "GFP_HIGHUSER_MOVABLE | __GFP_COMP | __GFP_NOMEMALLOC | __GFP_NORETRY | __GFP_NOWARN & ~__GFP_KSWAPD_RECLAIM"
         },
         "GFP_USER": {"value": "__GFP_RECLAIM | __GFP_IO | __GFP_FS | __GFP_HARDWALL"},
         #
         #
         # Modifier, mobility and placement hints:
-        "__GFP_ACCOUNT": {"value": "___GFP_ACCOUNT"},
         "__GFP_ATOMIC": {"value": "___GFP_ATOMIC"},
-        "__GFP_COLD": {"value": "___GFP_COLD"},
-        "__GFP_COMP": {"value": "___GFP_COMP"},
         "__GFP_DIRECT_RECLAIM": {"value": "___GFP_DIRECT_RECLAIM"},
-        "__GFP_DMA": {"value": "___GFP_DMA"},
-        "__GFP_DMA32": {"value": "___GFP_DMA32"},
-        "__GFP_FS": {"value": "___GFP_FS"},
-        "__GFP_HARDWALL": {"value": "___GFP_HARDWALL"},
-        "__GFP_HIGH": {"value": "___GFP_HIGH"},
-        "__GFP_HIGHMEM": {"value": "___GFP_HIGHMEM"},
-        "__GFP_IO": {"value": "___GFP_IO"},
         "__GFP_KSWAPD_RECLAIM": {"value": "___GFP_KSWAPD_RECLAIM"},
-        "__GFP_MEMALLOC": {"value": "___GFP_MEMALLOC"},
-        "__GFP_MOVABLE": {"value": "___GFP_MOVABLE"},
-        "__GFP_NOFAIL": {"value": "___GFP_NOFAIL"},
-        "__GFP_NOLOCKDEP": {"value": "___GFP_NOLOCKDEP"},
-        "__GFP_NOMEMALLOC": {"value": "___GFP_NOMEMALLOC"},
-        "__GFP_NORETRY": {"value": "___GFP_NORETRY"},
-        "__GFP_NOTRACK": {"value": "___GFP_NOTRACK"},
-        "__GFP_NOTRACK_FALSE_POSITIVE": {"value": "__GFP_NOTRACK"},
-        "__GFP_NOWARN": {"value": "___GFP_NOWARN"},
         "__GFP_RECLAIM": {"value": "___GFP_DIRECT_RECLAIM | ___GFP_KSWAPD_RECLAIM"},
-        "__GFP_RECLAIMABLE": {"value": "___GFP_RECLAIMABLE"},
-        "__GFP_RETRY_MAYFAIL": {"value": "___GFP_RETRY_MAYFAIL"},
-        "__GFP_WRITE": {"value": "___GFP_WRITE"},
-        "__GFP_ZERO": {"value": "___GFP_ZERO"},
         #
         #
         # Plain integer GFP bitmasks (for internal use only):
-        "___GFP_DMA": {"value": 0x01},
-        "___GFP_HIGHMEM": {"value": 0x02},
-        "___GFP_DMA32": {"value": 0x04},
-        "___GFP_MOVABLE": {"value": 0x08},
         "___GFP_RECLAIMABLE": {"value": 0x10},
-        "___GFP_HIGH": {"value": 0x20},
-        "___GFP_IO": {"value": 0x40},
-        "___GFP_FS": {"value": 0x80},
-        "___GFP_COLD": {"value": 0x100},
-        "___GFP_NOWARN": {"value": 0x200},
-        "___GFP_RETRY_MAYFAIL": {"value": 0x400},
-        "___GFP_NOFAIL": {"value": 0x800},
-        "___GFP_NORETRY": {"value": 0x1000},
-        "___GFP_MEMALLOC": {"value": 0x2000},
-        "___GFP_COMP": {"value": 0x4000},
-        "___GFP_ZERO": {"value": 0x8000},
-        "___GFP_NOMEMALLOC": {"value": 0x10000},
-        "___GFP_HARDWALL": {"value": 0x20000},
         "___GFP_ATOMIC": {"value": 0x80000},
-        "___GFP_ACCOUNT": {"value": 0x100000},
-        "___GFP_NOTRACK": {"value": 0x200000},
         "___GFP_DIRECT_RECLAIM": {"value": 0x400000},
-        "___GFP_WRITE": {"value": 0x800000},
-        "___GFP_KSWAPD_RECLAIM": {"value": 0x1000000},
-        "___GFP_NOLOCKDEP": {"value": 0x2000000},
+        "___GFP_KSWAPD_RECLAIM": {"value": 0x2000000},
+        #
+        #
+        # Removed flags:
+        "GFP_IOFS": None,
+        "__GFP_NO_KSWAPD": None,
+        "__GFP_WAIT": None,
+        "___GFP_NO_KSWAPD": None,
+        "___GFP_WAIT": None,
     }
 
 
-class KernelConfig_4_15(KernelConfig_4_14):
+class KernelConfig_4_5(KernelConfig_4_4):
     # Supported changes:
-    #  * mm: consolidate page table accounting (af5b0f6a09e42c9f4fa87735f2a366748767b686)
     #  * update GFP flags
 
-    name = "Configuration for Linux kernel 4.15 or later"
-    release = (4, 15, "")
+    name = "Configuration for Linux kernel 4.5 or later"
+    release = (4, 5, "")
 
     # NOTE: These flags are automatically extracted from a gfp.h file.
     #       Please do not change them manually!
-    GFP_FLAGS = {
+    GFP_FLAGS_DELTA = {
         #
         #
         # Useful GFP flag combinations:
-        "GFP_ATOMIC": {"value": "__GFP_HIGH | __GFP_ATOMIC | __GFP_KSWAPD_RECLAIM"},
-        "GFP_HIGHUSER": {"value": "GFP_USER | __GFP_HIGHMEM"},
-        "GFP_HIGHUSER_MOVABLE": {"value": "GFP_HIGHUSER | __GFP_MOVABLE"},
-        "GFP_KERNEL": {"value": "__GFP_RECLAIM | __GFP_IO | __GFP_FS"},
         "GFP_KERNEL_ACCOUNT": {"value": "GFP_KERNEL | __GFP_ACCOUNT"},
-        "GFP_NOFS": {"value": "__GFP_RECLAIM | __GFP_IO"},
-        "GFP_NOIO": {"value": "__GFP_RECLAIM"},
-        "GFP_NOWAIT": {"value": "__GFP_KSWAPD_RECLAIM"},
+        #
+        #
+        # Modifier, mobility and placement hints:
+        "__GFP_ACCOUNT": {"value": "___GFP_ACCOUNT"},
+        #
+        #
+        # Plain integer GFP bitmasks (for internal use only):
+        "___GFP_ACCOUNT": {"value": 0x100000},
+        #
+        #
+        # Removed flags:
+        "__GFP_NOACCOUNT": None,
+        "___GFP_NOACCOUNT": None,
+    }
+
+
+class KernelConfig_4_6(KernelConfig_4_5):
+    # Supported changes:
+    #  * "mm, oom_reaper: report success/failure" (bc448e897b6d24aae32701763b8a1fe15d29fa26)
+    #  * update GFP flags
+
+    name = "Configuration for Linux kernel 4.6 or later"
+    release = (4, 6, "")
+
+    # NOTE: These flags are automatically extracted from a gfp.h file.
+    #       Please do not change them manually!
+    GFP_FLAGS_DELTA = {
+        #
+        #
+        # Useful GFP flag combinations:
+        "GFP_TRANSHUGE": {
+            "value": "GFP_HIGHUSER_MOVABLE | __GFP_COMP | __GFP_NOMEMALLOC | __GFP_NORETRY | __GFP_NOWARN & ~__GFP_RECLAIM"
+        },
+    }
+
+    # The "oom_reaper" line is optionally
+    REC_OOM_END = re.compile(
+        r"^((Out of memory.*|Memory cgroup out of memory): Killed process \d+|oom_reaper:)",
+        re.MULTILINE,
+    )
+
+    def __init__(self):
+        super().__init__()
+
+
+class KernelConfig_4_8(KernelConfig_4_6):
+    # Supported changes:
+    #  * update GFP flags
+
+    name = "Configuration for Linux kernel 4.8 or later"
+    release = (4, 8, "")
+
+    # NOTE: These flags are automatically extracted from a gfp.h file.
+    #       Please do not change them manually!
+    GFP_FLAGS_DELTA = {
+        #
+        #
+        # Useful GFP flag combinations:
         "GFP_TRANSHUGE": {"value": "GFP_TRANSHUGE_LIGHT | __GFP_DIRECT_RECLAIM"},
         "GFP_TRANSHUGE_LIGHT": {
             "value": "GFP_HIGHUSER_MOVABLE | __GFP_COMP | __GFP_NOMEMALLOC | __GFP_NOWARN & ~__GFP_RECLAIM"
         },
-        "GFP_USER": {"value": "__GFP_RECLAIM | __GFP_IO | __GFP_FS | __GFP_HARDWALL"},
+    }
+
+
+class KernelConfig_4_9(KernelConfig_4_8):
+    # Supported changes:
+    #  * "mm: oom: deduplicate victim selection code for memcg and global oom" (7c5f64f84483bd13886348edda8b3e7b799a7fdb)
+
+    name = "Configuration for Linux kernel 4.9 or later"
+    release = (4, 9, "")
+
+    EXTRACT_PATTERN_OVERLAY_49 = {
+        "Details of process killed by OOM": (
+            r"^(Out of memory.*|Memory cgroup out of memory): Killed process \d+ \(.*\)"
+            r"(, UID \d+,)?"
+            r" total-vm:(?P<killed_proc_total_vm_kb>\d+)kB, anon-rss:(?P<killed_proc_anon_rss_kb>\d+)kB, "
+            r"file-rss:(?P<killed_proc_file_rss_kb>\d+)kB, shmem-rss:(?P<killed_proc_shmem_rss_kb>\d+)kB.*",
+            True,
+        ),
+    }
+
+    def __init__(self):
+        super().__init__()
+        self.EXTRACT_PATTERN.update(self.EXTRACT_PATTERN_OVERLAY_49)
+
+
+class KernelConfig_4_10(KernelConfig_4_9):
+    # Supported changes:
+    #  * update GFP flags
+
+    name = "Configuration for Linux kernel 4.10 or later"
+    release = (4, 10, "")
+
+    # NOTE: These flags are automatically extracted from a gfp.h file.
+    #       Please do not change them manually!
+    GFP_FLAGS_DELTA = {
+        #
+        #
+        # Plain integer GFP bitmasks (for internal use only):
+        "___GFP_WRITE": {"value": 0x800000},
+        "___GFP_KSWAPD_RECLAIM": {"value": 0x1000000},
+        #
+        #
+        # Removed flags:
+        "__GFP_OTHER_NODE": None,
+        "___GFP_OTHER_NODE": None,
+    }
+
+
+class KernelConfig_4_12(KernelConfig_4_10):
+    # Supported changes:
+    #  * update GFP flags
+
+    name = "Configuration for Linux kernel 4.12 or later"
+    release = (4, 12, "")
+
+    # NOTE: These flags are automatically extracted from a gfp.h file.
+    #       Please do not change them manually!
+    GFP_FLAGS_DELTA = {
         #
         #
         # Modifier, mobility and placement hints:
-        "__GFP_ACCOUNT": {"value": "___GFP_ACCOUNT"},
-        "__GFP_ATOMIC": {"value": "___GFP_ATOMIC"},
-        "__GFP_COMP": {"value": "___GFP_COMP"},
-        "__GFP_DIRECT_RECLAIM": {"value": "___GFP_DIRECT_RECLAIM"},
-        "__GFP_DMA": {"value": "___GFP_DMA"},
-        "__GFP_DMA32": {"value": "___GFP_DMA32"},
-        "__GFP_FS": {"value": "___GFP_FS"},
-        "__GFP_HARDWALL": {"value": "___GFP_HARDWALL"},
-        "__GFP_HIGH": {"value": "___GFP_HIGH"},
-        "__GFP_HIGHMEM": {"value": "___GFP_HIGHMEM"},
-        "__GFP_IO": {"value": "___GFP_IO"},
-        "__GFP_KSWAPD_RECLAIM": {"value": "___GFP_KSWAPD_RECLAIM"},
-        "__GFP_MEMALLOC": {"value": "___GFP_MEMALLOC"},
-        "__GFP_MOVABLE": {"value": "___GFP_MOVABLE"},
-        "__GFP_NOFAIL": {"value": "___GFP_NOFAIL"},
         "__GFP_NOLOCKDEP": {"value": "___GFP_NOLOCKDEP"},
-        "__GFP_NOMEMALLOC": {"value": "___GFP_NOMEMALLOC"},
-        "__GFP_NORETRY": {"value": "___GFP_NORETRY"},
-        "__GFP_NOWARN": {"value": "___GFP_NOWARN"},
-        "__GFP_RECLAIM": {"value": "___GFP_DIRECT_RECLAIM | ___GFP_KSWAPD_RECLAIM"},
-        "__GFP_RECLAIMABLE": {"value": "___GFP_RECLAIMABLE"},
-        "__GFP_RETRY_MAYFAIL": {"value": "___GFP_RETRY_MAYFAIL"},
-        "__GFP_WRITE": {"value": "___GFP_WRITE"},
-        "__GFP_ZERO": {"value": "___GFP_ZERO"},
         #
         #
         # Plain integer GFP bitmasks (for internal use only):
-        "___GFP_DMA": {"value": 0x01},
-        "___GFP_HIGHMEM": {"value": 0x02},
-        "___GFP_DMA32": {"value": 0x04},
-        "___GFP_MOVABLE": {"value": 0x08},
-        "___GFP_RECLAIMABLE": {"value": 0x10},
-        "___GFP_HIGH": {"value": 0x20},
-        "___GFP_IO": {"value": 0x40},
-        "___GFP_FS": {"value": 0x80},
-        "___GFP_NOWARN": {"value": 0x200},
+        "___GFP_NOLOCKDEP": {"value": 0x2000000},
+    }
+
+
+class KernelConfig_4_13(KernelConfig_4_12):
+    # Supported changes:
+    #  * update GFP flags
+
+    name = "Configuration for Linux kernel 4.13 or later"
+    release = (4, 13, "")
+
+    # NOTE: These flags are automatically extracted from a gfp.h file.
+    #       Please do not change them manually!
+    GFP_FLAGS_DELTA = {
+        #
+        #
+        # Modifier, mobility and placement hints:
+        "__GFP_RETRY_MAYFAIL": {"value": "___GFP_RETRY_MAYFAIL"},
+        #
+        #
+        # Plain integer GFP bitmasks (for internal use only):
         "___GFP_RETRY_MAYFAIL": {"value": 0x400},
-        "___GFP_NOFAIL": {"value": 0x800},
-        "___GFP_NORETRY": {"value": 0x1000},
-        "___GFP_MEMALLOC": {"value": 0x2000},
-        "___GFP_COMP": {"value": 0x4000},
-        "___GFP_ZERO": {"value": 0x8000},
-        "___GFP_NOMEMALLOC": {"value": 0x10000},
-        "___GFP_HARDWALL": {"value": 0x20000},
-        "___GFP_ATOMIC": {"value": 0x80000},
-        "___GFP_ACCOUNT": {"value": 0x100000},
-        "___GFP_DIRECT_RECLAIM": {"value": 0x400000},
-        "___GFP_WRITE": {"value": 0x800000},
-        "___GFP_KSWAPD_RECLAIM": {"value": 0x1000000},
-        "___GFP_NOLOCKDEP": {"value": 0x2000000},
+        #
+        #
+        # Removed flags:
+        "__GFP_REPEAT": None,
+        "___GFP_REPEAT": None,
+    }
+
+
+class KernelConfig_4_14(KernelConfig_4_13):
+    # Supported changes:
+    #  * update GFP flags
+
+    name = "Configuration for Linux kernel 4.14 or later"
+    release = (4, 14, "")
+
+    # NOTE: These flags are automatically extracted from a gfp.h file.
+    #       Please do not change them manually!
+    GFP_FLAGS_DELTA = {
+        #
+        #
+        # Removed flags:
+        "GFP_TEMPORARY": None,
+    }
+
+
+class KernelConfig_4_15(KernelConfig_4_14):
+    # Supported changes:
+    #  * mm: consolidate page table accounting (af5b0f6a09e42c9f4fa87735f2a366748767b686)
+    #  * update GFP flags
+
+    name = "Configuration for Linux kernel 4.15 or later"
+    release = (4, 15, "")
+
+    # NOTE: These flags are automatically extracted from a gfp.h file.
+    #       Please do not change them manually!
+    GFP_FLAGS_DELTA = {
+        #
+        #
+        # Removed flags:
+        "__GFP_COLD": None,
+        "__GFP_NOTRACK": None,
+        "__GFP_NOTRACK_FALSE_POSITIVE": None,
+        "___GFP_COLD": None,
+        "___GFP_NOTRACK": None,
     }
 
     # nr_ptes -> pgtables_bytes
@@ -2016,6 +1450,8 @@ class KernelConfig_4_15(KernelConfig_4_14):
         r"(?P<pgtables_bytes>\d+)\s+(?P<swapents_pages>\d+)\s+(?P<oom_score_adj>-?\d+)\s+(?P<name>.+)\s*"
     )
 
+    pstable_pgtables_bytes = True
+
     pstable_items = [
         "pid",
         "uid",
@@ -2052,73 +1488,11 @@ class KernelConfig_4_18(KernelConfig_4_15):
 
     # NOTE: These flags are automatically extracted from a gfp.h file.
     #       Please do not change them manually!
-    GFP_FLAGS = {
-        #
-        #
-        # Useful GFP flag combinations:
-        "GFP_ATOMIC": {"value": "__GFP_HIGH | __GFP_ATOMIC | __GFP_KSWAPD_RECLAIM"},
-        "GFP_HIGHUSER": {"value": "GFP_USER | __GFP_HIGHMEM"},
-        "GFP_HIGHUSER_MOVABLE": {"value": "GFP_HIGHUSER | __GFP_MOVABLE"},
-        "GFP_KERNEL": {"value": "__GFP_RECLAIM | __GFP_IO | __GFP_FS"},
-        "GFP_KERNEL_ACCOUNT": {"value": "GFP_KERNEL | __GFP_ACCOUNT"},
-        "GFP_NOFS": {"value": "__GFP_RECLAIM | __GFP_IO"},
-        "GFP_NOIO": {"value": "__GFP_RECLAIM"},
-        "GFP_NOWAIT": {"value": "__GFP_KSWAPD_RECLAIM"},
-        "GFP_TRANSHUGE": {"value": "GFP_TRANSHUGE_LIGHT | __GFP_DIRECT_RECLAIM"},
-        "GFP_TRANSHUGE_LIGHT": {
-            "value": "GFP_HIGHUSER_MOVABLE | __GFP_COMP | __GFP_NOMEMALLOC | __GFP_NOWARN & ~__GFP_RECLAIM"
-        },
-        "GFP_USER": {"value": "__GFP_RECLAIM | __GFP_IO | __GFP_FS | __GFP_HARDWALL"},
-        #
-        #
-        # Modifier, mobility and placement hints:
-        "__GFP_ACCOUNT": {"value": "___GFP_ACCOUNT"},
-        "__GFP_ATOMIC": {"value": "___GFP_ATOMIC"},
-        "__GFP_COMP": {"value": "___GFP_COMP"},
-        "__GFP_DIRECT_RECLAIM": {"value": "___GFP_DIRECT_RECLAIM"},
-        "__GFP_DMA": {"value": "___GFP_DMA"},
-        "__GFP_DMA32": {"value": "___GFP_DMA32"},
-        "__GFP_FS": {"value": "___GFP_FS"},
-        "__GFP_HARDWALL": {"value": "___GFP_HARDWALL"},
-        "__GFP_HIGH": {"value": "___GFP_HIGH"},
-        "__GFP_HIGHMEM": {"value": "___GFP_HIGHMEM"},
-        "__GFP_IO": {"value": "___GFP_IO"},
-        "__GFP_KSWAPD_RECLAIM": {"value": "___GFP_KSWAPD_RECLAIM"},
-        "__GFP_MEMALLOC": {"value": "___GFP_MEMALLOC"},
-        "__GFP_MOVABLE": {"value": "___GFP_MOVABLE"},
-        "__GFP_NOFAIL": {"value": "___GFP_NOFAIL"},
-        "__GFP_NOLOCKDEP": {"value": "___GFP_NOLOCKDEP"},
-        "__GFP_NOMEMALLOC": {"value": "___GFP_NOMEMALLOC"},
-        "__GFP_NORETRY": {"value": "___GFP_NORETRY"},
-        "__GFP_NOWARN": {"value": "___GFP_NOWARN"},
-        "__GFP_RECLAIM": {"value": "___GFP_DIRECT_RECLAIM | ___GFP_KSWAPD_RECLAIM"},
-        "__GFP_RECLAIMABLE": {"value": "___GFP_RECLAIMABLE"},
-        "__GFP_RETRY_MAYFAIL": {"value": "___GFP_RETRY_MAYFAIL"},
-        "__GFP_WRITE": {"value": "___GFP_WRITE"},
-        "__GFP_ZERO": {"value": "___GFP_ZERO"},
+    GFP_FLAGS_DELTA = {
         #
         #
         # Plain integer GFP bitmasks (for internal use only):
-        "___GFP_DMA": {"value": 0x01},
-        "___GFP_HIGHMEM": {"value": 0x02},
-        "___GFP_DMA32": {"value": 0x04},
-        "___GFP_MOVABLE": {"value": 0x08},
-        "___GFP_RECLAIMABLE": {"value": 0x10},
-        "___GFP_HIGH": {"value": 0x20},
-        "___GFP_IO": {"value": 0x40},
-        "___GFP_FS": {"value": 0x80},
         "___GFP_WRITE": {"value": 0x100},
-        "___GFP_NOWARN": {"value": 0x200},
-        "___GFP_RETRY_MAYFAIL": {"value": 0x400},
-        "___GFP_NOFAIL": {"value": 0x800},
-        "___GFP_NORETRY": {"value": 0x1000},
-        "___GFP_MEMALLOC": {"value": 0x2000},
-        "___GFP_COMP": {"value": 0x4000},
-        "___GFP_ZERO": {"value": 0x8000},
-        "___GFP_NOMEMALLOC": {"value": 0x10000},
-        "___GFP_HARDWALL": {"value": 0x20000},
-        "___GFP_ATOMIC": {"value": 0x80000},
-        "___GFP_ACCOUNT": {"value": 0x100000},
         "___GFP_DIRECT_RECLAIM": {"value": 0x200000},
         "___GFP_KSWAPD_RECLAIM": {"value": 0x400000},
         "___GFP_NOLOCKDEP": {"value": 0x800000},
@@ -2128,12 +1502,15 @@ class KernelConfig_4_18(KernelConfig_4_15):
 class KernelConfig_4_19(KernelConfig_4_18):
     # Supported changes:
     #  * mm, oom: describe task memory unit, larger PID pad (c3b78b11efbb2865433abf9d22c004ffe4a73f5c)
+    #  * mm, oom: remove 3% bonus for CAP_SYS_ADMIN processes (d46078b28889)
 
     name = "Configuration for Linux kernel 4.19 or later"
     release = (4, 19, "")
 
     pstable_start = "[  pid  ]"
 
+    oom_badness_admin_bonus = False
+
 
 class KernelConfig_5_0(KernelConfig_4_19):
     # Supported changes:
@@ -2146,12 +1523,18 @@ class KernelConfig_5_0(KernelConfig_4_19):
         # third last line - not integrated yet
         # oom-kill:constraint=CONSTRAINT_NONE,nodemask=(null),cpuset=/,mems_allowed=0,global_oom,task_memcg=/,task=sed,pid=29481,uid=12345
         "Process killed by OOM": (
-            r"^Out of memory: Killed process (?P<killed_proc_pid>\d+) \((?P<killed_proc_name>[\S ]+)\) "
-            r"total-vm:(?P<killed_proc_total_vm_kb>\d+)kB, anon-rss:(?P<killed_proc_anon_rss_kb>\d+)kB, "
+            r"^(Out of memory|Memory cgroup out of memory): Killed process (?P<killed_proc_pid>\d+) "
+            r"\((?P<killed_proc_name>[\S ]+)\) total-vm:(?P<killed_proc_total_vm_kb>\d+)kB, anon-rss:(?P<killed_proc_anon_rss_kb>\d+)kB, "
             r"file-rss:(?P<killed_proc_file_rss_kb>\d+)kB, shmem-rss:(?P<killed_proc_shmem_rss_kb>\d+)kB, "
             r"UID:\d+ pgtables:(?P<killed_proc_pgtables>\d+)kB oom_score_adj:(?P<killed_proc_oom_score_adj>\d+)",
             True,
         ),
+        # oom-kill:constraint=CONSTRAINT_MEMCG,nodemask=(null),cpuset=/,mems_allowed=0,oom_memcg=/docker/1a2b,task_memcg=/docker/1a2b,task=sed,pid=29481,uid=12345
+        "Memory cgroup": (
+            r"^oom-kill:constraint=CONSTRAINT_MEMCG,.*,oom_memcg=(?P<memcg_name>[^,]+),"
+            r"task_memcg=(?P<memcg_task>[^,]+),",
+            False,
+        ),
     }
 
     def __init__(self):
@@ -2168,61 +1551,10 @@ class KernelConfig_5_1(KernelConfig_5_0):
 
     # NOTE: These flags are automatically extracted from a gfp.h file.
     #       Please do not change them manually!
-    GFP_FLAGS = {
-        #
-        #
-        # Useful GFP flag combinations:
-        "GFP_ATOMIC": {"value": "__GFP_HIGH | __GFP_ATOMIC | __GFP_KSWAPD_RECLAIM"},
-        "GFP_HIGHUSER": {"value": "GFP_USER | __GFP_HIGHMEM"},
-        "GFP_HIGHUSER_MOVABLE": {"value": "GFP_HIGHUSER | __GFP_MOVABLE"},
-        "GFP_KERNEL": {"value": "__GFP_RECLAIM | __GFP_IO | __GFP_FS"},
-        "GFP_KERNEL_ACCOUNT": {"value": "GFP_KERNEL | __GFP_ACCOUNT"},
-        "GFP_NOFS": {"value": "__GFP_RECLAIM | __GFP_IO"},
-        "GFP_NOIO": {"value": "__GFP_RECLAIM"},
-        "GFP_NOWAIT": {"value": "__GFP_KSWAPD_RECLAIM"},
-        "GFP_TRANSHUGE": {"value": "GFP_TRANSHUGE_LIGHT | __GFP_DIRECT_RECLAIM"},
-        "GFP_TRANSHUGE_LIGHT": {
-            "value": "GFP_HIGHUSER_MOVABLE | __GFP_COMP | __GFP_NOMEMALLOC | __GFP_NOWARN & ~__GFP_RECLAIM"
-        },
-        "GFP_USER": {"value": "__GFP_RECLAIM | __GFP_IO | __GFP_FS | __GFP_HARDWALL"},
-        #
-        #
-        # Modifier, mobility and placement hints:
-        "__GFP_ACCOUNT": {"value": "___GFP_ACCOUNT"},
-        "__GFP_ATOMIC": {"value": "___GFP_ATOMIC"},
-        "__GFP_COMP": {"value": "___GFP_COMP"},
-        "__GFP_DIRECT_RECLAIM": {"value": "___GFP_DIRECT_RECLAIM"},
-        "__GFP_DMA": {"value": "___GFP_DMA"},
-        "__GFP_DMA32": {"value": "___GFP_DMA32"},
-        "__GFP_FS": {"value": "___GFP_FS"},
-        "__GFP_HARDWALL": {"value": "___GFP_HARDWALL"},
-        "__GFP_HIGH": {"value": "___GFP_HIGH"},
-        "__GFP_HIGHMEM": {"value": "___GFP_HIGHMEM"},
-        "__GFP_IO": {"value": "___GFP_IO"},
-        "__GFP_KSWAPD_RECLAIM": {"value": "___GFP_KSWAPD_RECLAIM"},
-        "__GFP_MEMALLOC": {"value": "___GFP_MEMALLOC"},
-        "__GFP_MOVABLE": {"value": "___GFP_MOVABLE"},
-        "__GFP_NOFAIL": {"value": "___GFP_NOFAIL"},
-        "__GFP_NOLOCKDEP": {"value": "___GFP_NOLOCKDEP"},
-        "__GFP_NOMEMALLOC": {"value": "___GFP_NOMEMALLOC"},
-        "__GFP_NORETRY": {"value": "___GFP_NORETRY"},
-        "__GFP_NOWARN": {"value": "___GFP_NOWARN"},
-        "__GFP_RECLAIM": {"value": "___GFP_DIRECT_RECLAIM | ___GFP_KSWAPD_RECLAIM"},
-        "__GFP_RECLAIMABLE": {"value": "___GFP_RECLAIMABLE"},
-        "__GFP_RETRY_MAYFAIL": {"value": "___GFP_RETRY_MAYFAIL"},
-        "__GFP_WRITE": {"value": "___GFP_WRITE"},
-        "__GFP_ZERO": {"value": "___GFP_ZERO"},
+    GFP_FLAGS_DELTA = {
         #
         #
         # Plain integer GFP bitmasks (for internal use only):
-        "___GFP_DMA": {"value": 0x01},
-        "___GFP_HIGHMEM": {"value": 0x02},
-        "___GFP_DMA32": {"value": 0x04},
-        "___GFP_MOVABLE": {"value": 0x08},
-        "___GFP_RECLAIMABLE": {"value": 0x10},
-        "___GFP_HIGH": {"value": 0x20},
-        "___GFP_IO": {"value": 0x40},
-        "___GFP_FS": {"value": 0x80},
         "___GFP_ZERO": {"value": 0x100},
         "___GFP_ATOMIC": {"value": 0x200},
         "___GFP_DIRECT_RECLAIM": {"value": 0x400},
@@ -2237,7 +1569,6 @@ class KernelConfig_5_1(KernelConfig_5_0):
         "___GFP_NOMEMALLOC": {"value": 0x80000},
         "___GFP_HARDWALL": {"value": 0x100000},
         "___GFP_ACCOUNT": {"value": 0x400000},
-        "___GFP_NOLOCKDEP": {"value": 0x800000},
     }
 
 
@@ -2269,88 +1600,40 @@ class KernelConfig_5_8(KernelConfig_5_1):
         self.EXTRACT_PATTERN.update(self.EXTRACT_PATTERN_OVERLAY_58)
 
 
-class KernelConfig_5_14(KernelConfig_5_8):
+class KernelConfig_5_9(KernelConfig_5_8):
+    # Supported changes:
+    #  * mm, oom: make the calculation of oom badness more accurate (9066e5cfb73c)
+
+    name = "Configuration for Linux kernel 5.9 or later"
+    release = (5, 9, "")
+
+    oom_badness_min_points = None
+
+
+class KernelConfig_5_14(KernelConfig_5_9):
     # Supported changes:
     #  * update GFP flags
 
     name = "Configuration for Linux kernel 5.14 or later"
-    release = (5, 14, "")
-
-    # NOTE: These flags are automatically extracted from a gfp.h file.
-    #       Please do not change them manually!
-    GFP_FLAGS = {
-        #
-        #
-        # Useful GFP flag combinations:
-        "GFP_ATOMIC": {"value": "__GFP_HIGH | __GFP_ATOMIC | __GFP_KSWAPD_RECLAIM"},
-        "GFP_HIGHUSER": {"value": "GFP_USER | __GFP_HIGHMEM"},
-        "GFP_HIGHUSER_MOVABLE": {
-            "value": "GFP_HIGHUSER | __GFP_MOVABLE | __GFP_SKIP_KASAN_POISON"
-        },
-        "GFP_KERNEL": {"value": "__GFP_RECLAIM | __GFP_IO | __GFP_FS"},
-        "GFP_KERNEL_ACCOUNT": {"value": "GFP_KERNEL | __GFP_ACCOUNT"},
-        "GFP_NOFS": {"value": "__GFP_RECLAIM | __GFP_IO"},
-        "GFP_NOIO": {"value": "__GFP_RECLAIM"},
-        "GFP_NOWAIT": {"value": "__GFP_KSWAPD_RECLAIM"},
-        "GFP_TRANSHUGE": {"value": "GFP_TRANSHUGE_LIGHT | __GFP_DIRECT_RECLAIM"},
-        "GFP_TRANSHUGE_LIGHT": {
-            "value": "GFP_HIGHUSER_MOVABLE | __GFP_COMP | __GFP_NOMEMALLOC | __GFP_NOWARN & ~__GFP_RECLAIM"
-        },
-        "GFP_USER": {"value": "__GFP_RECLAIM | __GFP_IO | __GFP_FS | __GFP_HARDWALL"},
-        #
-        #
-        # Modifier, mobility and placement hints:
-        "__GFP_ACCOUNT": {"value": "___GFP_ACCOUNT"},
-        "__GFP_ATOMIC": {"value": "___GFP_ATOMIC"},
-        "__GFP_COMP": {"value": "___GFP_COMP"},
-        "__GFP_DIRECT_RECLAIM": {"value": "___GFP_DIRECT_RECLAIM"},
-        "__GFP_DMA": {"value": "___GFP_DMA"},
-        "__GFP_DMA32": {"value": "___GFP_DMA32"},
-        "__GFP_FS": {"value": "___GFP_FS"},
-        "__GFP_HARDWALL": {"value": "___GFP_HARDWALL"},
-        "__GFP_HIGH": {"value": "___GFP_HIGH"},
-        "__GFP_HIGHMEM": {"value": "___GFP_HIGHMEM"},
-        "__GFP_IO": {"value": "___GFP_IO"},
-        "__GFP_KSWAPD_RECLAIM": {"value": "___GFP_KSWAPD_RECLAIM"},
-        "__GFP_MEMALLOC": {"value": "___GFP_MEMALLOC"},
-        "__GFP_MOVABLE": {"value": "___GFP_MOVABLE"},
-        "__GFP_NOFAIL": {"value": "___GFP_NOFAIL"},
-        "__GFP_NOLOCKDEP": {"value": "___GFP_NOLOCKDEP"},
-        "__GFP_NOMEMALLOC": {"value": "___GFP_NOMEMALLOC"},
-        "__GFP_NORETRY": {"value": "___GFP_NORETRY"},
-        "__GFP_NOWARN": {"value": "___GFP_NOWARN"},
-        "__GFP_RECLAIM": {"value": "___GFP_DIRECT_RECLAIM | ___GFP_KSWAPD_RECLAIM"},
-        "__GFP_RECLAIMABLE": {"value": "___GFP_RECLAIMABLE"},
-        "__GFP_RETRY_MAYFAIL": {"value": "___GFP_RETRY_MAYFAIL"},
-        "__GFP_SKIP_KASAN_POISON": {"value": "___GFP_SKIP_KASAN_POISON"},
-        "__GFP_WRITE": {"value": "___GFP_WRITE"},
-        "__GFP_ZERO": {"value": "___GFP_ZERO"},
-        "__GFP_ZEROTAGS": {"value": "___GFP_ZEROTAGS"},
-        #
-        #
-        # Plain integer GFP bitmasks (for internal use only):
-        "___GFP_DMA": {"value": 0x01},
-        "___GFP_HIGHMEM": {"value": 0x02},
-        "___GFP_DMA32": {"value": 0x04},
-        "___GFP_MOVABLE": {"value": 0x08},
-        "___GFP_RECLAIMABLE": {"value": 0x10},
-        "___GFP_HIGH": {"value": 0x20},
-        "___GFP_IO": {"value": 0x40},
-        "___GFP_FS": {"value": 0x80},
-        "___GFP_ZERO": {"value": 0x100},
-        "___GFP_ATOMIC": {"value": 0x200},
-        "___GFP_DIRECT_RECLAIM": {"value": 0x400},
-        "___GFP_KSWAPD_RECLAIM": {"value": 0x800},
-        "___GFP_WRITE": {"value": 0x1000},
-        "___GFP_NOWARN": {"value": 0x2000},
-        "___GFP_RETRY_MAYFAIL": {"value": 0x4000},
-        "___GFP_NOFAIL": {"value": 0x8000},
-        "___GFP_NORETRY": {"value": 0x10000},
-        "___GFP_MEMALLOC": {"value": 0x20000},
-        "___GFP_COMP": {"value": 0x40000},
-        "___GFP_NOMEMALLOC": {"value": 0x80000},
-        "___GFP_HARDWALL": {"value": 0x100000},
-        "___GFP_ACCOUNT": {"value": 0x400000},
+    release = (5, 14, "")
+
+    # NOTE: These flags are automatically extracted from a gfp.h file.
+    #       Please do not change them manually!
+    GFP_FLAGS_DELTA = {
+        #
+        #
+        # Useful GFP flag combinations:
+        "GFP_HIGHUSER_MOVABLE": {
+            "value": "GFP_HIGHUSER | __GFP_MOVABLE | __GFP_SKIP_KASAN_POISON"
+        },
+        #
+        #
+        # Modifier, mobility and placement hints:
+        "__GFP_SKIP_KASAN_POISON": {"value": "___GFP_SKIP_KASAN_POISON"},
+        "__GFP_ZEROTAGS": {"value": "___GFP_ZEROTAGS"},
+        #
+        #
+        # Plain integer GFP bitmasks (for internal use only):
         "___GFP_ZEROTAGS": {"value": 0x800000},
         "___GFP_SKIP_KASAN_POISON": {"value": 0x1000000},
         "___GFP_NOLOCKDEP": {"value": 0x2000000},
@@ -2364,16 +1647,6 @@ class KernelConfig_5_16(KernelConfig_5_14):
     name = "Configuration for Linux kernel 5.16 or later"
     release = (5, 16, "")
 
-    REC_WATERMARK = re.compile(
-        "Node (?P<node>\d+) (?P<zone>DMA|DMA32|Normal) "
-        "free:(?P<free>\d+)kB "
-        "boost:(?P<boost>\d+)kB "
-        "min:(?P<min>\d+)kB "
-        "low:(?P<low>\d+)kB "
-        "high:(?P<high>\d+)kB "
-        ".*"
-    )
-
 
 class KernelConfig_5_18(KernelConfig_5_16):
     # Supported changes:
@@ -2384,82 +1657,15 @@ class KernelConfig_5_18(KernelConfig_5_16):
 
     # NOTE: These flags are automatically extracted from a gfp.h file.
     #       Please do not change them manually!
-    GFP_FLAGS = {
-        #
-        #
-        # Useful GFP flag combinations:
-        "GFP_ATOMIC": {"value": "__GFP_HIGH | __GFP_ATOMIC | __GFP_KSWAPD_RECLAIM"},
-        "GFP_HIGHUSER": {"value": "GFP_USER | __GFP_HIGHMEM"},
-        "GFP_HIGHUSER_MOVABLE": {
-            "value": "GFP_HIGHUSER | __GFP_MOVABLE | __GFP_SKIP_KASAN_POISON"
-        },
-        "GFP_KERNEL": {"value": "__GFP_RECLAIM | __GFP_IO | __GFP_FS"},
-        "GFP_KERNEL_ACCOUNT": {"value": "GFP_KERNEL | __GFP_ACCOUNT"},
-        "GFP_NOFS": {"value": "__GFP_RECLAIM | __GFP_IO"},
-        "GFP_NOIO": {"value": "__GFP_RECLAIM"},
-        "GFP_NOWAIT": {"value": "__GFP_KSWAPD_RECLAIM"},
-        "GFP_TRANSHUGE": {"value": "GFP_TRANSHUGE_LIGHT | __GFP_DIRECT_RECLAIM"},
-        "GFP_TRANSHUGE_LIGHT": {
-            "value": "GFP_HIGHUSER_MOVABLE | __GFP_COMP | __GFP_NOMEMALLOC | __GFP_NOWARN & ~__GFP_RECLAIM"
-        },
-        "GFP_USER": {"value": "__GFP_RECLAIM | __GFP_IO | __GFP_FS | __GFP_HARDWALL"},
+    GFP_FLAGS_DELTA = {
         #
         #
         # Modifier, mobility and placement hints:
-        "__GFP_ACCOUNT": {"value": "___GFP_ACCOUNT"},
-        "__GFP_ATOMIC": {"value": "___GFP_ATOMIC"},
-        "__GFP_COMP": {"value": "___GFP_COMP"},
-        "__GFP_DIRECT_RECLAIM": {"value": "___GFP_DIRECT_RECLAIM"},
-        "__GFP_DMA": {"value": "___GFP_DMA"},
-        "__GFP_DMA32": {"value": "___GFP_DMA32"},
-        "__GFP_FS": {"value": "___GFP_FS"},
-        "__GFP_HARDWALL": {"value": "___GFP_HARDWALL"},
-        "__GFP_HIGH": {"value": "___GFP_HIGH"},
-        "__GFP_HIGHMEM": {"value": "___GFP_HIGHMEM"},
-        "__GFP_IO": {"value": "___GFP_IO"},
-        "__GFP_KSWAPD_RECLAIM": {"value": "___GFP_KSWAPD_RECLAIM"},
-        "__GFP_MEMALLOC": {"value": "___GFP_MEMALLOC"},
-        "__GFP_MOVABLE": {"value": "___GFP_MOVABLE"},
-        "__GFP_NOFAIL": {"value": "___GFP_NOFAIL"},
-        "__GFP_NOLOCKDEP": {"value": "___GFP_NOLOCKDEP"},
-        "__GFP_NOMEMALLOC": {"value": "___GFP_NOMEMALLOC"},
-        "__GFP_NORETRY": {"value": "___GFP_NORETRY"},
-        "__GFP_NOWARN": {"value": "___GFP_NOWARN"},
-        "__GFP_RECLAIM": {"value": "___GFP_DIRECT_RECLAIM | ___GFP_KSWAPD_RECLAIM"},
-        "__GFP_RECLAIMABLE": {"value": "___GFP_RECLAIMABLE"},
-        "__GFP_RETRY_MAYFAIL": {"value": "___GFP_RETRY_MAYFAIL"},
-        "__GFP_SKIP_KASAN_POISON": {"value": "___GFP_SKIP_KASAN_POISON"},
         "__GFP_SKIP_KASAN_UNPOISON": {"value": "___GFP_SKIP_KASAN_UNPOISON"},
         "__GFP_SKIP_ZERO": {"value": "___GFP_SKIP_ZERO"},
-        "__GFP_WRITE": {"value": "___GFP_WRITE"},
-        "__GFP_ZERO": {"value": "___GFP_ZERO"},
-        "__GFP_ZEROTAGS": {"value": "___GFP_ZEROTAGS"},
         #
         #
         # Plain integer GFP bitmasks (for internal use only):
-        "___GFP_DMA": {"value": 0x01},
-        "___GFP_HIGHMEM": {"value": 0x02},
-        "___GFP_DMA32": {"value": 0x04},
-        "___GFP_MOVABLE": {"value": 0x08},
-        "___GFP_RECLAIMABLE": {"value": 0x10},
-        "___GFP_HIGH": {"value": 0x20},
-        "___GFP_IO": {"value": 0x40},
-        "___GFP_FS": {"value": 0x80},
-        "___GFP_ZERO": {"value": 0x100},
-        "___GFP_ATOMIC": {"value": 0x200},
-        "___GFP_DIRECT_RECLAIM": {"value": 0x400},
-        "___GFP_KSWAPD_RECLAIM": {"value": 0x800},
-        "___GFP_WRITE": {"value": 0x1000},
-        "___GFP_NOWARN": {"value": 0x2000},
-        "___GFP_RETRY_MAYFAIL": {"value": 0x4000},
-        "___GFP_NOFAIL": {"value": 0x8000},
-        "___GFP_NORETRY": {"value": 0x10000},
-        "___GFP_MEMALLOC": {"value": 0x20000},
-        "___GFP_COMP": {"value": 0x40000},
-        "___GFP_NOMEMALLOC": {"value": 0x80000},
-        "___GFP_HARDWALL": {"value": 0x100000},
-        "___GFP_ACCOUNT": {"value": 0x400000},
-        "___GFP_ZEROTAGS": {"value": 0x800000},
         "___GFP_SKIP_ZERO": {"value": 0x1000000},
         "___GFP_SKIP_KASAN_UNPOISON": {"value": 0x2000000},
         "___GFP_SKIP_KASAN_POISON": {"value": 0x4000000},
@@ -2477,86 +1683,13 @@ class KernelConfig_6_0(KernelConfig_5_18):
 
     # NOTE: These flags are automatically extracted from a gfp.h file.
     #       Please do not change them manually!
-    GFP_FLAGS = {
+    GFP_FLAGS_DELTA = {
         #
         #
         # Useful GFP flag combinations:
-        "GFP_ATOMIC": {"value": "__GFP_HIGH | __GFP_ATOMIC | __GFP_KSWAPD_RECLAIM"},
-        "GFP_HIGHUSER": {"value": "GFP_USER | __GFP_HIGHMEM"},
         "GFP_HIGHUSER_MOVABLE": {
             "value": "GFP_HIGHUSER | __GFP_MOVABLE | __GFP_SKIP_KASAN_POISON | __GFP_SKIP_KASAN_UNPOISON"
         },
-        "GFP_KERNEL": {"value": "__GFP_RECLAIM | __GFP_IO | __GFP_FS"},
-        "GFP_KERNEL_ACCOUNT": {"value": "GFP_KERNEL | __GFP_ACCOUNT"},
-        "GFP_NOFS": {"value": "__GFP_RECLAIM | __GFP_IO"},
-        "GFP_NOIO": {"value": "__GFP_RECLAIM"},
-        "GFP_NOWAIT": {"value": "__GFP_KSWAPD_RECLAIM"},
-        "GFP_TRANSHUGE": {"value": "GFP_TRANSHUGE_LIGHT | __GFP_DIRECT_RECLAIM"},
-        "GFP_TRANSHUGE_LIGHT": {
-            "value": "GFP_HIGHUSER_MOVABLE | __GFP_COMP | __GFP_NOMEMALLOC | __GFP_NOWARN & ~__GFP_RECLAIM"
-        },
-        "GFP_USER": {"value": "__GFP_RECLAIM | __GFP_IO | __GFP_FS | __GFP_HARDWALL"},
-        #
-        #
-        # Modifier, mobility and placement hints:
-        "__GFP_ACCOUNT": {"value": "___GFP_ACCOUNT"},
-        "__GFP_ATOMIC": {"value": "___GFP_ATOMIC"},
-        "__GFP_COMP": {"value": "___GFP_COMP"},
-        "__GFP_DIRECT_RECLAIM": {"value": "___GFP_DIRECT_RECLAIM"},
-        "__GFP_DMA": {"value": "___GFP_DMA"},
-        "__GFP_DMA32": {"value": "___GFP_DMA32"},
-        "__GFP_FS": {"value": "___GFP_FS"},
-        "__GFP_HARDWALL": {"value": "___GFP_HARDWALL"},
-        "__GFP_HIGH": {"value": "___GFP_HIGH"},
-        "__GFP_HIGHMEM": {"value": "___GFP_HIGHMEM"},
-        "__GFP_IO": {"value": "___GFP_IO"},
-        "__GFP_KSWAPD_RECLAIM": {"value": "___GFP_KSWAPD_RECLAIM"},
-        "__GFP_MEMALLOC": {"value": "___GFP_MEMALLOC"},
-        "__GFP_MOVABLE": {"value": "___GFP_MOVABLE"},
-        "__GFP_NOFAIL": {"value": "___GFP_NOFAIL"},
-        "__GFP_NOLOCKDEP": {"value": "___GFP_NOLOCKDEP"},
-        "__GFP_NOMEMALLOC": {"value": "___GFP_NOMEMALLOC"},
-        "__GFP_NORETRY": {"value": "___GFP_NORETRY"},
-        "__GFP_NOWARN": {"value": "___GFP_NOWARN"},
-        "__GFP_RECLAIM": {"value": "___GFP_DIRECT_RECLAIM | ___GFP_KSWAPD_RECLAIM"},
-        "__GFP_RECLAIMABLE": {"value": "___GFP_RECLAIMABLE"},
-        "__GFP_RETRY_MAYFAIL": {"value": "___GFP_RETRY_MAYFAIL"},
-        "__GFP_SKIP_KASAN_POISON": {"value": "___GFP_SKIP_KASAN_POISON"},
-        "__GFP_SKIP_KASAN_UNPOISON": {"value": "___GFP_SKIP_KASAN_UNPOISON"},
-        "__GFP_SKIP_ZERO": {"value": "___GFP_SKIP_ZERO"},
-        "__GFP_WRITE": {"value": "___GFP_WRITE"},
-        "__GFP_ZERO": {"value": "___GFP_ZERO"},
-        "__GFP_ZEROTAGS": {"value": "___GFP_ZEROTAGS"},
-        #
-        #
-        # Plain integer GFP bitmasks (for internal use only):
-        "___GFP_DMA": {"value": 0x01},
-        "___GFP_HIGHMEM": {"value": 0x02},
-        "___GFP_DMA32": {"value": 0x04},
-        "___GFP_MOVABLE": {"value": 0x08},
-        "___GFP_RECLAIMABLE": {"value": 0x10},
-        "___GFP_HIGH": {"value": 0x20},
-        "___GFP_IO": {"value": 0x40},
-        "___GFP_FS": {"value": 0x80},
-        "___GFP_ZERO": {"value": 0x100},
-        "___GFP_ATOMIC": {"value": 0x200},
-        "___GFP_DIRECT_RECLAIM": {"value": 0x400},
-        "___GFP_KSWAPD_RECLAIM": {"value": 0x800},
-        "___GFP_WRITE": {"value": 0x1000},
-        "___GFP_NOWARN": {"value": 0x2000},
-        "___GFP_RETRY_MAYFAIL": {"value": 0x4000},
-        "___GFP_NOFAIL": {"value": 0x8000},
-        "___GFP_NORETRY": {"value": 0x10000},
-        "___GFP_MEMALLOC": {"value": 0x20000},
-        "___GFP_COMP": {"value": 0x40000},
-        "___GFP_NOMEMALLOC": {"value": 0x80000},
-        "___GFP_HARDWALL": {"value": 0x100000},
-        "___GFP_ACCOUNT": {"value": 0x400000},
-        "___GFP_ZEROTAGS": {"value": 0x800000},
-        "___GFP_SKIP_ZERO": {"value": 0x1000000},
-        "___GFP_SKIP_KASAN_UNPOISON": {"value": 0x2000000},
-        "___GFP_SKIP_KASAN_POISON": {"value": 0x4000000},
-        "___GFP_NOLOCKDEP": {"value": 0x8000000},
     }
 
     EXTRACT_PATTERN_OVERLAY_60 = {
@@ -2601,48 +1734,154 @@ class KernelConfig_6_1(KernelConfig_6_0):
 
 
 AllKernelConfigs = [
-    KernelConfig_6_1(),
-    KernelConfig_6_0(),
-    KernelConfig_5_18(),
-    KernelConfig_5_16(),
-    KernelConfig_5_14(),
-    KernelConfig_5_8(),
-    KernelConfig_5_1(),
-    KernelConfig_5_0(),
-    KernelConfig_4_15(),
-    KernelConfig_4_19(),
-    KernelConfig_4_18(),
-    KernelConfig_4_15(),
-    KernelConfig_4_14(),
-    KernelConfig_4_13(),
-    KernelConfig_4_12(),
-    KernelConfig_4_10(),
-    KernelConfig_4_9(),
-    KernelConfig_4_8(),
-    KernelConfig_4_6(),
-    KernelConfig_4_5(),
-    KernelConfig_4_4(),
-    KernelConfig_4_1(),
-    KernelConfig_3_19(),
-    KernelConfig_3_16(),
-    KernelConfig_3_10_EL7(),
-    KernelConfig_3_10(),
-    BaseKernelConfig(),
+    KernelConfig_6_1,
+    KernelConfig_6_0,
+    KernelConfig_5_18,
+    KernelConfig_5_16,
+    KernelConfig_5_14,
+    KernelConfig_5_9,
+    KernelConfig_5_8,
+    KernelConfig_5_1,
+    KernelConfig_5_0,
+    KernelConfig_4_19,
+    KernelConfig_4_18,
+    KernelConfig_4_15,
+    KernelConfig_4_14,
+    KernelConfig_4_13,
+    KernelConfig_4_12,
+    KernelConfig_4_10,
+    KernelConfig_4_9,
+    KernelConfig_4_8,
+    KernelConfig_4_6,
+    KernelConfig_4_5,
+    KernelConfig_4_4,
+    KernelConfig_4_1,
+    KernelConfig_3_19,
+    KernelConfig_3_16,
+    KernelConfig_3_10_EL7,
+    KernelConfig_3_10,
+    BaseKernelConfig,
 ]
 """
-Instances of all available kernel configurations.
+Classes of all available kernel configurations.
 
 Manually sorted from newest to oldest and from specific to general.
 
 The last entry in this list is the base configuration as a fallback.
+
+The classes are instantiated on first use with get_kernel_config(). This keeps
+the calculation of the GFP flags for all kernel versions out of the page
+startup.
+"""
+
+_kernel_config_instances = {}
+"""
+Kernel configurations already instantiated, indexed by class name
+
+@type: Dict(str, BaseKernelConfig)
+"""
+
+
+def get_kernel_config(kcfg_class):
+    """
+    Return the instance of a kernel configuration and create it on first use
+
+    The instances are shared between all analyses and not changed after the
+    creation. Concurrent first calls may create the same configuration twice, but
+    the instances are identical and only one is kept.
+
+    @param kcfg_class: Class of the kernel configuration from AllKernelConfigs
+    @rtype: BaseKernelConfig
+    """
+    name = kcfg_class.__name__
+    if name not in _kernel_config_instances:
+        _kernel_config_instances[name] = kcfg_class()
+    return _kernel_config_instances[name]
+
+
+class LogPrefix:
+    """Strip a known log prefix format like timestamps and hostnames from OOM lines"""
+
+    name = ""
+    """Name of the log prefix format"""
+
+    rec = None
+    """Compiled RE pattern matching the whole prefix"""
+
+    def __init__(self, name, pattern):
+        self.name = name
+        self.rec = re.compile(pattern)
+
+    def strip(self, line):
+        """
+        Return the line w/o prefix or None if the line doesn't start with this prefix
+
+        Continuation lines of multi-line messages like "Mem-Info:" start with spaces instead of the prefix.
+        They are returned with a single leading space, like the kernel writes them.
+
+        @type line: str
+        @rtype: str | None
+        """
+        match = self.rec.match(line)
+        if match:
+            return line[len(match.group(0)) :]
+        if line.startswith(" "):
+            return " " + line.strip()
+        return None
+
+
+AllLogPrefixes = [
+    # [11686.888109] CPU: 4 PID: 29481 Comm: sed Not tainted 3.10.0-514.6.1.el7.x86_64 #1
+    LogPrefix("dmesg", r"^\[\s*\d+\.\d+\] "),
+    # [Sun Oct  1 12:00:00 2023] CPU: 4 PID: 29481 Comm: sed Not tainted 3.10.0-514.6.1.el7.x86_64 #1
+    LogPrefix("dmesg -T", r"^\[\w{3} \w{3} [ \d]\d \d{2}:\d{2}:\d{2} \d{4}\] "),
+    # <6>1 2023-10-01T12:00:00.123456+02:00 mysrv kernel - - - CPU: 4 PID: 29481 Comm: sed ...
+    LogPrefix(
+        "RFC5424",
+        r"^(<\d+>)?1 \S+ \S+ kernel \S+ \S+ (-|\[[^\]]*\]) (\[\s*\d+\.\d+\] )?",
+    ),
+    # 2023-10-01T12:00:00+0200 mysrv kernel: CPU: 4 PID: 29481 Comm: sed ...
+    # 2023-10-01T12:00:00.123456+02:00 mysrv kernel: [11686.888109] CPU: 4 PID: 29481 Comm: sed ...
+    LogPrefix(
+        "short-iso",
+        r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d+)?(Z|[+-]\d{2}:?\d{2}) \S+ kernel: ?"
+        r"(\[\s*\d+\.\d+\] )?",
+    ),
+    # Apr 01 14:13:32 mysrv kernel: CPU: 4 PID: 29481 Comm: sed Not tainted 3.10.0-514.6.1.el7.x86_64 #1
+    # Apr  1 14:13:32 mysrv kernel: [11686.888109] CPU: 4 PID: 29481 Comm: sed Not tainted 3.10.0-514.6.1.el7.x86_64 #1
+    LogPrefix(
+        "short",
+        r"^(<\d+>)?\w{3} [ \d]\d \d{2}:\d{2}:\d{2} \S+ kernel: ?(\[\s*\d+\.\d+\] )?",
+    ),
+]
+"""
+Instances of all known log prefix formats
+
+The formats cover the output of dmesg (w/ and w/o -T), journalctl (short and short-iso) as well as rsyslog
+(RFC3164, RFC3339 and RFC5424).
 """
 
 
+def detect_log_prefix(line):
+    """
+    Return the log prefix format of the given line or None if the format is unknown
+
+    @type line: str
+    @rtype: LogPrefix | None
+    """
+    for log_prefix in AllLogPrefixes:
+        if log_prefix.rec.match(line):
+            return log_prefix
+    return None
+
+
 class OOMEntity:
-    """Hold whole OOM message block and provide access"""
+    """
+    Hold whole OOM message block and provide access
 
-    current_line = 0
-    """Zero based index of the current line in self.lines"""
+    The entity isn't changed after initialisation. Use OOMLineCursor to walk
+    through the lines.
+    """
 
     lines = []
     """OOM text as list of lines"""
@@ -2653,13 +1892,24 @@ class OOMEntity:
     text = ""
     """OOM as text"""
 
-    def __init__(self, text):
+    log_prefix = None
+    """Log prefix format of this OOM or None if the leading columns have been guessed"""
+
+    def __init__(self, text, stripped=False, log_prefix=None):
+        """
+        @param str text: OOM text
+        @param bool stripped: The lines contain only kernel messages w/o leading columns like timestamps or
+                              hostnames e.g. taken from the MESSAGE field of a journal entry. The column heuristics
+                              are skipped then.
+        @param log_prefix: Log prefix format detected in a previous OOM of the same log to skip the detection.
+                           The format is detected again, if a line doesn't match.
+        @type log_prefix: LogPrefix | None
+        """
         # use Unix LF only
         text = text.replace("\r\n", "\n")
         text = text.strip()
         oom_lines = text.split("\n")
 
-        self.current_line = 0
         self.lines = oom_lines
         self.text = text
 
@@ -2672,15 +1922,36 @@ class OOMEntity:
             return
 
         oom_lines = self._remove_non_oom_lines(oom_lines)
-        oom_lines = self._remove_kernel_colon(oom_lines)
-        cols_to_strip = self._number_of_columns_to_strip(
-            oom_lines[self._get_CPU_index(oom_lines)]
-        )
-        oom_lines = self._journalctl_add_leading_columns_to_meminfo(
-            oom_lines, cols_to_strip
-        )
-        oom_lines = self._strip_needless_columns(oom_lines, cols_to_strip)
-        oom_lines = self._rsyslog_unescape_lf(oom_lines)
+        self.log_prefix = None
+        prefix_stripped_lines = None
+        if not stripped:
+            if log_prefix:
+                prefix_stripped_lines = self._strip_log_prefix(oom_lines, log_prefix)
+            if prefix_stripped_lines is None:
+                log_prefix = detect_log_prefix(
+                    oom_lines[self._get_CPU_index(oom_lines)]
+                )
+                if log_prefix:
+                    prefix_stripped_lines = self._strip_log_prefix(
+                        oom_lines, log_prefix
+                    )
+            if prefix_stripped_lines is not None:
+                self.log_prefix = log_prefix
+
+        if stripped:
+            oom_lines = self._strip_needless_columns(oom_lines)
+        elif prefix_stripped_lines is not None:
+            oom_lines = self._rsyslog_unescape_lf(prefix_stripped_lines)
+        else:
+            oom_lines = self._remove_kernel_colon(oom_lines)
+            cols_to_strip = self._number_of_columns_to_strip(
+                oom_lines[self._get_CPU_index(oom_lines)]
+            )
+            oom_lines = self._journalctl_add_leading_columns_to_meminfo(
+                oom_lines, cols_to_strip
+            )
+            oom_lines = self._strip_needless_columns(oom_lines, cols_to_strip)
+            oom_lines = self._rsyslog_unescape_lf(oom_lines)
 
         self.lines = oom_lines
         self.text = "\n".join(oom_lines)
@@ -2690,6 +1961,27 @@ class OOMEntity:
         else:
             self.state = OOMEntityState.started
 
+    def _strip_log_prefix(self, oom_lines, log_prefix):
+        """
+        Remove the known log prefix from all lines
+
+        This is a faster alternative to guess and strip the leading columns. Empty lines are removed.
+
+        @param List(str) oom_lines: OOM lines
+        @param LogPrefix log_prefix: Log prefix format
+        @return: Lines w/o prefix or None if a line doesn't match the log prefix format
+        @rtype: List(str) | None
+        """
+        stripped_lines = []
+        for line in oom_lines:
+            if not line.strip():
+                continue
+            line = log_prefix.strip(line)
+            if line is None:
+                return None
+            stripped_lines.append(line)
+        return stripped_lines
+
     def _journalctl_add_leading_columns_to_meminfo(self, oom_lines, cols_to_add):
         """
         Add leading columns to handle line breaks in journalctl output correctly.
@@ -2839,6 +2131,28 @@ class OOMEntity:
 
         return stripped_lines
 
+
+class OOMLineCursor:
+    """
+    Line pointer to walk through the lines of an OOMEntity
+
+    Each analysis uses its own cursor. The OOMEntity isn't changed during the
+    analysis, so one entity can be analysed concurrently.
+    """
+
+    current_line = 0
+    """Zero based index of the current line in self.lines"""
+
+    lines = []
+    """OOM text as list of lines"""
+
+    def __init__(self, lines):
+        """
+        @param List(str) lines: OOM text as list of lines
+        """
+        self.current_line = 0
+        self.lines = lines
+
     def goto_previous_line(self):
         """Set line pointer to previous line
 
@@ -2873,26 +2187,64 @@ class OOMEntity:
 
         :return: True if the marker has found.
         """
-        for line in self.lines:
+        for i, line in enumerate(self.lines):
             if pattern in line:
-                self.current_line = self.lines.index(line)
+                self.current_line = i
                 return True
         return False
 
     def __iter__(self):
         return self
 
-    def __next__(self):
-        return self.next()
+    def __next__(self):
+        return self.next()
+
+
+class OOMResult:
+    """
+    Results of an OOM analysis
+
+    All values of an analysis are stored here and not in the kernel
+    configuration. The kernel configurations are shared between all analyses and
+    must not be changed.
+    """
+
+    buddyinfo = None
+    """
+    Free chunks of all zones as dense matrix per zone
+
+    @type: Dict(str, List(List(int)))
+    @see: OOMAnalyser._extract_buddyinfo()
+    """
+
+    buddyinfo_free_kb = None
+    """
+    Free memory in kB of all zones as matrix [<zone>][<order>][<node>]
+
+    @type: Dict(str, List(List(int)))
+    @see: OOMAnalyser._calc_buddyinfo_values()
+    """
+
+    buddyinfo_total_free_kb = None
+    """
+    Free memory in kB per zone and node as reported by the kernel or None for nodes w/o this zone
+
+    @type: Dict(str, List(int|None))
+    @see: OOMAnalyser._extract_buddyinfo()
+    """
 
+    call_trace_frames = None
+    """
+    Reliable frames of the call trace from the innermost to the outermost function
 
-class OOMResult:
-    """Results of an OOM analysis"""
+    Each frame is a tuple of the symbol, the offset into the function and the
+    module name or None for built-in functions.
 
-    buddyinfo = {}
-    """Information about free areas in all zones"""
+    @type: List(Tuple(str, int, str|None))
+    @see: OOMAnalyser._extract_call_trace()
+    """
 
-    details = {}
+    details = None
     """Extracted result"""
 
     error_msg = ""
@@ -2902,8 +2254,31 @@ class OOMResult:
     @type: str
     """
 
-    kconfig = BaseKernelConfig()
-    """Kernel configuration"""
+    fragmentation_index = None
+    """
+    Fragmentation index in thousandths of all zones as matrix [<zone>][<order>][<node>]
+
+    @type: Dict(str, List(List(int)))
+    @see: calc_buddyinfo_metrics()
+    """
+
+    hugepages = None
+    """
+    Huge page pools of all NUMA nodes and huge page sizes
+
+    Each entry contains the node, the huge page size in kB as well as the
+    total, free and surplus number of huge pages as reported by the kernel.
+
+    @type: List(dict)
+    @see: OOMAnalyser._extract_hugepages()
+    """
+
+    kconfig = None
+    """
+    Kernel configuration
+
+    @type: BaseKernelConfig
+    """
 
     kversion = None
     """
@@ -2912,12 +2287,49 @@ class OOMResult:
     @type: str
     """
 
+    memcg_stats = None
+    """
+    Statistics of the memory cgroup with the counter name as key
+
+    Values with the unit KB are converted to bytes like in memory.stat.
+
+    @type: Dict(str, int)
+    @see: OOMAnalyser._extract_memcg_stats()
+    """
+
     mem_alloc_failure = OOMMemoryAllocFailureType.not_started
     """State/result of the memory allocation failure analysis
 
     @see: OOMAnalyser._analyse_alloc_failure()
     """
 
+    memory_pressure = OOMMemoryPressureType.unknown
+    """
+    Memory shortage limited to some NUMA nodes or on all nodes
+
+    @type: int
+    @see: OOMMemoryPressureType, OOMAnalyser._analyse_all_nodes()
+    """
+
+    max_order = -1
+    """
+    Number of orders in the buddyinfo
+
+    The kernel memory allocator divides physically contiguous memory
+    blocks into "zones", where each zone is a power of two number of
+    pages.  The kernel option MAX_ORDER selects the largest power of two
+    that the kernel keeps in the memory allocator.
+
+    This value is actually maximum order plus one. For example, a value
+    of 11 means that the largest free memory block is 2^10 pages.
+
+    The value will be calculated dynamically based on the numbers of
+    orders in OOMAnalyser._extract_buddyinfo().
+
+    @type: int
+    @see: OOMAnalyser._extract_buddyinfo().
+    """
+
     mem_fragmented = None
     """True if the memory is heavily fragmented. This means that the higher order has no free chunks.
 
@@ -2925,6 +2337,27 @@ class OOMResult:
     @type: None | bool
     """
 
+    node_table = None
+    """
+    Watermarks, allocation and fragmentation results of all zones and NUMA nodes
+
+    Each entry contains the node, the zone, the free memory and the watermarks
+    in kB, if the free memory is below the min watermark as well as the
+    allocation failure, the heavy fragmentation and the fragmentation index for
+    the requested order. The last three are None if not evaluated.
+
+    @type: List(dict)
+    @see: OOMAnalyser._analyse_all_nodes()
+    """
+
+    oom_constraint = OOMConstraintType.unknown
+    """
+    Constraint of this OOM (system-wide, memory cgroup, ...)
+
+    @type: int
+    @see: OOMConstraintType, OOMAnalyser._identify_oom_constraint()
+    """
+
     oom_entity = None
     """
     State of this OOM (unknown, incomplete, ...)
@@ -2932,6 +2365,16 @@ class OOMResult:
     :type: OOMEntityState
     """
 
+    oom_victim_expected = None
+    """
+    True if the killed process has the highest recalculated OOM badness score
+
+    None if the score of the killed process is unknown.
+
+    @type: None | bool
+    @see: OOMAnalyser._rank_oom_victims()
+    """
+
     oom_text = None
     """
     OOM text
@@ -2946,6 +2389,28 @@ class OOMResult:
     :type: OOMEntityType
     """
 
+    profile = None
+    """
+    Wall time and allocated memory of all analysis stages
+
+    Each entry contains the stage name, the nesting depth, the duration in milliseconds and the allocated memory in
+    kB or None. It's only set by OOMAnalyserProfiler.
+
+    @type: List(dict)
+    @see: OOMAnalyserProfiler
+    """
+
+    slab_unreclaimable = None
+    """
+    Unreclaimable slab caches as columnar table
+
+    The columns "name", "used_kb" and "total_kb" are lists with one entry per
+    slab cache in the order of the OOM message.
+
+    @type: Dict(str, List(str|int))
+    @see: OOMAnalyser._extract_slab_unreclaimable()
+    """
+
     swap_active = False
     """
     Swap space active or inactive
@@ -2953,8 +2418,177 @@ class OOMResult:
     @type: bool
     """
 
-    watermarks = {}
-    """Memory watermark information"""
+    watermarks = None
+    """
+    Memory watermarks and all other counters per zone and node
+
+    The counters are stored with their kernel names e.g. "free", "min",
+    "managed" or "all_unreclaimable". Values with the unit kB are stored in kB.
+    Additionally, "lowmem_reserve" contains the lowmem reserves in pages.
+
+    @type: Dict(str, Dict(int, Dict(str, int|bool|List(int))))
+    @see: parse_zone_counters()
+    """
+
+    def __init__(self):
+        self.buddyinfo = {}
+        self.buddyinfo_free_kb = {}
+        self.buddyinfo_total_free_kb = {}
+        self.call_trace_frames = []
+        self.details = {}
+        self.fragmentation_index = {}
+        self.hugepages = []
+        self.kconfig = get_kernel_config(BaseKernelConfig)
+        self.memcg_stats = {}
+        self.node_table = []
+        self.slab_unreclaimable = {"name": [], "used_kb": [], "total_kb": []}
+        self.watermarks = {}
+
+
+REC_ZONE_COUNTER_VALUE = re.compile("^(?P<value>\d+)(kB|KB)?$")
+"""Match the value of a zone counter"""
+
+
+def parse_zone_counters(text):
+    """
+    Tokenise all counters of a memory zone
+
+    The counters are space separated "<name>:<value>" pairs as shown in the
+    zone lines of mm/page_alloc.c:__show_free_areas(). Values with the unit kB
+    are returned in kB, "yes" and "no" as bool e.g. "all_unreclaimable? yes".
+    Unknown tokens are ignored.
+
+    @param str text: Counters of a zone w/o the leading "Node <node> <zone> "
+    @rtype: Dict(str, int|bool)
+    """
+    counters = {}
+    name = None
+    for token in text.split(" "):
+        if not token:
+            continue
+        if name is None:
+            if token.endswith("?"):
+                name = token[:-1]
+                continue
+            if ":" not in token:
+                continue
+            name, token = token.split(":", 1)
+            if not token:
+                # value follows after a space e.g. "shmem_thp: 0kB"
+                continue
+        if token in ["yes", "no"]:
+            counters[name] = token == "yes"
+        else:
+            match = REC_ZONE_COUNTER_VALUE.match(token)
+            if match:
+                counters[name] = int(match.group("value"))
+        name = None
+    return counters
+
+
+def calc_buddyinfo_metrics(chunks, page_size_kb):
+    """
+    Calculate the free memory and the fragmentation index for all orders and nodes of a zone
+
+    The fragmentation index is calculated like mm/vmstat.c:__fragmentation_index()
+    for each order and node. It's returned as integer in thousandths like in
+    /sys/kernel/debug/extfrag/extfrag_index:
+
+     * -1000: A suitable chunk is free, an allocation of this order succeeds.
+     * 0: No free chunks at all.
+     * Otherwise an allocation of this order fails. Values towards 0 mean lack of
+       memory, values towards 1000 mean fragmentation.
+
+    NumPy is used if it's available.
+
+    @param List(List(int)) chunks: Free chunks as matrix [<order>][<node>]
+    @param int page_size_kb: Page size in kB
+    @return: Free memory in kB and fragmentation index as matrices [<order>][<node>]
+    @rtype: List(List(int)), List(List(int))
+    """
+    if numpy:
+        return _calc_buddyinfo_metrics_numpy(chunks, page_size_kb)
+
+    nr_orders = len(chunks)
+    nr_nodes = len(chunks[0]) if nr_orders else 0
+    free_kb = []
+    for order in range(nr_orders):
+        free_kb.append([count * page_size_kb * 2**order for count in chunks[order]])
+
+    fragmentation_index = [
+        [0 for node in range(nr_nodes)] for order in range(nr_orders)
+    ]
+    for node in range(nr_nodes):
+        free_pages = 0
+        free_blocks_total = 0
+        for order in range(nr_orders):
+            free_blocks_total += chunks[order][node]
+            free_pages += chunks[order][node] * 2**order
+        if not free_blocks_total:
+            continue
+
+        # walk from the highest order down to sum up the suitable blocks once
+        free_blocks_suitable = 0
+        for order in range(nr_orders - 1, -1, -1):
+            free_blocks_suitable = free_blocks_suitable * 2 + chunks[order][node]
+            if free_blocks_suitable:
+                fragmentation_index[order][node] = -1000
+            else:
+                fragmentation_index[order][node] = 1000 - (
+                    (1000 + (free_pages * 1000 // 2**order)) // free_blocks_total
+                )
+    return free_kb, fragmentation_index
+
+
+# __pragma__ ('skip')
+def _calc_buddyinfo_metrics_numpy(chunks, page_size_kb):
+    """
+    Calculate the free memory and the fragmentation index with NumPy
+
+    @see: calc_buddyinfo_metrics()
+    """
+    matrix = numpy.array(chunks, dtype=numpy.int64).reshape(len(chunks), -1)
+    pages_per_chunk = (2 ** numpy.arange(len(chunks), dtype=numpy.int64))[:, None]
+    free_pages = matrix * pages_per_chunk
+    free_kb = free_pages * page_size_kb
+
+    # blocks of this or any higher order in units of this order
+    suitable = numpy.flip(numpy.cumsum(numpy.flip(free_pages, 0), 0), 0)
+    suitable //= pages_per_chunk
+    free_blocks_total = matrix.sum(0)
+    requested = 1000 + free_pages.sum(0) * 1000 // pages_per_chunk
+    index = 1000 - requested // numpy.maximum(free_blocks_total, 1)
+    index = numpy.where(suitable > 0, -1000, index)
+    index = numpy.where(free_blocks_total == 0, 0, index)
+    return free_kb.tolist(), index.tolist()
+
+
+# __pragma__ ('noskip')
+
+
+OOM_BADNESS_RANKING_SIZE = 10
+"""Number of processes with the highest OOM badness scores to rank"""
+
+SLAB_RANKING_SIZE = 10
+"""Number of unreclaimable slab caches with the highest memory usage to rank"""
+
+MEMORY_ACCOUNTING_BUCKETS = [
+    "user",
+    "page_cache",
+    "swap_cache",
+    "slab",
+    "page_tables",
+    "hugepages",
+    "free",
+    "reserved",
+]
+"""
+Buckets of the memory accounting in the order of the breakdown
+
+The memory of each bucket is stored in OOMResult.details["accounted_<bucket>_kb"].
+
+@see: OOMAnalyser._calc_memory_accounting()
+"""
 
 
 class OOMAnalyser:
@@ -2967,15 +2601,22 @@ class OOMAnalyser:
     :type: OOMEntityState
     """
 
-    oom_result = OOMResult()
+    oom_result = None
     """
     Store details of OOM analysis
 
     :type: OOMResult
     """
 
+    cursor = None
+    """
+    Line pointer of this analysis
+
+    :type: OOMLineCursor
+    """
+
     REC_KERNEL_VERSION = re.compile(
-        r"CPU: \d+ PID: \d+ Comm: .* (Not tainted|Tainted: [A-Z ]+) (?P<kernel_version>\d[\w.-]+) (?:#\d) (?P<distribution>\w+ \w+).+"
+        r"CPU: \d+ PID: \d+ Comm: .* (Not tainted|Tainted: [A-Z ]+) (?P<kernel_version>\d[\w.-]+) #\d+\S*( (?P<distribution>\w+ \w+).*)?"
     )
     """RE to match the OOM line with kernel version"""
 
@@ -3001,6 +2642,7 @@ class OOMAnalyser:
     def __init__(self, oom):
         self.oom_entity = oom
         self.oom_result = OOMResult()
+        self.cursor = OOMLineCursor(oom.lines)
 
     def _identify_kernel_version(self):
         """
@@ -3053,11 +2695,11 @@ class OOMAnalyser:
 
         @see: _check_kversion_greater_equal(), AllKernelConfigs
         """
-        for kcfg in AllKernelConfigs:
+        for kcfg_class in AllKernelConfigs:
             if self._check_kversion_greater_equal(
-                self.oom_result.kversion, kcfg.release
+                self.oom_result.kversion, kcfg_class.release
             ):
-                self.oom_result.kconfig = kcfg
+                self.oom_result.kconfig = get_kernel_config(kcfg_class)
                 break
 
         if not self.oom_result.kconfig:
@@ -3066,7 +2708,7 @@ class OOMAnalyser:
                     self.oom_result.kversion
                 )
             )
-            self.oom_result.kconfig = BaseKernelConfig()
+            self.oom_result.kconfig = get_kernel_config(BaseKernelConfig)
         return
 
     def _check_for_empty_oom(self):
@@ -3109,20 +2751,43 @@ class OOMAnalyser:
         self.oom_result.error_msg = None
         return True
 
+    def _identify_oom_constraint(self):
+        """
+        Identify if the OOM is system-wide or limited e.g. to a memory cgroup
+
+        Older kernels don't show the constraint. Memory cgroup OOMs are
+        identified by the message of the killed process then.
+        """
+        constraints = {
+            "NONE": OOMConstraintType.none,
+            "CPUSET": OOMConstraintType.cpuset,
+            "MEMORY_POLICY": OOMConstraintType.memory_policy,
+            "MEMCG": OOMConstraintType.memcg,
+        }
+        match = self.oom_result.kconfig.REC_OOM_CONSTRAINT.search(self.oom_entity.text)
+        if match:
+            self.oom_result.oom_constraint = constraints.get(
+                match.group("constraint"), OOMConstraintType.unknown
+            )
+        elif self.oom_result.kconfig.REC_MEMCG_OOM.search(self.oom_entity.text):
+            self.oom_result.oom_constraint = OOMConstraintType.memcg
+        else:
+            self.oom_result.oom_constraint = OOMConstraintType.none
+
     def _extract_block_from_next_pos(self, marker):
         """
         Extract a block that starts with the marker and contains all lines up to the next line with ":".
         :rtype: str
         """
         block = ""
-        if not self.oom_entity.find_text(marker):
+        if not self.cursor.find_text(marker):
             return block
 
-        line = self.oom_entity.current()
+        line = self.cursor.current()
         block += "{}\n".format(line)
-        for line in self.oom_entity:
+        for line in self.cursor:
             if ":" in line:
-                self.oom_entity.goto_previous_line()
+                self.cursor.goto_previous_line()
                 break
             block += "{}\n".format(line)
         return block
@@ -3154,8 +2819,15 @@ class OOMAnalyser:
         """Extract details from OOM message text"""
 
         self.oom_result.details = {}
+        memcg = self.oom_result.oom_constraint == OOMConstraintType.memcg
+        if memcg:
+            skip_pattern = self.oom_result.kconfig.EXTRACT_PATTERN_GLOBAL_ONLY
+        else:
+            skip_pattern = self.oom_result.kconfig.EXTRACT_PATTERN_MEMCG_ONLY
         # __pragma__ ('jsiter')
         for k in self.oom_result.kconfig.EXTRACT_PATTERN:
+            if k in skip_pattern:
+                continue
             pattern, is_mandatory = self.oom_result.kconfig.EXTRACT_PATTERN[k]
             rec = re.compile(pattern, re.MULTILINE)
             match = rec.search(self.oom_entity.text)
@@ -3179,20 +2851,17 @@ class OOMAnalyser:
             "Hardware name:"
         )
 
-        # strip "Call Trace" line at beginning and remove leading spaces
-        call_trace = ""
-        block = self._extract_block_from_next_pos("Call Trace:")
-        for line in block.split("\n"):
-            if line.startswith("Call Trace"):
-                continue
-            call_trace += "{}\n".format(line.strip())
-        self.oom_result.details["call_trace"] = call_trace
-
+        self._extract_call_trace()
         self._extract_page_size()
         self._extract_pstable()
         self._extract_gpf_mask()
+        if memcg:
+            self._extract_memcg_stats()
+            return
         self._extract_buddyinfo()
+        self._extract_hugepages()
         self._extract_watermarks()
+        self._extract_slab_unreclaimable()
 
     def _extract_page_size(self):
         """Extract page size from buddyinfo DMZ zone"""
@@ -3208,8 +2877,8 @@ class OOMAnalyser:
     def _extract_pstable(self):
         """Extract process table"""
         self.oom_result.details["_pstable"] = {}
-        self.oom_entity.find_text(self.oom_result.kconfig.pstable_start)
-        for line in self.oom_entity:
+        self.cursor.find_text(self.oom_result.kconfig.pstable_start)
+        for line in self.cursor:
             if not line.startswith("["):
                 break
             if line.startswith(self.oom_result.kconfig.pstable_start):
@@ -3228,75 +2897,105 @@ class OOMAnalyser:
         The migration types "(UEM)" or similar are not evaluated. They are documented in
         mm/page_alloc.c:show_migration_types().
 
+        The free chunks of a zone are stored as dense matrix with one row per order
+        and one column per node. Nodes without this zone have 0 free chunks and
+        None as total.
+
         This function fills:
         * OOMResult.buddyinfo with [<zone>][<order>][<node>] = <number of free chunks>
-        * OOMResult.buddyinfo with [zone]["total_free_kb_per_node"][node] = int(total_free_kb_per_node)
+        * OOMResult.buddyinfo_total_free_kb with [<zone>][<node>] = int(total_free_kb_per_node) | None
+        * OOMResult.max_order
         """
         self.oom_result.buddyinfo = {}
-        buddy_info = self.oom_result.buddyinfo
-        self.oom_entity.find_text(self.oom_result.kconfig.zoneinfo_start)
+        self.oom_result.buddyinfo_total_free_kb = {}
+        self.cursor.find_text(self.oom_result.kconfig.zoneinfo_start)
 
-        self.oom_entity.goto_previous_line()
-        for line in self.oom_entity:
+        entries = []
+        nr_nodes = 0
+        max_order = 0
+        self.cursor.goto_previous_line()
+        for line in self.cursor:
             match = self.oom_result.kconfig.REC_FREE_MEMORY_CHUNKS.match(line)
             if not match:
                 continue
             node = int(match.group("node"))
-            zone = match.group("zone")
-
-            if zone not in buddy_info:
-                buddy_info[zone] = {}
-
-            if "total_free_kb_per_node" not in buddy_info[zone]:
-                buddy_info[zone]["total_free_kb_per_node"] = {}
-            buddy_info[zone]["total_free_kb_per_node"][node] = int(
-                int(match.group("total_free_kb_per_node"))
-            )
-
-            order = -1  # to start with 0 after the first increment in for loop
+            chunks = []
             for element in match.group("zone_usage").split(" "):
                 if element.startswith("("):  # skip migration types
                     continue
-                order += 1
-                if order not in buddy_info[zone]:
-                    buddy_info[zone][order] = {}
-                count = element.split("*")[0]
-                count.strip()
-
-                buddy_info[zone][order][node] = int(count)
-                if "free_chunks_total" not in buddy_info[zone][order]:
-                    buddy_info[zone][order]["free_chunks_total"] = 0
-                buddy_info[zone][order]["free_chunks_total"] += buddy_info[zone][order][
-                    node
+                chunks.append(int(element.split("*")[0]))
+            entries.append(
+                (
+                    match.group("zone"),
+                    node,
+                    chunks,
+                    int(match.group("total_free_kb_per_node")),
+                )
+            )
+            nr_nodes = max(nr_nodes, node + 1)
+            max_order = max(max_order, len(chunks))
+
+        for zone, node, chunks, total_free_kb in entries:
+            if zone not in self.oom_result.buddyinfo:
+                self.oom_result.buddyinfo[zone] = [
+                    [0 for i in range(nr_nodes)] for order in range(max_order)
                 ]
+                self.oom_result.buddyinfo_total_free_kb[zone] = [
+                    None for i in range(nr_nodes)
+                ]
+            matrix = self.oom_result.buddyinfo[zone]
+            for order in range(len(chunks)):
+                matrix[order][node] = chunks[order]
+            self.oom_result.buddyinfo_total_free_kb[zone][node] = total_free_kb
 
         # MAX_ORDER is actually maximum order plus one. For example,
         # a value of 11 means that the largest free memory block is 2^10 pages.
-        # __pragma__ ('jsiter')
-        max_order = 0
-        for o in self.oom_result.buddyinfo["DMA"]:
-            # JS: integer is sometimes a string :-/
-            if (isinstance(o, str) and o.isdigit()) or isinstance(o, int):
-                max_order += 1
-        # __pragma__ ('nojsiter')
-        self.oom_result.kconfig.MAX_ORDER = max_order
+        self.oom_result.max_order = max_order
+
+    def _extract_hugepages(self):
+        """
+        Extract the huge page pools of all NUMA nodes and huge page sizes
+
+        This function fills:
+        * OOMResult.hugepages with one entry per node and huge page size
+        """
+        self.oom_result.hugepages = []
+        if not self.cursor.find_text(self.oom_result.kconfig.hugepages_start):
+            return
+
+        self.cursor.goto_previous_line()
+        for line in self.cursor:
+            match = self.oom_result.kconfig.REC_HUGEPAGES.match(line)
+            if not match:
+                break
+            self.oom_result.hugepages.append(
+                {
+                    "node": int(match.group("node")),
+                    "size_kb": int(match.group("size_kb")),
+                    "total": int(match.group("total")),
+                    "free": int(match.group("free")),
+                    "surp": int(match.group("surp")),
+                }
+            )
 
     def _extract_watermarks(self):
         """
         Extract memory watermark information from all zones
 
+        Each zone line is tokenised once into all counters.
+
         This function fills:
-        * OOMResult.watermarks with [<zone>][<node>][(free|min|low|high)] = int
+        * OOMResult.watermarks with [<zone>][<node>][<counter>] = int|bool
         * OOMResult.watermarks with [<zone>][<node>][(lowmem_reserve)] = List(int)
         """
         self.oom_result.watermarks = {}
         watermark_info = self.oom_result.watermarks
-        self.oom_entity.find_text(self.oom_result.kconfig.watermark_start)
+        self.cursor.find_text(self.oom_result.kconfig.watermark_start)
 
         node = None
         zone = None
-        self.oom_entity.goto_previous_line()
-        for line in self.oom_entity:
+        self.cursor.goto_previous_line()
+        for line in self.cursor:
             match = self.oom_result.kconfig.REC_WATERMARK.match(line)
             if not match:
                 if line.startswith("lowmem_reserve[]:"):
@@ -3306,14 +3005,123 @@ class OOMAnalyser:
                     ]
                 continue
 
+            counters = parse_zone_counters(match.group("counters"))
+            if not all([i in counters for i in ["free", "min", "low", "high"]]):
+                continue
+
             node = int(match.group("node"))
             zone = match.group("zone")
             if zone not in watermark_info:
                 watermark_info[zone] = {}
-            if node not in watermark_info[zone]:
-                watermark_info[zone][node] = {}
-            for i in ["free", "min", "low", "high"]:
-                watermark_info[zone][node][i] = int(match.group(i))
+            watermark_info[zone][node] = counters
+
+    def _extract_call_trace(self):
+        """
+        Extract the call trace as text and split it into single frames
+
+        Unreliable frames and lines w/o a frame like "<TASK>" or the registers
+        are not part of the frames.
+
+        This function fills:
+        * OOMResult.details["call_trace"] with the text of the call trace
+        * OOMResult.call_trace_frames with [<frame>] = (symbol, offset, module)
+        """
+        # strip "Call Trace" line at beginning and remove leading spaces
+        call_trace = ""
+        frames = []
+        rec = self.oom_result.kconfig.REC_CALL_TRACE_FRAME
+        block = self._extract_block_from_next_pos("Call Trace:")
+        for line in block.split("\n"):
+            if line.startswith("Call Trace"):
+                continue
+            line = line.strip()
+            call_trace += "{}\n".format(line)
+            match = rec.match(line)
+            if not match or match.group("unreliable"):
+                continue
+            frames.append(
+                (
+                    match.group("symbol"),
+                    # Transcrypt ignores the base, but converts "0x..." correctly
+                    int(match.group("offset"), 16),
+                    match.group("module"),
+                )
+            )
+        self.oom_result.details["call_trace"] = call_trace
+        self.oom_result.call_trace_frames = frames
+
+    def _extract_slab_unreclaimable(self):
+        """
+        Extract the memory usage of all unreclaimable slab caches
+
+        The section is parsed in a single pass up to the first line that isn't a
+        slab cache. The values are appended column by column to keep the table
+        small even with thousands of caches.
+
+        This function fills:
+        * OOMResult.slab_unreclaimable with [<column>][<row>] = str | int
+        """
+        names = []
+        used_kb = []
+        total_kb = []
+        self.oom_result.slab_unreclaimable = {
+            "name": names,
+            "used_kb": used_kb,
+            "total_kb": total_kb,
+        }
+        if not self.cursor.find_text(self.oom_result.kconfig.slab_unreclaimable_start):
+            return
+
+        rec = self.oom_result.kconfig.REC_SLAB_LINE
+        for line in self.cursor:
+            match = rec.match(line)
+            if not match:
+                # skip the header "Name  Used  Total"
+                if line.startswith("Name "):
+                    continue
+                break
+            names.append(match.group("name"))
+            used_kb.append(int(match.group("used_kb")))
+            total_kb.append(int(match.group("total_kb")))
+
+    def _extract_memcg_stats(self):
+        """
+        Extract the statistics of the memory cgroup
+
+        Newer kernels print one counter per line like memory.stat. Older kernels
+        print all counters in the first line and continue with the statistics of
+        all child cgroups. Only the statistics of the memory cgroup that hit its
+        limit are extracted.
+
+        This function fills:
+        * OOMResult.memcg_stats with [<counter>] = int
+        * OOMResult.details["memcg_name"] if not already set
+        """
+        self.oom_result.memcg_stats = {}
+        stats = self.oom_result.memcg_stats
+        if not self.cursor.find_text(self.oom_result.kconfig.memcg_stats_start):
+            return
+
+        match = self.oom_result.kconfig.REC_MEMCG_STATS_INLINE.match(
+            self.cursor.current()
+        )
+        if not match:
+            return
+        if not self.oom_result.details.get("memcg_name", None):
+            self.oom_result.details["memcg_name"] = match.group("memcg")
+        if match.group("stats"):
+            for token in match.group("stats").split():
+                name, value = token.split(":")
+                # int() truncates to 32 bits in JS
+                stats[name] = round(float(value[: len(value) - 2])) * 1024
+            return
+
+        rec = self.oom_result.kconfig.REC_MEMCG_STAT
+        for line in self.cursor:
+            match = rec.match(line)
+            if not match:
+                break
+            stats[match.group("name")] = round(float(match.group("value")))
 
     def _search_node_with_memory_shortage(self):
         """
@@ -3365,13 +3173,25 @@ class OOMAnalyser:
             if self.oom_result.details[item] is None:
                 self.oom_result.details[item] = "<not found>"
                 continue
+            if item.startswith("memcg_") and item.endswith("_kb"):
+                self.oom_result.details[item] = self._convert_memcg_kb_to_integer(
+                    item, self.oom_result.details[item]
+                )
+                continue
             if (
                 item.endswith("_bytes")
                 or item.endswith("_kb")
                 or item.endswith("_pages")
                 or item.endswith("_pid")
                 or item
-                in ["killed_proc_score", "trigger_proc_order", "trigger_proc_oomscore"]
+                in [
+                    "killed_proc_score",
+                    "trigger_proc_order",
+                    "trigger_proc_oomscore",
+                    "memcg_failcnt",
+                    "memcg_swap_failcnt",
+                    "memcg_kmem_failcnt",
+                ]
             ):
                 try:
                     self.oom_result.details[item] = int(self.oom_result.details[item])
@@ -3383,22 +3203,99 @@ class OOMAnalyser:
                     )
         # __pragma__ ('nojsiter')
 
+    def _convert_memcg_kb_to_integer(self, item, value):
+        """
+        Convert a memory cgroup value in kB to integer w/o truncation to 32 bits
+
+        Transcrypt converts int() to a 32-bit integer, but the limits of memory
+        cgroups exceed 32 bits. JavaScript numbers are exact up to 2^53.
+
+        @return: Value in kB or "unlimited" for PAGE_COUNTER_MAX
+        @rtype: int | str
+        """
+        try:
+            value = round(float(value))
+        except:
+            error('Converting item "{}={}" to integer failed'.format(item, value))
+            return value
+        if value >= self.oom_result.kconfig.PAGE_COUNTER_MAX_KB:
+            return "unlimited"
+        return value
+
+    def _get_memcg_limit(self):
+        """
+        Return the effective limit of the memory cgroup and the usage of this limit
+
+        The kernel calculates the effective limit in
+        mm/memcontrol.c:mem_cgroup_get_max():
+
+         * cgroup v1: min(memory limit + total swap, memory+swap limit)
+         * cgroup v2: memory limit + min(swap limit, total swap)
+
+        A memory cgroup OOM doesn't show the total swap space. Therefore, the
+        memory+swap limit is used for cgroup v1 and the sum of the memory and
+        the swap limit for cgroup v2. The memory limit is used if the
+        memory+swap or the swap limit isn't set. The kernel doesn't add swap
+        space to the limit of memory cgroups with swappiness 0.
+
+        @return: Limit and usage in kB or None, None for unlimited memory cgroups
+        @rtype: (int, int) | (None, None)
+        """
+        details = self.oom_result.details
+        limit_kb = details.get("memcg_limit_kb", None)
+        usage_kb = details.get("memcg_usage_kb", None)
+        swap_counter = details.get("memcg_swap_counter", None)
+        swap_limit_kb = details.get("memcg_swap_limit_kb", None)
+        # isinstance(limit, int) is false for numbers above 32 bits in JS
+        swap_limited = swap_limit_kb is not None and not isinstance(swap_limit_kb, str)
+        if swap_counter == "memory+swap" and swap_limited:
+            return swap_limit_kb, details["memcg_swap_usage_kb"]
+        if limit_kb is None or isinstance(limit_kb, str):
+            return None, None
+        if swap_counter == "swap" and swap_limited:
+            return limit_kb + swap_limit_kb, usage_kb + details["memcg_swap_usage_kb"]
+        return limit_kb, usage_kb
+
     def _convert_pstable_values_to_integer(self):
-        """Convert numeric values in process table to integer values"""
+        """
+        Convert numeric values in process table to integer values
+
+        The OOM badness score of each process is calculated in the same pass and
+        the processes with the highest scores are ranked.
+
+        This function fills:
+        * OOMResult.details["_pstable"][<pid>]["oom_badness"] = int | None
+        * OOMResult.details["_oom_badness_ranking"] = List(int)
+
+        @see: BaseKernelConfig.oom_badness(), _rank_oom_victims()
+        """
         ps = self.oom_result.details["_pstable"]
         ps_index = []
+        kconfig = self.oom_result.kconfig
+        page_size_kb = self.oom_result.details["page_size_kb"]
+        adj_factor = self._calc_oom_badness_adj_factor()
+        scores = []
+        # [badness, pid] of the processes with the highest scores, highest first
+        ranking = []
+        # lowest score in a full ranking
+        threshold = None
+        int_items = [
+            item
+            for item in kconfig.pstable_items
+            if item not in kconfig.pstable_non_ints
+        ]
         # TODO Check if transcrypt issue: pragma jsiter for the whole block "for pid_str in ps: ..."
         #      sets item in "for item in ['uid',..." to 0 instead of 'uid'
         #      jsiter is necessary to iterate over ps
-        for pid_str in ps.keys():
+        for pid_str in list(ps.keys()):
             converted = {}
             process = ps[pid_str]
-            for item in self.oom_result.kconfig.pstable_items:
-                if item in self.oom_result.kconfig.pstable_non_ints:
-                    continue
+            complete = True
+            for item in int_items:
                 try:
                     converted[item] = int(process[item])
                 except:
+                    complete = False
                     if item not in process:
                         pitem = "<not in process table>"
                     else:
@@ -3416,8 +3313,93 @@ class OOMAnalyser:
             ps[pid_int] = converted
             ps_index.append(pid_int)
 
+            if adj_factor is None or not complete:
+                continue
+            badness = kconfig.oom_badness(converted, adj_factor, page_size_kb)
+            converted["oom_badness"] = badness
+            if badness is None:
+                continue
+            scores.append(badness)
+            if threshold is not None and badness < threshold:
+                continue
+            # the kernel chooses the last process with the highest score
+            pos = len(ranking)
+            while pos > 0 and badness >= ranking[pos - 1][0]:
+                pos -= 1
+            ranking.insert(pos, [badness, pid_int])
+            if len(ranking) > OOM_BADNESS_RANKING_SIZE:
+                ranking.pop()
+            if len(ranking) == OOM_BADNESS_RANKING_SIZE:
+                threshold = ranking[OOM_BADNESS_RANKING_SIZE - 1][0]
+
         ps_index.sort(key=int)
         self.oom_result.details["_pstable_index"] = ps_index
+        self.oom_result.details["_oom_badness_ranking"] = [
+            pid for badness, pid in ranking
+        ]
+        self._rank_oom_victims(scores)
+
+    def _calc_oom_badness_adj_factor(self):
+        """
+        Return the factor to normalise oom_score_adj to pages or None
+
+        The factor is the number of RAM and swap pages divided by 1000. The
+        effective limit of a memory cgroup replaces the RAM and swap pages.
+        The total swap space isn't part of a memory cgroup OOM.
+
+        @rtype: int|None
+        @see: BaseKernelConfig.oom_badness(), _get_memcg_limit()
+        """
+        details = self.oom_result.details
+        if self.oom_result.oom_constraint == OOMConstraintType.memcg:
+            limit_kb, unused = self._get_memcg_limit()
+            if limit_kb is None:
+                return None
+            return limit_kb // details["page_size_kb"] // 1000
+        if "ram_pages" not in details:
+            return None
+        total_pages = details["ram_pages"]
+        if "swap_total_kb" in details:
+            total_pages += details["swap_total_kb"] // details["page_size_kb"]
+        return total_pages // 1000
+
+    def _rank_oom_victims(self, scores):
+        """
+        Compare the OOM badness score of the killed process with all other processes
+
+        Processes with the same score share the same rank.
+
+        This function fills:
+        * OOMResult.details["killed_proc_oom_badness"] = int
+        * OOMResult.details["killed_proc_oom_badness_rank"] = int
+        * OOMResult.details["expected_victim_pid"] = int
+        * OOMResult.details["expected_victim_name"] = str
+        * OOMResult.details["expected_victim_oom_badness"] = int
+        * OOMResult.oom_victim_expected
+
+        @param List(int) scores: OOM badness scores of all killable processes
+        """
+        details = self.oom_result.details
+        ps = details["_pstable"]
+        ranking = details["_oom_badness_ranking"]
+        self.oom_result.oom_victim_expected = None
+        if not ranking:
+            return
+
+        expected_pid = ranking[0]
+        kpid = details.get("killed_proc_pid", None)
+        if kpid in ps and ps[kpid].get("oom_badness", None) is not None:
+            killed_badness = ps[kpid]["oom_badness"]
+            rank = 1 + len([score for score in scores if score > killed_badness])
+            details["killed_proc_oom_badness"] = killed_badness
+            details["killed_proc_oom_badness_rank"] = rank
+            self.oom_result.oom_victim_expected = rank == 1
+            if rank == 1:
+                expected_pid = kpid
+
+        details["expected_victim_pid"] = expected_pid
+        details["expected_victim_name"] = ps[expected_pid]["name"]
+        details["expected_victim_oom_badness"] = ps[expected_pid]["oom_badness"]
 
     def _check_free_chunks(self, start_with_order, zone, node):
         """Check for at least one free chunk in the current or any higher order.
@@ -3429,22 +3411,22 @@ class OOMAnalyser:
         @param str zone: Memory zone
         @param int node: Node number
         @rtype: None|bool
+        @see: _calc_buddyinfo_values()
         """
         if not self.oom_result.buddyinfo:
             return None
-        buddyinfo = self.oom_result.buddyinfo
-        if zone not in buddyinfo:
+        if zone not in self.oom_result.buddyinfo:
+            return None
+        total_free_kb = self.oom_result.buddyinfo_total_free_kb[zone]
+        if node >= len(total_free_kb) or total_free_kb[node] is None:
             return None
+        if start_with_order >= self.oom_result.max_order:
+            return False
 
-        for order in range(start_with_order, self.oom_result.kconfig.MAX_ORDER):
-            if order not in buddyinfo[zone]:
-                break
-            if node not in buddyinfo[zone][order]:
-                return None
-            free_chunks = buddyinfo[zone][order][node]
-            if free_chunks:
-                return True
-        return False
+        # the kernel returns -1000, if a suitable chunk is free
+        return (
+            self.oom_result.fragmentation_index[zone][start_with_order][node] == -1000
+        )
 
     def _check_for_memory_fragmentation(self):
         """Check for heavy memory fragmentation. This means that the higher order has no free chunks.
@@ -3509,19 +3491,35 @@ class OOMAnalyser:
         if node is None:
             return
 
-        # the remaining code is similar to mm/page_alloc.c:__zone_watermark_ok()
-        # =======================================================================
+        self.oom_result.mem_alloc_failure = self._check_alloc_failure(
+            order, zone, zone, node
+        )
+
+    def _check_alloc_failure(self, order, highest_zone, zone, node):
+        """
+        Check why an allocation of the given order failed in a zone of a NUMA node
+
+        The code in this function is similar to mm/page_alloc.c:__zone_watermark_ok()
+
+        @param int order: Requested order
+        @param str highest_zone: Requested zone, its lowmem reserve is taken into account
+        @param str zone: Zone to check
+        @param int node: Node number
+        @rtype: int
+        @see: OOMMemoryAllocFailureType
+        """
+        watermark_info = self.oom_result.watermarks
 
         # calculation in kB and not in pages
         free_kb = watermark_info[zone][node]["free"]
-        highest_zoneidx = self.oom_result.kconfig.ZONE_TYPES.index(zone)
+        highest_zoneidx = self.oom_result.kconfig.ZONE_TYPES.index(highest_zone)
         lowmem_reserve = watermark_info[zone][node]["lowmem_reserve"]
         min_kb = watermark_info[zone][node]["low"]
 
         # reduce minimum watermark for high priority calls
         # ALLOC_HIGH == __GFP_HIGH
         gfp_mask_decimal = self.oom_result.details["_trigger_proc_gfp_mask_decimal"]
-        gfp_flag_high = self.oom_result.kconfig.GFP_FLAGS["__GFP_DMA"]["_value"]
+        gfp_flag_high = self.oom_result.kconfig.GFP_FLAGS["__GFP_HIGH"]["_value"]
         if (gfp_mask_decimal & gfp_flag_high) == gfp_flag_high:
             min_kb -= int(min_kb / 2)
 
@@ -3534,22 +3532,106 @@ class OOMAnalyser:
                 * self.oom_result.details["page_size_kb"]
             )
         ):
-            self.oom_result.mem_alloc_failure = (
-                OOMMemoryAllocFailureType.failed_below_low_watermark
-            )
-            return
+            return OOMMemoryAllocFailureType.failed_below_low_watermark
 
         # For a high-order request, check at least one suitable page is free
         if not self._check_free_chunks(order, zone, node):
-            self.oom_result.mem_alloc_failure = (
-                OOMMemoryAllocFailureType.failed_no_free_chunks
-            )
+            return OOMMemoryAllocFailureType.failed_no_free_chunks
+
+        return OOMMemoryAllocFailureType.failed_unknown_reason
+
+    def _analyse_all_nodes(self):
+        """
+        Evaluate the watermarks and the fragmentation of all zones and NUMA nodes
+
+        The allocation is checked in the requested zone and all lower zones,
+        because the kernel falls back to them. Other zones have None as
+        allocation result.
+
+        This function fills:
+        * OOMResult.node_table with one entry per node and zone
+        * OOMResult.memory_pressure
+        """
+        self.oom_result.node_table = []
+        self.oom_result.memory_pressure = OOMMemoryPressureType.unknown
+        watermark_info = self.oom_result.watermarks
+        if not watermark_info:
             return
 
-        self.oom_result.mem_alloc_failure = (
-            OOMMemoryAllocFailureType.failed_unknown_reason
+        details = self.oom_result.details
+        kconfig = self.oom_result.kconfig
+        requested_zone = details.get("trigger_proc_mem_zone", None)
+        order = details.get("trigger_proc_order", None)
+        check_alloc = (
+            self.oom_result.oom_type == OOMEntityType.automatic
+            and requested_zone in kconfig.ZONE_TYPES
+            and order is not None
+            and order <= kconfig.PAGE_ALLOC_COSTLY_ORDER
+            and self.oom_result.max_order > 0
         )
 
+        zones = []
+        nodes = []
+        for zone in list(watermark_info.keys()):
+            zones.append(zone)
+            # __pragma__ ('jsiter')
+            for node in watermark_info[zone]:
+                if int(node) not in nodes:
+                    nodes.append(int(node))
+            # __pragma__ ('nojsiter')
+        nodes.sort()
+
+        nodes_below_min = []
+        nodes_with_zone = []
+        for node in nodes:
+            for zone in zones:
+                if node not in watermark_info[zone]:
+                    continue
+                levels = watermark_info[zone][node]
+                entry = {
+                    "node": node,
+                    "zone": zone,
+                    "free_kb": levels["free"],
+                    "min_kb": levels["min"],
+                    "low_kb": levels["low"],
+                    "high_kb": levels["high"],
+                    "below_min": levels["free"] < levels["min"],
+                    "mem_alloc_failure": None,
+                    "mem_fragmented": None,
+                    "fragmentation_index": None,
+                }
+                free_chunks = self._check_free_chunks(
+                    kconfig.PAGE_ALLOC_COSTLY_ORDER, zone, node
+                )
+                if free_chunks is not None:
+                    entry["mem_fragmented"] = not free_chunks
+                if (
+                    check_alloc
+                    and zone in kconfig.ZONE_TYPES
+                    and kconfig.ZONE_TYPES.index(zone)
+                    <= kconfig.ZONE_TYPES.index(requested_zone)
+                ):
+                    entry["mem_alloc_failure"] = self._check_alloc_failure(
+                        order, requested_zone, zone, node
+                    )
+                    if free_chunks is not None and order < self.oom_result.max_order:
+                        fragmentation_index = self.oom_result.fragmentation_index[zone]
+                        entry["fragmentation_index"] = fragmentation_index[order][node]
+                if zone == requested_zone:
+                    nodes_with_zone.append(node)
+                    if entry["below_min"]:
+                        nodes_below_min.append(node)
+                self.oom_result.node_table.append(entry)
+
+        if not nodes_with_zone:
+            return
+        if not nodes_below_min:
+            self.oom_result.memory_pressure = OOMMemoryPressureType.no_shortage
+        elif len(nodes_below_min) == len(nodes_with_zone):
+            self.oom_result.memory_pressure = OOMMemoryPressureType.all_nodes
+        else:
+            self.oom_result.memory_pressure = OOMMemoryPressureType.node_local
+
     def _calc_pstable_values(self):
         """Set additional notes to processes listed in the process table"""
         tpid = self.oom_result.details["trigger_proc_pid"]
@@ -3563,6 +3645,15 @@ class OOMAnalyser:
         if kpid in self.oom_result.details["_pstable"]:
             self.oom_result.details["_pstable"][kpid]["notes"] = "killed process"
 
+        epid = self.oom_result.details.get("expected_victim_pid", None)
+        if epid is not None and epid != kpid:
+            notes = self.oom_result.details["_pstable"][epid]["notes"]
+            if notes:
+                notes += ", "
+            self.oom_result.details["_pstable"][epid]["notes"] = (
+                notes + "expected OOM victim"
+            )
+
     def _calc_trigger_process_values(self):
         """Calculate all values related with the trigger process"""
         self.oom_result.details["trigger_proc_requested_memory_pages"] = (
@@ -3585,17 +3676,41 @@ class OOMAnalyser:
         self.oom_result.details["trigger_proc_mem_zone"] = zone
 
     def _calc_killed_process_values(self):
-        """Calculate all values related with the killed process"""
+        """
+        Calculate all values related with the killed process
+
+        The RSS of the killed process is set in relation to the effective
+        limit of a memory cgroup or to the total RAM otherwise.
+        """
         self.oom_result.details["killed_proc_total_rss_kb"] = (
             self.oom_result.details["killed_proc_anon_rss_kb"]
             + self.oom_result.details["killed_proc_file_rss_kb"]
             + self.oom_result.details["killed_proc_shmem_rss_kb"]
         )
 
+        if self.oom_result.oom_constraint == OOMConstraintType.memcg:
+            total_kb, unused = self._get_memcg_limit()
+            if total_kb is None:
+                return
+        else:
+            total_kb = self.oom_result.details["system_total_ram_kb"]
         self.oom_result.details["killed_proc_rss_percent"] = int(
-            100
-            * self.oom_result.details["killed_proc_total_rss_kb"]
-            / int(self.oom_result.details["system_total_ram_kb"])
+            100 * self.oom_result.details["killed_proc_total_rss_kb"] / int(total_kb)
+        )
+
+    def _calc_memcg_values(self):
+        """
+        Calculate all values related with the memory cgroup
+
+        The usage is set in relation to the effective limit.
+
+        @see: _get_memcg_limit()
+        """
+        limit_kb, usage_kb = self._get_memcg_limit()
+        if limit_kb is None:
+            return
+        self.oom_result.details["memcg_usage_percent"] = int(
+            100 * usage_kb / max(limit_kb, 1)
         )
 
     def _calc_swap_values(self):
@@ -3624,7 +3739,12 @@ class OOMAnalyser:
         )
 
     def _calc_system_values(self):
-        """Calculate system memory"""
+        """
+        Calculate system memory
+
+        The huge page pools are reserved and not part of the RSS of any process.
+        Therefore, they are added to the used memory.
+        """
 
         # calculate remaining explanation values
         self.oom_result.details["system_total_ram_kb"] = (
@@ -3649,8 +3769,21 @@ class OOMAnalyser:
             total_rss_pages += int(
                 self.oom_result.details["_pstable"][pid]["rss_pages"]
             )
+
+        hugepages_total_kb = 0
+        hugepages_free_kb = 0
+        for entry in self.oom_result.hugepages:
+            hugepages_total_kb += entry["total"] * entry["size_kb"]
+            hugepages_free_kb += entry["free"] * entry["size_kb"]
+        self.oom_result.details["hugepages_total_kb"] = hugepages_total_kb
+        self.oom_result.details["hugepages_free_kb"] = hugepages_free_kb
+        self.oom_result.details["hugepages_used_kb"] = (
+            hugepages_total_kb - hugepages_free_kb
+        )
+
         self.oom_result.details["system_total_ram_used_kb"] = (
             total_rss_pages * self.oom_result.details["page_size_kb"]
+            + hugepages_total_kb
         )
 
         self.oom_result.details["system_total_used_percent"] = int(
@@ -3659,6 +3792,138 @@ class OOMAnalyser:
             / self.oom_result.details["system_total_ram_kb"]
         )
 
+    def _calc_slab_values(self):
+        """
+        Summarise the unreclaimable slab caches and rank the largest ones
+
+        The share of RAM is the memory used by all caches in percent of the
+        total RAM.
+
+        This function fills:
+        * OOMResult.details["slab_unreclaimable_caches"] = int
+        * OOMResult.details["slab_unreclaimable_caches_used_kb"] = int
+        * OOMResult.details["slab_unreclaimable_caches_total_kb"] = int
+        * OOMResult.details["slab_unreclaimable_ram_percent"] = int
+        * OOMResult.details["_slab_unreclaimable_ranking"] = List(int)
+
+        @see: _extract_slab_unreclaimable()
+        """
+        total_kb = self.oom_result.slab_unreclaimable["total_kb"]
+        if not total_kb:
+            return
+
+        # [total_kb, index] of the largest caches, largest first
+        ranking = []
+        # smallest cache in a full ranking
+        threshold = None
+        for index in range(len(total_kb)):
+            size = total_kb[index]
+            if threshold is not None and size <= threshold:
+                continue
+            pos = len(ranking)
+            while pos > 0 and size > ranking[pos - 1][0]:
+                pos -= 1
+            ranking.insert(pos, [size, index])
+            if len(ranking) > SLAB_RANKING_SIZE:
+                ranking.pop()
+            if len(ranking) == SLAB_RANKING_SIZE:
+                threshold = ranking[SLAB_RANKING_SIZE - 1][0]
+
+        details = self.oom_result.details
+        details["slab_unreclaimable_caches"] = len(total_kb)
+        details["slab_unreclaimable_caches_used_kb"] = sum(
+            self.oom_result.slab_unreclaimable["used_kb"]
+        )
+        details["slab_unreclaimable_caches_total_kb"] = sum(total_kb)
+        details["slab_unreclaimable_ram_percent"] = int(
+            100
+            * details["slab_unreclaimable_caches_total_kb"]
+            / details["system_total_ram_kb"]
+        )
+        details["_slab_unreclaimable_ranking"] = [index for size, index in ranking]
+
+    def _calc_memory_accounting(self):
+        """
+        Break the physical memory down into buckets and calculate the unaccounted rest
+
+        The breakdown is based on the Mem-Info counters and not on the process
+        table, because the RSS counts shared and file-backed pages multiple
+        times. Shared memory and the swap cache are part of the anonymous LRU
+        lists as well as of the page cache. Therefore, both are subtracted from
+        the anonymous memory and the swap cache is subtracted from the page cache.
+
+        The unaccounted memory contains e.g. kernel stacks, vmalloc and per-CPU
+        allocations, memory allocated directly from the page allocator by drivers
+        and anonymous memory on the unevictable LRU list. A large unaccounted
+        rest can be a sign of a kernel memory leak. The value can be negative,
+        because the counters aren't taken atomically.
+
+        This function fills:
+        * OOMResult.details["accounted_<bucket>_kb"] = int
+        * OOMResult.details["unaccounted_kb"] = int
+        * OOMResult.details["unaccounted_percent"] = int
+
+        @see: MEMORY_ACCOUNTING_BUCKETS
+        """
+        details = self.oom_result.details
+        page_size_kb = details["page_size_kb"]
+
+        def pages(item):
+            value = details.get(item, 0)
+            if isinstance(value, int):
+                return value
+            return 0
+
+        if self.oom_result.swap_active:
+            swap_cache = details["swap_cache_kb"] // page_size_kb
+        else:
+            swap_cache = pages("swap_cache_pages")
+        anon = (
+            pages("active_anon_pages")
+            + pages("inactive_anon_pages")
+            + pages("isolated_anon_pages")
+        )
+        accounted = {
+            "user": max(anon - pages("shmem_pages") - swap_cache, 0),
+            "page_cache": max(pages("pagecache_total_pages") - swap_cache, 0),
+            "swap_cache": swap_cache,
+            "slab": pages("slab_reclaimable_pages") + pages("slab_unreclaimable_pages"),
+            "page_tables": pages("pagetables_pages"),
+            "hugepages": details["hugepages_total_kb"] // page_size_kb,
+            "free": pages("free_pages") + pages("free_pcp_pages"),
+            "reserved": pages("reserved_pages"),
+        }
+
+        unaccounted_kb = details["system_total_ram_kb"]
+        for bucket in MEMORY_ACCOUNTING_BUCKETS:
+            value_kb = accounted[bucket] * page_size_kb
+            details["accounted_{}_kb".format(bucket)] = value_kb
+            unaccounted_kb -= value_kb
+        details["unaccounted_kb"] = unaccounted_kb
+        details["unaccounted_percent"] = int(
+            100 * unaccounted_kb / details["system_total_ram_kb"]
+        )
+
+    def _calc_buddyinfo_values(self):
+        """
+        Calculate the free memory and the fragmentation index of all zones, orders and nodes
+
+        This function fills:
+        * OOMResult.buddyinfo_free_kb with [<zone>][<order>][<node>] = <free memory in kB>
+        * OOMResult.fragmentation_index with [<zone>][<order>][<node>] = <index * 1000>
+
+        @see: calc_buddyinfo_metrics()
+        """
+        self.oom_result.buddyinfo_free_kb = {}
+        self.oom_result.fragmentation_index = {}
+        for zone in list(self.oom_result.buddyinfo.keys()):
+            free_kb, fragmentation_index = calc_buddyinfo_metrics(
+                self.oom_result.buddyinfo[zone],
+                self.oom_result.details["page_size_kb"],
+            )
+            self.oom_result.buddyinfo_free_kb[zone] = free_kb
+            self.oom_result.fragmentation_index[zone] = fragmentation_index
+
     def _determinate_platform_and_distribution(self):
         """Determinate platform and distribution"""
         kernel_version = self.oom_result.details.get("kernel_version", "")
@@ -3669,7 +3934,7 @@ class OOMAnalyser:
             self.oom_result.details["platform"] = "unknown"
 
         dist = "unknown"
-        if distribution is not None:
+        if distribution not in [None, "<not found>"]:
             # this should work on openSUSE
             dist = distribution
         elif ".el7uek" in kernel_version:
@@ -3697,13 +3962,24 @@ class OOMAnalyser:
         self._calc_pstable_values()
 
         self._determinate_platform_and_distribution()
-        self._calc_swap_values()
-        self._calc_system_values()
+        memcg = self.oom_result.oom_constraint == OOMConstraintType.memcg
+        if memcg:
+            self._calc_memcg_values()
+        else:
+            self._calc_swap_values()
+            self._calc_system_values()
+            self._calc_slab_values()
+            self._calc_memory_accounting()
+            self._calc_buddyinfo_values()
         self._calc_trigger_process_values()
         self._calc_killed_process_values()
+        # the memory shortage is limited to the memory cgroup
+        if memcg:
+            return
         self._search_node_with_memory_shortage()
         self._analyse_alloc_failure()
         self._check_for_memory_fragmentation()
+        self._analyse_all_nodes()
 
     def analyse(self):
         """
@@ -3727,6 +4003,7 @@ class OOMAnalyser:
             error(self.oom_result.error_msg)
             return False
 
+        self._identify_oom_constraint()
         self._extract_from_oom_text()
         self._calc_from_oom_details()
         self.oom_result.oom_text = self.oom_entity.text
@@ -3734,6 +4011,190 @@ class OOMAnalyser:
         return True
 
 
+class OOMAnalyserProfiler(OOMAnalyser):
+    """
+    Analyse an OOM object and measure the wall time of all analysis stages
+
+    The allocated memory is measured too, if profile_memory_usage is set. The results are stored in
+    OOMResult.profile. Nested stages like _extract_pstable() are part of the outer stage _extract_from_oom_text().
+
+    The plain OOMAnalyser stays free of any measurement overhead.
+
+    @see: OOMResult.profile, profile_memory_usage
+    """
+
+    _depth = 0
+    """Nesting depth of the currently measured stage"""
+
+    def __init__(self, oom):
+        super().__init__(oom)
+        self.oom_result.profile = []
+        self._depth = 0
+
+    def _measure(self, name, stage):
+        """
+        Call the stage and record its wall time and allocated memory
+
+        @param str name: Stage name
+        @param stage: Unbound method of OOMAnalyser
+        @return: Return value of the stage
+        """
+        entry = {
+            "stage": name,
+            "depth": self._depth,
+            "duration_ms": 0,
+            "allocated_kb": None,
+        }
+        self.oom_result.profile.append(entry)
+        self._depth += 1
+        mem_start = 0
+        if profile_memory_usage:
+            mem_start = profile_memory_usage()
+        start = performance.now()
+        result = stage(self)
+        entry["duration_ms"] = performance.now() - start
+        if profile_memory_usage:
+            entry["allocated_kb"] = (profile_memory_usage() - mem_start) // 1024
+        self._depth -= 1
+        return result
+
+    def analyse(self):
+        return self._measure("analyse", OOMAnalyser.analyse)
+
+    def _check_for_empty_oom(self):
+        return self._measure("_check_for_empty_oom", OOMAnalyser._check_for_empty_oom)
+
+    def _identify_kernel_version(self):
+        return self._measure(
+            "_identify_kernel_version", OOMAnalyser._identify_kernel_version
+        )
+
+    def _choose_kernel_config(self):
+        return self._measure("_choose_kernel_config", OOMAnalyser._choose_kernel_config)
+
+    def _check_for_complete_oom(self):
+        return self._measure(
+            "_check_for_complete_oom", OOMAnalyser._check_for_complete_oom
+        )
+
+    def _identify_oom_constraint(self):
+        return self._measure(
+            "_identify_oom_constraint", OOMAnalyser._identify_oom_constraint
+        )
+
+    def _extract_from_oom_text(self):
+        return self._measure(
+            "_extract_from_oom_text", OOMAnalyser._extract_from_oom_text
+        )
+
+    def _extract_page_size(self):
+        return self._measure("_extract_page_size", OOMAnalyser._extract_page_size)
+
+    def _extract_pstable(self):
+        return self._measure("_extract_pstable", OOMAnalyser._extract_pstable)
+
+    def _extract_gpf_mask(self):
+        return self._measure("_extract_gpf_mask", OOMAnalyser._extract_gpf_mask)
+
+    def _extract_buddyinfo(self):
+        return self._measure("_extract_buddyinfo", OOMAnalyser._extract_buddyinfo)
+
+    def _extract_hugepages(self):
+        return self._measure("_extract_hugepages", OOMAnalyser._extract_hugepages)
+
+    def _extract_watermarks(self):
+        return self._measure("_extract_watermarks", OOMAnalyser._extract_watermarks)
+
+    def _extract_memcg_stats(self):
+        return self._measure("_extract_memcg_stats", OOMAnalyser._extract_memcg_stats)
+
+    def _extract_call_trace(self):
+        return self._measure("_extract_call_trace", OOMAnalyser._extract_call_trace)
+
+    def _extract_slab_unreclaimable(self):
+        return self._measure(
+            "_extract_slab_unreclaimable", OOMAnalyser._extract_slab_unreclaimable
+        )
+
+    def _calc_from_oom_details(self):
+        return self._measure(
+            "_calc_from_oom_details", OOMAnalyser._calc_from_oom_details
+        )
+
+    def _convert_numeric_results_to_integer(self):
+        return self._measure(
+            "_convert_numeric_results_to_integer",
+            OOMAnalyser._convert_numeric_results_to_integer,
+        )
+
+    def _convert_pstable_values_to_integer(self):
+        return self._measure(
+            "_convert_pstable_values_to_integer",
+            OOMAnalyser._convert_pstable_values_to_integer,
+        )
+
+    def _calc_pstable_values(self):
+        return self._measure("_calc_pstable_values", OOMAnalyser._calc_pstable_values)
+
+    def _determinate_platform_and_distribution(self):
+        return self._measure(
+            "_determinate_platform_and_distribution",
+            OOMAnalyser._determinate_platform_and_distribution,
+        )
+
+    def _calc_memcg_values(self):
+        return self._measure("_calc_memcg_values", OOMAnalyser._calc_memcg_values)
+
+    def _calc_swap_values(self):
+        return self._measure("_calc_swap_values", OOMAnalyser._calc_swap_values)
+
+    def _calc_system_values(self):
+        return self._measure("_calc_system_values", OOMAnalyser._calc_system_values)
+
+    def _calc_slab_values(self):
+        return self._measure("_calc_slab_values", OOMAnalyser._calc_slab_values)
+
+    def _calc_memory_accounting(self):
+        return self._measure(
+            "_calc_memory_accounting", OOMAnalyser._calc_memory_accounting
+        )
+
+    def _calc_trigger_process_values(self):
+        return self._measure(
+            "_calc_trigger_process_values", OOMAnalyser._calc_trigger_process_values
+        )
+
+    def _calc_killed_process_values(self):
+        return self._measure(
+            "_calc_killed_process_values", OOMAnalyser._calc_killed_process_values
+        )
+
+    def _search_node_with_memory_shortage(self):
+        return self._measure(
+            "_search_node_with_memory_shortage",
+            OOMAnalyser._search_node_with_memory_shortage,
+        )
+
+    def _analyse_alloc_failure(self):
+        return self._measure(
+            "_analyse_alloc_failure", OOMAnalyser._analyse_alloc_failure
+        )
+
+    def _calc_buddyinfo_values(self):
+        return self._measure(
+            "_calc_buddyinfo_values", OOMAnalyser._calc_buddyinfo_values
+        )
+
+    def _analyse_all_nodes(self):
+        return self._measure("_analyse_all_nodes", OOMAnalyser._analyse_all_nodes)
+
+    def _check_for_memory_fragmentation(self):
+        return self._measure(
+            "_check_for_memory_fragmentation",
+            OOMAnalyser._check_for_memory_fragmentation,
+        )
+
+
 class SVGChart:
     """
     Creates a horizontal stacked bar chart with a legend underneath.
@@ -4479,13 +4940,22 @@ class OOMDisplay:
             element.removeChild(element.firstChild)
 
         # remove svg charts
-        for element_id in ("svg_swap", "svg_ram"):
+        for element_id in ("svg_swap", "svg_ram", "svg_accounting", "memcg_stats"):
             element = document.getElementById(element_id)
             while element.firstChild:
                 element.removeChild(element.firstChild)
 
         self._clear_pstable()
 
+        for element_id in (
+            "node_table_content",
+            "hugepages_table_content",
+            "slab_table_content",
+        ):
+            element = document.getElementById(element_id)
+            while element.firstChild:
+                element.removeChild(element.firstChild)
+
     def _clear_pstable(self):
         """Clear process table"""
         element = document.getElementById("pstable_content")
@@ -4539,14 +5009,35 @@ class OOMDisplay:
         # set defaults and clear notifications
         self.set_html_defaults()
 
-        analyser = OOMAnalyser(self.oom)
+        if DEBUG:
+            analyser = OOMAnalyserProfiler(self.oom)
+        else:
+            analyser = OOMAnalyser(self.oom)
         success = analyser.analyse()
+        if DEBUG:
+            self._show_profile(analyser.oom_result.profile)
         if success:
             self.oom_result = analyser.oom_result
             self.show_oom_details()
             scroll(0,0)
 #            self.update_toc()
 
+    def _show_profile(self, profile):
+        """
+        Show the time and the allocated memory of all analysis stages in the notification box
+
+        @type profile: List(dict)
+        """
+        for entry in profile:
+            # string multiplication needs Transcrypt operator overloading
+            indent = "  " * entry["depth"]  # __:opov
+            msg = "Profile: {}{} {} ms".format(
+                indent, entry["stage"], round(entry["duration_ms"], 3)
+            )
+            if entry["allocated_kb"] is not None:
+                msg += " {} kB".format(entry["allocated_kb"])
+            debug(msg)
+
     def load_from_form(self):
         """
         Return the OOM text from textarea element
@@ -4562,10 +5053,18 @@ class OOMDisplay:
         Show all extracted details as well as additionally generated information
         """
         self._show_items()
-        self._show_swap_usage()
-        self._show_ram_usage()
+        if self.oom_result.oom_constraint == OOMConstraintType.memcg:
+            self._show_memcg()
+        else:
+            self._show_swap_usage()
+            self._show_ram_usage()
+            self._show_memory_accounting()
         self._show_alloc_failure()
         self._show_memory_fragmentation()
+        self._show_memory_pressure()
+        self._show_hugepages()
+        self._show_oom_victims()
+        self._show_slab_table()
         self._show_page_size()
 
         # generate process table
@@ -4609,6 +5108,153 @@ class OOMDisplay:
         if self.oom_result.details["trigger_proc_numa_node"] is None:
             hide_elements(".js-memory-shortage-node--hide")
 
+    def _show_memory_pressure(self):
+        """Show the memory pressure and the table of all NUMA nodes"""
+        pressure = self.oom_result.memory_pressure
+        if pressure == OOMMemoryPressureType.unknown:
+            return
+        show_elements(".js-memory-pressure--show")
+        if pressure == OOMMemoryPressureType.no_shortage:
+            show_elements(".js-memory-pressure-no-shortage--show")
+        elif pressure == OOMMemoryPressureType.node_local:
+            show_elements(".js-memory-pressure-node-local--show")
+        elif pressure == OOMMemoryPressureType.all_nodes:
+            show_elements(".js-memory-pressure-all-nodes--show")
+        self._show_node_table()
+
+    def _show_node_table(self):
+        """Create and show the table with the memory details of all NUMA nodes"""
+        alloc_failure_text = {
+            OOMMemoryAllocFailureType.missing_data: "missing data",
+            OOMMemoryAllocFailureType.failed_below_low_watermark: "below low watermark",
+            OOMMemoryAllocFailureType.failed_no_free_chunks: "no free chunks",
+            OOMMemoryAllocFailureType.failed_unknown_reason: "no shortage found",
+        }
+        new_table = ""
+        for entry in self.oom_result.node_table:
+            if entry["below_min"] and entry["zone"] == self.oom_result.details.get(
+                "trigger_proc_mem_zone", None
+            ):
+                css_class = 'class="js-pstable__killedproc--bgcolor"'
+            else:
+                css_class = ""
+            line = """
+            <tr {}>
+                <td>{}</td>
+                <td>{}</td>
+                <td>{}&nbsp;kBytes</td>
+                <td>{}&nbsp;kBytes</td>
+                <td>{}&nbsp;kBytes</td>
+                <td>{}&nbsp;kBytes</td>
+                <td>{}</td>
+                <td>{}</td>
+                <td>{}</td>
+                <td>{}</td>
+            </tr>
+            """.format(
+                css_class,
+                entry["node"],
+                entry["zone"],
+                entry["free_kb"],
+                entry["min_kb"],
+                entry["low_kb"],
+                entry["high_kb"],
+                "yes" if entry["below_min"] else "no",
+                alloc_failure_text.get(entry["mem_alloc_failure"], "-"),
+                "-"
+                if entry["mem_fragmented"] is None
+                else ("yes" if entry["mem_fragmented"] else "no"),
+                "-"
+                if entry["fragmentation_index"] is None
+                else entry["fragmentation_index"],
+            )
+            new_table += line
+
+        table_content = document.getElementById("node_table_content")
+        table_content.innerHTML = new_table
+
+    def _show_hugepages(self):
+        """Create and show the table with the huge page pools of all NUMA nodes"""
+        if not self.oom_result.details.get("hugepages_total_kb", 0):
+            return
+        show_elements(".js-hugepages--show")
+
+        new_table = ""
+        for entry in self.oom_result.hugepages:
+            line = """
+            <tr>
+                <td>{}</td>
+                <td>{}&nbsp;kBytes</td>
+                <td>{}</td>
+                <td>{}</td>
+                <td>{}</td>
+                <td>{}&nbsp;kBytes</td>
+            </tr>
+            """.format(
+                entry["node"],
+                entry["size_kb"],
+                entry["total"],
+                entry["free"],
+                entry["surp"],
+                entry["total"] * entry["size_kb"],
+            )
+            new_table += line
+
+        table_content = document.getElementById("hugepages_table_content")
+        table_content.innerHTML = new_table
+
+    def _show_oom_victims(self):
+        """Show the expected OOM victim and the next victims"""
+        ranking = self.oom_result.details.get("_oom_badness_ranking", [])
+        if not ranking:
+            return
+        show_elements(".js-oom-badness--show")
+        if self.oom_result.oom_victim_expected is True:
+            show_elements(".js-oom-victim-expected--show")
+        elif self.oom_result.oom_victim_expected is False:
+            show_elements(".js-oom-victim-unexpected--show")
+
+        ps = self.oom_result.details["_pstable"]
+        kpid = self.oom_result.details.get("killed_proc_pid", None)
+        victims = [
+            "&quot;{}&quot; (PID {}, {} points)".format(
+                escape_html(ps[pid]["name"]), pid, ps[pid]["oom_badness"]
+            )
+            for pid in ranking
+            if pid != kpid
+        ]
+        element = document.getElementById("next_oom_victims")
+        element.innerHTML = ", ".join(victims[:3])
+
+    def _show_slab_table(self):
+        """Create and show the table with the largest unreclaimable slab caches"""
+        ranking = self.oom_result.details.get("_slab_unreclaimable_ranking", [])
+        if not ranking:
+            return
+        show_elements(".js-slab-unreclaimable--show")
+
+        slab = self.oom_result.slab_unreclaimable
+        total_ram_kb = self.oom_result.details["system_total_ram_kb"]
+        new_table = ""
+        for index in ranking:
+            line = """
+            <tr>
+                <td>{}</td>
+                <td>{}&nbsp;kBytes</td>
+                <td>{}&nbsp;kBytes</td>
+                <td>{}&nbsp;%</td>
+            </tr>
+            """.format(
+                escape_html(slab["name"][index]),
+                slab["used_kb"][index],
+                slab["total_kb"][index],
+                int(100 * slab["total_kb"][index] / total_ram_kb),
+            )
+            new_table += line
+
+        table_content = document.getElementById("slab_table_content")
+        table_content.innerHTML = new_table
+
     def _show_page_size(self):
         """Show page size"""
         if self.oom_result.details.get("_page_size_guessed", True):
@@ -4649,6 +5295,41 @@ class OOMDisplay:
         elem_svg_ram = document.getElementById("svg_ram")
         elem_svg_ram.appendChild(svg_ram)
 
+    def _show_memcg(self):
+        """Show the memory cgroup and hide the system-wide memory usage"""
+        show_elements(".js-memcg--show")
+        hide_elements(".js-memcg--hide")
+        stats = self.oom_result.memcg_stats
+        element = document.getElementById("memcg_stats")
+        element.textContent = "\n".join(
+            ["{} {}".format(name, stats[name]) for name in stats.keys()]
+        )
+
+    def _show_memory_accounting(self):
+        """Generate memory accounting diagram"""
+        if "unaccounted_kb" not in self.oom_result.details:
+            return
+        show_elements(".js-memory-accounting--show")
+        accounting_title_attr = (
+            ("User processes", "accounted_user_kb"),
+            ("Page cache", "accounted_page_cache_kb"),
+            ("Swap cache", "accounted_swap_cache_kb"),
+            ("Slab", "accounted_slab_kb"),
+            ("Page tables", "accounted_page_tables_kb"),
+            ("Huge pages", "accounted_hugepages_kb"),
+            ("Free", "accounted_free_kb"),
+            ("Reserved", "accounted_reserved_kb"),
+            ("Unaccounted", "unaccounted_kb"),
+        )
+        chart_elements = [
+            (title, self.oom_result.details[value])
+            for title, value in accounting_title_attr
+        ]
+        svg = SVGChart()
+        svg_accounting = svg.generate_chart("Memory Accounting", *chart_elements)
+        elem_svg_accounting = document.getElementById("svg_accounting")
+        elem_svg_accounting.appendChild(svg_accounting)
+
     def _show_swap_usage(self):
         """Show/hide swap space and generate usage diagram"""
         if self.oom_result.swap_active:
@@ -4762,3 +5443,6 @@ class OOMDisplay:
 
 
 OOMDisplayInstance = OOMDisplay()
+
+# mark the end of the initialisation to measure the time to interactive
+performance.mark("OOMAnalyser-ready")
@@ -0,0 +1,639 @@
+# -*- coding: Latin-1 -*-
+#
+# Linux OOMAnalyser - benchmark suite
+#
+# Copyright (c) 2017-2023 Carsten Grohmann
+# License: MIT (see LICENSE.txt)
+# THIS PROGRAM COMES WITH NO WARRANTY
+"""
+Benchmark the OOM analysis w/o a browser.
+
+This module is not translated to JavaScript. It generates synthetic but
+realistic OOM blocks for all kernel configurations, scales the size of the
+process table, the number of NUMA nodes and the log prefix format and measures
+the time to create the OOMEntity as well as every stage of
+OOMAnalyser.analyse() with OOMAnalyser.OOMAnalyserProfiler. The memory held by
+a single OOMResult and OOMAnalyserCLI.CompactResult is reported too. The
+results are written as JSON to compare them between versions.
+"""
+
+import argparse
+import fnmatch
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+import OOMAnalyser
+import OOMAnalyserCLI
+
+LOG_PREFIXES = {
+    "none": lambda uptime: "",
+    "dmesg": lambda uptime: "[{:12.6f}] ".format(uptime),
+    "dmesg -T": lambda uptime: "[Sun Oct  1 12:00:00 2023] ",
+    "short": lambda uptime: "Oct 01 12:00:00 myhost kernel: ",
+    "short-iso": lambda uptime: "2023-10-01T12:00:00+0200 myhost kernel: ",
+    "RFC5424": lambda uptime: "<6>1 2023-10-01T12:00:00.{:06d}+02:00 myhost kernel - - - ".format(
+        int(uptime * 1000000) % 1000000
+    ),
+}
+"""
+Functions to create the log prefix for a line
+
+@type: Dict(str, function)
+"""
+
+PAGES_PER_NODE = 2097152
+"""Number of 4kB pages per NUMA node (8 GB)"""
+
+
+class SyntheticOOM:
+    """Generate a synthetic but realistic OOM block for a kernel configuration"""
+
+    kconfig = None
+    """Kernel configuration to generate the OOM for"""
+
+    nr_nodes = 1
+    """Number of NUMA nodes"""
+
+    nr_processes = 100
+    """Number of processes in the process table"""
+
+    nr_orders = 11
+    """Number of orders in the buddyinfo (MAX_ORDER)"""
+
+    prefix = "dmesg"
+    """Log prefix format, one of LOG_PREFIXES"""
+
+    def __init__(
+        self,
+        kconfig,
+        nr_processes=100,
+        nr_nodes=1,
+        prefix="dmesg",
+        seed=0,
+        nr_orders=11,
+    ):
+        """
+        @type kconfig: OOMAnalyser.BaseKernelConfig
+        @param int nr_processes: Number of processes in the process table
+        @param int nr_nodes: Number of NUMA nodes
+        @param str prefix: Log prefix format, one of LOG_PREFIXES
+        @param int seed: Seed for the random values to generate reproducible OOMs
+        @param int nr_orders: Number of orders in the buddyinfo (MAX_ORDER)
+        """
+        self.kconfig = kconfig
+        self.nr_processes = nr_processes
+        self.nr_nodes = nr_nodes
+        self.nr_orders = nr_orders
+        self.prefix = prefix
+        self._random = random.Random(seed)
+        self._uptime = 5907.004253
+        self._lines = []
+
+    @property
+    def version(self):
+        """Major and minor kernel version"""
+        return self.kconfig.release[0], self.kconfig.release[1]
+
+    def kernel_version(self):
+        """
+        Return a kernel version string matching the configuration
+
+        @rtype: str
+        """
+        major, minor, suffix = self.kconfig.release
+        if suffix == ".el7.":
+            return "{}.{}.0-1160.el7.x86_64".format(major, minor)
+        return "{}.{}.0-1-default".format(major, minor)
+
+    def _add(self, line, continuation=False):
+        """Add a line with the log prefix"""
+        prefix = LOG_PREFIXES[self.prefix](self._uptime)
+        if continuation and prefix:
+            # dmesg and journalctl indent continuation lines of multi-line messages
+            prefix = " " * len(prefix)
+        self._lines.append(prefix + line)
+        self._uptime += 0.000001
+
+    def _add_header(self, trigger_pid, trigger_name):
+        gfp_mask = self.kconfig.GFP_FLAGS["GFP_HIGHUSER_MOVABLE"]["_value"]
+        nodemask = "nodemask=(null), " if self.version >= (4, 8) else ""
+        self._add(
+            "{} invoked oom-killer: gfp_mask={}(GFP_HIGHUSER_MOVABLE), {}order=0, "
+            "oom_score_adj=0".format(trigger_name, hex(gfp_mask), nodemask)
+        )
+        if self.version < (5, 0):
+            # later kernels show mems_allowed in the "oom-kill:" line
+            self._add("{} cpuset=/ mems_allowed=0".format(trigger_name))
+        self._add(
+            "CPU: 2 PID: {} Comm: {} Not tainted {} #1 SMP PREEMPT_DYNAMIC "
+            "Sun Oct 1 12:00:00 UTC 2023 (1a2b3c4)".format(
+                trigger_pid, trigger_name, self.kernel_version()
+            )
+        )
+        self._add(
+            "Hardware name: QEMU Standard PC (Q35 + ICH9, 2009), BIOS 0.0.0 02/06/2015"
+        )
+        self._add("Call Trace:")
+        frames = [
+            "dump_stack_lvl+0x4c/0x66",
+            "dump_header+0x4a/0x211",
+            "oom_kill_process.cold+0xb/0x10",
+            "out_of_memory+0x1ed/0x4e0",
+            "__alloc_pages_slowpath.constprop.0+0xc2b/0xd10",
+            "__alloc_pages+0x2f0/0x330",
+            "alloc_pages_vma+0x8f/0x370",
+            "handle_mm_fault+0xcc/0x2a0",
+            "do_user_addr_fault+0x1c6/0x680",
+            "exc_page_fault+0x70/0x170",
+            "asm_exc_page_fault+0x22/0x30",
+        ]
+        if self.version >= (5, 10):
+            frames = ["<TASK>"] + frames + ["</TASK>"]
+        for frame in frames:
+            self._add(" " + frame)
+
+    def _add_meminfo(self, free_pages):
+        rnd = self._random.randint
+        self._add("Mem-Info:")
+        self._add(
+            "active_anon:{} inactive_anon:{} isolated_anon:0".format(
+                rnd(10000, 100000) * self.nr_nodes, rnd(100000, 900000) * self.nr_nodes
+            )
+        )
+        lines = [
+            "active_file:{} inactive_file:{} isolated_file:0".format(
+                rnd(100, 1000), rnd(100, 1000)
+            ),
+            "unevictable:{} dirty:{} writeback:{}".format(
+                rnd(0, 3000), rnd(0, 50), rnd(0, 50)
+            ),
+            "slab_reclaimable:{} slab_unreclaimable:{}".format(
+                rnd(1000, 10000), rnd(1000, 20000)
+            ),
+            "mapped:{} shmem:{} pagetables:{} bounce:0".format(
+                rnd(10, 100), rnd(1000, 5000), rnd(1000, 5000)
+            ),
+            "kernel_misc_reclaimable:0",
+            "free:{} free_pcp:{} free_cma:0".format(free_pages, rnd(0, 100)),
+        ]
+        if self.version < (5, 8):
+            lines[1] += " unstable:0"
+        if self.version < (4, 20):
+            del lines[4]
+        for line in lines:
+            self._add(" " + line, True)
+
+    def _zones(self, node):
+        """
+        Return all zones of a NUMA node with their size in pages
+
+        @rtype: List(str, int)
+        """
+        if node == 0:
+            return [
+                ("DMA", 3999),
+                ("DMA32", 519376),
+                ("Normal", PAGES_PER_NODE - 3999 - 519376),
+            ]
+        return [("Normal", PAGES_PER_NODE)]
+
+    def _lowmem_reserve(self, zones, zone):
+        """
+        Return the lowmem reserves of a zone in pages for requests of all zone types
+
+        The reserve is the sum of all higher zones divided by the default
+        lowmem_reserve_ratio of 256 like in mm/page_alloc.c:setup_per_zone_lowmem_reserve().
+
+        @param List(str, int) zones: All zones of the NUMA node with their size in pages
+        @param str zone: Zone to return the reserves for
+        @rtype: List(int)
+        """
+        zone_types = self.kconfig.ZONE_TYPES
+        pages = dict(zones)
+        zoneidx = zone_types.index(zone)
+        reserves = []
+        for highest_zoneidx in range(len(zone_types)):
+            reserves.append(
+                sum(
+                    [
+                        pages.get(zone_types[i], 0)
+                        for i in range(zoneidx + 1, highest_zoneidx + 1)
+                    ]
+                )
+                // 256
+            )
+        return reserves
+
+    def _add_zones(self):
+        rnd = self._random.randint
+        for node in range(self.nr_nodes):
+            self._add(
+                "Node {} active_anon:{}kB inactive_anon:{}kB active_file:{}kB "
+                "inactive_file:{}kB unevictable:0kB isolated(anon):0kB isolated(file):0kB "
+                "mapped:112kB dirty:64kB writeback:136kB shmem:8668kB "
+                "all_unreclaimable? yes".format(
+                    node,
+                    rnd(10000, 300000),
+                    rnd(1000000, 4000000),
+                    rnd(100, 1000),
+                    rnd(100, 3000),
+                )
+            )
+
+        buddyinfo = []
+        boost = "boost:0kB " if self.version >= (5, 16) else ""
+        for node in range(self.nr_nodes):
+            zones = self._zones(node)
+            for zone, pages in zones:
+                min_kb = pages * 4 // 512
+                # the Normal zone of the first node is below the min watermark
+                if zone == "Normal" and node == 0:
+                    chunks = [rnd(0, 50) for unused in range(self.nr_orders)]
+                # the lower zones of the first node are protected by the lowmem reserve
+                elif node == 0:
+                    chunks = [rnd(0, 2) for unused in range(self.nr_orders)]
+                else:
+                    chunks = [rnd(10, 500) for unused in range(self.nr_orders)]
+                free_kb = sum(
+                    [count * 4 * 2**order for order, count in enumerate(chunks)]
+                )
+                if zone == "Normal" and node == 0:
+                    min_kb = free_kb + 1024
+                self._add(
+                    "Node {} {} free:{}kB {}min:{}kB low:{}kB high:{}kB "
+                    "reserved_highatomic:0KB active_anon:0kB inactive_anon:0kB "
+                    "active_file:0kB inactive_file:0kB unevictable:0kB writepending:0kB "
+                    "present:{}kB managed:{}kB mlocked:0kB bounce:0kB free_pcp:0kB "
+                    "local_pcp:0kB free_cma:0kB".format(
+                        node,
+                        zone,
+                        free_kb,
+                        boost,
+                        min_kb,
+                        min_kb * 5 // 4,
+                        min_kb * 3 // 2,
+                        pages * 4,
+                        pages * 4 - 1024,
+                    )
+                )
+                self._add(
+                    "lowmem_reserve[]: {}".format(
+                        " ".join([str(r) for r in self._lowmem_reserve(zones, zone)])
+                    )
+                )
+                buddyinfo.append((node, zone, chunks, free_kb))
+
+        for node, zone, chunks, free_kb in buddyinfo:
+            self._add(
+                "Node {} {}: {} = {}kB".format(
+                    node,
+                    zone,
+                    " ".join(
+                        [
+                            "{}*{}kB{}".format(
+                                count, 4 * 2**order, " (UME)" if count else ""
+                            )
+                            for order, count in enumerate(chunks)
+                        ]
+                    ),
+                    free_kb,
+                )
+            )
+        for node in range(self.nr_nodes):
+            for size in [1048576, 2048]:
+                self._add(
+                    "Node {} hugepages_total=0 hugepages_free=0 hugepages_surp=0 "
+                    "hugepages_size={}kB".format(node, size)
+                )
+        return sum([free_kb for unused, unused, unused, free_kb in buddyinfo]) // 4
+
+    def _add_summary(self):
+        rnd = self._random.randint
+        self._add("{} total pagecache pages".format(rnd(10000, 300000)))
+        self._add("{} pages in swap cache".format(rnd(0, 300000)))
+        if self.version < (6, 0):
+            self._add("Swap cache stats: add 1234, delete 1000, find 12/34")
+        self._add("Free swap  = 0kB")
+        self._add("Total swap = 2098152kB")
+        self._add("{} pages RAM".format(PAGES_PER_NODE * self.nr_nodes))
+        self._add("0 pages HighMem/MovableOnly")
+        self._add("{} pages reserved".format(rnd(10000, 100000)))
+        self._add("0 pages hwpoisoned")
+
+    def _processes(self):
+        """
+        Return a list of random processes
+
+        @return: List of pid, uid, total_vm, rss, page tables, swap entries, oom_score_adj and name
+        @rtype: List(int, int, int, int, int, int, int, str)
+        """
+        rnd = self._random.randint
+        processes = []
+        for i in range(self.nr_processes):
+            pid = 300 + i * 7
+            rss = rnd(10, 50000)
+            processes.append(
+                (
+                    pid,
+                    rnd(0, 1000),
+                    rss + rnd(1000, 100000),
+                    rss,
+                    rnd(1, 200),
+                    rnd(0, 1000),
+                    rnd(-1000, 1000) if i % 10 == 0 else 0,
+                    "proc-{}".format(i),
+                )
+            )
+        return processes
+
+    def _add_pstable(self, processes):
+        if self.version >= (4, 19):
+            self._add("Tasks state (memory values in pages):")
+        page_tables = "pgtables_bytes" if self.version >= (4, 15) else "nr_ptes"
+        self._add(
+            "{}   uid  tgid total_vm      rss {} swapents oom_score_adj name".format(
+                self.kconfig.pstable_start, page_tables
+            )
+        )
+        pid_format = "[{:7d}]" if self.version >= (4, 19) else "[{:5d}]"
+        for pid, uid, total_vm, rss, ptes, swapents, score, name in processes:
+            if self.version >= (4, 15):
+                ptes *= 4096
+            self._add(
+                "{} {:5d} {:5d} {:8d} {:8d} {:8d} {:8d} {:13d} {}".format(
+                    pid_format.format(pid),
+                    uid,
+                    pid,
+                    total_vm,
+                    rss,
+                    ptes,
+                    swapents,
+                    score,
+                    name,
+                )
+            )
+
+    def _add_kill(self, victim):
+        pid, uid, total_vm, rss, ptes, unused, score, name = victim
+        usage = "total-vm:{}kB, anon-rss:{}kB, file-rss:0kB, shmem-rss:0kB".format(
+            total_vm * 4, rss * 4
+        )
+        if self.version >= (5, 0):
+            self._add(
+                "oom-kill:constraint=CONSTRAINT_NONE,nodemask=(null),cpuset=/,"
+                "mems_allowed=0,global_oom,task_memcg=/,task={},pid={},uid={}".format(
+                    name, pid, uid
+                )
+            )
+            self._add(
+                "Out of memory: Killed process {} ({}) {}, UID:{} pgtables:{}kB "
+                "oom_score_adj:{}".format(
+                    pid, name, usage, uid, ptes * 4, max(score, 0)
+                )
+            )
+        else:
+            self._add(
+                "Out of memory: Kill process {} ({}) score {} or sacrifice child".format(
+                    pid, name, self._random.randint(100, 1000)
+                )
+            )
+            if self.version >= (4, 9):
+                self._add(
+                    "Out of memory: Killed process {} ({}) {}".format(pid, name, usage)
+                )
+            else:
+                self._add("Killed process {} ({}) {}".format(pid, name, usage))
+        if self.version >= (4, 6):
+            self._add(
+                "oom_reaper: reaped process {} ({}), now anon-rss:0kB, file-rss:0kB, "
+                "shmem-rss:0kB".format(pid, name)
+            )
+
+    def text(self):
+        """
+        Return the OOM block as text
+
+        @rtype: str
+        """
+        self._lines = []
+        processes = self._processes()
+        trigger = processes[-1]
+        victim = max(processes, key=lambda p: p[3])
+        self._add_header(trigger[0], trigger[7])
+        # the free pages in Mem-Info are calculated from the buddyinfo
+        mark = len(self._lines)
+        free_pages = self._add_zones()
+        zone_lines = self._lines[mark:]
+        self._lines = self._lines[:mark]
+        self._add_meminfo(free_pages)
+        self._lines.extend(zone_lines)
+        self._add_summary()
+        self._add_pstable(processes)
+        self._add_kill(victim)
+        return "\n".join(self._lines)
+
+
+def kernel_configs(pattern="*"):
+    """
+    Return all kernel configurations matching the pattern once
+
+    The base configuration is skipped, because it's only the fallback for
+    unknown kernels.
+
+    @param str pattern: Shell-style pattern to match the class name e.g. "KernelConfig_5_*"
+    @rtype: List(OOMAnalyser.BaseKernelConfig)
+    """
+    configs = []
+    names = []
+    for kcfg_class in OOMAnalyser.AllKernelConfigs:
+        name = kcfg_class.__name__
+        if name in names or not name.startswith("KernelConfig_"):
+            continue
+        if not fnmatch.fnmatchcase(name, pattern):
+            continue
+        names.append(name)
+        configs.append(OOMAnalyser.get_kernel_config(kcfg_class))
+    return configs
+
+
+def result_memory(text):
+    """
+    Measure the memory held by the result of an analysis
+
+    The memory is measured with tracemalloc after the analysis, so temporary
+    allocations are not counted. The OOM text is part of the OOMResult. The
+    CompactResult is measured after creating a first one and dropping the
+    OOMResult, because the interned strings and the shared keys are allocated
+    once for all results of a fleet.
+
+    @param str text: OOM text
+    @return: Bytes held by a single OOMResult and CompactResult
+    @rtype: Dict(str, int)
+    """
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        success, result, messages = OOMAnalyserCLI.analyse_block(text)
+        result_bytes = tracemalloc.get_traced_memory()[0] - before
+
+        # keep the first one to hold the interned strings and the shared keys
+        first = OOMAnalyserCLI.CompactResult(success, result)
+        del result, messages
+
+        before = tracemalloc.get_traced_memory()[0]
+        success, result, messages = OOMAnalyserCLI.analyse_block(text)
+        compact = OOMAnalyserCLI.CompactResult(success, result)
+        del result, messages
+        compact_bytes = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        if started:
+            tracemalloc.stop()
+    return {"result_bytes": result_bytes, "compact_result_bytes": compact_bytes}
+
+
+def run_scenario(kconfig, nr_processes, nr_nodes, prefix, repeat):
+    """
+    Generate an OOM and measure the analysis
+
+    @type kconfig: OOMAnalyser.BaseKernelConfig
+    @param int nr_processes: Number of processes in the process table
+    @param int nr_nodes: Number of NUMA nodes
+    @param str prefix: Log prefix format, one of LOG_PREFIXES
+    @param int repeat: Number of runs, the median is reported
+    @return: Scenario description, median time per stage in milliseconds and
+             memory per result
+    @rtype: dict
+    """
+    text = SyntheticOOM(kconfig, nr_processes, nr_nodes, prefix).text()
+    runs = []
+    success = True
+    chosen_config = None
+    for unused in range(repeat):
+        del OOMAnalyserCLI.notifications[:]
+        start = time.perf_counter()
+        oom = OOMAnalyser.OOMEntity(text)
+        entity_time = time.perf_counter() - start
+
+        analyser = OOMAnalyser.OOMAnalyserProfiler(oom)
+        success = analyser.analyse() and success
+        timings = {}
+        for entry in analyser.oom_result.profile:
+            timings[entry["stage"]] = (
+                timings.get(entry["stage"], 0.0) + entry["duration_ms"] / 1000
+            )
+        timings["OOMEntity"] = entity_time
+        timings["total"] = entity_time + timings["analyse"]
+        runs.append(timings)
+        chosen_config = type(analyser.oom_result.kconfig).__name__
+
+    errors = [
+        msg for level, msg in OOMAnalyserCLI.notifications if level.endswith("ERROR")
+    ]
+    stages = sorted(set([name for timings in runs for name in timings]))
+    median_ms = {}
+    for name in stages:
+        median_ms[name] = round(
+            statistics.median([timings.get(name, 0.0) for timings in runs]) * 1000, 4
+        )
+    memory = result_memory(text)
+    return {
+        "kernel_config": type(kconfig).__name__,
+        "chosen_config": chosen_config,
+        "processes": nr_processes,
+        "nodes": nr_nodes,
+        "prefix": prefix,
+        "size_bytes": len(text),
+        "repeat": repeat,
+        "success": success and not errors,
+        "errors": errors,
+        "median_ms": median_ms,
+        "result_bytes": memory["result_bytes"],
+        "compact_result_bytes": memory["compact_result_bytes"],
+        "ooms_per_second": round(1000 / median_ms["total"], 1)
+        if median_ms["total"]
+        else None,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Benchmark the OOM analysis with synthetic OOMs for all kernel "
+        "configurations. The results are written as JSON to stdout."
+    )
+    parser.add_argument(
+        "--config",
+        default="*",
+        help='Pattern to select kernel configurations e.g. "KernelConfig_5_*" '
+        "(default: all)",
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        nargs="+",
+        default=[100, 1000],
+        help="Number of processes in the process table (default: 100 1000)",
+    )
+    parser.add_argument(
+        "--nodes",
+        type=int,
+        nargs="+",
+        default=[1, 4],
+        help="Number of NUMA nodes (default: 1 4)",
+    )
+    parser.add_argument(
+        "--prefix",
+        nargs="+",
+        choices=sorted(LOG_PREFIXES),
+        default=["dmesg", "short"],
+        help="Log prefix formats (default: dmesg short)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="Number of runs per scenario, the median is reported (default: 5)",
+    )
+    parser.add_argument(
+        "--output",
+        metavar="FILE",
+        help="Write the results to this file instead of stdout",
+    )
+    args = parser.parse_args(argv)
+
+    OOMAnalyser.add_to_notifybox = OOMAnalyserCLI.collect_notification
+
+    scenarios = []
+    for kconfig in kernel_configs(args.config):
+        for nr_processes in args.processes:
+            for nr_nodes in args.nodes:
+                for prefix in args.prefix:
+                    scenarios.append(
+                        run_scenario(
+                            kconfig, nr_processes, nr_nodes, prefix, args.repeat
+                        )
+                    )
+
+    results = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "scenarios": scenarios,
+    }
+    if args.output:
+        with open(args.output, "w") as fh:
+            json.dump(results, fh, indent=2, sort_keys=True)
+    else:
+        json.dump(results, sys.stdout, indent=2, sort_keys=True)
+        sys.stdout.write("\n")
+    return 0 if all([scenario["success"] for scenario in scenarios]) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
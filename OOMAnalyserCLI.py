@@ -0,0 +1,1473 @@
+# -*- coding: Latin-1 -*-
+#
+# Linux OOMAnalyser - command line interface
+#
+# Copyright (c) 2017-2023 Carsten Grohmann
+# License: MIT (see LICENSE.txt)
+# THIS PROGRAM COMES WITH NO WARRANTY
+"""
+Analyse OOM messages from log files on the command line.
+
+This module is not translated to JavaScript. It reads one or more log files
+or SUSE supportconfig / sosreport archives, splits them into single OOM blocks,
+analyses each block with the same code as the web page and writes one JSON
+object per OOM block to stdout.
+"""
+
+import argparse
+import array
+import bz2
+import datetime
+import fnmatch
+import gzip
+import heapq
+import io
+import json
+import lzma
+import os
+import re
+import struct
+import sys
+import tarfile
+import time
+import tracemalloc
+
+import OOMAnalyser
+
+COMPRESSION_MAGIC = [
+    (b"\x1f\x8b", "gzip", gzip.open),
+    (b"BZh", "bz2", bz2.open),
+    (b"\xfd7zXZ\x00", "xz", lzma.open),
+]
+"""
+Magic bytes of supported compression formats
+
+Each entry contains the magic bytes, a short name and a function to open a
+decompressing file object.
+
+@type: List(bytes, str, function)
+"""
+
+MAGIC_MAX_LEN = max([len(magic) for magic, unused, unused in COMPRESSION_MAGIC])
+"""Number of bytes to read to detect the compression format"""
+
+TAR_MAGIC_OFFSET = 257
+"""Offset of the "ustar" magic in a tar header"""
+
+TAR_MAGIC = b"ustar"
+"""Magic of POSIX and GNU tar archives"""
+
+ARCHIVE_LOG_MEMBERS = [
+    # supportconfig
+    "messages.txt",
+    "messages_*.txt",
+    "boot.txt",
+    "journal*.txt",
+    # sosreport
+    "var/log/messages*",
+    "var/log/kern.log*",
+    "var/log/syslog*",
+    "sos_commands/kernel/dmesg*",
+    "sos_commands/logs/journalctl_*",
+]
+"""
+Archive members that may contain OOM messages
+
+The patterns are matched against the member name without the leading directory
+of the archive.
+
+@type: List(str)
+"""
+
+ARCHIVE_UNAME_MEMBERS = [
+    # supportconfig
+    "basic-environment.txt",
+    # sosreport
+    "uname",
+    "sos_commands/kernel/uname_-a",
+]
+"""
+Archive members that contain the output of "uname -a"
+
+@type: List(str)
+"""
+
+REC_JOURNAL_EXPORT = re.compile(rb"^[A-Z_][A-Z0-9_]*=")
+"""
+Compiled RE to detect the journal export format by the first field
+
+@see: https://systemd.io/JOURNAL_EXPORT_FORMATS/
+"""
+
+REC_KMSG_RECORD = re.compile(
+    r"^(?P<prio>\d+),(?P<seq>\d+),(?P<usec>\d+),[^;]*;(?P<msg>.*)$"
+)
+"""
+Compiled RE to split a /dev/kmsg record into priority, sequence number, timestamp and message
+
+Example: 6,1234,5907004253,-;MonsterApp invoked oom-killer: ...
+
+@see: https://www.kernel.org/doc/Documentation/ABI/testing/dev-kmsg
+"""
+
+REC_KMSG_ESCAPE = re.compile(r"\\x([0-9a-f]{2})")
+"""Compiled RE to find escaped non-printable characters in /dev/kmsg messages"""
+
+REC_DMESG_RAW = re.compile(
+    r"^<(?P<prio>\d+)>(\[\s*(?P<sec>\d+)\.(?P<usec>\d+)\] ?)?(?P<msg>.*)$"
+)
+"""
+Compiled RE to split a line of "dmesg -r" into priority, timestamp and message
+
+Example: <6>[ 5907.004253] MonsterApp invoked oom-killer: ...
+"""
+
+KMSG_DEVICE = "/dev/kmsg"
+"""Kernel log buffer device, it's read w/o blocking until the last record"""
+
+
+class CountingReader(io.RawIOBase):
+    """
+    Count the number of bytes read from an underlying binary file object
+
+    It is used to report the number of bytes read from compressed files. It
+    also hides the missing seek support of tar members in stream mode.
+    """
+
+    bytes_read = 0
+    """Number of bytes read from the underlying file object"""
+
+    def __init__(self, fileobj):
+        super().__init__()
+        self._fileobj = fileobj
+        self.bytes_read = 0
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        data = self._fileobj.read(len(buffer))
+        size = len(data)
+        buffer[:size] = data
+        self.bytes_read += size
+        return size
+
+
+def detect_compression(fileobj):
+    """
+    Detect the compression format by the magic bytes at the beginning of the file
+
+    The file object must support peek() to keep the position unchanged.
+
+    @param fileobj: Binary file object
+    @return: Short name of the compression format and a function to open it or None, None
+    @rtype: (str, function) | (None, None)
+    """
+    head = fileobj.peek(MAGIC_MAX_LEN)[:MAGIC_MAX_LEN]
+    for magic, name, opener in COMPRESSION_MAGIC:
+        if head.startswith(magic):
+            return name, opener
+    return None, None
+
+
+def open_binary(fileobj):
+    """
+    Return a binary stream with support for peek() for the given binary file object
+
+    Compressed streams are decompressed on the fly. Nothing is written to disk.
+
+    @param fileobj: Binary file object
+    @rtype: io.BufferedIOBase
+    """
+    if not hasattr(fileobj, "peek"):
+        fileobj = io.BufferedReader(fileobj)
+    unused, opener = detect_compression(fileobj)
+    if opener:
+        fileobj = opener(fileobj, "rb")
+    return fileobj
+
+
+def is_tar(fileobj):
+    """
+    Check for the tar magic in the first header of an uncompressed stream
+
+    @param fileobj: Binary file object with support for peek()
+    @rtype: bool
+    """
+    head = fileobj.peek(TAR_MAGIC_OFFSET + len(TAR_MAGIC))
+    return head[TAR_MAGIC_OFFSET : TAR_MAGIC_OFFSET + len(TAR_MAGIC)] == TAR_MAGIC
+
+
+def open_log(fileobj):
+    """
+    Return a text stream for the given binary file object
+
+    Compressed streams are decompressed on the fly. Nothing is written to disk.
+
+    @param fileobj: Binary file object
+    @rtype: io.TextIOBase
+    """
+    return as_text(open_binary(fileobj))
+
+
+def as_text(fileobj):
+    """
+    Return a text stream for an uncompressed binary file object
+
+    @param fileobj: Binary file object
+    @rtype: io.TextIOBase
+    """
+    return io.TextIOWrapper(fileobj, encoding="utf-8", errors="replace", newline=None)
+
+
+class OOMBlockScanner:
+    """
+    Split a stream of log lines into single OOM blocks
+
+    An OOM block starts with "invoked oom-killer:" and ends with
+    "Killed process ..." optionally followed by "oom_reaper: ...". This is the same
+    logic as in OOMAnalyser.OOMEntity._remove_non_oom_lines(), but applied to an
+    endless stream of lines.
+
+    Every line can carry an optional tag e.g. the timestamp of a journal entry. The
+    tags of all lines are returned together with the OOM block.
+
+    @see: OOMAnalyser.OOMEntity._remove_non_oom_lines()
+    """
+
+    _lines = None
+    """Lines of the current OOM block or None outside a block"""
+
+    _killed_process = False
+    """The line "Killed process" is part of the current block"""
+
+    _tags = None
+    """Tags of all lines of the current OOM block"""
+
+    def __init__(self):
+        self._lines = None
+        self._killed_process = False
+        self._tags = None
+
+    def _finish(self):
+        """
+        Return the current block as text and the tags of its lines and reset the scanner
+
+        @rtype: (str, List(object))
+        """
+        block = ("\n".join(self._lines), self._tags)
+        self._lines = None
+        self._killed_process = False
+        self._tags = None
+        return block
+
+    def push(self, line, tag=None):
+        """
+        Process a single line and return an OOM block if it's complete
+
+        @param str line: Single line w/o line break
+        @param tag: Optional tag of this line
+        @return: Completed OOM block and the tags of its lines or None
+        @rtype: (str, List(object)) | None
+        """
+        block = None
+        if "invoked oom-killer:" in line:
+            # a new OOM starts before the previous one ends - return incomplete one
+            if self._lines is not None:
+                block = self._finish()
+            self._lines = [line]
+            self._tags = [tag]
+            return block
+
+        if self._lines is None:
+            return None
+
+        # OOM blocks ends with the second last only or both lines
+        #   Out of memory: Killed process ...
+        #   oom_reaper: reaped process ...
+        if self._killed_process:
+            if "oom_reaper" in line:
+                self._lines.append(line)
+                self._tags.append(tag)
+                return self._finish()
+            return self._finish()
+
+        self._lines.append(line)
+        self._tags.append(tag)
+        if "Killed process" in line:
+            self._killed_process = True
+        return None
+
+    def flush(self):
+        """
+        Return the remaining (possibly incomplete) block at the end of the stream
+
+        @rtype: (str, List(object)) | None
+        """
+        if self._lines is None:
+            return None
+        return self._finish()
+
+    def scan_tagged(self, tagged_lines):
+        """
+        Iterate over all OOM blocks in the given lines
+
+        @param tagged_lines: Iterable of lines w/o trailing line breaks and their tags
+        @type tagged_lines: Iterable(str, object)
+        @return: OOM blocks and the tags of their lines
+        @rtype: Iterator(str, List(object))
+        """
+        for line, tag in tagged_lines:
+            block = self.push(line, tag)
+            if block is not None:
+                yield block
+        block = self.flush()
+        if block is not None:
+            yield block
+
+    def scan(self, lines):
+        """
+        Iterate over all OOM blocks in the given lines
+
+        @param lines: Iterable of lines with or without trailing line breaks
+        @rtype: Iterator(str)
+        """
+        for block, unused in self.scan_tagged(
+            (line.rstrip("\r\n"), None) for line in lines
+        ):
+            yield block
+
+
+def detect_log_format(fileobj):
+    """
+    Detect the format of an uncompressed log stream
+
+    Supported formats:
+     - "journal-json": Output of "journalctl -o json"
+     - "journal-export": Output of "journalctl -o export"
+     - "kmsg": Records read from /dev/kmsg
+     - "dmesg-raw": Output of "dmesg -r"
+     - "text": All other plain text logs e.g. syslog, dmesg or "journalctl" default output
+
+    @param fileobj: Binary file object with support for peek()
+    @rtype: str
+    """
+    head = fileobj.peek(256).lstrip()
+    if head.startswith(b"{"):
+        return "journal-json"
+    if REC_JOURNAL_EXPORT.match(head):
+        return "journal-export"
+    line = head.split(b"\n", 1)[0].decode("utf-8", "replace")
+    if REC_KMSG_RECORD.match(line):
+        return "kmsg"
+    if REC_DMESG_RAW.match(line):
+        return "dmesg-raw"
+    return "text"
+
+
+def _journal_field_to_str(value):
+    """
+    Convert a field value of "journalctl -o json" into a string
+
+    Fields with non-printable characters are serialised as array of bytes and
+    fields with multiple values as array of values. In the latter case only the
+    first value is used.
+
+    @rtype: str | None
+    """
+    if isinstance(value, list):
+        if not value:
+            return None
+        if isinstance(value[0], int):
+            return bytes(value).decode("utf-8", "replace")
+        return _journal_field_to_str(value[0])
+    return value
+
+
+def read_journal_json(stream):
+    """
+    Iterate over all entries of "journalctl -o json" output
+
+    @param stream: Text stream with one JSON object per line
+    @return: Journal entries with all values converted to strings
+    @rtype: Iterator(dict)
+    """
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            continue
+        yield dict([(k, _journal_field_to_str(v)) for k, v in entry.items()])
+
+
+def read_journal_export(fileobj):
+    """
+    Iterate over all entries of "journalctl -o export" output
+
+    Text fields are serialised as "FIELD=value". Binary fields (e.g. messages
+    with embedded line breaks) are serialised as field name followed by a line
+    break, the data size as unsigned little endian 64-bit integer, the data and
+    a final line break. Entries are separated by an empty line.
+
+    @param fileobj: Binary file object
+    @return: Journal entries with all values converted to strings
+    @rtype: Iterator(dict)
+    @see: https://systemd.io/JOURNAL_EXPORT_FORMATS/
+    """
+    entry = {}
+    while True:
+        line = fileobj.readline()
+        if not line:
+            break
+        line = line.rstrip(b"\n")
+        if not line:
+            if entry:
+                yield entry
+            entry = {}
+            continue
+        if b"=" in line:
+            name, value = line.split(b"=", 1)
+        else:
+            name = line
+            size = struct.unpack("<Q", fileobj.read(8))[0]
+            value = fileobj.read(size)
+            fileobj.read(1)  # trailing line break
+        entry[name.decode("ascii", "replace")] = value.decode("utf-8", "replace")
+    if entry:
+        yield entry
+
+
+def journal_timestamp(value):
+    """
+    Convert the journal field __REALTIME_TIMESTAMP into an ISO 8601 string (UTC)
+
+    @param str value: Microseconds since epoch
+    @rtype: str | None
+    """
+    try:
+        usec = int(value)
+    except (TypeError, ValueError):
+        return None
+    epoch = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+    return (epoch + datetime.timedelta(microseconds=usec)).isoformat()
+
+
+def journal_kernel_lines(entries):
+    """
+    Split the kernel messages of journal entries into tagged lines
+
+    Messages of other transports are skipped. The message text is used as it is,
+    no leading columns have to be removed. Each line is tagged with the
+    timestamp and the hostname of the journal entry.
+
+    @type entries: Iterator(dict)
+    @return: Lines and their tag (timestamp, hostname)
+    @rtype: Iterator(str, (str, str))
+    """
+    for entry in entries:
+        transport = entry.get("_TRANSPORT")
+        if transport is not None and transport != "kernel":
+            continue
+        message = entry.get("MESSAGE")
+        if not message:
+            continue
+        tag = (
+            journal_timestamp(entry.get("__REALTIME_TIMESTAMP")),
+            entry.get("_HOSTNAME"),
+        )
+        for line in message.split("\n"):
+            yield line.rstrip("\r"), tag
+
+
+def _kmsg_unescape(match):
+    return chr(int(match.group(1), 16))
+
+
+def read_kmsg(lines):
+    """
+    Split /dev/kmsg records into tagged kernel messages
+
+    Non-printable characters incl. line breaks are escaped as "\\xNN" in the
+    message. Lines starting with a space after a record are dictionary
+    properties like "SUBSYSTEM=..." and are skipped. Records of user space
+    facilities are skipped too. They share the sequence numbers with kernel
+    records, therefore the number of skipped records directly before a kernel
+    record is part of its tag to distinguish them from dropped records.
+
+    @param lines: Iterable of records and dictionary properties
+    @return: Lines and their tag (sequence number, timestamp in microseconds,
+             number of skipped user space records)
+    @rtype: Iterator(str, (int, int, int))
+    """
+    skipped = 0
+    for line in lines:
+        line = line.rstrip("\r\n")
+        match = REC_KMSG_RECORD.match(line)
+        if not match:
+            continue
+        # facility is encoded in the upper bits of the priority - 0 is kernel
+        if int(match.group("prio")) >> 3:
+            skipped += 1
+            continue
+        tag = (int(match.group("seq")), int(match.group("usec")), skipped)
+        skipped = 0
+        message = REC_KMSG_ESCAPE.sub(_kmsg_unescape, match.group("msg"))
+        for msg_line in message.split("\n"):
+            yield msg_line, tag
+
+
+def read_kmsg_device(path=KMSG_DEVICE):
+    """
+    Read all records currently stored in the kernel log buffer
+
+    Each read() returns a single record. The device is opened in non-blocking
+    mode to stop after the last record instead of waiting for new ones. Records
+    overwritten during reading cause EPIPE, they are skipped and detected later
+    by gaps in the sequence numbers.
+
+    @param str path: Path of the kernel log buffer device
+    @return: Records with dictionary properties
+    @rtype: Iterator(str)
+    """
+    fd = os.open(path, os.O_RDONLY | os.O_NONBLOCK)
+    try:
+        while True:
+            try:
+                record = os.read(fd, 8192)
+            except BrokenPipeError:
+                continue
+            except BlockingIOError:
+                break
+            if not record:
+                break
+            for line in record.decode("utf-8", "replace").split("\n"):
+                yield line
+    finally:
+        os.close(fd)
+
+
+def read_dmesg_raw(lines):
+    """
+    Split the output of "dmesg -r" into tagged kernel messages
+
+    The kernel prefixes every line of a multi-line message with the priority
+    and the timestamp. Lines w/o a leading priority continue the previous message
+    nevertheless. The output does not contain sequence numbers, therefore dropped messages can't be detected.
+
+    @param lines: Iterable of lines
+    @return: Lines and their tag (None, timestamp in microseconds, 0)
+    @rtype: Iterator(str, (None, int, int))
+    """
+    tag = (None, None, 0)
+    for line in lines:
+        line = line.rstrip("\r\n")
+        match = REC_DMESG_RAW.match(line)
+        if not match:
+            # restore the single leading space of continuation lines
+            if line[:1].isspace():
+                line = " " + line.strip()
+            yield line, tag
+            continue
+        if int(match.group("prio")) >> 3:
+            continue
+        usec = None
+        if match.group("sec"):
+            usec = int(match.group("sec")) * 1000000 + int(
+                match.group("usec").ljust(6, "0")[:6]
+            )
+        tag = (None, usec, 0)
+        yield match.group("msg"), tag
+
+
+def count_dropped_records(tags):
+    """
+    Count missing records inside an OOM block by gaps in the sequence numbers
+
+    Lines of the same record share the sequence number. Skipped user space
+    records in between aren't dropped.
+
+    @param tags: Tags (sequence number, timestamp, number of skipped records)
+                 of all lines in an OOM block
+    @type tags: List(int, int, int)
+    @rtype: int
+    """
+    dropped = 0
+    last_seq = None
+    for seq, unused, skipped in tags:
+        if seq is None:
+            continue
+        if last_seq is not None and seq > last_seq + 1 + skipped:
+            dropped += seq - last_seq - 1 - skipped
+        last_seq = seq
+    return dropped
+
+
+notifications = []
+"""
+Messages send to the notification box during the current analysis
+
+@type: List(str, str)
+"""
+
+
+profiling = False
+"""Measure the time of all analysis stages and add it to the results"""
+
+
+def collect_notification(prefix, msg):
+    """Replacement for OOMAnalyser.add_to_notifybox() to collect messages"""
+    notifications.append((prefix, msg))
+
+
+def analyse_block(text, stripped=False):
+    """
+    Analyse a single OOM block
+
+    @param str text: OOM block
+    @param bool stripped: The lines contain kernel messages w/o leading columns
+    @return: Success and results of the analysis as well as all error and warning messages
+    @rtype: (bool, OOMAnalyser.OOMResult, List(str, str))
+    """
+    return analyse_entity(OOMAnalyser.OOMEntity(text, stripped))
+
+
+def analyse_entity(oom):
+    """
+    Analyse a single prepared OOM block
+
+    @type oom: OOMAnalyser.OOMEntity
+    @return: Success and results of the analysis as well as all error and warning messages
+    @rtype: (bool, OOMAnalyser.OOMResult, List(str, str))
+    """
+    del notifications[:]
+    if profiling:
+        analyser = OOMAnalyser.OOMAnalyserProfiler(oom)
+    else:
+        analyser = OOMAnalyser.OOMAnalyser(oom)
+    success = analyser.analyse()
+    return success, analyser.oom_result, notifications[:]
+
+
+def result_to_dict(success, result, messages):
+    """
+    Convert the analysis results into a dictionary that can be serialised as JSON
+
+    Internal items with a leading underscore are not included. Only the largest
+    unreclaimable slab caches are included. The frames of the call trace are
+    lists of symbol, offset and module.
+
+    @type success: bool
+    @type result: OOMAnalyser.OOMResult
+    @type messages: List(str, str)
+    @rtype: dict
+    """
+    res = {
+        "success": success,
+        "error_msg": result.error_msg,
+        "messages": [
+            "{}: {}".format(prefix, msg)
+            for prefix, msg in messages
+            if prefix != "DEBUG"
+        ],
+    }
+    if result.profile is not None:
+        res["profile"] = result.profile
+    if not success:
+        return res
+
+    res["kernel_version"] = result.kversion
+    res["kernel_config"] = result.kconfig.name
+    res["oom_type"] = result.oom_type
+    res["oom_constraint"] = result.oom_constraint
+    res["mem_alloc_failure"] = result.mem_alloc_failure
+    res["mem_fragmented"] = result.mem_fragmented
+    res["swap_active"] = result.swap_active
+    res["oom_victim_expected"] = result.oom_victim_expected
+    res["details"] = dict(
+        [(k, v) for k, v in result.details.items() if not k.startswith("_")]
+    )
+    res["memcg_stats"] = result.memcg_stats
+    res["call_trace_frames"] = result.call_trace_frames
+    slab = result.slab_unreclaimable
+    res["slab_unreclaimable"] = [
+        {
+            "name": slab["name"][index],
+            "used_kb": slab["used_kb"][index],
+            "total_kb": slab["total_kb"][index],
+        }
+        for index in result.details.get("_slab_unreclaimable_ranking", [])
+    ]
+    return res
+
+
+INTERNED_DETAILS = [
+    "kernel_version",
+    "distribution",
+    "dist",
+    "platform",
+    "trigger_proc_name",
+    "trigger_proc_gfp_mask",
+    "trigger_proc_mem_zone",
+    "trigger_proc_nodemask",
+    "killed_proc_name",
+    "expected_victim_name",
+    "memcg_name",
+    "memcg_task",
+]
+"""
+Details with string values repeated in many results of a fleet
+
+The values are interned and shared between all CompactResult instances.
+
+@type: List(str)
+"""
+
+_shared_tuples = {}
+"""
+Tuples of keys shared between all CompactResult instances
+
+@type: Dict(tuple, tuple)
+"""
+
+
+def _share(keys):
+    """Return a shared instance of an equal tuple of keys"""
+    keys = tuple(keys)
+    return _shared_tuples.setdefault(keys, keys)
+
+
+class CompactResult:
+    """
+    Memory efficient copy of an analysis result to hold many results in memory
+
+    OOMResult stores the details in a free-form dictionary and the buddyinfo
+    and the watermarks in nested dictionaries. A fleet report holding many
+    results needs much less memory with this class:
+
+     * The attributes are stored in __slots__ w/o an instance dictionary.
+     * Integer details are stored in an array. The names of the details are a
+       shared tuple, because all results of a kernel configuration have the
+       same details.
+     * Kernel, distribution and process names are interned.
+     * The buddyinfo, the zone counters incl. the watermarks and the lowmem
+       reserves are stored in arrays per zone and node. The names of the zone
+       counters are a shared tuple.
+     * The statistics of a memory cgroup are stored in an array. The names
+       of the counters are a shared tuple.
+     * The symbols and modules of the call trace are interned and the offsets
+       are stored in an array.
+     * The process table and other internal items with a leading underscore
+       are dropped.
+
+    @see: OOMAnalyser.OOMResult, INTERNED_DETAILS
+    """
+
+    __slots__ = (
+        "success",
+        "error_msg",
+        "kernel_version",
+        "kernel_config",
+        "oom_type",
+        "oom_constraint",
+        "mem_alloc_failure",
+        "mem_fragmented",
+        "swap_active",
+        "oom_victim_expected",
+        "max_order",
+        "_int_keys",
+        "_int_values",
+        "_other_keys",
+        "_other_values",
+        "_zones",
+        "_buddyinfo",
+        "_counter_keys",
+        "_watermarks",
+        "_lowmem_reserve",
+        "_memcg_stat_keys",
+        "_memcg_stats",
+        "_frame_symbols",
+        "_frame_offsets",
+        "_frame_modules",
+    )
+
+    def __init__(self, success, result):
+        """
+        @type success: bool
+        @type result: OOMAnalyser.OOMResult
+        """
+        self.success = success
+        self.error_msg = result.error_msg
+        self.kernel_version = sys.intern(result.kversion) if result.kversion else None
+        self.kernel_config = sys.intern(result.kconfig.name)
+        self.oom_type = result.oom_type
+        self.oom_constraint = result.oom_constraint
+        self.mem_alloc_failure = result.mem_alloc_failure
+        self.mem_fragmented = result.mem_fragmented
+        self.swap_active = result.swap_active
+        self.oom_victim_expected = result.oom_victim_expected
+        self.max_order = result.max_order
+
+        int_keys = []
+        int_values = []
+        other_keys = []
+        other_values = []
+        for key, value in result.details.items():
+            if key.startswith("_"):
+                continue
+            if type(value) is int:
+                int_keys.append(key)
+                int_values.append(value)
+                continue
+            if key in INTERNED_DETAILS and isinstance(value, str):
+                value = sys.intern(value)
+            other_keys.append(key)
+            other_values.append(value)
+        self._int_keys = _share(int_keys)
+        self._int_values = array.array("q", int_values)
+        self._other_keys = _share(other_keys)
+        self._other_values = tuple(other_values)
+
+        # watermarks: [zone][node], buddyinfo_total_free_kb: [zone][node] | None
+        zones = []
+        for zone in result.watermarks:
+            zones.extend([(zone, node) for node in result.watermarks[zone]])
+        for zone, total_free_kb in result.buddyinfo_total_free_kb.items():
+            for node, value in enumerate(total_free_kb):
+                if value is not None and (zone, node) not in zones:
+                    zones.append((zone, node))
+        self._zones = _share(zones)
+        counter_keys = []
+        for levels in self._levels(result):
+            counter_keys.extend(
+                [
+                    key
+                    for key in levels
+                    if key != "lowmem_reserve" and key not in counter_keys
+                ]
+            )
+        self._counter_keys = _share(counter_keys)
+        self._buddyinfo = array.array("q")
+        self._watermarks = array.array("q")
+        self._lowmem_reserve = array.array("q")
+        nr_reserves = max(
+            [len(levels.get("lowmem_reserve", [])) for levels in self._levels(result)]
+            + [0]
+        )
+        for (zone, node), levels in zip(zones, self._levels(result)):
+            total_free_kb = result.buddyinfo_total_free_kb.get(zone, [])
+            if node < len(total_free_kb) and total_free_kb[node] is not None:
+                matrix = result.buddyinfo[zone]
+                self._buddyinfo.extend([chunks[node] for chunks in matrix])
+            else:
+                self._buddyinfo.extend([-1] * self._nr_orders())
+            self._watermarks.extend([levels.get(key, -1) for key in counter_keys])
+            reserves = levels.get("lowmem_reserve", [])
+            self._lowmem_reserve.extend(reserves + [-1] * (nr_reserves - len(reserves)))
+
+        self._memcg_stat_keys = _share(result.memcg_stats.keys())
+        self._memcg_stats = array.array("q", result.memcg_stats.values())
+
+        frames = result.call_trace_frames
+        self._frame_symbols = tuple([sys.intern(frame[0]) for frame in frames])
+        self._frame_offsets = array.array("l", [frame[1] for frame in frames])
+        self._frame_modules = tuple(
+            [sys.intern(frame[2]) if frame[2] else None for frame in frames]
+        )
+
+    def _levels(self, result):
+        """Return the watermarks of all zones in the order of self._zones"""
+        return [
+            result.watermarks.get(zone, {}).get(node, {}) for zone, node in self._zones
+        ]
+
+    def _nr_orders(self):
+        """Return the number of orders stored per zone"""
+        return max(self.max_order, 0)
+
+    def details(self):
+        """
+        Return all details except internal items as dictionary
+
+        @rtype: dict
+        """
+        details = dict(zip(self._int_keys, self._int_values))
+        details.update(zip(self._other_keys, self._other_values))
+        return details
+
+    def memcg_stats(self):
+        """
+        Return the statistics of the memory cgroup
+
+        @rtype: Dict(str, int)
+        @see: OOMAnalyser.OOMResult.memcg_stats
+        """
+        return dict(zip(self._memcg_stat_keys, self._memcg_stats))
+
+    def call_trace_frames(self):
+        """
+        Return the reliable frames of the call trace
+
+        @rtype: List(Tuple(str, int, str|None))
+        @see: OOMAnalyser.OOMResult.call_trace_frames
+        """
+        return list(
+            zip(self._frame_symbols, self._frame_offsets.tolist(), self._frame_modules)
+        )
+
+    def zones(self):
+        """
+        Return the zone name and the node of all zones
+
+        @rtype: List(Tuple(str, int))
+        """
+        return list(self._zones)
+
+    def free_chunks(self, zone, node):
+        """
+        Return the number of free chunks per order or -1 if unknown
+
+        @param str zone: Zone name
+        @param int node: NUMA node
+        @rtype: List(int)
+        """
+        nr_orders = self._nr_orders()
+        index = self._zones.index((zone, node)) * nr_orders
+        return self._buddyinfo[index : index + nr_orders].tolist()
+
+    def watermarks(self, zone, node):
+        """
+        Return the watermarks, all other zone counters and the lowmem reserves
+
+        Missing counters are omitted, missing lowmem reserves are -1. Boolean
+        counters are returned as int.
+
+        @param str zone: Zone name
+        @param int node: NUMA node
+        @rtype: dict
+        @see: OOMAnalyser.OOMResult.watermarks
+        """
+        position = self._zones.index((zone, node))
+        nr_keys = len(self._counter_keys)
+        index = position * nr_keys
+        levels = dict(
+            [
+                (key, value)
+                for key, value in zip(
+                    self._counter_keys, self._watermarks[index : index + nr_keys]
+                )
+                if value != -1
+            ]
+        )
+        nr_reserves = len(self._lowmem_reserve) // len(self._zones)
+        index = position * nr_reserves
+        levels["lowmem_reserve"] = self._lowmem_reserve[
+            index : index + nr_reserves
+        ].tolist()
+        return levels
+
+
+OOM_KILLER_FRAMES = ["out_of_memory", "mem_cgroup_out_of_memory"]
+"""
+Functions that invoke the OOM killer
+
+The frames up to these functions print the OOM message and kill a process.
+
+@type: List(str)
+"""
+
+
+def allocation_path(frames):
+    """
+    Return the functions that called the OOM killer from the innermost to the outermost
+
+    Compiler suffixes like ".constprop.0" or ".cold" are removed from the
+    symbols to merge the paths of different kernel builds. The whole call trace
+    is returned if it doesn't contain the OOM killer.
+
+    @param frames: Frames of the call trace
+    @type frames: List(Tuple(str, int, str|None))
+    @rtype: List(str)
+    @see: OOM_KILLER_FRAMES
+    """
+    path = [frame[0].split(".", 1)[0] for frame in frames]
+    for index in range(len(path) - 1, -1, -1):
+        if path[index] in OOM_KILLER_FRAMES:
+            return path[index + 1 :]
+    return path
+
+
+class CallTraceTrie:
+    """
+    Prefix tree of the allocation paths of many OOMs
+
+    The paths are added from the innermost to the outermost function. Paths
+    with the same callers share the nodes of the trie. Each group e.g. a
+    kernel version has its own root.
+
+    The trie is stored in arrays indexed by the node to hold millions of frames:
+
+     * The symbols are interned and stored once in a list, the nodes refer to
+       the index of the symbol.
+     * The children are stored in a single dictionary with the parent node and
+       the symbol index combined into one integer key.
+     * Each node counts the paths passing through it and ending at it.
+
+    @see: allocation_path()
+    """
+
+    __slots__ = (
+        "_symbols",
+        "_symbol_ids",
+        "_roots",
+        "_children",
+        "_parent",
+        "_symbol",
+        "_passes",
+        "_ends",
+    )
+
+    def __init__(self):
+        self._symbols = []
+        self._symbol_ids = {}
+        self._roots = {}
+        self._children = {}
+        self._parent = array.array("l")
+        self._symbol = array.array("l")
+        self._passes = array.array("q")
+        self._ends = array.array("q")
+
+    def __len__(self):
+        """Return the number of nodes incl. the roots"""
+        return len(self._parent)
+
+    def _new_node(self, parent, symbol_id):
+        """Append a node and return its index"""
+        self._parent.append(parent)
+        self._symbol.append(symbol_id)
+        self._passes.append(0)
+        self._ends.append(0)
+        return len(self._parent) - 1
+
+    def _path(self, node):
+        """Return the symbols from the root to the node"""
+        path = []
+        while self._parent[node] != -1:
+            path.append(self._symbols[self._symbol[node]])
+            node = self._parent[node]
+        path.reverse()
+        return path
+
+    def add(self, path, group="", count=1):
+        """
+        Add an allocation path
+
+        @param List(str) path: Functions from the innermost to the outermost
+        @param str group: Group of the path e.g. the kernel version
+        @param int count: Number of OOMs with this path
+        """
+        node = self._roots.get(group)
+        if node is None:
+            node = self._new_node(-1, -1)
+            self._roots[group] = node
+        self._passes[node] += count
+        for symbol in path:
+            symbol_id = self._symbol_ids.get(symbol)
+            if symbol_id is None:
+                symbol_id = len(self._symbols)
+                self._symbols.append(sys.intern(symbol))
+                self._symbol_ids[symbol] = symbol_id
+            key = node << 32 | symbol_id
+            child = self._children.get(key)
+            if child is None:
+                child = self._new_node(node, symbol_id)
+                self._children[key] = child
+            node = child
+            self._passes[node] += count
+        self._ends[node] += count
+
+    def groups(self):
+        """
+        Return the names of all groups
+
+        @rtype: List(str)
+        """
+        return sorted(self._roots)
+
+    def _matching_roots(self, pattern):
+        """Return the roots of all groups matching the shell-style pattern"""
+        return set(
+            [
+                node
+                for group, node in self._roots.items()
+                if fnmatch.fnmatchcase(group, pattern)
+            ]
+        )
+
+    def count(self, prefix, pattern="*"):
+        """
+        Return the number of OOMs whose allocation path starts with the prefix
+
+        @param List(str) prefix: Functions from the innermost to the outermost
+        @param str pattern: Shell-style pattern to match the groups e.g. "6.*"
+        @rtype: int
+        """
+        total = 0
+        for node in self._matching_roots(pattern):
+            for symbol in prefix:
+                symbol_id = self._symbol_ids.get(symbol)
+                if symbol_id is None:
+                    break
+                node = self._children.get(node << 32 | symbol_id)
+                if node is None:
+                    break
+            else:
+                total += self._passes[node]
+        return total
+
+    def top_paths(self, nr_paths=10, pattern="*", depth=None):
+        """
+        Return the most frequent allocation paths
+
+        Equal paths of different groups are summed up. With a depth, the paths
+        are truncated to this number of functions.
+
+        @param int nr_paths: Number of paths to return
+        @param str pattern: Shell-style pattern to match the groups e.g. "6.*"
+        @param int|None depth: Maximum number of functions per path
+        @return: Number of OOMs and path ordered by the number of OOMs
+        @rtype: List(Tuple(int, List(str)))
+        """
+        roots = self._matching_roots(pattern)
+        # nodes are always appended after their parent
+        node_root = array.array("l", [0]) * len(self._parent)
+        node_depth = array.array("l", [0]) * len(self._parent)
+        totals = {}
+        for node, parent in enumerate(self._parent):
+            if parent == -1:
+                node_root[node] = node
+                continue
+            node_root[node] = node_root[parent]
+            node_depth[node] = node_depth[parent] + 1
+            if node_root[node] not in roots:
+                continue
+            if depth is None or node_depth[node] < depth:
+                value = self._ends[node]
+            elif node_depth[node] == depth:
+                value = self._passes[node]
+            else:
+                continue
+            if value:
+                path = tuple(self._path(node))
+                totals[path] = totals.get(path, 0) + value
+        top = heapq.nlargest(nr_paths, totals.items(), key=lambda item: item[1])
+        return [(value, list(path)) for path, value in top]
+
+
+def analyse_stream(stream, source):
+    """
+    Analyse all OOM blocks in a text stream
+
+    The log prefix format is detected once and reused for all following OOM
+    blocks as long as it matches.
+
+    @param stream: Text stream
+    @param str source: Name of the stream used in the results
+    @rtype: Iterator(dict)
+    """
+    scanner = OOMBlockScanner()
+    log_prefix = None
+    for index, block in enumerate(scanner.scan(stream)):
+        # all OOMs of a log share the same prefix format usually
+        oom = OOMAnalyser.OOMEntity(block, False, log_prefix)
+        log_prefix = oom.log_prefix
+        res = result_to_dict(*analyse_entity(oom))
+        res["source"] = source
+        res["index"] = index
+        yield res
+
+
+def analyse_journal(entries, source):
+    """
+    Analyse all OOM blocks in the kernel messages of journal entries
+
+    The results contain the timestamp and the hostname of the journal entry
+    with the first line of the OOM block.
+
+    @param entries: Journal entries
+    @type entries: Iterator(dict)
+    @param str source: Name of the stream used in the results
+    @rtype: Iterator(dict)
+    """
+    scanner = OOMBlockScanner()
+    blocks = scanner.scan_tagged(journal_kernel_lines(entries))
+    for index, (block, tags) in enumerate(blocks):
+        res = result_to_dict(*analyse_block(block, True))
+        res["source"] = source
+        res["index"] = index
+        res["timestamp"], res["hostname"] = tags[0]
+        yield res
+
+
+def analyse_kmsg(tagged_lines, source):
+    """
+    Analyse all OOM blocks in records of the kernel log buffer
+
+    The results contain the sequence number and the timestamp in seconds since
+    boot of the first line of the OOM block as well as the number of records
+    dropped inside the OOM block. The kernel drops records if the log buffer
+    overflows before they are read.
+
+    @param tagged_lines: Lines and their tag (sequence number, timestamp in
+                         microseconds, number of skipped user space records)
+    @type tagged_lines: Iterator(str, (int, int, int))
+    @param str source: Name of the stream used in the results
+    @rtype: Iterator(dict)
+    @see: read_kmsg(), read_dmesg_raw()
+    """
+    scanner = OOMBlockScanner()
+    for index, (block, tags) in enumerate(scanner.scan_tagged(tagged_lines)):
+        res = result_to_dict(*analyse_block(block, True))
+        res["source"] = source
+        res["index"] = index
+        seq, usec, unused = tags[0]
+        res["kmsg_seq"] = seq
+        res["uptime"] = usec / 1000000 if usec is not None else None
+        res["dropped_records"] = count_dropped_records(tags)
+        if res["dropped_records"]:
+            res["messages"].append(
+                "WARNING: {} kernel message(s) dropped inside this OOM block, the "
+                "results may be incomplete".format(res["dropped_records"])
+            )
+        yield res
+
+
+def analyse_log(fileobj, source):
+    """
+    Analyse all OOM blocks in an uncompressed log stream of any supported format
+
+    @param fileobj: Binary file object with support for peek()
+    @param str source: Name of the stream used in the results
+    @rtype: Iterator(dict)
+    @see: detect_log_format()
+    """
+    log_format = detect_log_format(fileobj)
+    if log_format == "journal-json":
+        return analyse_journal(read_journal_json(as_text(fileobj)), source)
+    if log_format == "journal-export":
+        return analyse_journal(read_journal_export(fileobj), source)
+    if log_format == "kmsg":
+        return analyse_kmsg(read_kmsg(as_text(fileobj)), source)
+    if log_format == "dmesg-raw":
+        return analyse_kmsg(read_dmesg_raw(as_text(fileobj)), source)
+    return analyse_stream(as_text(fileobj), source)
+
+
+def _strip_archive_dir(name):
+    """
+    Remove the leading directory of an archive member name
+
+    supportconfig and sosreport archives store all files below a single
+    directory e.g. "scc_myhost_231001_1200/messages.txt".
+
+    @type name: str
+    @rtype: str
+    """
+    parts = name.split("/", 1)
+    if len(parts) == 2:
+        return parts[1]
+    return name
+
+
+def _match_member(name, patterns):
+    """
+    Return True if the member name matches one of the patterns
+
+    @type name: str
+    @type patterns: List(str)
+    @rtype: bool
+    """
+    for pattern in patterns:
+        if fnmatch.fnmatchcase(name, pattern):
+            return True
+    return False
+
+
+def parse_uname(text):
+    """
+    Extract hostname and kernel version from the output of "uname -a"
+
+    Example: Linux myhost 5.14.21-150400.24.46-default #1 SMP PREEMPT_DYNAMIC ...
+
+    @param str text: Text with uname output, other lines are ignored
+    @return: Hostname and kernel version or None, None
+    @rtype: (str, str) | (None, None)
+    """
+    for line in text.splitlines():
+        columns = line.split()
+        if len(columns) >= 3 and columns[0] == "Linux":
+            return columns[1], columns[2]
+    return None, None
+
+
+def analyse_archive(fileobj, source):
+    """
+    Analyse all OOM blocks in a supportconfig or sosreport archive
+
+    The archive is read as a stream. Only members with log messages are passed to
+    the OOM scanner. Compressed members are decompressed on the fly.
+
+    The results are tagged with hostname and kernel version of the archive. Both
+    values are only known after the archive is read completely, because the
+    archive may contain the system information after the log files.
+
+    @param fileobj: Uncompressed binary file object
+    @param str source: Name of the archive used in the results
+    @rtype: List(dict)
+    """
+    results = []
+    hostname = None
+    kernel = None
+    with tarfile.open(fileobj=fileobj, mode="r|") as archive:
+        for member in archive:
+            if not member.isfile():
+                continue
+            name = _strip_archive_dir(member.name)
+            if _match_member(name, ARCHIVE_UNAME_MEMBERS):
+                content = archive.extractfile(member).read()
+                hostname, kernel = parse_uname(content.decode("utf-8", "replace"))
+            elif _match_member(name, ARCHIVE_LOG_MEMBERS):
+                # tar members in stream mode don't support seekable()
+                fileobj = open_binary(CountingReader(archive.extractfile(member)))
+                for res in analyse_log(fileobj, source):
+                    res["member"] = member.name
+                    results.append(res)
+
+    for res in results:
+        # journal entries contain the hostname already
+        if res.get("hostname") is None:
+            res["hostname"] = hostname
+        res["archive_kernel_version"] = kernel
+    return results
+
+
+def analyse_file(fileobj, source):
+    """
+    Analyse all OOM blocks in a log file, a journal export or an archive
+
+    @param fileobj: Binary file object
+    @param str source: Name of the file used in the results
+    @rtype: Iterator(dict)
+    """
+    fileobj = open_binary(fileobj)
+    if is_tar(fileobj):
+        return iter(analyse_archive(fileobj, source))
+    return analyse_log(fileobj, source)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Analyse all OOM messages in the given log files, journal exports "
+        '("journalctl -o json" or "-o export"), kernel log buffer records ("/dev/kmsg" '
+        'or "dmesg -r") or supportconfig / sosreport archives. '
+        "Compressed files (gzip, bzip2, xz) are decompressed on the "
+        "fly. The results are written as one JSON object per line to stdout."
+    )
+    parser.add_argument(
+        "files",
+        metavar="FILE",
+        nargs="*",
+        default=["-"],
+        help='Log file or archive to analyse, "-" reads from stdin (default)',
+    )
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="Write the number of analysed blocks and the throughput to stderr",
+    )
+    parser.add_argument(
+        "--top-paths",
+        metavar="N",
+        type=int,
+        default=0,
+        help="Write the N most frequent allocation paths that invoked the OOM killer "
+        "to stderr",
+    )
+    parser.add_argument(
+        "--path-depth",
+        metavar="D",
+        type=int,
+        default=None,
+        help="Truncate the allocation paths to D functions (default: no limit)",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Add the time of all analysis stages to the results",
+    )
+    parser.add_argument(
+        "--profile-memory",
+        action="store_true",
+        help="Add the time and the allocated memory (tracemalloc) of all analysis "
+        "stages to the results, this slows down the analysis",
+    )
+    args = parser.parse_args(argv)
+
+    global profiling
+    OOMAnalyser.add_to_notifybox = collect_notification
+    profiling = args.profile or args.profile_memory
+    if args.profile_memory:
+        tracemalloc.start()
+        OOMAnalyser.profile_memory_usage = lambda: tracemalloc.get_traced_memory()[0]
+
+    trie = CallTraceTrie()
+    nr_blocks = 0
+    bytes_read = 0
+    start = time.perf_counter()
+    for filename in args.files:
+        fileobj = raw = None
+        if filename == KMSG_DEVICE:
+            # the device doesn't support regular reads w/o blocking
+            results = analyse_kmsg(read_kmsg(read_kmsg_device()), filename)
+        else:
+            if filename == "-":
+                fileobj = sys.stdin.buffer
+            else:
+                fileobj = open(filename, "rb")
+            raw = CountingReader(fileobj)
+            results = analyse_file(raw, filename)
+        for res in results:
+            nr_blocks += 1
+            if args.top_paths and res["success"]:
+                trie.add(
+                    allocation_path(res["call_trace_frames"]),
+                    res["kernel_version"] or "",
+                )
+            sys.stdout.write(json.dumps(res, sort_keys=True))
+            sys.stdout.write("\n")
+        if raw:
+            bytes_read += raw.bytes_read
+        if fileobj and fileobj is not sys.stdin.buffer:
+            fileobj.close()
+    duration = time.perf_counter() - start
+
+    if args.top_paths:
+        for value, path in trie.top_paths(args.top_paths, depth=args.path_depth):
+            sys.stderr.write("{:8d} {}\n".format(value, " <- ".join(path)))
+    if args.stats:
+        sys.stderr.write(
+            "{} OOM block(s) from {} file(s) - {} bytes read in {:.3f}s ({:.1f} MB/s)\n".format(
+                nr_blocks,
+                len(args.files),
+                bytes_read,
+                duration,
+                bytes_read / duration / 1024 / 1024 if duration else 0,
+            )
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
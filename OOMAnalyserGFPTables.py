@@ -0,0 +1,2826 @@
+# -*- coding: Latin-1 -*-
+#
+# Linux OOMAnalyser - precomputed GFP tables
+#
+# Copyright (c) 2017-2023 Carsten Grohmann
+# License: MIT (see LICENSE.txt)
+# THIS PROGRAM COMES WITH NO WARRANTY
+#
+# THIS FILE IS GENERATED BY OOMAnalyserGenerate.py - DO NOT EDIT
+# Run "make gfp-tables" after changing GFP_FLAGS in OOMAnalyser.py.
+
+GFP_TABLES = {
+    "BaseKernelConfig": (
+        {
+            "GFP_ATOMIC": 0x20,
+            "GFP_HIGHUSER": 0x200D2,
+            "GFP_HIGHUSER_MOVABLE": 0x200DA,
+            "GFP_IOFS": 0xC0,
+            "GFP_KERNEL": 0xD0,
+            "GFP_NOFS": 0x50,
+            "GFP_NOIO": 0x10,
+            "GFP_NOWAIT": 0x0,
+            "GFP_TEMPORARY": 0x800D0,
+            "GFP_TRANSHUGE": 0x4352DA,
+            "GFP_USER": 0x200D0,
+            "__GFP_COLD": 0x100,
+            "__GFP_COMP": 0x4000,
+            "__GFP_DMA": 0x1,
+            "__GFP_DMA32": 0x4,
+            "__GFP_FS": 0x80,
+            "__GFP_HARDWALL": 0x20000,
+            "__GFP_HIGH": 0x20,
+            "__GFP_HIGHMEM": 0x2,
+            "__GFP_IO": 0x40,
+            "__GFP_KMEMCG": 0x100000,
+            "__GFP_MEMALLOC": 0x2000,
+            "__GFP_MOVABLE": 0x8,
+            "__GFP_NOFAIL": 0x800,
+            "__GFP_NOMEMALLOC": 0x10000,
+            "__GFP_NORETRY": 0x1000,
+            "__GFP_NOTRACK": 0x200000,
+            "__GFP_NOTRACK_FALSE_POSITIVE": 0x200000,
+            "__GFP_NOWARN": 0x200,
+            "__GFP_NO_KSWAPD": 0x400000,
+            "__GFP_OTHER_NODE": 0x800000,
+            "__GFP_RECLAIMABLE": 0x80000,
+            "__GFP_REPEAT": 0x400,
+            "__GFP_WAIT": 0x10,
+            "__GFP_WRITE": 0x1000000,
+            "__GFP_ZERO": 0x8000,
+            "___GFP_COLD": 0x100,
+            "___GFP_COMP": 0x4000,
+            "___GFP_DMA": 0x1,
+            "___GFP_DMA32": 0x4,
+            "___GFP_FS": 0x80,
+            "___GFP_HARDWALL": 0x20000,
+            "___GFP_HIGH": 0x20,
+            "___GFP_HIGHMEM": 0x2,
+            "___GFP_IO": 0x40,
+            "___GFP_KMEMCG": 0x100000,
+            "___GFP_MEMALLOC": 0x2000,
+            "___GFP_MOVABLE": 0x8,
+            "___GFP_NOFAIL": 0x800,
+            "___GFP_NOMEMALLOC": 0x10000,
+            "___GFP_NORETRY": 0x1000,
+            "___GFP_NOTRACK": 0x200000,
+            "___GFP_NOWARN": 0x200,
+            "___GFP_NO_KSWAPD": 0x400000,
+            "___GFP_OTHER_NODE": 0x800000,
+            "___GFP_RECLAIMABLE": 0x80000,
+            "___GFP_REPEAT": 0x400,
+            "___GFP_WAIT": 0x10,
+            "___GFP_WRITE": 0x1000000,
+            "___GFP_ZERO": 0x8000,
+        },
+        [
+            "GFP_TRANSHUGE",
+            "GFP_TEMPORARY",
+            "GFP_HIGHUSER_MOVABLE",
+            "GFP_HIGHUSER",
+            "GFP_USER",
+            "GFP_KERNEL",
+            "GFP_IOFS",
+            "GFP_NOFS",
+            "GFP_ATOMIC",
+            "GFP_NOIO",
+            "__GFP_WRITE",
+            "__GFP_OTHER_NODE",
+            "__GFP_NO_KSWAPD",
+            "__GFP_NOTRACK",
+            "__GFP_NOTRACK_FALSE_POSITIVE",
+            "__GFP_KMEMCG",
+            "__GFP_RECLAIMABLE",
+            "__GFP_HARDWALL",
+            "__GFP_NOMEMALLOC",
+            "__GFP_ZERO",
+            "__GFP_COMP",
+            "__GFP_MEMALLOC",
+            "__GFP_NORETRY",
+            "__GFP_NOFAIL",
+            "__GFP_REPEAT",
+            "__GFP_NOWARN",
+            "__GFP_COLD",
+            "__GFP_FS",
+            "__GFP_IO",
+            "__GFP_HIGH",
+            "__GFP_WAIT",
+            "__GFP_MOVABLE",
+            "__GFP_DMA32",
+            "__GFP_HIGHMEM",
+            "__GFP_DMA",
+        ],
+    ),
+    "KernelConfig_3_10": (
+        {
+            "GFP_ATOMIC": 0x20,
+            "GFP_HIGHUSER": 0x200D2,
+            "GFP_HIGHUSER_MOVABLE": 0x200DA,
+            "GFP_IOFS": 0xC0,
+            "GFP_KERNEL": 0xD0,
+            "GFP_NOFS": 0x50,
+            "GFP_NOIO": 0x10,
+            "GFP_NOWAIT": 0x0,
+            "GFP_TEMPORARY": 0x800D0,
+            "GFP_TRANSHUGE": 0x4352DA,
+            "GFP_USER": 0x200D0,
+            "__GFP_COLD": 0x100,
+            "__GFP_COMP": 0x4000,
+            "__GFP_DMA": 0x1,
+            "__GFP_DMA32": 0x4,
+            "__GFP_FS": 0x80,
+            "__GFP_HARDWALL": 0x20000,
+            "__GFP_HIGH": 0x20,
+            "__GFP_HIGHMEM": 0x2,
+            "__GFP_IO": 0x40,
+            "__GFP_KMEMCG": 0x100000,
+            "__GFP_MEMALLOC": 0x2000,
+            "__GFP_MOVABLE": 0x8,
+            "__GFP_NOFAIL": 0x800,
+            "__GFP_NOMEMALLOC": 0x10000,
+            "__GFP_NORETRY": 0x1000,
+            "__GFP_NOTRACK": 0x200000,
+            "__GFP_NOTRACK_FALSE_POSITIVE": 0x200000,
+            "__GFP_NOWARN": 0x200,
+            "__GFP_NO_KSWAPD": 0x400000,
+            "__GFP_OTHER_NODE": 0x800000,
+            "__GFP_RECLAIMABLE": 0x80000,
+            "__GFP_REPEAT": 0x400,
+            "__GFP_WAIT": 0x10,
+            "__GFP_WRITE": 0x1000000,
+            "__GFP_ZERO": 0x8000,
+            "___GFP_COLD": 0x100,
+            "___GFP_COMP": 0x4000,
+            "___GFP_DMA": 0x1,
+            "___GFP_DMA32": 0x4,
+            "___GFP_FS": 0x80,
+            "___GFP_HARDWALL": 0x20000,
+            "___GFP_HIGH": 0x20,
+            "___GFP_HIGHMEM": 0x2,
+            "___GFP_IO": 0x40,
+            "___GFP_KMEMCG": 0x100000,
+            "___GFP_MEMALLOC": 0x2000,
+            "___GFP_MOVABLE": 0x8,
+            "___GFP_NOFAIL": 0x800,
+            "___GFP_NOMEMALLOC": 0x10000,
+            "___GFP_NORETRY": 0x1000,
+            "___GFP_NOTRACK": 0x200000,
+            "___GFP_NOWARN": 0x200,
+            "___GFP_NO_KSWAPD": 0x400000,
+            "___GFP_OTHER_NODE": 0x800000,
+            "___GFP_RECLAIMABLE": 0x80000,
+            "___GFP_REPEAT": 0x400,
+            "___GFP_WAIT": 0x10,
+            "___GFP_WRITE": 0x1000000,
+            "___GFP_ZERO": 0x8000,
+        },
+        [
+            "GFP_TRANSHUGE",
+            "GFP_TEMPORARY",
+            "GFP_HIGHUSER_MOVABLE",
+            "GFP_HIGHUSER",
+            "GFP_USER",
+            "GFP_KERNEL",
+            "GFP_IOFS",
+            "GFP_NOFS",
+            "GFP_ATOMIC",
+            "GFP_NOIO",
+            "__GFP_WRITE",
+            "__GFP_OTHER_NODE",
+            "__GFP_NO_KSWAPD",
+            "__GFP_NOTRACK",
+            "__GFP_NOTRACK_FALSE_POSITIVE",
+            "__GFP_KMEMCG",
+            "__GFP_RECLAIMABLE",
+            "__GFP_HARDWALL",
+            "__GFP_NOMEMALLOC",
+            "__GFP_ZERO",
+            "__GFP_COMP",
+            "__GFP_MEMALLOC",
+            "__GFP_NORETRY",
+            "__GFP_NOFAIL",
+            "__GFP_REPEAT",
+            "__GFP_NOWARN",
+            "__GFP_COLD",
+            "__GFP_FS",
+            "__GFP_IO",
+            "__GFP_HIGH",
+            "__GFP_WAIT",
+            "__GFP_MOVABLE",
+            "__GFP_DMA32",
+            "__GFP_HIGHMEM",
+            "__GFP_DMA",
+        ],
+    ),
+    "KernelConfig_3_10_EL7": (
+        {
+            "GFP_ATOMIC": 0x20,
+            "GFP_HIGHUSER": 0x200D2,
+            "GFP_HIGHUSER_MOVABLE": 0x200DA,
+            "GFP_IOFS": 0xC0,
+            "GFP_KERNEL": 0xD0,
+            "GFP_KERNEL_ACCOUNT": 0x1000D0,
+            "GFP_NOFS": 0x50,
+            "GFP_NOIO": 0x10,
+            "GFP_NOWAIT": 0x0,
+            "GFP_TEMPORARY": 0x800D0,
+            "GFP_TRANSHUGE": 0x4352DA,
+            "GFP_USER": 0x200D0,
+            "__GFP_ACCOUNT": 0x100000,
+            "__GFP_COLD": 0x100,
+            "__GFP_COMP": 0x4000,
+            "__GFP_DMA": 0x1,
+            "__GFP_DMA32": 0x4,
+            "__GFP_FS": 0x80,
+            "__GFP_HARDWALL": 0x20000,
+            "__GFP_HIGH": 0x20,
+            "__GFP_HIGHMEM": 0x2,
+            "__GFP_IO": 0x40,
+            "__GFP_MEMALLOC": 0x2000,
+            "__GFP_MOVABLE": 0x8,
+            "__GFP_NOFAIL": 0x800,
+            "__GFP_NOMEMALLOC": 0x10000,
+            "__GFP_NORETRY": 0x1000,
+            "__GFP_NOTRACK": 0x200000,
+            "__GFP_NOTRACK_FALSE_POSITIVE": 0x200000,
+            "__GFP_NOWARN": 0x200,
+            "__GFP_NO_KSWAPD": 0x400000,
+            "__GFP_OTHER_NODE": 0x800000,
+            "__GFP_RECLAIMABLE": 0x80000,
+            "__GFP_REPEAT": 0x400,
+            "__GFP_WAIT": 0x10,
+            "__GFP_WRITE": 0x1000000,
+            "__GFP_ZERO": 0x8000,
+            "___GFP_ACCOUNT": 0x100000,
+            "___GFP_COLD": 0x100,
+            "___GFP_COMP": 0x4000,
+            "___GFP_DMA": 0x1,
+            "___GFP_DMA32": 0x4,
+            "___GFP_FS": 0x80,
+            "___GFP_HARDWALL": 0x20000,
+            "___GFP_HIGH": 0x20,
+            "___GFP_HIGHMEM": 0x2,
+            "___GFP_IO": 0x40,
+            "___GFP_MEMALLOC": 0x2000,
+            "___GFP_MOVABLE": 0x8,
+            "___GFP_NOFAIL": 0x800,
+            "___GFP_NOMEMALLOC": 0x10000,
+            "___GFP_NORETRY": 0x1000,
+            "___GFP_NOTRACK": 0x200000,
+            "___GFP_NOWARN": 0x200,
+            "___GFP_NO_KSWAPD": 0x400000,
+            "___GFP_OTHER_NODE": 0x800000,
+            "___GFP_RECLAIMABLE": 0x80000,
+            "___GFP_REPEAT": 0x400,
+            "___GFP_WAIT": 0x10,
+            "___GFP_WRITE": 0x1000000,
+            "___GFP_ZERO": 0x8000,
+        },
+        [
+            "GFP_TRANSHUGE",
+            "GFP_KERNEL_ACCOUNT",
+            "GFP_TEMPORARY",
+            "GFP_HIGHUSER_MOVABLE",
+            "GFP_HIGHUSER",
+            "GFP_USER",
+            "GFP_KERNEL",
+            "GFP_IOFS",
+            "GFP_NOFS",
+            "GFP_ATOMIC",
+            "GFP_NOIO",
+            "__GFP_WRITE",
+            "__GFP_OTHER_NODE",
+            "__GFP_NO_KSWAPD",
+            "__GFP_NOTRACK",
+            "__GFP_NOTRACK_FALSE_POSITIVE",
+            "__GFP_ACCOUNT",
+            "__GFP_RECLAIMABLE",
+            "__GFP_HARDWALL",
+            "__GFP_NOMEMALLOC",
+            "__GFP_ZERO",
+            "__GFP_COMP",
+            "__GFP_MEMALLOC",
+            "__GFP_NORETRY",
+            "__GFP_NOFAIL",
+            "__GFP_REPEAT",
+            "__GFP_NOWARN",
+            "__GFP_COLD",
+            "__GFP_FS",
+            "__GFP_IO",
+            "__GFP_HIGH",
+            "__GFP_WAIT",
+            "__GFP_MOVABLE",
+            "__GFP_DMA32",
+            "__GFP_HIGHMEM",
+            "__GFP_DMA",
+        ],
+    ),
+    "KernelConfig_3_16": (
+        {
+            "GFP_ATOMIC": 0x20,
+            "GFP_HIGHUSER": 0x200D2,
+            "GFP_HIGHUSER_MOVABLE": 0x200DA,
+            "GFP_IOFS": 0xC0,
+            "GFP_KERNEL": 0xD0,
+            "GFP_NOFS": 0x50,
+            "GFP_NOIO": 0x10,
+            "GFP_NOWAIT": 0x0,
+            "GFP_TEMPORARY": 0x800D0,
+            "GFP_TRANSHUGE": 0x4352DA,
+            "GFP_USER": 0x200D0,
+            "__GFP_COLD": 0x100,
+            "__GFP_COMP": 0x4000,
+            "__GFP_DMA": 0x1,
+            "__GFP_DMA32": 0x4,
+            "__GFP_FS": 0x80,
+            "__GFP_HARDWALL": 0x20000,
+            "__GFP_HIGH": 0x20,
+            "__GFP_HIGHMEM": 0x2,
+            "__GFP_IO": 0x40,
+            "__GFP_MEMALLOC": 0x2000,
+            "__GFP_MOVABLE": 0x8,
+            "__GFP_NOFAIL": 0x800,
+            "__GFP_NOMEMALLOC": 0x10000,
+            "__GFP_NORETRY": 0x1000,
+            "__GFP_NOTRACK": 0x200000,
+            "__GFP_NOTRACK_FALSE_POSITIVE": 0x200000,
+            "__GFP_NOWARN": 0x200,
+            "__GFP_NO_KSWAPD": 0x400000,
+            "__GFP_OTHER_NODE": 0x800000,
+            "__GFP_RECLAIMABLE": 0x80000,
+            "__GFP_REPEAT": 0x400,
+            "__GFP_WAIT": 0x10,
+            "__GFP_WRITE": 0x1000000,
+            "__GFP_ZERO": 0x8000,
+            "___GFP_COLD": 0x100,
+            "___GFP_COMP": 0x4000,
+            "___GFP_DMA": 0x1,
+            "___GFP_DMA32": 0x4,
+            "___GFP_FS": 0x80,
+            "___GFP_HARDWALL": 0x20000,
+            "___GFP_HIGH": 0x20,
+            "___GFP_HIGHMEM": 0x2,
+            "___GFP_IO": 0x40,
+            "___GFP_MEMALLOC": 0x2000,
+            "___GFP_MOVABLE": 0x8,
+            "___GFP_NOFAIL": 0x800,
+            "___GFP_NOMEMALLOC": 0x10000,
+            "___GFP_NORETRY": 0x1000,
+            "___GFP_NOTRACK": 0x200000,
+            "___GFP_NOWARN": 0x200,
+            "___GFP_NO_KSWAPD": 0x400000,
+            "___GFP_OTHER_NODE": 0x800000,
+            "___GFP_RECLAIMABLE": 0x80000,
+            "___GFP_REPEAT": 0x400,
+            "___GFP_WAIT": 0x10,
+            "___GFP_WRITE": 0x1000000,
+            "___GFP_ZERO": 0x8000,
+        },
+        [
+            "GFP_TRANSHUGE",
+            "GFP_TEMPORARY",
+            "GFP_HIGHUSER_MOVABLE",
+            "GFP_HIGHUSER",
+            "GFP_USER",
+            "GFP_KERNEL",
+            "GFP_IOFS",
+            "GFP_NOFS",
+            "GFP_ATOMIC",
+            "GFP_NOIO",
+            "__GFP_WRITE",
+            "__GFP_OTHER_NODE",
+            "__GFP_NO_KSWAPD",
+            "__GFP_NOTRACK",
+            "__GFP_NOTRACK_FALSE_POSITIVE",
+            "__GFP_RECLAIMABLE",
+            "__GFP_HARDWALL",
+            "__GFP_NOMEMALLOC",
+            "__GFP_ZERO",
+            "__GFP_COMP",
+            "__GFP_MEMALLOC",
+            "__GFP_NORETRY",
+            "__GFP_NOFAIL",
+            "__GFP_REPEAT",
+            "__GFP_NOWARN",
+            "__GFP_COLD",
+            "__GFP_FS",
+            "__GFP_IO",
+            "__GFP_HIGH",
+            "__GFP_WAIT",
+            "__GFP_MOVABLE",
+            "__GFP_DMA32",
+            "__GFP_HIGHMEM",
+            "__GFP_DMA",
+        ],
+    ),
+    "KernelConfig_3_19": (
+        {
+            "GFP_ATOMIC": 0x20,
+            "GFP_HIGHUSER": 0x200D2,
+            "GFP_HIGHUSER_MOVABLE": 0x200DA,
+            "GFP_IOFS": 0xC0,
+            "GFP_KERNEL": 0xD0,
+            "GFP_NOFS": 0x50,
+            "GFP_NOIO": 0x10,
+            "GFP_NOWAIT": 0x0,
+            "GFP_TEMPORARY": 0x800D0,
+            "GFP_TRANSHUGE": 0x4352DA,
+            "GFP_USER": 0x200D0,
+            "__GFP_COLD": 0x100,
+            "__GFP_COMP": 0x4000,
+            "__GFP_DMA": 0x1,
+            "__GFP_DMA32": 0x4,
+            "__GFP_FS": 0x80,
+            "__GFP_HARDWALL": 0x20000,
+            "__GFP_HIGH": 0x20,
+            "__GFP_HIGHMEM": 0x2,
+            "__GFP_IO": 0x40,
+            "__GFP_MEMALLOC": 0x2000,
+            "__GFP_MOVABLE": 0x8,
+            "__GFP_NOFAIL": 0x800,
+            "__GFP_NOMEMALLOC": 0x10000,
+            "__GFP_NORETRY": 0x1000,
+            "__GFP_NOTRACK": 0x200000,
+            "__GFP_NOTRACK_FALSE_POSITIVE": 0x200000,
+            "__GFP_NOWARN": 0x200,
+            "__GFP_NO_KSWAPD": 0x400000,
+            "__GFP_OTHER_NODE": 0x800000,
+            "__GFP_RECLAIMABLE": 0x80000,
+            "__GFP_REPEAT": 0x400,
+            "__GFP_WAIT": 0x10,
+            "__GFP_WRITE": 0x1000000,
+            "__GFP_ZERO": 0x8000,
+            "___GFP_COLD": 0x100,
+            "___GFP_COMP": 0x4000,
+            "___GFP_DMA": 0x1,
+            "___GFP_DMA32": 0x4,
+            "___GFP_FS": 0x80,
+            "___GFP_HARDWALL": 0x20000,
+            "___GFP_HIGH": 0x20,
+            "___GFP_HIGHMEM": 0x2,
+            "___GFP_IO": 0x40,
+            "___GFP_MEMALLOC": 0x2000,
+            "___GFP_MOVABLE": 0x8,
+            "___GFP_NOFAIL": 0x800,
+            "___GFP_NOMEMALLOC": 0x10000,
+            "___GFP_NORETRY": 0x1000,
+            "___GFP_NOTRACK": 0x200000,
+            "___GFP_NOWARN": 0x200,
+            "___GFP_NO_KSWAPD": 0x400000,
+            "___GFP_OTHER_NODE": 0x800000,
+            "___GFP_RECLAIMABLE": 0x80000,
+            "___GFP_REPEAT": 0x400,
+            "___GFP_WAIT": 0x10,
+            "___GFP_WRITE": 0x1000000,
+            "___GFP_ZERO": 0x8000,
+        },
+        [
+            "GFP_TRANSHUGE",
+            "GFP_TEMPORARY",
+            "GFP_HIGHUSER_MOVABLE",
+            "GFP_HIGHUSER",
+            "GFP_USER",
+            "GFP_KERNEL",
+            "GFP_IOFS",
+            "GFP_NOFS",
+            "GFP_ATOMIC",
+            "GFP_NOIO",
+            "__GFP_WRITE",
+            "__GFP_OTHER_NODE",
+            "__GFP_NO_KSWAPD",
+            "__GFP_NOTRACK",
+            "__GFP_NOTRACK_FALSE_POSITIVE",
+            "__GFP_RECLAIMABLE",
+            "__GFP_HARDWALL",
+            "__GFP_NOMEMALLOC",
+            "__GFP_ZERO",
+            "__GFP_COMP",
+            "__GFP_MEMALLOC",
+            "__GFP_NORETRY",
+            "__GFP_NOFAIL",
+            "__GFP_REPEAT",
+            "__GFP_NOWARN",
+            "__GFP_COLD",
+            "__GFP_FS",
+            "__GFP_IO",
+            "__GFP_HIGH",
+            "__GFP_WAIT",
+            "__GFP_MOVABLE",
+            "__GFP_DMA32",
+            "__GFP_HIGHMEM",
+            "__GFP_DMA",
+        ],
+    ),
+    "KernelConfig_4_1": (
+        {
+            "GFP_ATOMIC": 0x20,
+            "GFP_HIGHUSER": 0x200D2,
+            "GFP_HIGHUSER_MOVABLE": 0x200DA,
+            "GFP_IOFS": 0xC0,
+            "GFP_KERNEL": 0xD0,
+            "GFP_NOFS": 0x50,
+            "GFP_NOIO": 0x10,
+            "GFP_NOWAIT": 0x0,
+            "GFP_TEMPORARY": 0x800D0,
+            "GFP_TRANSHUGE": 0x4352DA,
+            "GFP_USER": 0x200D0,
+            "__GFP_COLD": 0x100,
+            "__GFP_COMP": 0x4000,
+            "__GFP_DMA": 0x1,
+            "__GFP_DMA32": 0x4,
+            "__GFP_FS": 0x80,
+            "__GFP_HARDWALL": 0x20000,
+            "__GFP_HIGH": 0x20,
+            "__GFP_HIGHMEM": 0x2,
+            "__GFP_IO": 0x40,
+            "__GFP_MEMALLOC": 0x2000,
+            "__GFP_MOVABLE": 0x8,
+            "__GFP_NOACCOUNT": 0x100000,
+            "__GFP_NOFAIL": 0x800,
+            "__GFP_NOMEMALLOC": 0x10000,
+            "__GFP_NORETRY": 0x1000,
+            "__GFP_NOTRACK": 0x200000,
+            "__GFP_NOTRACK_FALSE_POSITIVE": 0x200000,
+            "__GFP_NOWARN": 0x200,
+            "__GFP_NO_KSWAPD": 0x400000,
+            "__GFP_OTHER_NODE": 0x800000,
+            "__GFP_RECLAIMABLE": 0x80000,
+            "__GFP_REPEAT": 0x400,
+            "__GFP_WAIT": 0x10,
+            "__GFP_WRITE": 0x1000000,
+            "__GFP_ZERO": 0x8000,
+            "___GFP_COLD": 0x100,
+            "___GFP_COMP": 0x4000,
+            "___GFP_DMA": 0x1,
+            "___GFP_DMA32": 0x4,
+            "___GFP_FS": 0x80,
+            "___GFP_HARDWALL": 0x20000,
+            "___GFP_HIGH": 0x20,
+            "___GFP_HIGHMEM": 0x2,
+            "___GFP_IO": 0x40,
+            "___GFP_MEMALLOC": 0x2000,
+            "___GFP_MOVABLE": 0x8,
+            "___GFP_NOACCOUNT": 0x100000,
+            "___GFP_NOFAIL": 0x800,
+            "___GFP_NOMEMALLOC": 0x10000,
+            "___GFP_NORETRY": 0x1000,
+            "___GFP_NOTRACK": 0x200000,
+            "___GFP_NOWARN": 0x200,
+            "___GFP_NO_KSWAPD": 0x400000,
+            "___GFP_OTHER_NODE": 0x800000,
+            "___GFP_RECLAIMABLE": 0x80000,
+            "___GFP_REPEAT": 0x400,
+            "___GFP_WAIT": 0x10,
+            "___GFP_WRITE": 0x1000000,
+            "___GFP_ZERO": 0x8000,
+        },
+        [
+            "GFP_TRANSHUGE",
+            "GFP_TEMPORARY",
+            "GFP_HIGHUSER_MOVABLE",
+            "GFP_HIGHUSER",
+            "GFP_USER",
+            "GFP_KERNEL",
+            "GFP_IOFS",
+            "GFP_NOFS",
+            "GFP_ATOMIC",
+            "GFP_NOIO",
+            "__GFP_WRITE",
+            "__GFP_OTHER_NODE",
+            "__GFP_NO_KSWAPD",
+            "__GFP_NOTRACK",
+            "__GFP_NOTRACK_FALSE_POSITIVE",
+            "__GFP_NOACCOUNT",
+            "__GFP_RECLAIMABLE",
+            "__GFP_HARDWALL",
+            "__GFP_NOMEMALLOC",
+            "__GFP_ZERO",
+            "__GFP_COMP",
+            "__GFP_MEMALLOC",
+            "__GFP_NORETRY",
+            "__GFP_NOFAIL",
+            "__GFP_REPEAT",
+            "__GFP_NOWARN",
+            "__GFP_COLD",
+            "__GFP_FS",
+            "__GFP_IO",
+            "__GFP_HIGH",
+            "__GFP_WAIT",
+            "__GFP_MOVABLE",
+            "__GFP_DMA32",
+            "__GFP_HIGHMEM",
+            "__GFP_DMA",
+        ],
+    ),
+    "KernelConfig_4_10": (
+        {
+            "GFP_ATOMIC": 0x1080020,
+            "GFP_HIGHUSER": 0x14200C2,
+            "GFP_HIGHUSER_MOVABLE": 0x14200CA,
+            "GFP_KERNEL": 0x14000C0,
+            "GFP_KERNEL_ACCOUNT": 0x15000C0,
+            "GFP_NOFS": 0x1400040,
+            "GFP_NOIO": 0x1400000,
+            "GFP_NOWAIT": 0x1000000,
+            "GFP_TEMPORARY": 0x14000D0,
+            "GFP_TRANSHUGE": 0x4342CA,
+            "GFP_TRANSHUGE_LIGHT": 0x342CA,
+            "GFP_USER": 0x14200C0,
+            "__GFP_ACCOUNT": 0x100000,
+            "__GFP_ATOMIC": 0x80000,
+            "__GFP_COLD": 0x100,
+            "__GFP_COMP": 0x4000,
+            "__GFP_DIRECT_RECLAIM": 0x400000,
+            "__GFP_DMA": 0x1,
+            "__GFP_DMA32": 0x4,
+            "__GFP_FS": 0x80,
+            "__GFP_HARDWALL": 0x20000,
+            "__GFP_HIGH": 0x20,
+            "__GFP_HIGHMEM": 0x2,
+            "__GFP_IO": 0x40,
+            "__GFP_KSWAPD_RECLAIM": 0x1000000,
+            "__GFP_MEMALLOC": 0x2000,
+            "__GFP_MOVABLE": 0x8,
+            "__GFP_NOFAIL": 0x800,
+            "__GFP_NOMEMALLOC": 0x10000,
+            "__GFP_NORETRY": 0x1000,
+            "__GFP_NOTRACK": 0x200000,
+            "__GFP_NOTRACK_FALSE_POSITIVE": 0x200000,
+            "__GFP_NOWARN": 0x200,
+            "__GFP_RECLAIM": 0x1400000,
+            "__GFP_RECLAIMABLE": 0x10,
+            "__GFP_REPEAT": 0x400,
+            "__GFP_WRITE": 0x800000,
+            "__GFP_ZERO": 0x8000,
+            "___GFP_ACCOUNT": 0x100000,
+            "___GFP_ATOMIC": 0x80000,
+            "___GFP_COLD": 0x100,
+            "___GFP_COMP": 0x4000,
+            "___GFP_DIRECT_RECLAIM": 0x400000,
+            "___GFP_DMA": 0x1,
+            "___GFP_DMA32": 0x4,
+            "___GFP_FS": 0x80,
+            "___GFP_HARDWALL": 0x20000,
+            "___GFP_HIGH": 0x20,
+            "___GFP_HIGHMEM": 0x2,
+            "___GFP_IO": 0x40,
+            "___GFP_KSWAPD_RECLAIM": 0x1000000,
+            "___GFP_MEMALLOC": 0x2000,
+            "___GFP_MOVABLE": 0x8,
+            "___GFP_NOFAIL": 0x800,
+            "___GFP_NOMEMALLOC": 0x10000,
+            "___GFP_NORETRY": 0x1000,
+            "___GFP_NOTRACK": 0x200000,
+            "___GFP_NOWARN": 0x200,
+            "___GFP_RECLAIMABLE": 0x10,
+            "___GFP_REPEAT": 0x400,
+            "___GFP_WRITE": 0x800000,
+            "___GFP_ZERO": 0x8000,
+        },
+        [
+            "GFP_KERNEL_ACCOUNT",
+            "GFP_HIGHUSER_MOVABLE",
+            "GFP_HIGHUSER",
+            "GFP_USER",
+            "GFP_TEMPORARY",
+            "GFP_KERNEL",
+            "GFP_NOFS",
+            "GFP_NOIO",
+            "GFP_ATOMIC",
+            "GFP_NOWAIT",
+            "GFP_TRANSHUGE",
+            "GFP_TRANSHUGE_LIGHT",
+            "__GFP_RECLAIM",
+            "__GFP_KSWAPD_RECLAIM",
+            "__GFP_WRITE",
+            "__GFP_DIRECT_RECLAIM",
+            "__GFP_NOTRACK",
+            "__GFP_NOTRACK_FALSE_POSITIVE",
+            "__GFP_ACCOUNT",
+            "__GFP_ATOMIC",
+            "__GFP_HARDWALL",
+            "__GFP_NOMEMALLOC",
+            "__GFP_ZERO",
+            "__GFP_COMP",
+            "__GFP_MEMALLOC",
+            "__GFP_NORETRY",
+            "__GFP_NOFAIL",
+            "__GFP_REPEAT",
+            "__GFP_NOWARN",
+            "__GFP_COLD",
+            "__GFP_FS",
+            "__GFP_IO",
+            "__GFP_HIGH",
+            "__GFP_RECLAIMABLE",
+            "__GFP_MOVABLE",
+            "__GFP_DMA32",
+            "__GFP_HIGHMEM",
+            "__GFP_DMA",
+        ],
+    ),
+    "KernelConfig_4_12": (
+        {
+            "GFP_ATOMIC": 0x1080020,
+            "GFP_HIGHUSER": 0x14200C2,
+            "GFP_HIGHUSER_MOVABLE": 0x14200CA,
+            "GFP_KERNEL": 0x14000C0,
+            "GFP_KERNEL_ACCOUNT": 0x15000C0,
+            "GFP_NOFS": 0x1400040,
+            "GFP_NOIO": 0x1400000,
+            "GFP_NOWAIT": 0x1000000,
+            "GFP_TEMPORARY": 0x14000D0,
+            "GFP_TRANSHUGE": 0x4342CA,
+            "GFP_TRANSHUGE_LIGHT": 0x342CA,
+            "GFP_USER": 0x14200C0,
+            "__GFP_ACCOUNT": 0x100000,
+            "__GFP_ATOMIC": 0x80000,
+            "__GFP_COLD": 0x100,
+            "__GFP_COMP": 0x4000,
+            "__GFP_DIRECT_RECLAIM": 0x400000,
+            "__GFP_DMA": 0x1,
+            "__GFP_DMA32": 0x4,
+            "__GFP_FS": 0x80,
+            "__GFP_HARDWALL": 0x20000,
+            "__GFP_HIGH": 0x20,
+            "__GFP_HIGHMEM": 0x2,
+            "__GFP_IO": 0x40,
+            "__GFP_KSWAPD_RECLAIM": 0x1000000,
+            "__GFP_MEMALLOC": 0x2000,
+            "__GFP_MOVABLE": 0x8,
+            "__GFP_NOFAIL": 0x800,
+            "__GFP_NOLOCKDEP": 0x2000000,
+            "__GFP_NOMEMALLOC": 0x10000,
+            "__GFP_NORETRY": 0x1000,
+            "__GFP_NOTRACK": 0x200000,
+            "__GFP_NOTRACK_FALSE_POSITIVE": 0x200000,
+            "__GFP_NOWARN": 0x200,
+            "__GFP_RECLAIM": 0x1400000,
+            "__GFP_RECLAIMABLE": 0x10,
+            "__GFP_REPEAT": 0x400,
+            "__GFP_WRITE": 0x800000,
+            "__GFP_ZERO": 0x8000,
+            "___GFP_ACCOUNT": 0x100000,
+            "___GFP_ATOMIC": 0x80000,
+            "___GFP_COLD": 0x100,
+            "___GFP_COMP": 0x4000,
+            "___GFP_DIRECT_RECLAIM": 0x400000,
+            "___GFP_DMA": 0x1,
+            "___GFP_DMA32": 0x4,
+            "___GFP_FS": 0x80,
+            "___GFP_HARDWALL": 0x20000,
+            "___GFP_HIGH": 0x20,
+            "___GFP_HIGHMEM": 0x2,
+            "___GFP_IO": 0x40,
+            "___GFP_KSWAPD_RECLAIM": 0x1000000,
+            "___GFP_MEMALLOC": 0x2000,
+            "___GFP_MOVABLE": 0x8,
+            "___GFP_NOFAIL": 0x800,
+            "___GFP_NOLOCKDEP": 0x2000000,
+            "___GFP_NOMEMALLOC": 0x10000,
+            "___GFP_NORETRY": 0x1000,
+            "___GFP_NOTRACK": 0x200000,
+            "___GFP_NOWARN": 0x200,
+            "___GFP_RECLAIMABLE": 0x10,
+            "___GFP_REPEAT": 0x400,
+            "___GFP_WRITE": 0x800000,
+            "___GFP_ZERO": 0x8000,
+        },
+        [
+            "GFP_KERNEL_ACCOUNT",
+            "GFP_HIGHUSER_MOVABLE",
+            "GFP_HIGHUSER",
+            "GFP_USER",
+            "GFP_TEMPORARY",
+            "GFP_KERNEL",
+            "GFP_NOFS",
+            "GFP_NOIO",
+            "GFP_ATOMIC",
+            "GFP_NOWAIT",
+            "GFP_TRANSHUGE",
+            "GFP_TRANSHUGE_LIGHT",
+            "__GFP_NOLOCKDEP",
+            "__GFP_RECLAIM",
+            "__GFP_KSWAPD_RECLAIM",
+            "__GFP_WRITE",
+            "__GFP_DIRECT_RECLAIM",
+            "__GFP_NOTRACK",
+            "__GFP_NOTRACK_FALSE_POSITIVE",
+            "__GFP_ACCOUNT",
+            "__GFP_ATOMIC",
+            "__GFP_HARDWALL",
+            "__GFP_NOMEMALLOC",
+            "__GFP_ZERO",
+            "__GFP_COMP",
+            "__GFP_MEMALLOC",
+            "__GFP_NORETRY",
+            "__GFP_NOFAIL",
+            "__GFP_REPEAT",
+            "__GFP_NOWARN",
+            "__GFP_COLD",
+            "__GFP_FS",
+            "__GFP_IO",
+            "__GFP_HIGH",
+            "__GFP_RECLAIMABLE",
+            "__GFP_MOVABLE",
+            "__GFP_DMA32",
+            "__GFP_HIGHMEM",
+            "__GFP_DMA",
+        ],
+    ),
+    "KernelConfig_4_13": (
+        {
+            "GFP_ATOMIC": 0x1080020,
+            "GFP_HIGHUSER": 0x14200C2,
+            "GFP_HIGHUSER_MOVABLE": 0x14200CA,
+            "GFP_KERNEL": 0x14000C0,
+            "GFP_KERNEL_ACCOUNT": 0x15000C0,
+            "GFP_NOFS": 0x1400040,
+            "GFP_NOIO": 0x1400000,
+            "GFP_NOWAIT": 0x1000000,
+            "GFP_TEMPORARY": 0x14000D0,
+            "GFP_TRANSHUGE": 0x4342CA,
+            "GFP_TRANSHUGE_LIGHT": 0x342CA,
+            "GFP_USER": 0x14200C0,
+            "__GFP_ACCOUNT": 0x100000,
+            "__GFP_ATOMIC": 0x80000,
+            "__GFP_COLD": 0x100,
+            "__GFP_COMP": 0x4000,
+            "__GFP_DIRECT_RECLAIM": 0x400000,
+            "__GFP_DMA": 0x1,
+            "__GFP_DMA32": 0x4,
+            "__GFP_FS": 0x80,
+            "__GFP_HARDWALL": 0x20000,
+            "__GFP_HIGH": 0x20,
+            "__GFP_HIGHMEM": 0x2,
+            "__GFP_IO": 0x40,
+            "__GFP_KSWAPD_RECLAIM": 0x1000000,
+            "__GFP_MEMALLOC": 0x2000,
+            "__GFP_MOVABLE": 0x8,
+            "__GFP_NOFAIL": 0x800,
+            "__GFP_NOLOCKDEP": 0x2000000,
+            "__GFP_NOMEMALLOC": 0x10000,
+            "__GFP_NORETRY": 0x1000,
+            "__GFP_NOTRACK": 0x200000,
+            "__GFP_NOTRACK_FALSE_POSITIVE": 0x200000,
+            "__GFP_NOWARN": 0x200,
+            "__GFP_RECLAIM": 0x1400000,
+            "__GFP_RECLAIMABLE": 0x10,
+            "__GFP_RETRY_MAYFAIL": 0x400,
+            "__GFP_WRITE": 0x800000,
+            "__GFP_ZERO": 0x8000,
+            "___GFP_ACCOUNT": 0x100000,
+            "___GFP_ATOMIC": 0x80000,
+            "___GFP_COLD": 0x100,
+            "___GFP_COMP": 0x4000,
+            "___GFP_DIRECT_RECLAIM": 0x400000,
+            "___GFP_DMA": 0x1,
+            "___GFP_DMA32": 0x4,
+            "___GFP_FS": 0x80,
+            "___GFP_HARDWALL": 0x20000,
+            "___GFP_HIGH": 0x20,
+            "___GFP_HIGHMEM": 0x2,
+            "___GFP_IO": 0x40,
+            "___GFP_KSWAPD_RECLAIM": 0x1000000,
+            "___GFP_MEMALLOC": 0x2000,
+            "___GFP_MOVABLE": 0x8,
+            "___GFP_NOFAIL": 0x800,
+            "___GFP_NOLOCKDEP": 0x2000000,
+            "___GFP_NOMEMALLOC": 0x10000,
+            "___GFP_NORETRY": 0x1000,
+            "___GFP_NOTRACK": 0x200000,
+            "___GFP_NOWARN": 0x200,
+            "___GFP_RECLAIMABLE": 0x10,
+            "___GFP_RETRY_MAYFAIL": 0x400,
+            "___GFP_WRITE": 0x800000,
+            "___GFP_ZERO": 0x8000,
+        },
+        [
+            "GFP_KERNEL_ACCOUNT",
+            "GFP_HIGHUSER_MOVABLE",
+            "GFP_HIGHUSER",
+            "GFP_USER",
+            "GFP_TEMPORARY",
+            "GFP_KERNEL",
+            "GFP_NOFS",
+            "GFP_NOIO",
+            "GFP_ATOMIC",
+            "GFP_NOWAIT",
+            "GFP_TRANSHUGE",
+            "GFP_TRANSHUGE_LIGHT",
+            "__GFP_NOLOCKDEP",
+            "__GFP_RECLAIM",
+            "__GFP_KSWAPD_RECLAIM",
+            "__GFP_WRITE",
+            "__GFP_DIRECT_RECLAIM",
+            "__GFP_NOTRACK",
+            "__GFP_NOTRACK_FALSE_POSITIVE",
+            "__GFP_ACCOUNT",
+            "__GFP_ATOMIC",
+            "__GFP_HARDWALL",
+            "__GFP_NOMEMALLOC",
+            "__GFP_ZERO",
+            "__GFP_COMP",
+            "__GFP_MEMALLOC",
+            "__GFP_NORETRY",
+            "__GFP_NOFAIL",
+            "__GFP_RETRY_MAYFAIL",
+            "__GFP_NOWARN",
+            "__GFP_COLD",
+            "__GFP_FS",
+            "__GFP_IO",
+            "__GFP_HIGH",
+            "__GFP_RECLAIMABLE",
+            "__GFP_MOVABLE",
+            "__GFP_DMA32",
+            "__GFP_HIGHMEM",
+            "__GFP_DMA",
+        ],
+    ),
+    "KernelConfig_4_14": (
+        {
+            "GFP_ATOMIC": 0x1080020,
+            "GFP_HIGHUSER": 0x14200C2,
+            "GFP_HIGHUSER_MOVABLE": 0x14200CA,
+            "GFP_KERNEL": 0x14000C0,
+            "GFP_KERNEL_ACCOUNT": 0x15000C0,
+            "GFP_NOFS": 0x1400040,
+            "GFP_NOIO": 0x1400000,
+            "GFP_NOWAIT": 0x1000000,
+            "GFP_TRANSHUGE": 0x4342CA,
+            "GFP_TRANSHUGE_LIGHT": 0x342CA,
+            "GFP_USER": 0x14200C0,
+            "__GFP_ACCOUNT": 0x100000,
+            "__GFP_ATOMIC": 0x80000,
+            "__GFP_COLD": 0x100,
+            "__GFP_COMP": 0x4000,
+            "__GFP_DIRECT_RECLAIM": 0x400000,
+            "__GFP_DMA": 0x1,
+            "__GFP_DMA32": 0x4,
+            "__GFP_FS": 0x80,
+            "__GFP_HARDWALL": 0x20000,
+            "__GFP_HIGH": 0x20,
+            "__GFP_HIGHMEM": 0x2,
+            "__GFP_IO": 0x40,
+            "__GFP_KSWAPD_RECLAIM": 0x1000000,
+            "__GFP_MEMALLOC": 0x2000,
+            "__GFP_MOVABLE": 0x8,
+            "__GFP_NOFAIL": 0x800,
+            "__GFP_NOLOCKDEP": 0x2000000,
+            "__GFP_NOMEMALLOC": 0x10000,
+            "__GFP_NORETRY": 0x1000,
+            "__GFP_NOTRACK": 0x200000,
+            "__GFP_NOTRACK_FALSE_POSITIVE": 0x200000,
+            "__GFP_NOWARN": 0x200,
+            "__GFP_RECLAIM": 0x1400000,
+            "__GFP_RECLAIMABLE": 0x10,
+            "__GFP_RETRY_MAYFAIL": 0x400,
+            "__GFP_WRITE": 0x800000,
+            "__GFP_ZERO": 0x8000,
+            "___GFP_ACCOUNT": 0x100000,
+            "___GFP_ATOMIC": 0x80000,
+            "___GFP_COLD": 0x100,
+            "___GFP_COMP": 0x4000,
+            "___GFP_DIRECT_RECLAIM": 0x400000,
+            "___GFP_DMA": 0x1,
+            "___GFP_DMA32": 0x4,
+            "___GFP_FS": 0x80,
+            "___GFP_HARDWALL": 0x20000,
+            "___GFP_HIGH": 0x20,
+            "___GFP_HIGHMEM": 0x2,
+            "___GFP_IO": 0x40,
+            "___GFP_KSWAPD_RECLAIM": 0x1000000,
+            "___GFP_MEMALLOC": 0x2000,
+            "___GFP_MOVABLE": 0x8,
+            "___GFP_NOFAIL": 0x800,
+            "___GFP_NOLOCKDEP": 0x2000000,
+            "___GFP_NOMEMALLOC": 0x10000,
+            "___GFP_NORETRY": 0x1000,
+            "___GFP_NOTRACK": 0x200000,
+            "___GFP_NOWARN": 0x200,
+            "___GFP_RECLAIMABLE": 0x10,
+            "___GFP_RETRY_MAYFAIL": 0x400,
+            "___GFP_WRITE": 0x800000,
+            "___GFP_ZERO": 0x8000,
+        },
+        [
+            "GFP_KERNEL_ACCOUNT",
+            "GFP_HIGHUSER_MOVABLE",
+            "GFP_HIGHUSER",
+            "GFP_USER",
+            "GFP_KERNEL",
+            "GFP_NOFS",
+            "GFP_NOIO",
+            "GFP_ATOMIC",
+            "GFP_NOWAIT",
+            "GFP_TRANSHUGE",
+            "GFP_TRANSHUGE_LIGHT",
+            "__GFP_NOLOCKDEP",
+            "__GFP_RECLAIM",
+            "__GFP_KSWAPD_RECLAIM",
+            "__GFP_WRITE",
+            "__GFP_DIRECT_RECLAIM",
+            "__GFP_NOTRACK",
+            "__GFP_NOTRACK_FALSE_POSITIVE",
+            "__GFP_ACCOUNT",
+            "__GFP_ATOMIC",
+            "__GFP_HARDWALL",
+            "__GFP_NOMEMALLOC",
+            "__GFP_ZERO",
+            "__GFP_COMP",
+            "__GFP_MEMALLOC",
+            "__GFP_NORETRY",
+            "__GFP_NOFAIL",
+            "__GFP_RETRY_MAYFAIL",
+            "__GFP_NOWARN",
+            "__GFP_COLD",
+            "__GFP_FS",
+            "__GFP_IO",
+            "__GFP_HIGH",
+            "__GFP_RECLAIMABLE",
+            "__GFP_MOVABLE",
+            "__GFP_DMA32",
+            "__GFP_HIGHMEM",
+            "__GFP_DMA",
+        ],
+    ),
+    "KernelConfig_4_15": (
+        {
+            "GFP_ATOMIC": 0x1080020,
+            "GFP_HIGHUSER": 0x14200C2,
+            "GFP_HIGHUSER_MOVABLE": 0x14200CA,
+            "GFP_KERNEL": 0x14000C0,
+            "GFP_KERNEL_ACCOUNT": 0x15000C0,
+            "GFP_NOFS": 0x1400040,
+            "GFP_NOIO": 0x1400000,
+            "GFP_NOWAIT": 0x1000000,
+            "GFP_TRANSHUGE": 0x4342CA,
+            "GFP_TRANSHUGE_LIGHT": 0x342CA,
+            "GFP_USER": 0x14200C0,
+            "__GFP_ACCOUNT": 0x100000,
+            "__GFP_ATOMIC": 0x80000,
+            "__GFP_COMP": 0x4000,
+            "__GFP_DIRECT_RECLAIM": 0x400000,
+            "__GFP_DMA": 0x1,
+            "__GFP_DMA32": 0x4,
+            "__GFP_FS": 0x80,
+            "__GFP_HARDWALL": 0x20000,
+            "__GFP_HIGH": 0x20,
+            "__GFP_HIGHMEM": 0x2,
+            "__GFP_IO": 0x40,
+            "__GFP_KSWAPD_RECLAIM": 0x1000000,
+            "__GFP_MEMALLOC": 0x2000,
+            "__GFP_MOVABLE": 0x8,
+            "__GFP_NOFAIL": 0x800,
+            "__GFP_NOLOCKDEP": 0x2000000,
+            "__GFP_NOMEMALLOC": 0x10000,
+            "__GFP_NORETRY": 0x1000,
+            "__GFP_NOWARN": 0x200,
+            "__GFP_RECLAIM": 0x1400000,
+            "__GFP_RECLAIMABLE": 0x10,
+            "__GFP_RETRY_MAYFAIL": 0x400,
+            "__GFP_WRITE": 0x800000,
+            "__GFP_ZERO": 0x8000,
+            "___GFP_ACCOUNT": 0x100000,
+            "___GFP_ATOMIC": 0x80000,
+            "___GFP_COMP": 0x4000,
+            "___GFP_DIRECT_RECLAIM": 0x400000,
+            "___GFP_DMA": 0x1,
+            "___GFP_DMA32": 0x4,
+            "___GFP_FS": 0x80,
+            "___GFP_HARDWALL": 0x20000,
+            "___GFP_HIGH": 0x20,
+            "___GFP_HIGHMEM": 0x2,
+            "___GFP_IO": 0x40,
+            "___GFP_KSWAPD_RECLAIM": 0x1000000,
+            "___GFP_MEMALLOC": 0x2000,
+            "___GFP_MOVABLE": 0x8,
+            "___GFP_NOFAIL": 0x800,
+            "___GFP_NOLOCKDEP": 0x2000000,
+            "___GFP_NOMEMALLOC": 0x10000,
+            "___GFP_NORETRY": 0x1000,
+            "___GFP_NOWARN": 0x200,
+            "___GFP_RECLAIMABLE": 0x10,
+            "___GFP_RETRY_MAYFAIL": 0x400,
+            "___GFP_WRITE": 0x800000,
+            "___GFP_ZERO": 0x8000,
+        },
+        [
+            "GFP_KERNEL_ACCOUNT",
+            "GFP_HIGHUSER_MOVABLE",
+            "GFP_HIGHUSER",
+            "GFP_USER",
+            "GFP_KERNEL",
+            "GFP_NOFS",
+            "GFP_NOIO",
+            "GFP_ATOMIC",
+            "GFP_NOWAIT",
+            "GFP_TRANSHUGE",
+            "GFP_TRANSHUGE_LIGHT",
+            "__GFP_NOLOCKDEP",
+            "__GFP_RECLAIM",
+            "__GFP_KSWAPD_RECLAIM",
+            "__GFP_WRITE",
+            "__GFP_DIRECT_RECLAIM",
+            "__GFP_ACCOUNT",
+            "__GFP_ATOMIC",
+            "__GFP_HARDWALL",
+            "__GFP_NOMEMALLOC",
+            "__GFP_ZERO",
+            "__GFP_COMP",
+            "__GFP_MEMALLOC",
+            "__GFP_NORETRY",
+            "__GFP_NOFAIL",
+            "__GFP_RETRY_MAYFAIL",
+            "__GFP_NOWARN",
+            "__GFP_FS",
+            "__GFP_IO",
+            "__GFP_HIGH",
+            "__GFP_RECLAIMABLE",
+            "__GFP_MOVABLE",
+            "__GFP_DMA32",
+            "__GFP_HIGHMEM",
+            "__GFP_DMA",
+        ],
+    ),
+    "KernelConfig_4_18": (
+        {
+            "GFP_ATOMIC": 0x480020,
+            "GFP_HIGHUSER": 0x6200C2,
+            "GFP_HIGHUSER_MOVABLE": 0x6200CA,
+            "GFP_KERNEL": 0x6000C0,
+            "GFP_KERNEL_ACCOUNT": 0x7000C0,
+            "GFP_NOFS": 0x600040,
+            "GFP_NOIO": 0x600000,
+            "GFP_NOWAIT": 0x400000,
+            "GFP_TRANSHUGE": 0x2342CA,
+            "GFP_TRANSHUGE_LIGHT": 0x342CA,
+            "GFP_USER": 0x6200C0,
+            "__GFP_ACCOUNT": 0x100000,
+            "__GFP_ATOMIC": 0x80000,
+            "__GFP_COMP": 0x4000,
+            "__GFP_DIRECT_RECLAIM": 0x200000,
+            "__GFP_DMA": 0x1,
+            "__GFP_DMA32": 0x4,
+            "__GFP_FS": 0x80,
+            "__GFP_HARDWALL": 0x20000,
+            "__GFP_HIGH": 0x20,
+            "__GFP_HIGHMEM": 0x2,
+            "__GFP_IO": 0x40,
+            "__GFP_KSWAPD_RECLAIM": 0x400000,
+            "__GFP_MEMALLOC": 0x2000,
+            "__GFP_MOVABLE": 0x8,
+            "__GFP_NOFAIL": 0x800,
+            "__GFP_NOLOCKDEP": 0x800000,
+            "__GFP_NOMEMALLOC": 0x10000,
+            "__GFP_NORETRY": 0x1000,
+            "__GFP_NOWARN": 0x200,
+            "__GFP_RECLAIM": 0x600000,
+            "__GFP_RECLAIMABLE": 0x10,
+            "__GFP_RETRY_MAYFAIL": 0x400,
+            "__GFP_WRITE": 0x100,
+            "__GFP_ZERO": 0x8000,
+            "___GFP_ACCOUNT": 0x100000,
+            "___GFP_ATOMIC": 0x80000,
+            "___GFP_COMP": 0x4000,
+            "___GFP_DIRECT_RECLAIM": 0x200000,
+            "___GFP_DMA": 0x1,
+            "___GFP_DMA32": 0x4,
+            "___GFP_FS": 0x80,
+            "___GFP_HARDWALL": 0x20000,
+            "___GFP_HIGH": 0x20,
+            "___GFP_HIGHMEM": 0x2,
+            "___GFP_IO": 0x40,
+            "___GFP_KSWAPD_RECLAIM": 0x400000,
+            "___GFP_MEMALLOC": 0x2000,
+            "___GFP_MOVABLE": 0x8,
+            "___GFP_NOFAIL": 0x800,
+            "___GFP_NOLOCKDEP": 0x800000,
+            "___GFP_NOMEMALLOC": 0x10000,
+            "___GFP_NORETRY": 0x1000,
+            "___GFP_NOWARN": 0x200,
+            "___GFP_RECLAIMABLE": 0x10,
+            "___GFP_RETRY_MAYFAIL": 0x400,
+            "___GFP_WRITE": 0x100,
+            "___GFP_ZERO": 0x8000,
+        },
+        [
+            "GFP_KERNEL_ACCOUNT",
+            "GFP_HIGHUSER_MOVABLE",
+            "GFP_HIGHUSER",
+            "GFP_USER",
+            "GFP_KERNEL",
+            "GFP_NOFS",
+            "GFP_NOIO",
+            "GFP_ATOMIC",
+            "GFP_NOWAIT",
+            "GFP_TRANSHUGE",
+            "GFP_TRANSHUGE_LIGHT",
+            "__GFP_NOLOCKDEP",
+            "__GFP_RECLAIM",
+            "__GFP_KSWAPD_RECLAIM",
+            "__GFP_DIRECT_RECLAIM",
+            "__GFP_ACCOUNT",
+            "__GFP_ATOMIC",
+            "__GFP_HARDWALL",
+            "__GFP_NOMEMALLOC",
+            "__GFP_ZERO",
+            "__GFP_COMP",
+            "__GFP_MEMALLOC",
+            "__GFP_NORETRY",
+            "__GFP_NOFAIL",
+            "__GFP_RETRY_MAYFAIL",
+            "__GFP_NOWARN",
+            "__GFP_WRITE",
+            "__GFP_FS",
+            "__GFP_IO",
+            "__GFP_HIGH",
+            "__GFP_RECLAIMABLE",
+            "__GFP_MOVABLE",
+            "__GFP_DMA32",
+            "__GFP_HIGHMEM",
+            "__GFP_DMA",
+        ],
+    ),
+    "KernelConfig_4_19": (
+        {
+            "GFP_ATOMIC": 0x480020,
+            "GFP_HIGHUSER": 0x6200C2,
+            "GFP_HIGHUSER_MOVABLE": 0x6200CA,
+            "GFP_KERNEL": 0x6000C0,
+            "GFP_KERNEL_ACCOUNT": 0x7000C0,
+            "GFP_NOFS": 0x600040,
+            "GFP_NOIO": 0x600000,
+            "GFP_NOWAIT": 0x400000,
+            "GFP_TRANSHUGE": 0x2342CA,
+            "GFP_TRANSHUGE_LIGHT": 0x342CA,
+            "GFP_USER": 0x6200C0,
+            "__GFP_ACCOUNT": 0x100000,
+            "__GFP_ATOMIC": 0x80000,
+            "__GFP_COMP": 0x4000,
+            "__GFP_DIRECT_RECLAIM": 0x200000,
+            "__GFP_DMA": 0x1,
+            "__GFP_DMA32": 0x4,
+            "__GFP_FS": 0x80,
+            "__GFP_HARDWALL": 0x20000,
+            "__GFP_HIGH": 0x20,
+            "__GFP_HIGHMEM": 0x2,
+            "__GFP_IO": 0x40,
+            "__GFP_KSWAPD_RECLAIM": 0x400000,
+            "__GFP_MEMALLOC": 0x2000,
+            "__GFP_MOVABLE": 0x8,
+            "__GFP_NOFAIL": 0x800,
+            "__GFP_NOLOCKDEP": 0x800000,
+            "__GFP_NOMEMALLOC": 0x10000,
+            "__GFP_NORETRY": 0x1000,
+            "__GFP_NOWARN": 0x200,
+            "__GFP_RECLAIM": 0x600000,
+            "__GFP_RECLAIMABLE": 0x10,
+            "__GFP_RETRY_MAYFAIL": 0x400,
+            "__GFP_WRITE": 0x100,
+            "__GFP_ZERO": 0x8000,
+            "___GFP_ACCOUNT": 0x100000,
+            "___GFP_ATOMIC": 0x80000,
+            "___GFP_COMP": 0x4000,
+            "___GFP_DIRECT_RECLAIM": 0x200000,
+            "___GFP_DMA": 0x1,
+            "___GFP_DMA32": 0x4,
+            "___GFP_FS": 0x80,
+            "___GFP_HARDWALL": 0x20000,
+            "___GFP_HIGH": 0x20,
+            "___GFP_HIGHMEM": 0x2,
+            "___GFP_IO": 0x40,
+            "___GFP_KSWAPD_RECLAIM": 0x400000,
+            "___GFP_MEMALLOC": 0x2000,
+            "___GFP_MOVABLE": 0x8,
+            "___GFP_NOFAIL": 0x800,
+            "___GFP_NOLOCKDEP": 0x800000,
+            "___GFP_NOMEMALLOC": 0x10000,
+            "___GFP_NORETRY": 0x1000,
+            "___GFP_NOWARN": 0x200,
+            "___GFP_RECLAIMABLE": 0x10,
+            "___GFP_RETRY_MAYFAIL": 0x400,
+            "___GFP_WRITE": 0x100,
+            "___GFP_ZERO": 0x8000,
+        },
+        [
+            "GFP_KERNEL_ACCOUNT",
+            "GFP_HIGHUSER_MOVABLE",
+            "GFP_HIGHUSER",
+            "GFP_USER",
+            "GFP_KERNEL",
+            "GFP_NOFS",
+            "GFP_NOIO",
+            "GFP_ATOMIC",
+            "GFP_NOWAIT",
+            "GFP_TRANSHUGE",
+            "GFP_TRANSHUGE_LIGHT",
+            "__GFP_NOLOCKDEP",
+            "__GFP_RECLAIM",
+            "__GFP_KSWAPD_RECLAIM",
+            "__GFP_DIRECT_RECLAIM",
+            "__GFP_ACCOUNT",
+            "__GFP_ATOMIC",
+            "__GFP_HARDWALL",
+            "__GFP_NOMEMALLOC",
+            "__GFP_ZERO",
+            "__GFP_COMP",
+            "__GFP_MEMALLOC",
+            "__GFP_NORETRY",
+            "__GFP_NOFAIL",
+            "__GFP_RETRY_MAYFAIL",
+            "__GFP_NOWARN",
+            "__GFP_WRITE",
+            "__GFP_FS",
+            "__GFP_IO",
+            "__GFP_HIGH",
+            "__GFP_RECLAIMABLE",
+            "__GFP_MOVABLE",
+            "__GFP_DMA32",
+            "__GFP_HIGHMEM",
+            "__GFP_DMA",
+        ],
+    ),
+    "KernelConfig_4_4": (
+        {
+            "GFP_ATOMIC": 0x2080020,
+            "GFP_HIGHUSER": 0x24200C2,
+            "GFP_HIGHUSER_MOVABLE": 0x24200CA,
+            "GFP_KERNEL": 0x24000C0,
+            "GFP_NOFS": 0x2400040,
+            "GFP_NOIO": 0x2400000,
+            "GFP_NOWAIT": 0x2000000,
+            "GFP_TEMPORARY": 0x24000D0,
+            "GFP_TRANSHUGE": 0x4352CA,
+            "GFP_USER": 0x24200C0,
+            "__GFP_ATOMIC": 0x80000,
+            "__GFP_COLD": 0x100,
+            "__GFP_COMP": 0x4000,
+            "__GFP_DIRECT_RECLAIM": 0x400000,
+            "__GFP_DMA": 0x1,
+            "__GFP_DMA32": 0x4,
+            "__GFP_FS": 0x80,
+            "__GFP_HARDWALL": 0x20000,
+            "__GFP_HIGH": 0x20,
+            "__GFP_HIGHMEM": 0x2,
+            "__GFP_IO": 0x40,
+            "__GFP_KSWAPD_RECLAIM": 0x2000000,
+            "__GFP_MEMALLOC": 0x2000,
+            "__GFP_MOVABLE": 0x8,
+            "__GFP_NOACCOUNT": 0x100000,
+            "__GFP_NOFAIL": 0x800,
+            "__GFP_NOMEMALLOC": 0x10000,
+            "__GFP_NORETRY": 0x1000,
+            "__GFP_NOTRACK": 0x200000,
+            "__GFP_NOTRACK_FALSE_POSITIVE": 0x200000,
+            "__GFP_NOWARN": 0x200,
+            "__GFP_OTHER_NODE": 0x800000,
+            "__GFP_RECLAIM": 0x2400000,
+            "__GFP_RECLAIMABLE": 0x10,
+            "__GFP_REPEAT": 0x400,
+            "__GFP_WRITE": 0x1000000,
+            "__GFP_ZERO": 0x8000,
+            "___GFP_ATOMIC": 0x80000,
+            "___GFP_COLD": 0x100,
+            "___GFP_COMP": 0x4000,
+            "___GFP_DIRECT_RECLAIM": 0x400000,
+            "___GFP_DMA": 0x1,
+            "___GFP_DMA32": 0x4,
+            "___GFP_FS": 0x80,
+            "___GFP_HARDWALL": 0x20000,
+            "___GFP_HIGH": 0x20,
+            "___GFP_HIGHMEM": 0x2,
+            "___GFP_IO": 0x40,
+            "___GFP_KSWAPD_RECLAIM": 0x2000000,
+            "___GFP_MEMALLOC": 0x2000,
+            "___GFP_MOVABLE": 0x8,
+            "___GFP_NOACCOUNT": 0x100000,
+            "___GFP_NOFAIL": 0x800,
+            "___GFP_NOMEMALLOC": 0x10000,
+            "___GFP_NORETRY": 0x1000,
+            "___GFP_NOTRACK": 0x200000,
+            "___GFP_NOWARN": 0x200,
+            "___GFP_OTHER_NODE": 0x800000,
+            "___GFP_RECLAIMABLE": 0x10,
+            "___GFP_REPEAT": 0x400,
+            "___GFP_WRITE": 0x1000000,
+            "___GFP_ZERO": 0x8000,
+        },
+        [
+            "GFP_HIGHUSER_MOVABLE",
+            "GFP_HIGHUSER",
+            "GFP_USER",
+            "GFP_TEMPORARY",
+            "GFP_KERNEL",
+            "GFP_NOFS",
+            "GFP_NOIO",
+            "GFP_ATOMIC",
+            "GFP_NOWAIT",
+            "GFP_TRANSHUGE",
+            "__GFP_RECLAIM",
+            "__GFP_KSWAPD_RECLAIM",
+            "__GFP_WRITE",
+            "__GFP_OTHER_NODE",
+            "__GFP_DIRECT_RECLAIM",
+            "__GFP_NOTRACK",
+            "__GFP_NOTRACK_FALSE_POSITIVE",
+            "__GFP_NOACCOUNT",
+            "__GFP_ATOMIC",
+            "__GFP_HARDWALL",
+            "__GFP_NOMEMALLOC",
+            "__GFP_ZERO",
+            "__GFP_COMP",
+            "__GFP_MEMALLOC",
+            "__GFP_NORETRY",
+            "__GFP_NOFAIL",
+            "__GFP_REPEAT",
+            "__GFP_NOWARN",
+            "__GFP_COLD",
+            "__GFP_FS",
+            "__GFP_IO",
+            "__GFP_HIGH",
+            "__GFP_RECLAIMABLE",
+            "__GFP_MOVABLE",
+            "__GFP_DMA32",
+            "__GFP_HIGHMEM",
+            "__GFP_DMA",
+        ],
+    ),
+    "KernelConfig_4_5": (
+        {
+            "GFP_ATOMIC": 0x2080020,
+            "GFP_HIGHUSER": 0x24200C2,
+            "GFP_HIGHUSER_MOVABLE": 0x24200CA,
+            "GFP_KERNEL": 0x24000C0,
+            "GFP_KERNEL_ACCOUNT": 0x25000C0,
+            "GFP_NOFS": 0x2400040,
+            "GFP_NOIO": 0x2400000,
+            "GFP_NOWAIT": 0x2000000,
+            "GFP_TEMPORARY": 0x24000D0,
+            "GFP_TRANSHUGE": 0x4352CA,
+            "GFP_USER": 0x24200C0,
+            "__GFP_ACCOUNT": 0x100000,
+            "__GFP_ATOMIC": 0x80000,
+            "__GFP_COLD": 0x100,
+            "__GFP_COMP": 0x4000,
+            "__GFP_DIRECT_RECLAIM": 0x400000,
+            "__GFP_DMA": 0x1,
+            "__GFP_DMA32": 0x4,
+            "__GFP_FS": 0x80,
+            "__GFP_HARDWALL": 0x20000,
+            "__GFP_HIGH": 0x20,
+            "__GFP_HIGHMEM": 0x2,
+            "__GFP_IO": 0x40,
+            "__GFP_KSWAPD_RECLAIM": 0x2000000,
+            "__GFP_MEMALLOC": 0x2000,
+            "__GFP_MOVABLE": 0x8,
+            "__GFP_NOFAIL": 0x800,
+            "__GFP_NOMEMALLOC": 0x10000,
+            "__GFP_NORETRY": 0x1000,
+            "__GFP_NOTRACK": 0x200000,
+            "__GFP_NOTRACK_FALSE_POSITIVE": 0x200000,
+            "__GFP_NOWARN": 0x200,
+            "__GFP_OTHER_NODE": 0x800000,
+            "__GFP_RECLAIM": 0x2400000,
+            "__GFP_RECLAIMABLE": 0x10,
+            "__GFP_REPEAT": 0x400,
+            "__GFP_WRITE": 0x1000000,
+            "__GFP_ZERO": 0x8000,
+            "___GFP_ACCOUNT": 0x100000,
+            "___GFP_ATOMIC": 0x80000,
+            "___GFP_COLD": 0x100,
+            "___GFP_COMP": 0x4000,
+            "___GFP_DIRECT_RECLAIM": 0x400000,
+            "___GFP_DMA": 0x1,
+            "___GFP_DMA32": 0x4,
+            "___GFP_FS": 0x80,
+            "___GFP_HARDWALL": 0x20000,
+            "___GFP_HIGH": 0x20,
+            "___GFP_HIGHMEM": 0x2,
+            "___GFP_IO": 0x40,
+            "___GFP_KSWAPD_RECLAIM": 0x2000000,
+            "___GFP_MEMALLOC": 0x2000,
+            "___GFP_MOVABLE": 0x8,
+            "___GFP_NOFAIL": 0x800,
+            "___GFP_NOMEMALLOC": 0x10000,
+            "___GFP_NORETRY": 0x1000,
+            "___GFP_NOTRACK": 0x200000,
+            "___GFP_NOWARN": 0x200,
+            "___GFP_OTHER_NODE": 0x800000,
+            "___GFP_RECLAIMABLE": 0x10,
+            "___GFP_REPEAT": 0x400,
+            "___GFP_WRITE": 0x1000000,
+            "___GFP_ZERO": 0x8000,
+        },
+        [
+            "GFP_KERNEL_ACCOUNT",
+            "GFP_HIGHUSER_MOVABLE",
+            "GFP_HIGHUSER",
+            "GFP_USER",
+            "GFP_TEMPORARY",
+            "GFP_KERNEL",
+            "GFP_NOFS",
+            "GFP_NOIO",
+            "GFP_ATOMIC",
+            "GFP_NOWAIT",
+            "GFP_TRANSHUGE",
+            "__GFP_RECLAIM",
+            "__GFP_KSWAPD_RECLAIM",
+            "__GFP_WRITE",
+            "__GFP_OTHER_NODE",
+            "__GFP_DIRECT_RECLAIM",
+            "__GFP_NOTRACK",
+            "__GFP_NOTRACK_FALSE_POSITIVE",
+            "__GFP_ACCOUNT",
+            "__GFP_ATOMIC",
+            "__GFP_HARDWALL",
+            "__GFP_NOMEMALLOC",
+            "__GFP_ZERO",
+            "__GFP_COMP",
+            "__GFP_MEMALLOC",
+            "__GFP_NORETRY",
+            "__GFP_NOFAIL",
+            "__GFP_REPEAT",
+            "__GFP_NOWARN",
+            "__GFP_COLD",
+            "__GFP_FS",
+            "__GFP_IO",
+            "__GFP_HIGH",
+            "__GFP_RECLAIMABLE",
+            "__GFP_MOVABLE",
+            "__GFP_DMA32",
+            "__GFP_HIGHMEM",
+            "__GFP_DMA",
+        ],
+    ),
+    "KernelConfig_4_6": (
+        {
+            "GFP_ATOMIC": 0x2080020,
+            "GFP_HIGHUSER": 0x24200C2,
+            "GFP_HIGHUSER_MOVABLE": 0x24200CA,
+            "GFP_KERNEL": 0x24000C0,
+            "GFP_KERNEL_ACCOUNT": 0x25000C0,
+            "GFP_NOFS": 0x2400040,
+            "GFP_NOIO": 0x2400000,
+            "GFP_NOWAIT": 0x2000000,
+            "GFP_TEMPORARY": 0x24000D0,
+            "GFP_TRANSHUGE": 0x352CA,
+            "GFP_USER": 0x24200C0,
+            "__GFP_ACCOUNT": 0x100000,
+            "__GFP_ATOMIC": 0x80000,
+            "__GFP_COLD": 0x100,
+            "__GFP_COMP": 0x4000,
+            "__GFP_DIRECT_RECLAIM": 0x400000,
+            "__GFP_DMA": 0x1,
+            "__GFP_DMA32": 0x4,
+            "__GFP_FS": 0x80,
+            "__GFP_HARDWALL": 0x20000,
+            "__GFP_HIGH": 0x20,
+            "__GFP_HIGHMEM": 0x2,
+            "__GFP_IO": 0x40,
+            "__GFP_KSWAPD_RECLAIM": 0x2000000,
+            "__GFP_MEMALLOC": 0x2000,
+            "__GFP_MOVABLE": 0x8,
+            "__GFP_NOFAIL": 0x800,
+            "__GFP_NOMEMALLOC": 0x10000,
+            "__GFP_NORETRY": 0x1000,
+            "__GFP_NOTRACK": 0x200000,
+            "__GFP_NOTRACK_FALSE_POSITIVE": 0x200000,
+            "__GFP_NOWARN": 0x200,
+            "__GFP_OTHER_NODE": 0x800000,
+            "__GFP_RECLAIM": 0x2400000,
+            "__GFP_RECLAIMABLE": 0x10,
+            "__GFP_REPEAT": 0x400,
+            "__GFP_WRITE": 0x1000000,
+            "__GFP_ZERO": 0x8000,
+            "___GFP_ACCOUNT": 0x100000,
+            "___GFP_ATOMIC": 0x80000,
+            "___GFP_COLD": 0x100,
+            "___GFP_COMP": 0x4000,
+            "___GFP_DIRECT_RECLAIM": 0x400000,
+            "___GFP_DMA": 0x1,
+            "___GFP_DMA32": 0x4,
+            "___GFP_FS": 0x80,
+            "___GFP_HARDWALL": 0x20000,
+            "___GFP_HIGH": 0x20,
+            "___GFP_HIGHMEM": 0x2,
+            "___GFP_IO": 0x40,
+            "___GFP_KSWAPD_RECLAIM": 0x2000000,
+            "___GFP_MEMALLOC": 0x2000,
+            "___GFP_MOVABLE": 0x8,
+            "___GFP_NOFAIL": 0x800,
+            "___GFP_NOMEMALLOC": 0x10000,
+            "___GFP_NORETRY": 0x1000,
+            "___GFP_NOTRACK": 0x200000,
+            "___GFP_NOWARN": 0x200,
+            "___GFP_OTHER_NODE": 0x800000,
+            "___GFP_RECLAIMABLE": 0x10,
+            "___GFP_REPEAT": 0x400,
+            "___GFP_WRITE": 0x1000000,
+            "___GFP_ZERO": 0x8000,
+        },
+        [
+            "GFP_KERNEL_ACCOUNT",
+            "GFP_HIGHUSER_MOVABLE",
+            "GFP_HIGHUSER",
+            "GFP_USER",
+            "GFP_TEMPORARY",
+            "GFP_KERNEL",
+            "GFP_NOFS",
+            "GFP_NOIO",
+            "GFP_ATOMIC",
+            "GFP_NOWAIT",
+            "GFP_TRANSHUGE",
+            "__GFP_RECLAIM",
+            "__GFP_KSWAPD_RECLAIM",
+            "__GFP_WRITE",
+            "__GFP_OTHER_NODE",
+            "__GFP_DIRECT_RECLAIM",
+            "__GFP_NOTRACK",
+            "__GFP_NOTRACK_FALSE_POSITIVE",
+            "__GFP_ACCOUNT",
+            "__GFP_ATOMIC",
+            "__GFP_HARDWALL",
+            "__GFP_NOMEMALLOC",
+            "__GFP_ZERO",
+            "__GFP_COMP",
+            "__GFP_MEMALLOC",
+            "__GFP_NORETRY",
+            "__GFP_NOFAIL",
+            "__GFP_REPEAT",
+            "__GFP_NOWARN",
+            "__GFP_COLD",
+            "__GFP_FS",
+            "__GFP_IO",
+            "__GFP_HIGH",
+            "__GFP_RECLAIMABLE",
+            "__GFP_MOVABLE",
+            "__GFP_DMA32",
+            "__GFP_HIGHMEM",
+            "__GFP_DMA",
+        ],
+    ),
+    "KernelConfig_4_8": (
+        {
+            "GFP_ATOMIC": 0x2080020,
+            "GFP_HIGHUSER": 0x24200C2,
+            "GFP_HIGHUSER_MOVABLE": 0x24200CA,
+            "GFP_KERNEL": 0x24000C0,
+            "GFP_KERNEL_ACCOUNT": 0x25000C0,
+            "GFP_NOFS": 0x2400040,
+            "GFP_NOIO": 0x2400000,
+            "GFP_NOWAIT": 0x2000000,
+            "GFP_TEMPORARY": 0x24000D0,
+            "GFP_TRANSHUGE": 0x4342CA,
+            "GFP_TRANSHUGE_LIGHT": 0x342CA,
+            "GFP_USER": 0x24200C0,
+            "__GFP_ACCOUNT": 0x100000,
+            "__GFP_ATOMIC": 0x80000,
+            "__GFP_COLD": 0x100,
+            "__GFP_COMP": 0x4000,
+            "__GFP_DIRECT_RECLAIM": 0x400000,
+            "__GFP_DMA": 0x1,
+            "__GFP_DMA32": 0x4,
+            "__GFP_FS": 0x80,
+            "__GFP_HARDWALL": 0x20000,
+            "__GFP_HIGH": 0x20,
+            "__GFP_HIGHMEM": 0x2,
+            "__GFP_IO": 0x40,
+            "__GFP_KSWAPD_RECLAIM": 0x2000000,
+            "__GFP_MEMALLOC": 0x2000,
+            "__GFP_MOVABLE": 0x8,
+            "__GFP_NOFAIL": 0x800,
+            "__GFP_NOMEMALLOC": 0x10000,
+            "__GFP_NORETRY": 0x1000,
+            "__GFP_NOTRACK": 0x200000,
+            "__GFP_NOTRACK_FALSE_POSITIVE": 0x200000,
+            "__GFP_NOWARN": 0x200,
+            "__GFP_OTHER_NODE": 0x800000,
+            "__GFP_RECLAIM": 0x2400000,
+            "__GFP_RECLAIMABLE": 0x10,
+            "__GFP_REPEAT": 0x400,
+            "__GFP_WRITE": 0x1000000,
+            "__GFP_ZERO": 0x8000,
+            "___GFP_ACCOUNT": 0x100000,
+            "___GFP_ATOMIC": 0x80000,
+            "___GFP_COLD": 0x100,
+            "___GFP_COMP": 0x4000,
+            "___GFP_DIRECT_RECLAIM": 0x400000,
+            "___GFP_DMA": 0x1,
+            "___GFP_DMA32": 0x4,
+            "___GFP_FS": 0x80,
+            "___GFP_HARDWALL": 0x20000,
+            "___GFP_HIGH": 0x20,
+            "___GFP_HIGHMEM": 0x2,
+            "___GFP_IO": 0x40,
+            "___GFP_KSWAPD_RECLAIM": 0x2000000,
+            "___GFP_MEMALLOC": 0x2000,
+            "___GFP_MOVABLE": 0x8,
+            "___GFP_NOFAIL": 0x800,
+            "___GFP_NOMEMALLOC": 0x10000,
+            "___GFP_NORETRY": 0x1000,
+            "___GFP_NOTRACK": 0x200000,
+            "___GFP_NOWARN": 0x200,
+            "___GFP_OTHER_NODE": 0x800000,
+            "___GFP_RECLAIMABLE": 0x10,
+            "___GFP_REPEAT": 0x400,
+            "___GFP_WRITE": 0x1000000,
+            "___GFP_ZERO": 0x8000,
+        },
+        [
+            "GFP_KERNEL_ACCOUNT",
+            "GFP_HIGHUSER_MOVABLE",
+            "GFP_HIGHUSER",
+            "GFP_USER",
+            "GFP_TEMPORARY",
+            "GFP_KERNEL",
+            "GFP_NOFS",
+            "GFP_NOIO",
+            "GFP_ATOMIC",
+            "GFP_NOWAIT",
+            "GFP_TRANSHUGE",
+            "GFP_TRANSHUGE_LIGHT",
+            "__GFP_RECLAIM",
+            "__GFP_KSWAPD_RECLAIM",
+            "__GFP_WRITE",
+            "__GFP_OTHER_NODE",
+            "__GFP_DIRECT_RECLAIM",
+            "__GFP_NOTRACK",
+            "__GFP_NOTRACK_FALSE_POSITIVE",
+            "__GFP_ACCOUNT",
+            "__GFP_ATOMIC",
+            "__GFP_HARDWALL",
+            "__GFP_NOMEMALLOC",
+            "__GFP_ZERO",
+            "__GFP_COMP",
+            "__GFP_MEMALLOC",
+            "__GFP_NORETRY",
+            "__GFP_NOFAIL",
+            "__GFP_REPEAT",
+            "__GFP_NOWARN",
+            "__GFP_COLD",
+            "__GFP_FS",
+            "__GFP_IO",
+            "__GFP_HIGH",
+            "__GFP_RECLAIMABLE",
+            "__GFP_MOVABLE",
+            "__GFP_DMA32",
+            "__GFP_HIGHMEM",
+            "__GFP_DMA",
+        ],
+    ),
+    "KernelConfig_4_9": (
+        {
+            "GFP_ATOMIC": 0x2080020,
+            "GFP_HIGHUSER": 0x24200C2,
+            "GFP_HIGHUSER_MOVABLE": 0x24200CA,
+            "GFP_KERNEL": 0x24000C0,
+            "GFP_KERNEL_ACCOUNT": 0x25000C0,
+            "GFP_NOFS": 0x2400040,
+            "GFP_NOIO": 0x2400000,
+            "GFP_NOWAIT": 0x2000000,
+            "GFP_TEMPORARY": 0x24000D0,
+            "GFP_TRANSHUGE": 0x4342CA,
+            "GFP_TRANSHUGE_LIGHT": 0x342CA,
+            "GFP_USER": 0x24200C0,
+            "__GFP_ACCOUNT": 0x100000,
+            "__GFP_ATOMIC": 0x80000,
+            "__GFP_COLD": 0x100,
+            "__GFP_COMP": 0x4000,
+            "__GFP_DIRECT_RECLAIM": 0x400000,
+            "__GFP_DMA": 0x1,
+            "__GFP_DMA32": 0x4,
+            "__GFP_FS": 0x80,
+            "__GFP_HARDWALL": 0x20000,
+            "__GFP_HIGH": 0x20,
+            "__GFP_HIGHMEM": 0x2,
+            "__GFP_IO": 0x40,
+            "__GFP_KSWAPD_RECLAIM": 0x2000000,
+            "__GFP_MEMALLOC": 0x2000,
+            "__GFP_MOVABLE": 0x8,
+            "__GFP_NOFAIL": 0x800,
+            "__GFP_NOMEMALLOC": 0x10000,
+            "__GFP_NORETRY": 0x1000,
+            "__GFP_NOTRACK": 0x200000,
+            "__GFP_NOTRACK_FALSE_POSITIVE": 0x200000,
+            "__GFP_NOWARN": 0x200,
+            "__GFP_OTHER_NODE": 0x800000,
+            "__GFP_RECLAIM": 0x2400000,
+            "__GFP_RECLAIMABLE": 0x10,
+            "__GFP_REPEAT": 0x400,
+            "__GFP_WRITE": 0x1000000,
+            "__GFP_ZERO": 0x8000,
+            "___GFP_ACCOUNT": 0x100000,
+            "___GFP_ATOMIC": 0x80000,
+            "___GFP_COLD": 0x100,
+            "___GFP_COMP": 0x4000,
+            "___GFP_DIRECT_RECLAIM": 0x400000,
+            "___GFP_DMA": 0x1,
+            "___GFP_DMA32": 0x4,
+            "___GFP_FS": 0x80,
+            "___GFP_HARDWALL": 0x20000,
+            "___GFP_HIGH": 0x20,
+            "___GFP_HIGHMEM": 0x2,
+            "___GFP_IO": 0x40,
+            "___GFP_KSWAPD_RECLAIM": 0x2000000,
+            "___GFP_MEMALLOC": 0x2000,
+            "___GFP_MOVABLE": 0x8,
+            "___GFP_NOFAIL": 0x800,
+            "___GFP_NOMEMALLOC": 0x10000,
+            "___GFP_NORETRY": 0x1000,
+            "___GFP_NOTRACK": 0x200000,
+            "___GFP_NOWARN": 0x200,
+            "___GFP_OTHER_NODE": 0x800000,
+            "___GFP_RECLAIMABLE": 0x10,
+            "___GFP_REPEAT": 0x400,
+            "___GFP_WRITE": 0x1000000,
+            "___GFP_ZERO": 0x8000,
+        },
+        [
+            "GFP_KERNEL_ACCOUNT",
+            "GFP_HIGHUSER_MOVABLE",
+            "GFP_HIGHUSER",
+            "GFP_USER",
+            "GFP_TEMPORARY",
+            "GFP_KERNEL",
+            "GFP_NOFS",
+            "GFP_NOIO",
+            "GFP_ATOMIC",
+            "GFP_NOWAIT",
+            "GFP_TRANSHUGE",
+            "GFP_TRANSHUGE_LIGHT",
+            "__GFP_RECLAIM",
+            "__GFP_KSWAPD_RECLAIM",
+            "__GFP_WRITE",
+            "__GFP_OTHER_NODE",
+            "__GFP_DIRECT_RECLAIM",
+            "__GFP_NOTRACK",
+            "__GFP_NOTRACK_FALSE_POSITIVE",
+            "__GFP_ACCOUNT",
+            "__GFP_ATOMIC",
+            "__GFP_HARDWALL",
+            "__GFP_NOMEMALLOC",
+            "__GFP_ZERO",
+            "__GFP_COMP",
+            "__GFP_MEMALLOC",
+            "__GFP_NORETRY",
+            "__GFP_NOFAIL",
+            "__GFP_REPEAT",
+            "__GFP_NOWARN",
+            "__GFP_COLD",
+            "__GFP_FS",
+            "__GFP_IO",
+            "__GFP_HIGH",
+            "__GFP_RECLAIMABLE",
+            "__GFP_MOVABLE",
+            "__GFP_DMA32",
+            "__GFP_HIGHMEM",
+            "__GFP_DMA",
+        ],
+    ),
+    "KernelConfig_5_0": (
+        {
+            "GFP_ATOMIC": 0x480020,
+            "GFP_HIGHUSER": 0x6200C2,
+            "GFP_HIGHUSER_MOVABLE": 0x6200CA,
+            "GFP_KERNEL": 0x6000C0,
+            "GFP_KERNEL_ACCOUNT": 0x7000C0,
+            "GFP_NOFS": 0x600040,
+            "GFP_NOIO": 0x600000,
+            "GFP_NOWAIT": 0x400000,
+            "GFP_TRANSHUGE": 0x2342CA,
+            "GFP_TRANSHUGE_LIGHT": 0x342CA,
+            "GFP_USER": 0x6200C0,
+            "__GFP_ACCOUNT": 0x100000,
+            "__GFP_ATOMIC": 0x80000,
+            "__GFP_COMP": 0x4000,
+            "__GFP_DIRECT_RECLAIM": 0x200000,
+            "__GFP_DMA": 0x1,
+            "__GFP_DMA32": 0x4,
+            "__GFP_FS": 0x80,
+            "__GFP_HARDWALL": 0x20000,
+            "__GFP_HIGH": 0x20,
+            "__GFP_HIGHMEM": 0x2,
+            "__GFP_IO": 0x40,
+            "__GFP_KSWAPD_RECLAIM": 0x400000,
+            "__GFP_MEMALLOC": 0x2000,
+            "__GFP_MOVABLE": 0x8,
+            "__GFP_NOFAIL": 0x800,
+            "__GFP_NOLOCKDEP": 0x800000,
+            "__GFP_NOMEMALLOC": 0x10000,
+            "__GFP_NORETRY": 0x1000,
+            "__GFP_NOWARN": 0x200,
+            "__GFP_RECLAIM": 0x600000,
+            "__GFP_RECLAIMABLE": 0x10,
+            "__GFP_RETRY_MAYFAIL": 0x400,
+            "__GFP_WRITE": 0x100,
+            "__GFP_ZERO": 0x8000,
+            "___GFP_ACCOUNT": 0x100000,
+            "___GFP_ATOMIC": 0x80000,
+            "___GFP_COMP": 0x4000,
+            "___GFP_DIRECT_RECLAIM": 0x200000,
+            "___GFP_DMA": 0x1,
+            "___GFP_DMA32": 0x4,
+            "___GFP_FS": 0x80,
+            "___GFP_HARDWALL": 0x20000,
+            "___GFP_HIGH": 0x20,
+            "___GFP_HIGHMEM": 0x2,
+            "___GFP_IO": 0x40,
+            "___GFP_KSWAPD_RECLAIM": 0x400000,
+            "___GFP_MEMALLOC": 0x2000,
+            "___GFP_MOVABLE": 0x8,
+            "___GFP_NOFAIL": 0x800,
+            "___GFP_NOLOCKDEP": 0x800000,
+            "___GFP_NOMEMALLOC": 0x10000,
+            "___GFP_NORETRY": 0x1000,
+            "___GFP_NOWARN": 0x200,
+            "___GFP_RECLAIMABLE": 0x10,
+            "___GFP_RETRY_MAYFAIL": 0x400,
+            "___GFP_WRITE": 0x100,
+            "___GFP_ZERO": 0x8000,
+        },
+        [
+            "GFP_KERNEL_ACCOUNT",
+            "GFP_HIGHUSER_MOVABLE",
+            "GFP_HIGHUSER",
+            "GFP_USER",
+            "GFP_KERNEL",
+            "GFP_NOFS",
+            "GFP_NOIO",
+            "GFP_ATOMIC",
+            "GFP_NOWAIT",
+            "GFP_TRANSHUGE",
+            "GFP_TRANSHUGE_LIGHT",
+            "__GFP_NOLOCKDEP",
+            "__GFP_RECLAIM",
+            "__GFP_KSWAPD_RECLAIM",
+            "__GFP_DIRECT_RECLAIM",
+            "__GFP_ACCOUNT",
+            "__GFP_ATOMIC",
+            "__GFP_HARDWALL",
+            "__GFP_NOMEMALLOC",
+            "__GFP_ZERO",
+            "__GFP_COMP",
+            "__GFP_MEMALLOC",
+            "__GFP_NORETRY",
+            "__GFP_NOFAIL",
+            "__GFP_RETRY_MAYFAIL",
+            "__GFP_NOWARN",
+            "__GFP_WRITE",
+            "__GFP_FS",
+            "__GFP_IO",
+            "__GFP_HIGH",
+            "__GFP_RECLAIMABLE",
+            "__GFP_MOVABLE",
+            "__GFP_DMA32",
+            "__GFP_HIGHMEM",
+            "__GFP_DMA",
+        ],
+    ),
+    "KernelConfig_5_1": (
+        {
+            "GFP_ATOMIC": 0xA20,
+            "GFP_HIGHUSER": 0x100CC2,
+            "GFP_HIGHUSER_MOVABLE": 0x100CCA,
+            "GFP_KERNEL": 0xCC0,
+            "GFP_KERNEL_ACCOUNT": 0x400CC0,
+            "GFP_NOFS": 0xC40,
+            "GFP_NOIO": 0xC00,
+            "GFP_NOWAIT": 0x800,
+            "GFP_TRANSHUGE": 0x1C24CA,
+            "GFP_TRANSHUGE_LIGHT": 0x1C20CA,
+            "GFP_USER": 0x100CC0,
+            "__GFP_ACCOUNT": 0x400000,
+            "__GFP_ATOMIC": 0x200,
+            "__GFP_COMP": 0x40000,
+            "__GFP_DIRECT_RECLAIM": 0x400,
+            "__GFP_DMA": 0x1,
+            "__GFP_DMA32": 0x4,
+            "__GFP_FS": 0x80,
+            "__GFP_HARDWALL": 0x100000,
+            "__GFP_HIGH": 0x20,
+            "__GFP_HIGHMEM": 0x2,
+            "__GFP_IO": 0x40,
+            "__GFP_KSWAPD_RECLAIM": 0x800,
+            "__GFP_MEMALLOC": 0x20000,
+            "__GFP_MOVABLE": 0x8,
+            "__GFP_NOFAIL": 0x8000,
+            "__GFP_NOLOCKDEP": 0x800000,
+            "__GFP_NOMEMALLOC": 0x80000,
+            "__GFP_NORETRY": 0x10000,
+            "__GFP_NOWARN": 0x2000,
+            "__GFP_RECLAIM": 0xC00,
+            "__GFP_RECLAIMABLE": 0x10,
+            "__GFP_RETRY_MAYFAIL": 0x4000,
+            "__GFP_WRITE": 0x1000,
+            "__GFP_ZERO": 0x100,
+            "___GFP_ACCOUNT": 0x400000,
+            "___GFP_ATOMIC": 0x200,
+            "___GFP_COMP": 0x40000,
+            "___GFP_DIRECT_RECLAIM": 0x400,
+            "___GFP_DMA": 0x1,
+            "___GFP_DMA32": 0x4,
+            "___GFP_FS": 0x80,
+            "___GFP_HARDWALL": 0x100000,
+            "___GFP_HIGH": 0x20,
+            "___GFP_HIGHMEM": 0x2,
+            "___GFP_IO": 0x40,
+            "___GFP_KSWAPD_RECLAIM": 0x800,
+            "___GFP_MEMALLOC": 0x20000,
+            "___GFP_MOVABLE": 0x8,
+            "___GFP_NOFAIL": 0x8000,
+            "___GFP_NOLOCKDEP": 0x800000,
+            "___GFP_NOMEMALLOC": 0x80000,
+            "___GFP_NORETRY": 0x10000,
+            "___GFP_NOWARN": 0x2000,
+            "___GFP_RECLAIMABLE": 0x10,
+            "___GFP_RETRY_MAYFAIL": 0x4000,
+            "___GFP_WRITE": 0x1000,
+            "___GFP_ZERO": 0x100,
+        },
+        [
+            "GFP_KERNEL_ACCOUNT",
+            "GFP_TRANSHUGE",
+            "GFP_TRANSHUGE_LIGHT",
+            "GFP_HIGHUSER_MOVABLE",
+            "GFP_HIGHUSER",
+            "GFP_USER",
+            "GFP_KERNEL",
+            "GFP_NOFS",
+            "GFP_NOIO",
+            "GFP_ATOMIC",
+            "GFP_NOWAIT",
+            "__GFP_NOLOCKDEP",
+            "__GFP_ACCOUNT",
+            "__GFP_HARDWALL",
+            "__GFP_NOMEMALLOC",
+            "__GFP_COMP",
+            "__GFP_MEMALLOC",
+            "__GFP_NORETRY",
+            "__GFP_NOFAIL",
+            "__GFP_RETRY_MAYFAIL",
+            "__GFP_NOWARN",
+            "__GFP_WRITE",
+            "__GFP_RECLAIM",
+            "__GFP_KSWAPD_RECLAIM",
+            "__GFP_DIRECT_RECLAIM",
+            "__GFP_ATOMIC",
+            "__GFP_ZERO",
+            "__GFP_FS",
+            "__GFP_IO",
+            "__GFP_HIGH",
+            "__GFP_RECLAIMABLE",
+            "__GFP_MOVABLE",
+            "__GFP_DMA32",
+            "__GFP_HIGHMEM",
+            "__GFP_DMA",
+        ],
+    ),
+    "KernelConfig_5_14": (
+        {
+            "GFP_ATOMIC": 0xA20,
+            "GFP_HIGHUSER": 0x100CC2,
+            "GFP_HIGHUSER_MOVABLE": 0x1100CCA,
+            "GFP_KERNEL": 0xCC0,
+            "GFP_KERNEL_ACCOUNT": 0x400CC0,
+            "GFP_NOFS": 0xC40,
+            "GFP_NOIO": 0xC00,
+            "GFP_NOWAIT": 0x800,
+            "GFP_TRANSHUGE": 0x11C24CA,
+            "GFP_TRANSHUGE_LIGHT": 0x11C20CA,
+            "GFP_USER": 0x100CC0,
+            "__GFP_ACCOUNT": 0x400000,
+            "__GFP_ATOMIC": 0x200,
+            "__GFP_COMP": 0x40000,
+            "__GFP_DIRECT_RECLAIM": 0x400,
+            "__GFP_DMA": 0x1,
+            "__GFP_DMA32": 0x4,
+            "__GFP_FS": 0x80,
+            "__GFP_HARDWALL": 0x100000,
+            "__GFP_HIGH": 0x20,
+            "__GFP_HIGHMEM": 0x2,
+            "__GFP_IO": 0x40,
+            "__GFP_KSWAPD_RECLAIM": 0x800,
+            "__GFP_MEMALLOC": 0x20000,
+            "__GFP_MOVABLE": 0x8,
+            "__GFP_NOFAIL": 0x8000,
+            "__GFP_NOLOCKDEP": 0x2000000,
+            "__GFP_NOMEMALLOC": 0x80000,
+            "__GFP_NORETRY": 0x10000,
+            "__GFP_NOWARN": 0x2000,
+            "__GFP_RECLAIM": 0xC00,
+            "__GFP_RECLAIMABLE": 0x10,
+            "__GFP_RETRY_MAYFAIL": 0x4000,
+            "__GFP_SKIP_KASAN_POISON": 0x1000000,
+            "__GFP_WRITE": 0x1000,
+            "__GFP_ZERO": 0x100,
+            "__GFP_ZEROTAGS": 0x800000,
+            "___GFP_ACCOUNT": 0x400000,
+            "___GFP_ATOMIC": 0x200,
+            "___GFP_COMP": 0x40000,
+            "___GFP_DIRECT_RECLAIM": 0x400,
+            "___GFP_DMA": 0x1,
+            "___GFP_DMA32": 0x4,
+            "___GFP_FS": 0x80,
+            "___GFP_HARDWALL": 0x100000,
+            "___GFP_HIGH": 0x20,
+            "___GFP_HIGHMEM": 0x2,
+            "___GFP_IO": 0x40,
+            "___GFP_KSWAPD_RECLAIM": 0x800,
+            "___GFP_MEMALLOC": 0x20000,
+            "___GFP_MOVABLE": 0x8,
+            "___GFP_NOFAIL": 0x8000,
+            "___GFP_NOLOCKDEP": 0x2000000,
+            "___GFP_NOMEMALLOC": 0x80000,
+            "___GFP_NORETRY": 0x10000,
+            "___GFP_NOWARN": 0x2000,
+            "___GFP_RECLAIMABLE": 0x10,
+            "___GFP_RETRY_MAYFAIL": 0x4000,
+            "___GFP_SKIP_KASAN_POISON": 0x1000000,
+            "___GFP_WRITE": 0x1000,
+            "___GFP_ZERO": 0x100,
+            "___GFP_ZEROTAGS": 0x800000,
+        },
+        [
+            "GFP_TRANSHUGE",
+            "GFP_TRANSHUGE_LIGHT",
+            "GFP_HIGHUSER_MOVABLE",
+            "GFP_KERNEL_ACCOUNT",
+            "GFP_HIGHUSER",
+            "GFP_USER",
+            "GFP_KERNEL",
+            "GFP_NOFS",
+            "GFP_NOIO",
+            "GFP_ATOMIC",
+            "GFP_NOWAIT",
+            "__GFP_NOLOCKDEP",
+            "__GFP_SKIP_KASAN_POISON",
+            "__GFP_ZEROTAGS",
+            "__GFP_ACCOUNT",
+            "__GFP_HARDWALL",
+            "__GFP_NOMEMALLOC",
+            "__GFP_COMP",
+            "__GFP_MEMALLOC",
+            "__GFP_NORETRY",
+            "__GFP_NOFAIL",
+            "__GFP_RETRY_MAYFAIL",
+            "__GFP_NOWARN",
+            "__GFP_WRITE",
+            "__GFP_RECLAIM",
+            "__GFP_KSWAPD_RECLAIM",
+            "__GFP_DIRECT_RECLAIM",
+            "__GFP_ATOMIC",
+            "__GFP_ZERO",
+            "__GFP_FS",
+            "__GFP_IO",
+            "__GFP_HIGH",
+            "__GFP_RECLAIMABLE",
+            "__GFP_MOVABLE",
+            "__GFP_DMA32",
+            "__GFP_HIGHMEM",
+            "__GFP_DMA",
+        ],
+    ),
+    "KernelConfig_5_16": (
+        {
+            "GFP_ATOMIC": 0xA20,
+            "GFP_HIGHUSER": 0x100CC2,
+            "GFP_HIGHUSER_MOVABLE": 0x1100CCA,
+            "GFP_KERNEL": 0xCC0,
+            "GFP_KERNEL_ACCOUNT": 0x400CC0,
+            "GFP_NOFS": 0xC40,
+            "GFP_NOIO": 0xC00,
+            "GFP_NOWAIT": 0x800,
+            "GFP_TRANSHUGE": 0x11C24CA,
+            "GFP_TRANSHUGE_LIGHT": 0x11C20CA,
+            "GFP_USER": 0x100CC0,
+            "__GFP_ACCOUNT": 0x400000,
+            "__GFP_ATOMIC": 0x200,
+            "__GFP_COMP": 0x40000,
+            "__GFP_DIRECT_RECLAIM": 0x400,
+            "__GFP_DMA": 0x1,
+            "__GFP_DMA32": 0x4,
+            "__GFP_FS": 0x80,
+            "__GFP_HARDWALL": 0x100000,
+            "__GFP_HIGH": 0x20,
+            "__GFP_HIGHMEM": 0x2,
+            "__GFP_IO": 0x40,
+            "__GFP_KSWAPD_RECLAIM": 0x800,
+            "__GFP_MEMALLOC": 0x20000,
+            "__GFP_MOVABLE": 0x8,
+            "__GFP_NOFAIL": 0x8000,
+            "__GFP_NOLOCKDEP": 0x2000000,
+            "__GFP_NOMEMALLOC": 0x80000,
+            "__GFP_NORETRY": 0x10000,
+            "__GFP_NOWARN": 0x2000,
+            "__GFP_RECLAIM": 0xC00,
+            "__GFP_RECLAIMABLE": 0x10,
+            "__GFP_RETRY_MAYFAIL": 0x4000,
+            "__GFP_SKIP_KASAN_POISON": 0x1000000,
+            "__GFP_WRITE": 0x1000,
+            "__GFP_ZERO": 0x100,
+            "__GFP_ZEROTAGS": 0x800000,
+            "___GFP_ACCOUNT": 0x400000,
+            "___GFP_ATOMIC": 0x200,
+            "___GFP_COMP": 0x40000,
+            "___GFP_DIRECT_RECLAIM": 0x400,
+            "___GFP_DMA": 0x1,
+            "___GFP_DMA32": 0x4,
+            "___GFP_FS": 0x80,
+            "___GFP_HARDWALL": 0x100000,
+            "___GFP_HIGH": 0x20,
+            "___GFP_HIGHMEM": 0x2,
+            "___GFP_IO": 0x40,
+            "___GFP_KSWAPD_RECLAIM": 0x800,
+            "___GFP_MEMALLOC": 0x20000,
+            "___GFP_MOVABLE": 0x8,
+            "___GFP_NOFAIL": 0x8000,
+            "___GFP_NOLOCKDEP": 0x2000000,
+            "___GFP_NOMEMALLOC": 0x80000,
+            "___GFP_NORETRY": 0x10000,
+            "___GFP_NOWARN": 0x2000,
+            "___GFP_RECLAIMABLE": 0x10,
+            "___GFP_RETRY_MAYFAIL": 0x4000,
+            "___GFP_SKIP_KASAN_POISON": 0x1000000,
+            "___GFP_WRITE": 0x1000,
+            "___GFP_ZERO": 0x100,
+            "___GFP_ZEROTAGS": 0x800000,
+        },
+        [
+            "GFP_TRANSHUGE",
+            "GFP_TRANSHUGE_LIGHT",
+            "GFP_HIGHUSER_MOVABLE",
+            "GFP_KERNEL_ACCOUNT",
+            "GFP_HIGHUSER",
+            "GFP_USER",
+            "GFP_KERNEL",
+            "GFP_NOFS",
+            "GFP_NOIO",
+            "GFP_ATOMIC",
+            "GFP_NOWAIT",
+            "__GFP_NOLOCKDEP",
+            "__GFP_SKIP_KASAN_POISON",
+            "__GFP_ZEROTAGS",
+            "__GFP_ACCOUNT",
+            "__GFP_HARDWALL",
+            "__GFP_NOMEMALLOC",
+            "__GFP_COMP",
+            "__GFP_MEMALLOC",
+            "__GFP_NORETRY",
+            "__GFP_NOFAIL",
+            "__GFP_RETRY_MAYFAIL",
+            "__GFP_NOWARN",
+            "__GFP_WRITE",
+            "__GFP_RECLAIM",
+            "__GFP_KSWAPD_RECLAIM",
+            "__GFP_DIRECT_RECLAIM",
+            "__GFP_ATOMIC",
+            "__GFP_ZERO",
+            "__GFP_FS",
+            "__GFP_IO",
+            "__GFP_HIGH",
+            "__GFP_RECLAIMABLE",
+            "__GFP_MOVABLE",
+            "__GFP_DMA32",
+            "__GFP_HIGHMEM",
+            "__GFP_DMA",
+        ],
+    ),
+    "KernelConfig_5_18": (
+        {
+            "GFP_ATOMIC": 0xA20,
+            "GFP_HIGHUSER": 0x100CC2,
+            "GFP_HIGHUSER_MOVABLE": 0x4100CCA,
+            "GFP_KERNEL": 0xCC0,
+            "GFP_KERNEL_ACCOUNT": 0x400CC0,
+            "GFP_NOFS": 0xC40,
+            "GFP_NOIO": 0xC00,
+            "GFP_NOWAIT": 0x800,
+            "GFP_TRANSHUGE": 0x41C24CA,
+            "GFP_TRANSHUGE_LIGHT": 0x41C20CA,
+            "GFP_USER": 0x100CC0,
+            "__GFP_ACCOUNT": 0x400000,
+            "__GFP_ATOMIC": 0x200,
+            "__GFP_COMP": 0x40000,
+            "__GFP_DIRECT_RECLAIM": 0x400,
+            "__GFP_DMA": 0x1,
+            "__GFP_DMA32": 0x4,
+            "__GFP_FS": 0x80,
+            "__GFP_HARDWALL": 0x100000,
+            "__GFP_HIGH": 0x20,
+            "__GFP_HIGHMEM": 0x2,
+            "__GFP_IO": 0x40,
+            "__GFP_KSWAPD_RECLAIM": 0x800,
+            "__GFP_MEMALLOC": 0x20000,
+            "__GFP_MOVABLE": 0x8,
+            "__GFP_NOFAIL": 0x8000,
+            "__GFP_NOLOCKDEP": 0x8000000,
+            "__GFP_NOMEMALLOC": 0x80000,
+            "__GFP_NORETRY": 0x10000,
+            "__GFP_NOWARN": 0x2000,
+            "__GFP_RECLAIM": 0xC00,
+            "__GFP_RECLAIMABLE": 0x10,
+            "__GFP_RETRY_MAYFAIL": 0x4000,
+            "__GFP_SKIP_KASAN_POISON": 0x4000000,
+            "__GFP_SKIP_KASAN_UNPOISON": 0x2000000,
+            "__GFP_SKIP_ZERO": 0x1000000,
+            "__GFP_WRITE": 0x1000,
+            "__GFP_ZERO": 0x100,
+            "__GFP_ZEROTAGS": 0x800000,
+            "___GFP_ACCOUNT": 0x400000,
+            "___GFP_ATOMIC": 0x200,
+            "___GFP_COMP": 0x40000,
+            "___GFP_DIRECT_RECLAIM": 0x400,
+            "___GFP_DMA": 0x1,
+            "___GFP_DMA32": 0x4,
+            "___GFP_FS": 0x80,
+            "___GFP_HARDWALL": 0x100000,
+            "___GFP_HIGH": 0x20,
+            "___GFP_HIGHMEM": 0x2,
+            "___GFP_IO": 0x40,
+            "___GFP_KSWAPD_RECLAIM": 0x800,
+            "___GFP_MEMALLOC": 0x20000,
+            "___GFP_MOVABLE": 0x8,
+            "___GFP_NOFAIL": 0x8000,
+            "___GFP_NOLOCKDEP": 0x8000000,
+            "___GFP_NOMEMALLOC": 0x80000,
+            "___GFP_NORETRY": 0x10000,
+            "___GFP_NOWARN": 0x2000,
+            "___GFP_RECLAIMABLE": 0x10,
+            "___GFP_RETRY_MAYFAIL": 0x4000,
+            "___GFP_SKIP_KASAN_POISON": 0x4000000,
+            "___GFP_SKIP_KASAN_UNPOISON": 0x2000000,
+            "___GFP_SKIP_ZERO": 0x1000000,
+            "___GFP_WRITE": 0x1000,
+            "___GFP_ZERO": 0x100,
+            "___GFP_ZEROTAGS": 0x800000,
+        },
+        [
+            "GFP_TRANSHUGE",
+            "GFP_TRANSHUGE_LIGHT",
+            "GFP_HIGHUSER_MOVABLE",
+            "GFP_KERNEL_ACCOUNT",
+            "GFP_HIGHUSER",
+            "GFP_USER",
+            "GFP_KERNEL",
+            "GFP_NOFS",
+            "GFP_NOIO",
+            "GFP_ATOMIC",
+            "GFP_NOWAIT",
+            "__GFP_NOLOCKDEP",
+            "__GFP_SKIP_KASAN_POISON",
+            "__GFP_SKIP_KASAN_UNPOISON",
+            "__GFP_SKIP_ZERO",
+            "__GFP_ZEROTAGS",
+            "__GFP_ACCOUNT",
+            "__GFP_HARDWALL",
+            "__GFP_NOMEMALLOC",
+            "__GFP_COMP",
+            "__GFP_MEMALLOC",
+            "__GFP_NORETRY",
+            "__GFP_NOFAIL",
+            "__GFP_RETRY_MAYFAIL",
+            "__GFP_NOWARN",
+            "__GFP_WRITE",
+            "__GFP_RECLAIM",
+            "__GFP_KSWAPD_RECLAIM",
+            "__GFP_DIRECT_RECLAIM",
+            "__GFP_ATOMIC",
+            "__GFP_ZERO",
+            "__GFP_FS",
+            "__GFP_IO",
+            "__GFP_HIGH",
+            "__GFP_RECLAIMABLE",
+            "__GFP_MOVABLE",
+            "__GFP_DMA32",
+            "__GFP_HIGHMEM",
+            "__GFP_DMA",
+        ],
+    ),
+    "KernelConfig_5_8": (
+        {
+            "GFP_ATOMIC": 0xA20,
+            "GFP_HIGHUSER": 0x100CC2,
+            "GFP_HIGHUSER_MOVABLE": 0x100CCA,
+            "GFP_KERNEL": 0xCC0,
+            "GFP_KERNEL_ACCOUNT": 0x400CC0,
+            "GFP_NOFS": 0xC40,
+            "GFP_NOIO": 0xC00,
+            "GFP_NOWAIT": 0x800,
+            "GFP_TRANSHUGE": 0x1C24CA,
+            "GFP_TRANSHUGE_LIGHT": 0x1C20CA,
+            "GFP_USER": 0x100CC0,
+            "__GFP_ACCOUNT": 0x400000,
+            "__GFP_ATOMIC": 0x200,
+            "__GFP_COMP": 0x40000,
+            "__GFP_DIRECT_RECLAIM": 0x400,
+            "__GFP_DMA": 0x1,
+            "__GFP_DMA32": 0x4,
+            "__GFP_FS": 0x80,
+            "__GFP_HARDWALL": 0x100000,
+            "__GFP_HIGH": 0x20,
+            "__GFP_HIGHMEM": 0x2,
+            "__GFP_IO": 0x40,
+            "__GFP_KSWAPD_RECLAIM": 0x800,
+            "__GFP_MEMALLOC": 0x20000,
+            "__GFP_MOVABLE": 0x8,
+            "__GFP_NOFAIL": 0x8000,
+            "__GFP_NOLOCKDEP": 0x800000,
+            "__GFP_NOMEMALLOC": 0x80000,
+            "__GFP_NORETRY": 0x10000,
+            "__GFP_NOWARN": 0x2000,
+            "__GFP_RECLAIM": 0xC00,
+            "__GFP_RECLAIMABLE": 0x10,
+            "__GFP_RETRY_MAYFAIL": 0x4000,
+            "__GFP_WRITE": 0x1000,
+            "__GFP_ZERO": 0x100,
+            "___GFP_ACCOUNT": 0x400000,
+            "___GFP_ATOMIC": 0x200,
+            "___GFP_COMP": 0x40000,
+            "___GFP_DIRECT_RECLAIM": 0x400,
+            "___GFP_DMA": 0x1,
+            "___GFP_DMA32": 0x4,
+            "___GFP_FS": 0x80,
+            "___GFP_HARDWALL": 0x100000,
+            "___GFP_HIGH": 0x20,
+            "___GFP_HIGHMEM": 0x2,
+            "___GFP_IO": 0x40,
+            "___GFP_KSWAPD_RECLAIM": 0x800,
+            "___GFP_MEMALLOC": 0x20000,
+            "___GFP_MOVABLE": 0x8,
+            "___GFP_NOFAIL": 0x8000,
+            "___GFP_NOLOCKDEP": 0x800000,
+            "___GFP_NOMEMALLOC": 0x80000,
+            "___GFP_NORETRY": 0x10000,
+            "___GFP_NOWARN": 0x2000,
+            "___GFP_RECLAIMABLE": 0x10,
+            "___GFP_RETRY_MAYFAIL": 0x4000,
+            "___GFP_WRITE": 0x1000,
+            "___GFP_ZERO": 0x100,
+        },
+        [
+            "GFP_KERNEL_ACCOUNT",
+            "GFP_TRANSHUGE",
+            "GFP_TRANSHUGE_LIGHT",
+            "GFP_HIGHUSER_MOVABLE",
+            "GFP_HIGHUSER",
+            "GFP_USER",
+            "GFP_KERNEL",
+            "GFP_NOFS",
+            "GFP_NOIO",
+            "GFP_ATOMIC",
+            "GFP_NOWAIT",
+            "__GFP_NOLOCKDEP",
+            "__GFP_ACCOUNT",
+            "__GFP_HARDWALL",
+            "__GFP_NOMEMALLOC",
+            "__GFP_COMP",
+            "__GFP_MEMALLOC",
+            "__GFP_NORETRY",
+            "__GFP_NOFAIL",
+            "__GFP_RETRY_MAYFAIL",
+            "__GFP_NOWARN",
+            "__GFP_WRITE",
+            "__GFP_RECLAIM",
+            "__GFP_KSWAPD_RECLAIM",
+            "__GFP_DIRECT_RECLAIM",
+            "__GFP_ATOMIC",
+            "__GFP_ZERO",
+            "__GFP_FS",
+            "__GFP_IO",
+            "__GFP_HIGH",
+            "__GFP_RECLAIMABLE",
+            "__GFP_MOVABLE",
+            "__GFP_DMA32",
+            "__GFP_HIGHMEM",
+            "__GFP_DMA",
+        ],
+    ),
+    "KernelConfig_5_9": (
+        {
+            "GFP_ATOMIC": 0xA20,
+            "GFP_HIGHUSER": 0x100CC2,
+            "GFP_HIGHUSER_MOVABLE": 0x100CCA,
+            "GFP_KERNEL": 0xCC0,
+            "GFP_KERNEL_ACCOUNT": 0x400CC0,
+            "GFP_NOFS": 0xC40,
+            "GFP_NOIO": 0xC00,
+            "GFP_NOWAIT": 0x800,
+            "GFP_TRANSHUGE": 0x1C24CA,
+            "GFP_TRANSHUGE_LIGHT": 0x1C20CA,
+            "GFP_USER": 0x100CC0,
+            "__GFP_ACCOUNT": 0x400000,
+            "__GFP_ATOMIC": 0x200,
+            "__GFP_COMP": 0x40000,
+            "__GFP_DIRECT_RECLAIM": 0x400,
+            "__GFP_DMA": 0x1,
+            "__GFP_DMA32": 0x4,
+            "__GFP_FS": 0x80,
+            "__GFP_HARDWALL": 0x100000,
+            "__GFP_HIGH": 0x20,
+            "__GFP_HIGHMEM": 0x2,
+            "__GFP_IO": 0x40,
+            "__GFP_KSWAPD_RECLAIM": 0x800,
+            "__GFP_MEMALLOC": 0x20000,
+            "__GFP_MOVABLE": 0x8,
+            "__GFP_NOFAIL": 0x8000,
+            "__GFP_NOLOCKDEP": 0x800000,
+            "__GFP_NOMEMALLOC": 0x80000,
+            "__GFP_NORETRY": 0x10000,
+            "__GFP_NOWARN": 0x2000,
+            "__GFP_RECLAIM": 0xC00,
+            "__GFP_RECLAIMABLE": 0x10,
+            "__GFP_RETRY_MAYFAIL": 0x4000,
+            "__GFP_WRITE": 0x1000,
+            "__GFP_ZERO": 0x100,
+            "___GFP_ACCOUNT": 0x400000,
+            "___GFP_ATOMIC": 0x200,
+            "___GFP_COMP": 0x40000,
+            "___GFP_DIRECT_RECLAIM": 0x400,
+            "___GFP_DMA": 0x1,
+            "___GFP_DMA32": 0x4,
+            "___GFP_FS": 0x80,
+            "___GFP_HARDWALL": 0x100000,
+            "___GFP_HIGH": 0x20,
+            "___GFP_HIGHMEM": 0x2,
+            "___GFP_IO": 0x40,
+            "___GFP_KSWAPD_RECLAIM": 0x800,
+            "___GFP_MEMALLOC": 0x20000,
+            "___GFP_MOVABLE": 0x8,
+            "___GFP_NOFAIL": 0x8000,
+            "___GFP_NOLOCKDEP": 0x800000,
+            "___GFP_NOMEMALLOC": 0x80000,
+            "___GFP_NORETRY": 0x10000,
+            "___GFP_NOWARN": 0x2000,
+            "___GFP_RECLAIMABLE": 0x10,
+            "___GFP_RETRY_MAYFAIL": 0x4000,
+            "___GFP_WRITE": 0x1000,
+            "___GFP_ZERO": 0x100,
+        },
+        [
+            "GFP_KERNEL_ACCOUNT",
+            "GFP_TRANSHUGE",
+            "GFP_TRANSHUGE_LIGHT",
+            "GFP_HIGHUSER_MOVABLE",
+            "GFP_HIGHUSER",
+            "GFP_USER",
+            "GFP_KERNEL",
+            "GFP_NOFS",
+            "GFP_NOIO",
+            "GFP_ATOMIC",
+            "GFP_NOWAIT",
+            "__GFP_NOLOCKDEP",
+            "__GFP_ACCOUNT",
+            "__GFP_HARDWALL",
+            "__GFP_NOMEMALLOC",
+            "__GFP_COMP",
+            "__GFP_MEMALLOC",
+            "__GFP_NORETRY",
+            "__GFP_NOFAIL",
+            "__GFP_RETRY_MAYFAIL",
+            "__GFP_NOWARN",
+            "__GFP_WRITE",
+            "__GFP_RECLAIM",
+            "__GFP_KSWAPD_RECLAIM",
+            "__GFP_DIRECT_RECLAIM",
+            "__GFP_ATOMIC",
+            "__GFP_ZERO",
+            "__GFP_FS",
+            "__GFP_IO",
+            "__GFP_HIGH",
+            "__GFP_RECLAIMABLE",
+            "__GFP_MOVABLE",
+            "__GFP_DMA32",
+            "__GFP_HIGHMEM",
+            "__GFP_DMA",
+        ],
+    ),
+    "KernelConfig_6_0": (
+        {
+            "GFP_ATOMIC": 0xA20,
+            "GFP_HIGHUSER": 0x100CC2,
+            "GFP_HIGHUSER_MOVABLE": 0x6100CCA,
+            "GFP_KERNEL": 0xCC0,
+            "GFP_KERNEL_ACCOUNT": 0x400CC0,
+            "GFP_NOFS": 0xC40,
+            "GFP_NOIO": 0xC00,
+            "GFP_NOWAIT": 0x800,
+            "GFP_TRANSHUGE": 0x61C24CA,
+            "GFP_TRANSHUGE_LIGHT": 0x61C20CA,
+            "GFP_USER": 0x100CC0,
+            "__GFP_ACCOUNT": 0x400000,
+            "__GFP_ATOMIC": 0x200,
+            "__GFP_COMP": 0x40000,
+            "__GFP_DIRECT_RECLAIM": 0x400,
+            "__GFP_DMA": 0x1,
+            "__GFP_DMA32": 0x4,
+            "__GFP_FS": 0x80,
+            "__GFP_HARDWALL": 0x100000,
+            "__GFP_HIGH": 0x20,
+            "__GFP_HIGHMEM": 0x2,
+            "__GFP_IO": 0x40,
+            "__GFP_KSWAPD_RECLAIM": 0x800,
+            "__GFP_MEMALLOC": 0x20000,
+            "__GFP_MOVABLE": 0x8,
+            "__GFP_NOFAIL": 0x8000,
+            "__GFP_NOLOCKDEP": 0x8000000,
+            "__GFP_NOMEMALLOC": 0x80000,
+            "__GFP_NORETRY": 0x10000,
+            "__GFP_NOWARN": 0x2000,
+            "__GFP_RECLAIM": 0xC00,
+            "__GFP_RECLAIMABLE": 0x10,
+            "__GFP_RETRY_MAYFAIL": 0x4000,
+            "__GFP_SKIP_KASAN_POISON": 0x4000000,
+            "__GFP_SKIP_KASAN_UNPOISON": 0x2000000,
+            "__GFP_SKIP_ZERO": 0x1000000,
+            "__GFP_WRITE": 0x1000,
+            "__GFP_ZERO": 0x100,
+            "__GFP_ZEROTAGS": 0x800000,
+            "___GFP_ACCOUNT": 0x400000,
+            "___GFP_ATOMIC": 0x200,
+            "___GFP_COMP": 0x40000,
+            "___GFP_DIRECT_RECLAIM": 0x400,
+            "___GFP_DMA": 0x1,
+            "___GFP_DMA32": 0x4,
+            "___GFP_FS": 0x80,
+            "___GFP_HARDWALL": 0x100000,
+            "___GFP_HIGH": 0x20,
+            "___GFP_HIGHMEM": 0x2,
+            "___GFP_IO": 0x40,
+            "___GFP_KSWAPD_RECLAIM": 0x800,
+            "___GFP_MEMALLOC": 0x20000,
+            "___GFP_MOVABLE": 0x8,
+            "___GFP_NOFAIL": 0x8000,
+            "___GFP_NOLOCKDEP": 0x8000000,
+            "___GFP_NOMEMALLOC": 0x80000,
+            "___GFP_NORETRY": 0x10000,
+            "___GFP_NOWARN": 0x2000,
+            "___GFP_RECLAIMABLE": 0x10,
+            "___GFP_RETRY_MAYFAIL": 0x4000,
+            "___GFP_SKIP_KASAN_POISON": 0x4000000,
+            "___GFP_SKIP_KASAN_UNPOISON": 0x2000000,
+            "___GFP_SKIP_ZERO": 0x1000000,
+            "___GFP_WRITE": 0x1000,
+            "___GFP_ZERO": 0x100,
+            "___GFP_ZEROTAGS": 0x800000,
+        },
+        [
+            "GFP_TRANSHUGE",
+            "GFP_TRANSHUGE_LIGHT",
+            "GFP_HIGHUSER_MOVABLE",
+            "GFP_KERNEL_ACCOUNT",
+            "GFP_HIGHUSER",
+            "GFP_USER",
+            "GFP_KERNEL",
+            "GFP_NOFS",
+            "GFP_NOIO",
+            "GFP_ATOMIC",
+            "GFP_NOWAIT",
+            "__GFP_NOLOCKDEP",
+            "__GFP_SKIP_KASAN_POISON",
+            "__GFP_SKIP_KASAN_UNPOISON",
+            "__GFP_SKIP_ZERO",
+            "__GFP_ZEROTAGS",
+            "__GFP_ACCOUNT",
+            "__GFP_HARDWALL",
+            "__GFP_NOMEMALLOC",
+            "__GFP_COMP",
+            "__GFP_MEMALLOC",
+            "__GFP_NORETRY",
+            "__GFP_NOFAIL",
+            "__GFP_RETRY_MAYFAIL",
+            "__GFP_NOWARN",
+            "__GFP_WRITE",
+            "__GFP_RECLAIM",
+            "__GFP_KSWAPD_RECLAIM",
+            "__GFP_DIRECT_RECLAIM",
+            "__GFP_ATOMIC",
+            "__GFP_ZERO",
+            "__GFP_FS",
+            "__GFP_IO",
+            "__GFP_HIGH",
+            "__GFP_RECLAIMABLE",
+            "__GFP_MOVABLE",
+            "__GFP_DMA32",
+            "__GFP_HIGHMEM",
+            "__GFP_DMA",
+        ],
+    ),
+    "KernelConfig_6_1": (
+        {
+            "GFP_ATOMIC": 0xA20,
+            "GFP_HIGHUSER": 0x100CC2,
+            "GFP_HIGHUSER_MOVABLE": 0x6100CCA,
+            "GFP_KERNEL": 0xCC0,
+            "GFP_KERNEL_ACCOUNT": 0x400CC0,
+            "GFP_NOFS": 0xC40,
+            "GFP_NOIO": 0xC00,
+            "GFP_NOWAIT": 0x800,
+            "GFP_TRANSHUGE": 0x61C24CA,
+            "GFP_TRANSHUGE_LIGHT": 0x61C20CA,
+            "GFP_USER": 0x100CC0,
+            "__GFP_ACCOUNT": 0x400000,
+            "__GFP_ATOMIC": 0x200,
+            "__GFP_COMP": 0x40000,
+            "__GFP_DIRECT_RECLAIM": 0x400,
+            "__GFP_DMA": 0x1,
+            "__GFP_DMA32": 0x4,
+            "__GFP_FS": 0x80,
+            "__GFP_HARDWALL": 0x100000,
+            "__GFP_HIGH": 0x20,
+            "__GFP_HIGHMEM": 0x2,
+            "__GFP_IO": 0x40,
+            "__GFP_KSWAPD_RECLAIM": 0x800,
+            "__GFP_MEMALLOC": 0x20000,
+            "__GFP_MOVABLE": 0x8,
+            "__GFP_NOFAIL": 0x8000,
+            "__GFP_NOLOCKDEP": 0x8000000,
+            "__GFP_NOMEMALLOC": 0x80000,
+            "__GFP_NORETRY": 0x10000,
+            "__GFP_NOWARN": 0x2000,
+            "__GFP_RECLAIM": 0xC00,
+            "__GFP_RECLAIMABLE": 0x10,
+            "__GFP_RETRY_MAYFAIL": 0x4000,
+            "__GFP_SKIP_KASAN_POISON": 0x4000000,
+            "__GFP_SKIP_KASAN_UNPOISON": 0x2000000,
+            "__GFP_SKIP_ZERO": 0x1000000,
+            "__GFP_WRITE": 0x1000,
+            "__GFP_ZERO": 0x100,
+            "__GFP_ZEROTAGS": 0x800000,
+            "___GFP_ACCOUNT": 0x400000,
+            "___GFP_ATOMIC": 0x200,
+            "___GFP_COMP": 0x40000,
+            "___GFP_DIRECT_RECLAIM": 0x400,
+            "___GFP_DMA": 0x1,
+            "___GFP_DMA32": 0x4,
+            "___GFP_FS": 0x80,
+            "___GFP_HARDWALL": 0x100000,
+            "___GFP_HIGH": 0x20,
+            "___GFP_HIGHMEM": 0x2,
+            "___GFP_IO": 0x40,
+            "___GFP_KSWAPD_RECLAIM": 0x800,
+            "___GFP_MEMALLOC": 0x20000,
+            "___GFP_MOVABLE": 0x8,
+            "___GFP_NOFAIL": 0x8000,
+            "___GFP_NOLOCKDEP": 0x8000000,
+            "___GFP_NOMEMALLOC": 0x80000,
+            "___GFP_NORETRY": 0x10000,
+            "___GFP_NOWARN": 0x2000,
+            "___GFP_RECLAIMABLE": 0x10,
+            "___GFP_RETRY_MAYFAIL": 0x4000,
+            "___GFP_SKIP_KASAN_POISON": 0x4000000,
+            "___GFP_SKIP_KASAN_UNPOISON": 0x2000000,
+            "___GFP_SKIP_ZERO": 0x1000000,
+            "___GFP_WRITE": 0x1000,
+            "___GFP_ZERO": 0x100,
+            "___GFP_ZEROTAGS": 0x800000,
+        },
+        [
+            "GFP_TRANSHUGE",
+            "GFP_TRANSHUGE_LIGHT",
+            "GFP_HIGHUSER_MOVABLE",
+            "GFP_KERNEL_ACCOUNT",
+            "GFP_HIGHUSER",
+            "GFP_USER",
+            "GFP_KERNEL",
+            "GFP_NOFS",
+            "GFP_NOIO",
+            "GFP_ATOMIC",
+            "GFP_NOWAIT",
+            "__GFP_NOLOCKDEP",
+            "__GFP_SKIP_KASAN_POISON",
+            "__GFP_SKIP_KASAN_UNPOISON",
+            "__GFP_SKIP_ZERO",
+            "__GFP_ZEROTAGS",
+            "__GFP_ACCOUNT",
+            "__GFP_HARDWALL",
+            "__GFP_NOMEMALLOC",
+            "__GFP_COMP",
+            "__GFP_MEMALLOC",
+            "__GFP_NORETRY",
+            "__GFP_NOFAIL",
+            "__GFP_RETRY_MAYFAIL",
+            "__GFP_NOWARN",
+            "__GFP_WRITE",
+            "__GFP_RECLAIM",
+            "__GFP_KSWAPD_RECLAIM",
+            "__GFP_DIRECT_RECLAIM",
+            "__GFP_ATOMIC",
+            "__GFP_ZERO",
+            "__GFP_FS",
+            "__GFP_IO",
+            "__GFP_HIGH",
+            "__GFP_RECLAIMABLE",
+            "__GFP_MOVABLE",
+            "__GFP_DMA32",
+            "__GFP_HIGHMEM",
+            "__GFP_DMA",
+        ],
+    ),
+}
+"""
+Resolved values of all GFP flags and the sorted reverse lookup list indexed by the
+class name of the kernel configuration
+
+@type: Dict(str, Tuple(Dict(str, int), List(str)))
+@see: BaseKernelConfig._gfp_calc_all_values(), BaseKernelConfig._gfp_create_reverse_lookup()
+"""
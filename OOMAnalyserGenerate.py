@@ -0,0 +1,338 @@
+# -*- coding: Latin-1 -*-
+#
+# Linux OOMAnalyser - generator for precomputed tables
+#
+# Copyright (c) 2017-2023 Carsten Grohmann
+# License: MIT (see LICENSE.txt)
+# THIS PROGRAM COMES WITH NO WARRANTY
+"""
+Generate static tables for OOMAnalyser at build time.
+
+This module is not translated to JavaScript. It has two commands:
+
+ * gfp-tables evaluates the GFP flags of all kernel configurations once and
+   writes the resolved integer values and the sorted reverse lookup lists into
+   OOMAnalyserGFPTables.py. OOMAnalyser.py imports this module and loads the
+   values instead of calculating them at runtime.
+
+ * gfp-delta extracts the GFP flags from gfp.h / gfp_types.h of a kernel source
+   tree and prints the GFP_FLAGS_DELTA to the parent kernel configuration. The
+   output is ready to paste into a new KernelConfig class.
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+
+import OOMAnalyser
+
+GFP_TABLES_FILE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "OOMAnalyserGFPTables.py"
+)
+"""Default file for the generated GFP tables"""
+
+GFP_TABLES_HEADER = """\
+# -*- coding: Latin-1 -*-
+#
+# Linux OOMAnalyser - precomputed GFP tables
+#
+# Copyright (c) 2017-2023 Carsten Grohmann
+# License: MIT (see LICENSE.txt)
+# THIS PROGRAM COMES WITH NO WARRANTY
+#
+# THIS FILE IS GENERATED BY OOMAnalyserGenerate.py - DO NOT EDIT
+# Run "make gfp-tables" after changing GFP_FLAGS in OOMAnalyser.py.
+
+GFP_TABLES = {
+"""
+"""Beginning of the generated module"""
+
+
+def calc_gfp_tables():
+    """
+    Calculate the GFP values and the reverse lookup lists of all kernel configurations
+
+    The values are calculated from GFP_FLAGS without using the current tables.
+
+    @return: Tuple of flag values and reverse lookup list indexed by class name
+    @rtype: Dict(str, Tuple(Dict(str, int), List(str)))
+    """
+    tables = {}
+    for kcfg_class in OOMAnalyser.AllKernelConfigs:
+        kcfg = kcfg_class()
+        kcfg._gfp_calc_all_values()
+        values = dict(
+            [(flag, kcfg.GFP_FLAGS[flag]["_value"]) for flag in sorted(kcfg.GFP_FLAGS)]
+        )
+        tables[kcfg_class.__name__] = (values, kcfg._gfp_create_reverse_lookup())
+    return tables
+
+
+def format_hex(value):
+    """
+    Return an integer as hexadecimal literal in the notation of black
+
+    @type value: int
+    @rtype: str
+    """
+    sign = "-" if value < 0 else ""
+    return "{}0x{:X}".format(sign, abs(value))
+
+
+def format_gfp_tables(tables):
+    """
+    Return the source code of the module with the GFP tables
+
+    @param tables: Tables returned by calc_gfp_tables()
+    @rtype: str
+    """
+    lines = [GFP_TABLES_HEADER]
+    for name in sorted(tables):
+        values, reverse_lookup = tables[name]
+        lines.append('    "{}": (\n        {{\n'.format(name))
+        for flag, value in values.items():
+            lines.append('            "{}": {},\n'.format(flag, format_hex(value)))
+        lines.append("        },\n        [\n")
+        for flag in reverse_lookup:
+            lines.append('            "{}",\n'.format(flag))
+        lines.append("        ],\n    ),\n")
+    lines.append(
+        '}\n"""\n'
+        "Resolved values of all GFP flags and the sorted reverse lookup list indexed "
+        "by the\nclass name of the kernel configuration\n\n"
+        "@type: Dict(str, Tuple(Dict(str, int), List(str)))\n"
+        "@see: BaseKernelConfig._gfp_calc_all_values(), "
+        "BaseKernelConfig._gfp_create_reverse_lookup()\n"
+        '"""\n'
+    )
+    return "".join(lines)
+
+
+REC_GFP_DEFINE = re.compile(
+    r"^\s*#\s*define\s+(?P<name>_{0,3}GFP_\w+)\s+(?P<value>.+)$"
+)
+"""Match a GFP flag definition in gfp.h / gfp_types.h"""
+
+REC_GFP_TOKEN = re.compile(r"^~?(_{0,3}GFP_\w+|0x[0-9a-fA-F]+|\d+)$")
+"""Match a single token of a GFP flag value"""
+
+GFP_GROUPS = [
+    ("Useful GFP flag combinations:", re.compile(r"^GFP_")),
+    ("Modifier, mobility and placement hints:", re.compile(r"^__GFP_")),
+    ("Plain integer GFP bitmasks (for internal use only):", re.compile(r"^___GFP_")),
+]
+"""Comment and pattern of the flag groups in GFP_FLAGS"""
+
+
+def parse_gfp_value(value):
+    """
+    Convert the value of a GFP #define into the notation of GFP_FLAGS
+
+    Casts, parentheses and integer suffixes are removed. The flags are evaluated
+    from left to right like in BaseKernelConfig._gfp_flag2decimal(). Definitions
+    using other macros, shifts or arithmetic are not supported.
+
+    @param str value: Value of the #define
+    @return: Integer, flag expression or None if the value is not supported
+    @rtype: int|str|None
+    """
+    value = value.replace("(__force gfp_t)", "")
+    value = value.replace("(", " ").replace(")", " ")
+    value = re.sub(r"\b(0x[0-9a-fA-F]+|\d+)[uUlL]+\b", r"\1", value)
+    value = re.sub(r"~\s+", "~", value)
+    tokens = re.split(r"\s*([|&])\s*", value.strip())
+    for token in tokens:
+        if token not in ["|", "&"] and not REC_GFP_TOKEN.match(token):
+            return None
+    if len(tokens) == 1 and tokens[0][0].isdigit():
+        return int(tokens[0], 0)
+    return " ".join(tokens)
+
+
+def parse_gfp_header(filenames, unparsable=None):
+    """
+    Extract all GFP flags from gfp.h / gfp_types.h
+
+    The first definition of a flag is used e.g. the CONFIG_LOCKDEP branch of
+    ___GFP_NOLOCKDEP.
+
+    @param List(str) filenames: Header files
+    @param List(str) unparsable: Names of definitions with unsupported values are
+                                 appended to this list
+    @return: Flags in the notation of GFP_FLAGS
+    @rtype: Dict(str, dict)
+    """
+    flags = {}
+    if unparsable is None:
+        unparsable = []
+    for filename in filenames:
+        with open(filename, encoding="utf-8", errors="replace") as fh:
+            source = fh.read()
+        source = re.sub(r"/\*.*?\*/", " ", source, flags=re.DOTALL)
+        source = re.sub(r"//.*", "", source)
+        source = source.replace("\\\n", " ")
+        for line in source.splitlines():
+            match = REC_GFP_DEFINE.match(line)
+            name = match.group("name") if match else None
+            if not match or name in flags or name in unparsable:
+                continue
+            value = parse_gfp_value(match.group("value"))
+            if value is None:
+                unparsable.append(name)
+            else:
+                flags[name] = {"value": value}
+    return flags
+
+
+def calc_gfp_delta(flags, parent_flags, unparsable=()):
+    """
+    Return the changes of the GFP flags compared to the parent configuration
+
+    Removed flags have the value None. Flags that are still defined, but with an
+    unsupported value, are not treated as removed.
+
+    @param Dict(str, dict) flags: Flags of the new kernel configuration
+    @param Dict(str, dict) parent_flags: Flags of the parent kernel configuration
+    @param List(str) unparsable: Names of definitions with unsupported values
+    @rtype: Dict(str, dict|None)
+    """
+    delta = {}
+    for flag in sorted(flags):
+        if flag not in parent_flags or (
+            parent_flags[flag]["value"] != flags[flag]["value"]
+        ):
+            delta[flag] = {"value": flags[flag]["value"]}
+    for flag in sorted(parent_flags):
+        if flag not in flags and flag not in unparsable:
+            delta[flag] = None
+    return delta
+
+
+def _format_gfp_flag(flag, entry, indent):
+    """Return the source code of a single GFP flag in black notation"""
+    if entry is None:
+        return ["{}{}: None,".format(indent, json.dumps(flag))]
+    value = entry["value"]
+    if isinstance(value, int):
+        value = "0x{:02X}".format(value)
+    else:
+        value = json.dumps(value)
+    line = '{}{}: {{"value": {}}},'.format(indent, json.dumps(flag), value)
+    if len(line) <= 88:
+        return [line]
+    return [
+        "{}{}: {{".format(indent, json.dumps(flag)),
+        '{}    "value": {}'.format(indent, value),
+        "{}}},".format(indent),
+    ]
+
+
+def format_gfp_delta(delta, indent="    "):
+    """
+    Return the source code of GFP_FLAGS_DELTA grouped like GFP_FLAGS
+
+    @param Dict(str, dict|None) delta: Changes returned by calc_gfp_delta()
+    @param str indent: Indentation of the class attribute
+    @rtype: str
+    """
+    lines = [
+        "{}# NOTE: These flags are automatically extracted from a gfp.h file.".format(
+            indent
+        ),
+        "{}#       Please do not change them manually!".format(indent),
+        "{}GFP_FLAGS_DELTA = {{".format(indent),
+    ]
+    for comment, rec in GFP_GROUPS:
+        changed = [flag for flag in delta if rec.match(flag) and delta[flag]]
+        if not changed:
+            continue
+        lines.extend(["{}    #".format(indent)] * 2)
+        lines.append("{}    # {}".format(indent, comment))
+        if rec.pattern == "^___GFP_":
+            changed.sort(key=lambda flag: delta[flag]["value"])
+        for flag in changed:
+            lines.extend(_format_gfp_flag(flag, delta[flag], indent + "    "))
+    removed = [flag for flag in delta if delta[flag] is None]
+    if removed:
+        lines.extend(["{}    #".format(indent)] * 2)
+        lines.append("{}    # Removed flags:".format(indent))
+        for flag in removed:
+            lines.extend(_format_gfp_flag(flag, None, indent + "    "))
+    lines.append("{}}}".format(indent))
+    return "\n".join(lines) + "\n"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Generate static tables and source code for OOMAnalyser."
+    )
+    subparsers = parser.add_subparsers(dest="command")
+    parser_tables = subparsers.add_parser(
+        "gfp-tables",
+        help="Generate the precomputed GFP tables for all kernel configurations",
+    )
+    parser_tables.add_argument(
+        "--output",
+        metavar="FILE",
+        default=GFP_TABLES_FILE,
+        help="Write the tables to this file (default: OOMAnalyserGFPTables.py)",
+    )
+    parser_delta = subparsers.add_parser(
+        "gfp-delta",
+        help="Print the GFP_FLAGS_DELTA of gfp.h / gfp_types.h to the parent "
+        "kernel configuration",
+    )
+    parser_delta.add_argument(
+        "--parent",
+        required=True,
+        help='Class name of the parent kernel configuration e.g. "KernelConfig_6_1"',
+    )
+    parser_delta.add_argument(
+        "header",
+        nargs="+",
+        help="Header files e.g. include/linux/gfp.h include/linux/gfp_types.h",
+    )
+    args = parser.parse_args(argv)
+
+    if args.command == "gfp-delta":
+        parent = getattr(OOMAnalyser, args.parent, None)
+        if parent is None:
+            parser.error("Unknown kernel configuration {}".format(args.parent))
+        parent_flags = parent().GFP_FLAGS
+        unparsable = []
+        flags = parse_gfp_header(args.header, unparsable)
+        sys.stdout.write(
+            format_gfp_delta(calc_gfp_delta(flags, parent_flags, unparsable))
+        )
+        if unparsable:
+            sys.stderr.write(
+                "Unsupported values of the GFP definitions: {}\n".format(
+                    ", ".join(unparsable)
+                )
+            )
+        # The current values of these flags are unknown. Don't use the delta
+        # without adding them manually.
+        missing = [flag for flag in unparsable if flag in parent_flags]
+        if missing:
+            sys.stderr.write(
+                "Please add the missing GFP flags manually: {}\n".format(
+                    ", ".join(missing)
+                )
+            )
+            return 1
+        return 0
+
+    if args.command == "gfp-tables":
+        source = format_gfp_tables(calc_gfp_tables())
+        with open(args.output, "w", encoding="latin-1") as fh:
+            fh.write(source)
+        return 0
+
+    parser.print_help()
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
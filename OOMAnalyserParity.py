@@ -0,0 +1,363 @@
+# -*- coding: Latin-1 -*-
+#
+# Linux OOMAnalyser - differential test of the Python and JavaScript analysis
+#
+# Copyright (c) 2017-2023 Carsten Grohmann
+# License: MIT (see LICENSE.txt)
+# THIS PROGRAM COMES WITH NO WARRANTY
+"""
+Compare the analysis results of CPython and the JavaScript bundle.
+
+This module is not translated to JavaScript. It analyses the corpus of
+OOMAnalyserRegression with the Python source and with the JavaScript bundle
+built by Transcrypt and Rollup or with the ES modules generated by Transcrypt
+in __target__. The JavaScript code runs in Node.js with a minimal DOM
+replacement similar to the MOC objects in OOMAnalyser.py. Both results are
+converted into the same JSON structure and compared item by item. The
+throughput of both implementations is reported as well.
+"""
+
+import argparse
+import html
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+import OOMAnalyser
+import OOMAnalyserCLI
+import OOMAnalyserRegression
+
+BUNDLE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "OOMAnalyser.js")
+"""Default JavaScript bundle"""
+
+TARGET_FILE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "__target__", "OOMAnalyser.js"
+)
+"""ES module generated by Transcrypt before bundling"""
+
+RESULT_FIELDS = [
+    "error_msg",
+    "kversion",
+    "oom_type",
+    "oom_constraint",
+    "mem_alloc_failure",
+    "mem_fragmented",
+    "memory_pressure",
+    "swap_active",
+    "max_order",
+    "details",
+    "buddyinfo",
+    "buddyinfo_free_kb",
+    "buddyinfo_total_free_kb",
+    "fragmentation_index",
+    "watermarks",
+    "node_table",
+    "hugepages",
+    "slab_unreclaimable",
+    "memcg_stats",
+    "oom_victim_expected",
+    "call_trace_frames",
+]
+"""
+Attributes of OOMAnalyser.OOMResult compared between Python and JavaScript
+
+The kernel configuration is compared by its name. The profile is skipped,
+because it contains durations only.
+"""
+
+NODE_OPTS = ["--experimental-detect-module"]
+"""Node.js options to load the UMD bundle as well as the ES modules in __target__"""
+
+NODE_SCRIPT = r"""
+"use strict";
+const fs = require("fs");
+const path = require("path");
+const url = require("url");
+
+// minimal DOM replacement, similar to the MOC objects in OOMAnalyser.py
+const notifications = [];
+class Element {
+    constructor(id) {
+        this.id = id;
+        this.classList = {add() {}, remove() {}, toggle() {}, contains() { return false; }};
+        this.style = {};
+        this.textContent = "";
+        this.innerHTML = "";
+        this.firstChild = null;
+        this.parentNode = this;
+        this.offsetWidth = 0;
+    }
+    appendChild(child) {
+        if (this.id === "notify_box") {
+            notifications.push(child.innerHTML);
+        }
+        return child;
+    }
+    removeChild(child) { return child; }
+    setAttribute() {}
+    insertAdjacentHTML() {}
+}
+const elements = {};
+globalThis.window = globalThis;
+globalThis.scroll = function () {};
+globalThis.document = {
+    getElementById(id) {
+        if (!(id in elements)) {
+            elements[id] = new Element(id);
+        }
+        return elements[id];
+    },
+    getElementsByClassName() { return []; },
+    querySelectorAll() { return []; },
+    createElement() { return new Element(null); },
+    createElementNS() { return new Element(null); },
+};
+
+async function main() {
+    const imported = await import(url.pathToFileURL(path.resolve(process.argv[1])));
+    // the UMD bundle is loaded as CommonJS module
+    const lib = imported.OOMAnalyser ? imported : imported.default;
+    const corpus = JSON.parse(fs.readFileSync(process.argv[2], "utf-8"));
+    const fields = JSON.parse(process.argv[3]);
+    const output = {results: [], durations_ms: []};
+    for (const [name, text] of corpus) {
+        notifications.length = 0;
+        const start = performance.now();
+        const analyser = lib.OOMAnalyser(lib.OOMEntity(text));
+        const success = analyser.analyse();
+        output.durations_ms.push(performance.now() - start);
+        const result = analyser.oom_result;
+        const item = {success: success, kconfig: result.kconfig.name};
+        for (const field of fields) {
+            item[field] = result[field];
+        }
+        item.messages = notifications.slice();
+        output.results.push(item);
+    }
+    process.stdout.write(JSON.stringify(output));
+}
+main();
+"""
+"""
+Node.js script to analyse all corpus entries with the JavaScript bundle
+
+Arguments: path of the bundle or the ES module, path of a JSON file with the
+corpus, JSON list of the compared result attributes
+
+@see: RESULT_FIELDS
+"""
+
+
+def normalise(value):
+    """
+    Convert a value into the representation it gets after a JSON round trip in JS
+
+    Dictionary keys become strings, tuples become lists and floats without
+    fractional part become integers, because JavaScript doesn't distinguish
+    between them.
+    """
+    if isinstance(value, dict):
+        return dict([(str(k), normalise(v)) for k, v in value.items()])
+    if isinstance(value, (list, tuple)):
+        return [normalise(v) for v in value]
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def python_result(success, result, messages):
+    """
+    Return the comparable part of an analysis result
+
+    @type success: bool
+    @type result: OOMAnalyser.OOMResult
+    @type messages: List(str, str)
+    @rtype: dict
+    """
+    comparable = {"success": success, "kconfig": result.kconfig.name}
+    for field in RESULT_FIELDS:
+        comparable[field] = getattr(result, field)
+    comparable["messages"] = [
+        "{}: {}".format(prefix, msg) for prefix, msg in messages if prefix != "DEBUG"
+    ]
+    return normalise(comparable)
+
+
+def run_python(corpus):
+    """
+    Analyse all corpus entries with the Python source
+
+    @param List(Tuple(str, str)) corpus: Name and OOM text of all entries
+    @return: Comparable results and durations in milliseconds
+    @rtype: Tuple(List(dict), List(float))
+    """
+    OOMAnalyser.add_to_notifybox = OOMAnalyserCLI.collect_notification
+    results = []
+    durations = []
+    for name, text in corpus:
+        del OOMAnalyserCLI.notifications[:]
+        start = time.perf_counter()
+        success, result, messages = OOMAnalyserCLI.analyse_block(text)
+        durations.append((time.perf_counter() - start) * 1000)
+        results.append(python_result(success, result, messages))
+    return results, durations
+
+
+def run_js(corpus, bundle=BUNDLE_FILE, node="node"):
+    """
+    Analyse all corpus entries with the JavaScript bundle in Node.js
+
+    @param List(Tuple(str, str)) corpus: Name and OOM text of all entries
+    @param str bundle: Path of the JavaScript bundle or the ES module in __target__
+    @param str node: Node.js executable
+    @return: Comparable results and durations in milliseconds
+    @rtype: Tuple(List(dict), List(float))
+    """
+    with tempfile.NamedTemporaryFile("w", suffix=".json") as fh:
+        json.dump(corpus, fh)
+        fh.flush()
+        proc = subprocess.run(
+            [node]
+            + NODE_OPTS
+            + ["-e", NODE_SCRIPT, bundle, fh.name, json.dumps(RESULT_FIELDS)],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            check=True,
+            universal_newlines=True,
+        )
+    output = json.loads(proc.stdout)
+    for result in output["results"]:
+        # notifications are added as escaped HTML "<prefix>: <msg><br>"
+        result["messages"] = [
+            html.unescape(msg[: -len("<br>")])
+            for msg in result["messages"]
+            if not msg.startswith("DEBUG: ")
+        ]
+    return [normalise(r) for r in output["results"]], output["durations_ms"]
+
+
+def diff(python_value, js_value, path=""):
+    """
+    Return all differences between two comparable results
+
+    @param python_value: Result of the Python implementation
+    @param js_value: Result of the JavaScript implementation
+    @param str path: Path of the current item used in the messages
+    @rtype: List(str)
+    """
+    if isinstance(python_value, dict) and isinstance(js_value, dict):
+        differences = []
+        for key in sorted(set(python_value) | set(js_value)):
+            item_path = "{}.{}".format(path, key) if path else key
+            if key not in js_value:
+                differences.append("{}: missing in JS".format(item_path))
+            elif key not in python_value:
+                differences.append("{}: missing in Python".format(item_path))
+            else:
+                differences.extend(diff(python_value[key], js_value[key], item_path))
+        return differences
+
+    if (
+        isinstance(python_value, list)
+        and isinstance(js_value, list)
+        and len(python_value) == len(js_value)
+    ):
+        differences = []
+        for i, (py_item, js_item) in enumerate(zip(python_value, js_value)):
+            differences.extend(diff(py_item, js_item, "{}[{}]".format(path, i)))
+        return differences
+
+    # compare types too: 1 != "1" is the typical JavaScript divergence
+    if python_value != js_value or type(python_value) != type(js_value):
+        return ["{}: Python {!r} != JS {!r}".format(path, python_value, js_value)]
+    return []
+
+
+def throughput(durations):
+    """
+    Return the number of analysed OOMs per second
+
+    @param List(float) durations: Duration per OOM in milliseconds
+    @rtype: float
+    """
+    total = sum(durations)
+    return round(len(durations) * 1000 / total, 1) if total else None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Analyse the OOM corpus with the Python source and the "
+        "JavaScript bundle, compare the results and report the throughput."
+    )
+    parser.add_argument(
+        "--bundle",
+        default=BUNDLE_FILE,
+        help="JavaScript bundle or ES module in __target__ (default: OOMAnalyser.js)",
+    )
+    parser.add_argument(
+        "--node",
+        default="node",
+        help="Node.js executable (default: node)",
+    )
+    parser.add_argument(
+        "--no-synthetic",
+        action="store_true",
+        help="Skip the large synthetic OOMs",
+    )
+    parser.add_argument(
+        "--max-diffs",
+        type=int,
+        default=10,
+        help="Maximum number of differences shown per OOM (default: 10)",
+    )
+    args = parser.parse_args(argv)
+
+    if not shutil.which(args.node):
+        sys.stderr.write("Node.js executable {} not found\n".format(args.node))
+        return 2
+    if not os.path.exists(args.bundle):
+        sys.stderr.write(
+            "JavaScript bundle {} not found, run 'make build' first\n".format(
+                args.bundle
+            )
+        )
+        return 2
+
+    corpus = OOMAnalyserRegression.load_corpus(
+        OOMAnalyserRegression.CORPUS_DIR, not args.no_synthetic
+    )
+    py_results, py_durations = run_python(corpus)
+    js_results, js_durations = run_js(corpus, args.bundle, args.node)
+
+    diverged = 0
+    for (name, text), py_result, js_result in zip(corpus, py_results, js_results):
+        differences = diff(py_result, js_result)
+        if differences:
+            diverged += 1
+            print("{}: {} difference(s)".format(name, len(differences)))
+            for difference in differences[: args.max_diffs]:
+                print("  {}".format(difference))
+        else:
+            print("{}: identical".format(name))
+
+    print(
+        "Python: {} OOMs/s, JavaScript: {} OOMs/s".format(
+            throughput(py_durations), throughput(js_durations)
+        )
+    )
+    if diverged:
+        sys.stderr.write(
+            "{} of {} OOMs differ between Python and JavaScript\n".format(
+                diverged, len(corpus)
+            )
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,308 @@
+# -*- coding: Latin-1 -*-
+#
+# Linux OOMAnalyser - performance regression check
+#
+# Copyright (c) 2017-2023 Carsten Grohmann
+# License: MIT (see LICENSE.txt)
+# THIS PROGRAM COMES WITH NO WARRANTY
+"""
+Check the OOM analysis for performance regressions.
+
+This module is not translated to JavaScript. It analyses a curated corpus of
+OOM blocks, measures the throughput, the latency per block and the peak RSS and
+compares the numbers with a stored baseline. The corpus consists of
+
+ * the real-world OOMs in corpus/*.txt,
+ * the examples embedded in OOMAnalyser.OOMDisplay and
+ * large synthetic OOMs generated with OOMAnalyserBench.SyntheticOOM.
+
+The synthetic OOMs are generated at runtime with a fixed seed, so they are
+identical between runs without checking in several megabytes of text.
+"""
+
+import argparse
+import glob
+import json
+import os
+import platform
+import resource
+import sys
+import time
+
+import OOMAnalyser
+import OOMAnalyserBench
+import OOMAnalyserCLI
+
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "corpus")
+"""Directory with the real-world OOMs and the baseline"""
+
+BASELINE_FILE = os.path.join(CORPUS_DIR, "baseline.json")
+"""Default file with the stored baseline"""
+
+DEFAULT_TOLERANCE = 0.5
+"""Accepted slowdown before a value counts as regression (0.5 = 50%)"""
+
+DEFAULT_NOISE_FLOOR_MS = 2.0
+"""Latency differences below this value are ignored to not fail on timer noise"""
+
+SYNTHETIC_ENTRIES = [
+    ("KernelConfig_6_1", 10000),
+    ("KernelConfig_6_1", 50000),
+    ("KernelConfig_3_10_EL7", 10000),
+]
+"""Kernel configuration and number of processes of the synthetic corpus entries"""
+
+
+def load_corpus(directory=CORPUS_DIR, synthetic=True):
+    """
+    Return all corpus entries
+
+    @param str directory: Directory with the real-world OOMs (*.txt)
+    @param bool synthetic: Add the large synthetic OOMs
+    @return: Name and OOM text of all corpus entries
+    @rtype: List(Tuple(str, str))
+    """
+    corpus = []
+    for filename in sorted(glob.glob(os.path.join(directory, "*.txt"))):
+        name = os.path.splitext(os.path.basename(filename))[0]
+        with open(filename, encoding="utf-8") as fh:
+            corpus.append(("file:{}".format(name), fh.read()))
+
+    for attr in sorted(dir(OOMAnalyser.OOMDisplay)):
+        if attr.startswith("example_"):
+            corpus.append(
+                ("example:{}".format(attr[8:]), getattr(OOMAnalyser.OOMDisplay, attr))
+            )
+
+    if synthetic:
+        for name, nr_processes in SYNTHETIC_ENTRIES:
+            kconfig = OOMAnalyserBench.kernel_configs(name)[0]
+            text = OOMAnalyserBench.SyntheticOOM(kconfig, nr_processes).text()
+            corpus.append(
+                (
+                    "synthetic:{}-{}k".format(
+                        name[len("KernelConfig_") :], nr_processes // 1000
+                    ),
+                    text,
+                )
+            )
+    return corpus
+
+
+def percentile(values, percent):
+    """
+    Return the percentile of the values using the nearest-rank method
+
+    @param List(float) values: Measured values
+    @param int percent: Percentile between 1 and 100
+    @rtype: float
+    """
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * percent // 100))
+    return ordered[rank - 1]
+
+
+def peak_rss_kb():
+    """
+    Return the peak resident set size of this process in kB
+
+    @rtype: int
+    """
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        # macOS reports bytes instead of kilobytes
+        usage //= 1024
+    return usage
+
+
+def measure(corpus, repeat):
+    """
+    Analyse all corpus entries several times and return the measurements
+
+    @param List(Tuple(str, str)) corpus: Name and OOM text of all entries
+    @param int repeat: Number of runs per entry
+    @return: Latency per entry, throughput and peak RSS
+    @rtype: dict
+    """
+    entries = {}
+    failed = []
+    total_time = 0.0
+    runs = 0
+    for name, text in corpus:
+        durations = []
+        for unused in range(repeat):
+            del OOMAnalyserCLI.notifications[:]
+            start = time.perf_counter()
+            success, result, messages = OOMAnalyserCLI.analyse_block(text)
+            duration = time.perf_counter() - start
+            durations.append(duration * 1000)
+            total_time += duration
+            runs += 1
+            if not success or [
+                msg for level, msg in messages if level.endswith("ERROR")
+            ]:
+                failed.append(name)
+                break
+        entries[name] = {
+            "size_bytes": len(text),
+            "p50_ms": round(percentile(durations, 50), 3),
+            "p99_ms": round(percentile(durations, 99), 3),
+        }
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "repeat": repeat,
+        "entries": entries,
+        "failed": sorted(set(failed)),
+        "ooms_per_second": round(runs / total_time, 1) if total_time else None,
+        "peak_rss_kb": peak_rss_kb(),
+    }
+
+
+def compare(current, baseline, tolerance=DEFAULT_TOLERANCE, noise_floor_ms=0.0):
+    """
+    Compare the measurements with the baseline and return all regressions
+
+    A latency is a regression, if it's more than tolerance slower than the
+    baseline and the difference is above the noise floor. The throughput and
+    the peak RSS are compared with the same tolerance. Corpus entries missing in
+    the baseline are skipped.
+
+    @param dict current: Current measurements returned by measure()
+    @param dict baseline: Stored measurements returned by measure()
+    @param float tolerance: Accepted slowdown e.g. 0.5 for 50%
+    @param float noise_floor_ms: Ignore latency differences below this value
+    @return: Description of all regressions
+    @rtype: List(str)
+    """
+    regressions = []
+    for name in current["failed"]:
+        regressions.append("{}: analysis failed".format(name))
+
+    limit = 1 + tolerance
+    for name, values in sorted(current["entries"].items()):
+        base = baseline["entries"].get(name)
+        if not base:
+            continue
+        for key in ["p50_ms", "p99_ms"]:
+            if (
+                values[key] > base[key] * limit
+                and values[key] - base[key] > noise_floor_ms
+            ):
+                regressions.append(
+                    "{}: {} {:.3f} ms vs. {:.3f} ms in baseline ({:.1f}x)".format(
+                        name, key, values[key], base[key], values[key] / base[key]
+                    )
+                )
+
+    if (
+        baseline.get("ooms_per_second")
+        and current["ooms_per_second"] * limit < baseline["ooms_per_second"]
+    ):
+        regressions.append(
+            "throughput: {} OOMs/s vs. {} OOMs/s in baseline".format(
+                current["ooms_per_second"], baseline["ooms_per_second"]
+            )
+        )
+
+    if (
+        baseline.get("peak_rss_kb")
+        and current["peak_rss_kb"] > baseline["peak_rss_kb"] * limit
+    ):
+        regressions.append(
+            "peak RSS: {} kB vs. {} kB in baseline".format(
+                current["peak_rss_kb"], baseline["peak_rss_kb"]
+            )
+        )
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Analyse the OOM corpus and compare throughput, latency and "
+        "peak RSS with the stored baseline."
+    )
+    parser.add_argument(
+        "--baseline",
+        metavar="FILE",
+        default=BASELINE_FILE,
+        help="File with the stored baseline (default: corpus/baseline.json)",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Write the current measurements as new baseline",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help="Accepted slowdown before failing e.g. 0.5 for 50%% (default: 0.5)",
+    )
+    parser.add_argument(
+        "--noise-floor",
+        type=float,
+        default=DEFAULT_NOISE_FLOOR_MS,
+        help="Ignore latency differences below this value in ms (default: 2.0)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="Number of runs per corpus entry (default: 5)",
+    )
+    parser.add_argument(
+        "--no-synthetic",
+        action="store_true",
+        help="Skip the large synthetic OOMs",
+    )
+    args = parser.parse_args(argv)
+
+    OOMAnalyser.add_to_notifybox = OOMAnalyserCLI.collect_notification
+
+    corpus = load_corpus(CORPUS_DIR, not args.no_synthetic)
+    current = measure(corpus, args.repeat)
+    for name, values in sorted(current["entries"].items()):
+        print(
+            "{:<32} {:>10} bytes  p50 {:>10.3f} ms  p99 {:>10.3f} ms".format(
+                name, values["size_bytes"], values["p50_ms"], values["p99_ms"]
+            )
+        )
+    print(
+        "{} OOMs/s, peak RSS {} kB".format(
+            current["ooms_per_second"], current["peak_rss_kb"]
+        )
+    )
+
+    if args.update_baseline:
+        if current["failed"]:
+            sys.stderr.write(
+                "Baseline not written, analysis failed for: {}\n".format(
+                    ", ".join(current["failed"])
+                )
+            )
+            return 1
+        with open(args.baseline, "w") as fh:
+            json.dump(current, fh, indent=2, sort_keys=True)
+            fh.write("\n")
+        print("Baseline written to {}".format(args.baseline))
+        return 0
+
+    with open(args.baseline) as fh:
+        baseline = json.load(fh)
+    regressions = compare(current, baseline, args.tolerance, args.noise_floor)
+    if regressions:
+        sys.stderr.write(
+            "PERFORMANCE REGRESSION: {} value(s) exceed the baseline by more than "
+            "{:.0%}:\n".format(len(regressions), args.tolerance)
+        )
+        for regression in regressions:
+            sys.stderr.write("  {}\n".format(regression))
+        return 1
+    print("No performance regression (tolerance {:.0%})".format(args.tolerance))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
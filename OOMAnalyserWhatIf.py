@@ -0,0 +1,549 @@
+# -*- coding: Latin-1 -*-
+#
+# Linux OOMAnalyser - what-if simulation of the memory watermarks
+#
+# Copyright (c) 2017-2023 Carsten Grohmann
+# License: MIT (see LICENSE.txt)
+# THIS PROGRAM COMES WITH NO WARRANTY
+"""
+Simulate the memory allocation of an OOM with changed parameters.
+
+This module is not translated to JavaScript. It starts from the zone counters
+and the buddyinfo of an analysed OOM and evaluates the watermark and the free
+chunk check of mm/page_alloc.c:__zone_watermark_ok() for a grid of
+hypothetical scenarios:
+
+ * additional RAM per NUMA node,
+ * a different vm.min_free_kbytes,
+ * a different vm.watermark_scale_factor,
+ * a different order and
+ * the GFP flag __GFP_HIGH set or not set.
+
+All scenarios are evaluated at once. NumPy is used if it's available, see
+OOMAnalyser.numpy.
+"""
+
+import argparse
+import itertools
+import json
+import sys
+import time
+
+import OOMAnalyser
+import OOMAnalyserCLI
+
+AXES = (
+    "extra_ram_kb",
+    "min_free_kbytes",
+    "watermark_scale_factor",
+    "order",
+    "gfp_high",
+)
+"""Parameters of a scenario in the order of the grid dimensions"""
+
+
+class Simulation:
+    """Results of all scenarios of a grid"""
+
+    axes = None
+    """
+    Name and values of all parameters in the order of AXES
+
+    None stands for the value observed in the OOM.
+
+    @type: List(Tuple(str, list))
+    """
+
+    satisfied = None
+    """
+    Allocation result of each scenario in the order of itertools.product() of all axes
+
+    @type: List(bool)
+    """
+
+    def __init__(self, axes, satisfied):
+        self.axes = axes
+        self.satisfied = satisfied
+
+    def __len__(self):
+        return len(self.satisfied)
+
+    def scenarios(self):
+        """
+        Return all scenarios with their parameters and the allocation result
+
+        @rtype: Iterator(dict)
+        """
+        names = [name for name, values in self.axes]
+        for values, satisfied in zip(
+            itertools.product(*[values for name, values in self.axes]),
+            self.satisfied,
+        ):
+            scenario = dict(zip(names, values))
+            scenario["satisfied"] = satisfied
+            yield scenario
+
+
+class WatermarkSimulator:
+    """
+    Evaluate the allocation of an OOM for a grid of hypothetical scenarios
+
+    The checks are the same as in OOMAnalyser._check_alloc_failure() incl. the
+    lowmem reserves, the reduced watermark for __GFP_HIGH and the fallback to
+    lower zones. Additionally, the free memory is reduced by the size of the
+    requested chunk minus one page like in the kernel. The analysis does not
+    subtract the chunk.
+    A scenario is satisfied if at least one zone of an allowed node passes the
+    watermark and the free chunk check.
+
+    The allowed nodes are the nodes of the nodemask and the cpuset of the
+    trigger process (mems_allowed). All nodes are checked if the OOM contains
+    neither of them. In this case the simulation may report an allocation as
+    satisfied that failed in reality due to a node-local memory shortage.
+
+    The watermarks are only recalculated for explicit values of min_free_kbytes
+    or watermark_scale_factor like in mm/page_alloc.c:__setup_per_zone_wmarks().
+    Otherwise the observed watermarks are used. Additional RAM is added as free
+    and managed memory to the requested zone of each node. It also contains a
+    free chunk of the requested order, if it's large enough.
+    """
+
+    zones = None
+    """
+    Zone and node of all zones checked for the allocation
+
+    @type: List(Tuple(str, int))
+    """
+
+    nodes = None
+    """
+    Nodes allowed for the allocation or None if all nodes are allowed
+
+    @type: List(int) | None
+    """
+
+    observed = None
+    """
+    Observed values of all parameters
+
+    min_free_kbytes is the sum of the min watermarks of all lowmem zones.
+
+    @type: dict
+    """
+
+    page_size_kb = 4
+    """Page size in kB"""
+
+    lowmem_managed_kb = 0
+    """Managed memory of all zones except HighMem in kB"""
+
+    nr_requested_zones = 0
+    """Number of nodes with the requested zone, they get the additional RAM"""
+
+    free_kb = None
+    """
+    Free memory of all zones in self.zones in kB
+
+    The other per zone lists are managed_kb, min_kb, gap_kb (low - min
+    watermark), reserve_kb (lowmem reserve of the requested zone),
+    highest_free_order (-1 w/o free chunks) and requested (requested zone).
+
+    @type: List(int)
+    """
+
+    def __init__(self, result):
+        """
+        @type result: OOMAnalyser.OOMResult
+        @raise ValueError: Missing data in the analysis result
+        """
+        details = result.details
+        kconfig = result.kconfig
+        requested_zone = details.get("trigger_proc_mem_zone", None)
+        order = details.get("trigger_proc_order", None)
+        gfp_mask = details.get("_trigger_proc_gfp_mask_decimal", None)
+        if not result.watermarks or requested_zone not in result.watermarks:
+            raise ValueError("Missing watermarks of the requested memory zone")
+        if order is None or gfp_mask is None:
+            raise ValueError("Missing order or GFP mask of the memory request")
+
+        self.page_size_kb = details.get("page_size_kb", 4)
+        highest_zoneidx = kconfig.ZONE_TYPES.index(requested_zone)
+        gfp_flag_high = kconfig.GFP_FLAGS["__GFP_HIGH"]["_value"]
+        self.observed = {
+            "extra_ram_kb": 0,
+            "min_free_kbytes": 0,
+            "watermark_scale_factor": None,
+            "order": order,
+            "gfp_high": (gfp_mask & gfp_flag_high) == gfp_flag_high,
+        }
+
+        self.nodes = self._allowed_nodes(details)
+        self.zones = []
+        self.lowmem_managed_kb = 0
+        self.nr_requested_zones = 0
+        columns = []
+        for zone in kconfig.ZONE_TYPES:
+            if zone not in result.watermarks:
+                continue
+            for node in sorted(result.watermarks[zone]):
+                counters = result.watermarks[zone][node]
+                if zone != "HighMem":
+                    self.lowmem_managed_kb += counters.get("managed", 0)
+                    self.observed["min_free_kbytes"] += counters["min"]
+                if kconfig.ZONE_TYPES.index(zone) > highest_zoneidx:
+                    continue
+                requested = zone == requested_zone
+                # the additional RAM is added to all nodes
+                self.nr_requested_zones += 1 if requested else 0
+                if self.nodes is not None and node not in self.nodes:
+                    continue
+                lowmem_reserve = counters.get("lowmem_reserve", [])
+                reserve_pages = (
+                    lowmem_reserve[highest_zoneidx]
+                    if highest_zoneidx < len(lowmem_reserve)
+                    else 0
+                )
+                # highest order with a free chunk or -1
+                highest_free_order = -1
+                if zone in result.buddyinfo:
+                    for chunk_order, chunks in enumerate(result.buddyinfo[zone]):
+                        if node < len(chunks) and chunks[node]:
+                            highest_free_order = chunk_order
+                self.zones.append((zone, node))
+                columns.append(
+                    (
+                        counters["free"],
+                        counters.get("managed", 0),
+                        counters["min"],
+                        counters["low"] - counters["min"],
+                        reserve_pages * self.page_size_kb,
+                        highest_free_order,
+                        requested,
+                    )
+                )
+        if not columns:
+            raise ValueError("Missing watermarks of the allowed NUMA nodes")
+        (
+            self.free_kb,
+            self.managed_kb,
+            self.min_kb,
+            self.gap_kb,
+            self.reserve_kb,
+            self.highest_free_order,
+            self.requested,
+        ) = [list(column) for column in zip(*columns)]
+
+    @staticmethod
+    def _allowed_nodes(details):
+        """
+        Return the nodes of the nodemask and of mems_allowed of the trigger process
+
+        @return: Sorted list of allowed nodes or None if all nodes are allowed
+        @rtype: List(int) | None
+        """
+        nodes = None
+        for item in ["trigger_proc_nodemask", "trigger_proc_mems_allowed"]:
+            allowed = parse_nodelist(details.get(item, None))
+            if allowed is None:
+                continue
+            nodes = allowed if nodes is None else nodes & allowed
+        return sorted(nodes) if nodes is not None else None
+
+    def grid(
+        self,
+        extra_ram_kb=None,
+        min_free_kbytes=None,
+        watermark_scale_factor=None,
+        order=None,
+        gfp_high=None,
+    ):
+        """
+        Return the values of all axes, missing axes contain the observed value
+
+        @rtype: List(Tuple(str, list))
+        """
+        axes = []
+        for name, values in zip(
+            AXES,
+            [extra_ram_kb, min_free_kbytes, watermark_scale_factor, order, gfp_high],
+        ):
+            if values is None:
+                values = [None]
+            axes.append((name, list(values)))
+        return axes
+
+    def simulate(
+        self,
+        extra_ram_kb=None,
+        min_free_kbytes=None,
+        watermark_scale_factor=None,
+        order=None,
+        gfp_high=None,
+    ):
+        """
+        Evaluate all combinations of the given parameter values
+
+        Each parameter is a list of values. None as parameter or as value stands
+        for the observed value.
+
+        @param List(int) extra_ram_kb: Additional RAM per NUMA node in kB
+        @param List(int) min_free_kbytes: Value of vm.min_free_kbytes in kB
+        @param List(int) watermark_scale_factor: Value of vm.watermark_scale_factor
+        @param List(int) order: Order of the memory request
+        @param List(bool) gfp_high: Memory request with __GFP_HIGH
+        @rtype: Simulation
+        """
+        axes = self.grid(
+            extra_ram_kb, min_free_kbytes, watermark_scale_factor, order, gfp_high
+        )
+        if OOMAnalyser.numpy:
+            satisfied = self._simulate_numpy(axes)
+        else:
+            satisfied = self._simulate_python(axes)
+        return Simulation(axes, satisfied)
+
+    def _resolve(self, axes):
+        """
+        Return the values of all axes with the observed values instead of None
+
+        The watermark parameters use -1 instead, because the observed
+        watermarks are used for them.
+        """
+        resolved = []
+        for name, values in axes:
+            if name in ["min_free_kbytes", "watermark_scale_factor"]:
+                observed = -1
+            else:
+                observed = self.observed[name]
+            resolved.append([observed if value is None else value for value in values])
+        return resolved
+
+    def _simulate_python(self, axes):
+        """
+        Evaluate all scenarios in pure Python
+
+        @see: simulate()
+        """
+        extra_values, mfk_values, wsf_values, order_values, high_values = self._resolve(
+            axes
+        )
+        zones = list(
+            zip(
+                self.free_kb,
+                self.managed_kb,
+                self.min_kb,
+                self.gap_kb,
+                self.reserve_kb,
+                self.highest_free_order,
+                self.requested,
+            )
+        )
+        page_size_kb = self.page_size_kb
+        satisfied = []
+        for extra in extra_values:
+            lowmem_managed_kb = self.lowmem_managed_kb + extra * self.nr_requested_zones
+            for mfk in mfk_values:
+                # free, managed and min watermark per zone
+                zone_mins = []
+                for free, managed, min_kb, gap, reserve, highest, requested in zones:
+                    if requested:
+                        free += extra
+                        managed += extra
+                    if mfk >= 0:
+                        min_kb = mfk * managed // max(lowmem_managed_kb, 1)
+                    zone_mins.append((free, managed, min_kb))
+                for wsf in wsf_values:
+                    marks = []
+                    for (free, managed, min_kb), zone in zip(zone_mins, zones):
+                        # observed watermarks are used as they are to avoid
+                        # rounding errors
+                        gap = zone[3]
+                        if wsf >= 0:
+                            gap = max(min_kb // 4, managed * wsf // 10000)
+                        elif mfk >= 0:
+                            gap = max(min_kb // 4, gap)
+                        marks.append(min_kb + gap)
+                    for order in order_values:
+                        chunk_kb = 2**order * page_size_kb
+                        for high in high_values:
+                            result = False
+                            for (free, managed, min_kb), mark, zone in zip(
+                                zone_mins, marks, zones
+                            ):
+                                if high:
+                                    mark -= mark // 2
+                                if free - chunk_kb + page_size_kb <= mark + zone[4]:
+                                    continue
+                                if (
+                                    order == 0
+                                    or zone[5] >= order
+                                    or (zone[6] and extra >= chunk_kb)
+                                ):
+                                    result = True
+                                    break
+                            satisfied.append(result)
+        return satisfied
+
+    def _simulate_numpy(self, axes):
+        """
+        Evaluate all scenarios with NumPy
+
+        The axes are broadcast to an array with one dimension per axis and a
+        last dimension for the zones.
+
+        @see: simulate()
+        """
+        numpy = OOMAnalyser.numpy
+        nr_axes = len(axes)
+
+        def axis(index, values):
+            shape = [1] * (nr_axes + 1)
+            shape[index] = len(values)
+            return numpy.array(values, dtype=numpy.int64).reshape(shape)
+
+        def zone_values(values):
+            return numpy.array(values, dtype=numpy.int64).reshape([1] * nr_axes + [-1])
+
+        extra_values, mfk_values, wsf_values, order_values, high_values = self._resolve(
+            axes
+        )
+        extra = axis(0, extra_values)
+        mfk = axis(1, mfk_values)
+        wsf = axis(2, wsf_values)
+        order = axis(3, order_values)
+        high = axis(4, high_values).astype(bool)
+        requested = zone_values(self.requested).astype(bool)
+
+        free = zone_values(self.free_kb) + extra * requested
+        managed = zone_values(self.managed_kb) + extra * requested
+        lowmem_managed_kb = self.lowmem_managed_kb + extra * self.nr_requested_zones
+        min_kb = numpy.where(
+            mfk < 0,
+            zone_values(self.min_kb),
+            mfk * managed // numpy.maximum(lowmem_managed_kb, 1),
+        )
+        gap = numpy.where(wsf < 0, zone_values(self.gap_kb), managed * wsf // 10000)
+        gap = numpy.where((mfk < 0) & (wsf < 0), gap, numpy.maximum(min_kb // 4, gap))
+        mark = min_kb + gap
+        mark = numpy.where(high, mark - mark // 2, mark)
+
+        chunk_kb = 2**order * self.page_size_kb
+        watermark_ok = free - chunk_kb + self.page_size_kb > mark + zone_values(
+            self.reserve_kb
+        )
+        chunk_ok = (
+            (order == 0)
+            | (zone_values(self.highest_free_order) >= order)
+            | (requested & (extra >= chunk_kb))
+        )
+        return (watermark_ok & chunk_ok).any(axis=-1).ravel().tolist()
+
+
+def parse_nodelist(text):
+    """
+    Convert a node list like "0-2,4" as printed by the kernel with "%*pbl"
+
+    @param str text: Node list, "(null)" or "<not found>"
+    @return: Set of node numbers or None for a missing node list
+    @rtype: Set(int) | None
+    """
+    if not text or text in ["(null)", "<not found>"]:
+        return None
+    nodes = set()
+    for item in text.split(","):
+        start, unused, stop = item.partition("-")
+        nodes.update(range(int(start), int(stop or start) + 1))
+    return nodes
+
+
+def parse_values(text):
+    """
+    Convert a list or range of integers given on the command line
+
+    Ranges "<start>:<stop>:<step>" include the stop value.
+
+    @param str text: Comma separated integers or a range
+    @rtype: List(int)
+    """
+    if ":" in text:
+        start, stop, step = [int(value) for value in text.split(":")]
+        return list(range(start, stop + 1, step))
+    return [int(value) for value in text.split(",")]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Analyse an OOM and check whether the memory allocation would "
+        "succeed with changed parameters. All combinations of the given values are "
+        "evaluated and written as JSON to stdout. Values are comma separated "
+        'integers or ranges "<start>:<stop>:<step>".'
+    )
+    parser.add_argument("file", help="File with an OOM message")
+    parser.add_argument(
+        "--extra-ram",
+        type=parse_values,
+        metavar="KB",
+        help="Additional RAM per NUMA node in kB",
+    )
+    parser.add_argument(
+        "--min-free-kbytes",
+        type=parse_values,
+        metavar="KB",
+        help="Values of vm.min_free_kbytes",
+    )
+    parser.add_argument(
+        "--watermark-scale-factor",
+        type=parse_values,
+        metavar="FACTOR",
+        help="Values of vm.watermark_scale_factor",
+    )
+    parser.add_argument(
+        "--order",
+        type=parse_values,
+        help="Orders of the memory request",
+    )
+    parser.add_argument(
+        "--gfp-high",
+        nargs="+",
+        choices=["yes", "no"],
+        help="Memory request with or without __GFP_HIGH",
+    )
+    args = parser.parse_args(argv)
+
+    OOMAnalyser.add_to_notifybox = OOMAnalyserCLI.collect_notification
+    with open(args.file, encoding="utf-8", errors="replace") as fh:
+        success, result, messages = OOMAnalyserCLI.analyse_block(fh.read())
+    if not success:
+        sys.stderr.write("OOM analysis failed: {}\n".format(result.error_msg))
+        return 1
+    try:
+        simulator = WatermarkSimulator(result)
+    except ValueError as e:
+        sys.stderr.write("{}\n".format(e))
+        return 1
+
+    gfp_high = [value == "yes" for value in args.gfp_high] if args.gfp_high else None
+    start = time.perf_counter()
+    simulation = simulator.simulate(
+        args.extra_ram,
+        args.min_free_kbytes,
+        args.watermark_scale_factor,
+        args.order,
+        gfp_high,
+    )
+    duration_ms = (time.perf_counter() - start) * 1000
+    results = {
+        "observed": simulator.observed,
+        "nodes": simulator.nodes,
+        "zones": simulator.zones,
+        "duration_ms": round(duration_ms, 3),
+        "satisfied": sum(simulation.satisfied),
+        "scenarios": list(simulation.scenarios()),
+    }
+    json.dump(results, sys.stdout, indent=2, sort_keys=True)
+    sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,10 +4,23 @@
 # License: MIT (see LICENSE.txt)
 # THIS PROGRAM COMES WITH NO WARRANTY
 
+import bz2
+import concurrent.futures
+import contextlib
+import gzip
 import http.server
+import io
+import json
+import lzma
 import os
+import platform
 import re
+import shutil
 import socketserver
+import struct
+import sys
+import tarfile
+import tempfile
 import threading
 import unittest
 from selenium import webdriver
@@ -18,6 +31,12 @@ from webdriver_manager.chrome import ChromeDriverManager
 import warnings
 
 import OOMAnalyser
+import OOMAnalyserBench
+import OOMAnalyserCLI
+import OOMAnalyserGenerate
+import OOMAnalyserParity
+import OOMAnalyserRegression
+import OOMAnalyserWhatIf
 
 
 class MyRequestHandler(http.server.SimpleHTTPRequestHandler):
@@ -35,6 +54,54 @@ class ThreadedTCPServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
     pass
 
 
+BROWSER_BENCH_SCRIPT = """
+var display = OOMAnalyser.OOMDisplayInstance;
+var measure = function (name, func) {
+    performance.clearMarks();
+    performance.clearMeasures(name);
+    performance.mark(name + "-start");
+    func();
+    // force a synchronous layout to include the rendering of the new DOM content
+    document.body.offsetHeight;
+    performance.mark(name + "-end");
+    performance.measure(name, name + "-start", name + "-end");
+    return performance.getEntriesByName(name, "measure")[0].duration;
+};
+var column = arguments[2];
+var results = {};
+document.getElementById("textarea_oom").value = arguments[0];
+results["analyse_and_show"] = measure("analyse_and_show", function () {
+    display.analyse_and_show();
+});
+results["_show_pstable"] = measure("_show_pstable", function () {
+    display._show_pstable();
+});
+if (arguments[1]) {
+    results["sort_pstable"] = measure("sort_pstable", function () {
+        display.sort_pstable(column);
+    });
+}
+return results;
+"""
+"""
+JavaScript to insert an OOM, to run the analysis, to show and to sort the process
+table and to measure all steps with the Performance API
+
+Arguments: OOM text, sort the table (bool), number of the column to sort
+"""
+
+PAGE_LOAD_SCRIPT = """
+var navigation = performance.getEntriesByType("navigation")[0];
+var ready = performance.getEntriesByName("OOMAnalyser-ready", "mark");
+return {
+    "dom_interactive": navigation.domInteractive,
+    "dom_content_loaded": navigation.domContentLoadedEventEnd,
+    "analyser_ready": ready.length ? ready[0].startTime : null,
+};
+"""
+"""JavaScript to return the time to interactive of the page in milliseconds"""
+
+
 class TestBase(unittest.TestCase):
     text_alloc_failed_below_low_watermark = (
         "The request failed because the free memory would be below the memory low "
@@ -647,6 +714,48 @@ Killed process 6576 (java) total-vm:33914892kB, anon-rss:20629004kB, file-rss:0k
         self.assert_on_warn_error()
         self.check_swap_inactive()
 
+    @unittest.skipUnless(
+        os.environ.get("OOM_BROWSER_BENCH"),
+        "set OOM_BROWSER_BENCH=<output file> to run the browser benchmark",
+    )
+    def test_090_benchmark(self):
+        """Measure the analysis and the process table rendering of large OOMs"""
+        # bubble sort is O(n^2), sorting 50k processes takes minutes
+        max_sort_processes = 10000
+        rss_column = 4
+        kconfig = OOMAnalyserBench.kernel_configs("KernelConfig_6_1")[0]
+        page_load = self.driver.execute_script(PAGE_LOAD_SCRIPT)
+        scenarios = []
+        for nr_processes in [1000, 10000, 50000]:
+            self.click_reset()
+            text = OOMAnalyserBench.SyntheticOOM(kconfig, nr_processes).text()
+            self.driver.set_script_timeout(600)
+            timings = self.driver.execute_script(
+                BROWSER_BENCH_SCRIPT,
+                text,
+                nr_processes <= max_sort_processes,
+                rss_column,
+            )
+            self.assert_on_error()
+            scenarios.append(
+                {
+                    "processes": nr_processes,
+                    "size_bytes": len(text),
+                    "duration_ms": dict(
+                        [(name, round(value, 3)) for name, value in timings.items()]
+                    ),
+                }
+            )
+
+        results = {
+            "browser": self.driver.execute_script("return navigator.userAgent;"),
+            "machine": platform.machine(),
+            "page_load_ms": page_load,
+            "scenarios": scenarios,
+        }
+        with open(os.environ["OOM_BROWSER_BENCH"], "w") as fh:
+            json.dump(results, fh, indent=2, sort_keys=True)
+
 
 class TestPython(TestBase):
     def test_001_trigger_proc_space(self):
@@ -740,6 +849,14 @@ Hardware name: HP ProLiant DL385 G7, BIOS A18 12/08/2012
                 "CPU: 4 PID: 1 Comm: systemd Not tainted 3.10.0-1062.9.1.el7.x86_64 #1",
                 "3.10.0-1062.9.1.el7.x86_64",
             ),
+            (
+                "CPU: 1 PID: 5514 Comm: stress Not tainted 5.13.0-19-generic #19-Ubuntu",
+                "5.13.0-19-generic",
+            ),
+            (
+                "CPU: 5 PID: 2201 Comm: ld Not tainted 6.1.12-1-default #1 SMP PREEMPT_DYNAMIC Wed Feb 15 05:31:41 UTC 2023 (373f017)",
+                "6.1.12-1-default",
+            ),
         ]:
             analyser.oom_entity.text = text
             success = analyser._identify_kernel_version()
@@ -748,11 +865,28 @@ Hardware name: HP ProLiant DL385 G7, BIOS A18 12/08/2012
             )
             self.assertEqual(analyser.oom_result.kversion, kversion)
 
+    def test_005_extract_wo_optional_details(self):
+        """Test extracting details w/o distribution and kernel_misc_reclaimable"""
+        example = OOMAnalyser.OOMDisplay.example_tumbleweed_swap
+        example = example.replace(
+            "#1 openSUSE Tumbleweed 50a6ebc5cb1873d6b9c639843cdd1ed0089a1281",
+            "#19-Ubuntu",
+        )
+        example = re.sub(r"\n.*kernel_misc_reclaimable:\d+", "", example)
+        analyser = OOMAnalyser.OOMAnalyser(OOMAnalyser.OOMEntity(example))
+        self.assertTrue(analyser.analyse(), analyser.oom_result.error_msg)
+        details = analyser.oom_result.details
+        self.assertEqual(details["kernel_version"], "6.0.3-1-default")
+        self.assertEqual(details["distribution"], "<not found>")
+        self.assertNotEqual(details["dist"], "<not found>")
+        self.assertEqual(details["kernel_misc_reclaimable"], "<not found>")
+        self.assertIsInstance(details["free_pages"], int)
+
     def test_006_choosing_kernel_config(self):
         """Test choosing the right kernel configuration"""
         for kcfg, kversion in [
             (
-                OOMAnalyser.KernelConfig_5_8(),
+                OOMAnalyser.KernelConfig_5_9(),
                 "CPU: 4 PID: 29481 Comm: sed Not tainted 5.13.0-514 #1",
             ),
             (
@@ -948,22 +1082,16 @@ Hardware name: HP ProLiant DL385 G7, BIOS A18 12/08/2012
         for zone, order, node, except_count in [
             ("Normal", 6, 0, 0),  # order 6 - page size 256kB
             ("Normal", 6, 1, 2),  # order 6 - page size 256kB
-            ("Normal", 6, "free_chunks_total", 0 + 2),  # order 6 - page size 256kB
             ("Normal", 0, 0, 1231),  # order 0 - page size 4kB
             ("Normal", 0, 1, 2245),  # order 0 - page size 4kB
-            ("Normal", 0, "free_chunks_total", 1231 + 2245),  # order 0 - page size 4kB
             ("DMA", 5, 0, 1),  # order 5 - page size 128kB
-            ("DMA", 5, "free_chunks_total", 1),  # order 5 - page size 128kB
             ("DMA32", 4, 0, 157),  # order 4 - page size 64k
-            ("DMA32", 4, "free_chunks_total", 157),  # order 4 - page size 64k
-            ("Normal", "total_free_kb_per_node", 0, 38260),
-            ("Normal", "total_free_kb_per_node", 1, 50836),
         ]:
             self.assertTrue(
                 zone in buddyinfo, "Missing details for zone %s in buddy info" % zone
             )
             self.assertTrue(
-                order in buddyinfo[zone],
+                order < len(buddyinfo[zone]),
                 'Missing details for order "%s" in buddy info' % order,
             )
             count = buddyinfo[zone][order][node]
@@ -972,6 +1100,16 @@ Hardware name: HP ProLiant DL385 G7, BIOS A18 12/08/2012
                 'Wrong chunk count for order %s in zone "%s" for node "%s" (got: %d, expect %d)'
                 % (order, zone, node, count, except_count),
             )
+        self.assertEqual(sum(buddyinfo["Normal"][0]), 1231 + 2245)
+        self.assertEqual(
+            analyser.oom_result.buddyinfo_total_free_kb["Normal"], [38260, 50836]
+        )
+        # DMA and DMA32 are on the first node only
+        self.assertEqual(analyser.oom_result.buddyinfo_total_free_kb["DMA"][1], None)
+        self.assertEqual(buddyinfo["DMA"][5][1], 0)
+        self.assertEqual(
+            analyser.oom_result.buddyinfo_free_kb["Normal"][0][1], 2245 * 4
+        )
 
     def test_010_extract_zoneinfo(self):
         """Test extracting watermark information"""
@@ -1019,10 +1157,10 @@ Hardware name: HP ProLiant DL385 G7, BIOS A18 12/08/2012
             node == 0, "Wrong node with memory shortage (got: %s, expect: 0)" % node
         )
         self.assertEqual(
-            analyser.oom_result.kconfig.MAX_ORDER,
+            analyser.oom_result.max_order,
             11,  # This is a hard coded value as extracted from kernel 6.2.0
             "Unexpected number of chunk sizes (got: %s, expect: 11 (kernel 6.2.0))"
-            % analyser.oom_result.kconfig.MAX_ORDER,
+            % analyser.oom_result.max_order,
         )
 
     def test_011_alloc_failure(self):
@@ -1127,6 +1265,1361 @@ Hardware name: HP ProLiant DL385 G7, BIOS A18 12/08/2012
             "Page size guessed and not determinated",
         )
 
+    def test_014_log_prefix(self):
+        """Test detecting and stripping known log prefix formats"""
+        message = "CPU: 4 PID: 29481 Comm: sed Not tainted 3.10.0-514.6.1.el7.x86_64 #1"
+        for name, prefix in [
+            ("dmesg", "[11686.888109] "),
+            ("dmesg", "[    5.123456] "),
+            ("dmesg -T", "[Sun Oct  1 14:13:32 2023] "),
+            ("RFC5424", "<6>1 2023-04-01T14:13:32.123456+02:00 mysrv kernel - - - "),
+            ("short-iso", "2023-04-01T14:13:32+0200 mysrv kernel: "),
+            ("short-iso", "2023-04-01T14:13:32.123456+02:00 mysrv kernel: "),
+            ("short", "Apr 01 14:13:32 mysrv kernel: "),
+            ("short", "Apr  1 14:13:32 mysrv kernel: [11686.888109] "),
+        ]:
+            line = prefix + message
+            log_prefix = OOMAnalyser.detect_log_prefix(line)
+            self.assertIsNotNone(log_prefix, 'No prefix detected in "%s"' % line)
+            self.assertEqual(log_prefix.name, name)
+            self.assertEqual(log_prefix.strip(line), message)
+
+        self.assertIsNone(OOMAnalyser.detect_log_prefix(message))
+        log_prefix = OOMAnalyser.detect_log_prefix("[11686.888109] " + message)
+        self.assertIsNone(log_prefix.strip("Apr 01 14:13:32 mysrv kernel: " + message))
+        self.assertEqual(
+            log_prefix.strip("                active_file:121 inactive_file:511"),
+            " active_file:121 inactive_file:511",
+            "Continuation lines are not stripped to a single leading space",
+        )
+
+    def test_015_log_prefix_vs_column_heuristic(self):
+        """Test stripping a known log prefix gives the same result as guessing the columns"""
+        original_detect_log_prefix = OOMAnalyser.detect_log_prefix
+        for prefix in [
+            "Oct 01 12:00:00 myhost kernel: ",
+            "2023-10-01T12:00:00+0200 myhost kernel: ",
+            "<6>1 2023-10-01T12:00:00.123456+02:00 myhost kernel - - - ",
+        ]:
+            lines = []
+            for line in OOMAnalyser.OOMDisplay.example_tumbleweed_swap.split("\n"):
+                if line.startswith("["):
+                    lines.append(prefix + line.split("] ", 1)[1])
+                else:
+                    lines.append(line)
+            text = "\n".join(lines)
+
+            oom = OOMAnalyser.OOMEntity(text)
+            self.assertIsNotNone(oom.log_prefix, "Log prefix not detected")
+            try:
+                OOMAnalyser.detect_log_prefix = lambda line: None
+                oom_guessed = OOMAnalyser.OOMEntity(text)
+            finally:
+                OOMAnalyser.detect_log_prefix = original_detect_log_prefix
+            self.assertIsNone(oom_guessed.log_prefix)
+            self.assertEqual(oom.lines, oom_guessed.lines)
+
+            # reuse the prefix of a different format
+            dmesg_prefix = OOMAnalyser.detect_log_prefix("[1.0] CPU: 1")
+            oom = OOMAnalyser.OOMEntity(text, False, dmesg_prefix)
+            self.assertEqual(oom.lines, oom_guessed.lines)
+            self.assertIsNot(
+                oom.log_prefix, dmesg_prefix, "Log prefix not detected again"
+            )
+
+    def test_016_profiler(self):
+        """Test measuring all analysis stages"""
+        oom = OOMAnalyser.OOMEntity(OOMAnalyser.OOMDisplay.example_tumbleweed_swap)
+        analyser = OOMAnalyser.OOMAnalyserProfiler(oom)
+        success = analyser.analyse()
+        self.assertTrue(success, "OOM analysis failed")
+        profile = analyser.oom_result.profile
+        self.assertEqual(profile[0]["stage"], "analyse")
+        self.assertEqual(profile[0]["depth"], 0)
+        stages = dict([(entry["stage"], entry) for entry in profile])
+        self.assertEqual(stages["_extract_from_oom_text"]["depth"], 1)
+        self.assertEqual(stages["_extract_pstable"]["depth"], 2)
+        self.assertEqual(stages["_convert_pstable_values_to_integer"]["depth"], 2)
+        self.assertIsNone(stages["_extract_pstable"]["allocated_kb"])
+        self.assertGreaterEqual(
+            profile[0]["duration_ms"],
+            stages["_extract_from_oom_text"]["duration_ms"],
+            "Inner stage takes longer than the outer one",
+        )
+
+        # the plain analyser doesn't profile at all
+        analyser = OOMAnalyser.OOMAnalyser(oom)
+        analyser.analyse()
+        self.assertIsNone(analyser.oom_result.profile)
+
+    def test_017_gfp_tables(self):
+        """Test the precomputed GFP tables are up-to-date"""
+        tables = OOMAnalyserGenerate.calc_gfp_tables()
+        self.assertEqual(
+            sorted(tables),
+            sorted(OOMAnalyser.GFP_TABLES),
+            'GFP tables outdated, run "make gfp-tables"',
+        )
+        for name, (values, reverse_lookup) in tables.items():
+            self.assertEqual(
+                (values, reverse_lookup),
+                OOMAnalyser.GFP_TABLES[name],
+                'GFP tables of %s outdated, run "make gfp-tables"' % name,
+            )
+
+        kcfg = OOMAnalyser.KernelConfig_6_1()
+        self.assertEqual(kcfg.gfp_reverse_lookup, tables["KernelConfig_6_1"][1])
+        self.assertIsNot(
+            kcfg.gfp_reverse_lookup, OOMAnalyser.GFP_TABLES["KernelConfig_6_1"][1]
+        )
+        self.assertEqual(kcfg.GFP_FLAGS["GFP_KERNEL"]["_value"], 0xCC0)
+
+    def test_018_gfp_delta(self):
+        """Test extracting GFP flags from gfp.h and applying the deltas"""
+        header = (
+            "/* comment */\n"
+            "#define ___GFP_DMA\t\t0x01u\n"
+            "#ifdef CONFIG_LOCKDEP\n"
+            "#define ___GFP_NOLOCKDEP\t0x8000000u\n"
+            "#else\n"
+            "#define ___GFP_NOLOCKDEP\t0\n"
+            "#endif\n"
+            "#define __GFP_DMA\t((__force gfp_t)___GFP_DMA)\n"
+            "#define __GFP_BITS_SHIFT (26 + IS_ENABLED(CONFIG_LOCKDEP))\n"
+            "#define GFP_NOWAIT\t(__GFP_KSWAPD_RECLAIM)\n"
+            "#define GFP_TRANSHUGE_LIGHT\t((GFP_HIGHUSER_MOVABLE | __GFP_COMP | \\\n"
+            "\t\t\t __GFP_NOWARN) & ~__GFP_RECLAIM)\n"
+        )
+        with tempfile.NamedTemporaryFile("w", suffix=".h") as fh:
+            fh.write(header)
+            fh.flush()
+            flags = OOMAnalyserGenerate.parse_gfp_header([fh.name])
+        self.assertEqual(
+            flags,
+            {
+                "___GFP_DMA": {"value": 0x01},
+                "___GFP_NOLOCKDEP": {"value": 0x8000000},
+                "__GFP_DMA": {"value": "___GFP_DMA"},
+                "GFP_NOWAIT": {"value": "__GFP_KSWAPD_RECLAIM"},
+                "GFP_TRANSHUGE_LIGHT": {
+                    "value": "GFP_HIGHUSER_MOVABLE | __GFP_COMP | __GFP_NOWARN & "
+                    "~__GFP_RECLAIM"
+                },
+            },
+        )
+
+        parent = OOMAnalyser.KernelConfig_5_18()
+        kcfg = OOMAnalyser.KernelConfig_6_0()
+        delta = OOMAnalyserGenerate.calc_gfp_delta(kcfg.GFP_FLAGS, parent.GFP_FLAGS)
+        self.assertEqual(delta, OOMAnalyser.KernelConfig_6_0.GFP_FLAGS_DELTA)
+
+        # unsupported values are reported and not treated as removed flags
+        header = "#define ___GFP_IO\tBIT(___GFP_IO_BIT)\n" + header
+        with tempfile.NamedTemporaryFile("w", suffix=".h") as fh:
+            fh.write(header)
+            fh.flush()
+            unparsable = []
+            flags = OOMAnalyserGenerate.parse_gfp_header([fh.name], unparsable)
+            self.assertEqual(unparsable, ["___GFP_IO", "__GFP_BITS_SHIFT"])
+            self.assertNotIn("___GFP_IO", flags)
+            delta = OOMAnalyserGenerate.calc_gfp_delta(
+                flags, parent.GFP_FLAGS, unparsable
+            )
+            self.assertNotIn("___GFP_IO", delta)
+            self.assertIsNone(delta["___GFP_FS"])
+
+            stdout = io.StringIO()
+            stderr = io.StringIO()
+            with contextlib.redirect_stderr(stderr), contextlib.redirect_stdout(stdout):
+                rc = OOMAnalyserGenerate.main(
+                    ["gfp-delta", "--parent", "KernelConfig_5_18", fh.name]
+                )
+        self.assertEqual(rc, 1)
+        self.assertIn("GFP_FLAGS_DELTA", stdout.getvalue())
+        self.assertNotIn('"___GFP_IO": None', stdout.getvalue())
+        self.assertIn(
+            "Unsupported values of the GFP definitions: ___GFP_IO, __GFP_BITS_SHIFT",
+            stderr.getvalue(),
+        )
+        self.assertIn(
+            "Please add the missing GFP flags manually: ___GFP_IO", stderr.getvalue()
+        )
+
+        self.assertNotIn("__GFP_KMEMCG", OOMAnalyser.KernelConfig_3_16().GFP_FLAGS)
+        self.assertIn("__GFP_KMEMCG", OOMAnalyser.KernelConfig_3_10().GFP_FLAGS)
+
+    def test_019_concurrent_analysis(self):
+        """Test analysing OOMs concurrently in a thread pool"""
+        entities = []
+        for name, nr_orders in [
+            ("KernelConfig_6_1", 11),
+            ("KernelConfig_5_8", 9),
+            ("KernelConfig_4_14", 14),
+            ("KernelConfig_3_10_EL7", 11),
+        ]:
+            kconfig = OOMAnalyserBench.kernel_configs(name)[0]
+            text = OOMAnalyserBench.SyntheticOOM(
+                kconfig, 300, nr_orders=nr_orders
+            ).text()
+            entities.append((OOMAnalyser.OOMEntity(text), nr_orders))
+
+        def analyse(entity):
+            analyser = OOMAnalyser.OOMAnalyser(entity)
+            success = analyser.analyse()
+            result = analyser.oom_result
+            return (
+                success,
+                result.kconfig.name,
+                result.max_order,
+                result.mem_fragmented,
+                result.details,
+                result.buddyinfo,
+                result.watermarks,
+            )
+
+        expected = [analyse(entity) for entity, nr_orders in entities]
+        for (entity, nr_orders), result in zip(entities, expected):
+            self.assertTrue(result[0], "OOM analysis failed")
+            self.assertEqual(result[2], nr_orders)
+
+        # all threads share the same OOMEntity and kernel configuration instances
+        jobs = entities * 25
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(analyse, [entity for entity, _ in jobs]))
+        for i, result in enumerate(results):
+            self.assertEqual(
+                result,
+                expected[i % len(entities)],
+                "Concurrent analysis differs from the sequential one",
+            )
+
+        for kcfg_class in OOMAnalyser.AllKernelConfigs:
+            self.assertNotIn(
+                "max_order", vars(OOMAnalyser.get_kernel_config(kcfg_class))
+            )
+        self.assertEqual(OOMAnalyser.OOMResult().details, {})
+        self.assertIsNot(
+            OOMAnalyser.OOMResult().details, OOMAnalyser.OOMResult().details
+        )
+
+    def test_020_fragmentation_index(self):
+        """Test calculating the free memory and the fragmentation index"""
+        chunks = [[4, 0], [0, 1], [0, 0]]
+        expected = (
+            [[16, 0], [0, 8], [0, 0]],
+            [[-1000, -1000], [250, -1000], [500, -500]],
+        )
+        original_numpy = OOMAnalyser.numpy
+        OOMAnalyser.numpy = None
+        try:
+            self.assertEqual(OOMAnalyser.calc_buddyinfo_metrics(chunks, 4), expected)
+            self.assertEqual(
+                OOMAnalyser.calc_buddyinfo_metrics([[0], [0]], 4),
+                ([[0], [0]], [[0], [0]]),
+            )
+            kconfig = OOMAnalyserBench.kernel_configs("KernelConfig_6_1")[0]
+            text = OOMAnalyserBench.SyntheticOOM(kconfig, 20, 8).text()
+            analyser = OOMAnalyser.OOMAnalyser(OOMAnalyser.OOMEntity(text))
+            self.assertTrue(analyser.analyse(), "OOM analysis failed")
+        finally:
+            OOMAnalyser.numpy = original_numpy
+        result = analyser.oom_result
+        self.assertEqual(len(result.buddyinfo["Normal"]), 11)
+        self.assertEqual(len(result.buddyinfo["Normal"][0]), 8)
+        self.assertEqual(
+            [sum(free_kb) for free_kb in zip(*result.buddyinfo_free_kb["Normal"])],
+            result.buddyinfo_total_free_kb["Normal"],
+        )
+
+        if not original_numpy:
+            return
+        for zone in result.buddyinfo:
+            self.assertEqual(
+                OOMAnalyser.calc_buddyinfo_metrics(result.buddyinfo[zone], 4),
+                (
+                    result.buddyinfo_free_kb[zone],
+                    result.fragmentation_index[zone],
+                ),
+                "NumPy and pure Python differ for zone %s" % zone,
+            )
+        self.assertEqual(OOMAnalyser.calc_buddyinfo_metrics(chunks, 4), expected)
+
+    def test_021_all_nodes(self):
+        """Test evaluating the watermarks of all NUMA nodes"""
+        kconfig = OOMAnalyserBench.kernel_configs("KernelConfig_6_1")[0]
+        text = OOMAnalyserBench.SyntheticOOM(kconfig, 20, 3).text()
+        analyser = OOMAnalyser.OOMAnalyser(OOMAnalyser.OOMEntity(text))
+        self.assertTrue(analyser.analyse(), "OOM analysis failed")
+        result = analyser.oom_result
+        self.assertEqual(
+            result.memory_pressure, OOMAnalyser.OOMMemoryPressureType.node_local
+        )
+        self.assertEqual(len(result.node_table), 5)
+        self.assertEqual(
+            [(entry["node"], entry["zone"]) for entry in result.node_table],
+            [(0, "DMA"), (0, "DMA32"), (0, "Normal"), (1, "Normal"), (2, "Normal")],
+        )
+        entry = result.node_table[2]
+        self.assertTrue(entry["below_min"])
+        self.assertEqual(
+            entry["mem_alloc_failure"],
+            OOMAnalyser.OOMMemoryAllocFailureType.failed_below_low_watermark,
+        )
+        self.assertEqual(entry["mem_alloc_failure"], result.mem_alloc_failure)
+        for entry in result.node_table[3:]:
+            self.assertFalse(entry["below_min"])
+
+        analyser = OOMAnalyser.OOMAnalyser(
+            OOMAnalyser.OOMEntity(OOMAnalyser.OOMDisplay.example_tumbleweed_noswap)
+        )
+        self.assertTrue(analyser.analyse(), "OOM analysis failed")
+        self.assertEqual(
+            analyser.oom_result.memory_pressure,
+            OOMAnalyser.OOMMemoryPressureType.all_nodes,
+        )
+
+    def test_022_zone_counters(self):
+        """Test tokenising all counters of a memory zone"""
+        self.assertEqual(
+            OOMAnalyser.parse_zone_counters(
+                "free:15872kB min:40kB low:48kB high:60kB reserved_highatomic:0KB "
+                "present:15992kB managed:15908kB pages_scanned:0 "
+                "all_unreclaimable? yes shmem_thp: 0kB"
+            ),
+            {
+                "free": 15872,
+                "min": 40,
+                "low": 48,
+                "high": 60,
+                "reserved_highatomic": 0,
+                "present": 15992,
+                "managed": 15908,
+                "pages_scanned": 0,
+                "all_unreclaimable": True,
+                "shmem_thp": 0,
+            },
+        )
+
+        oom = OOMAnalyser.OOMEntity(OOMAnalyser.OOMDisplay.example_tumbleweed_noswap)
+        analyser = OOMAnalyser.OOMAnalyser(oom)
+        self.assertTrue(analyser.analyse(), "OOM analysis failed")
+        counters = analyser.oom_result.watermarks["DMA32"][0]
+        for name, value in [
+            ("free", 40272),
+            ("boost", 0),
+            ("min", 16608),
+            ("present", 2077504),
+            ("managed", 2011712),
+            ("free_cma", 0),
+            ("lowmem_reserve", [0, 0, 5957, 5957, 5957]),
+        ]:
+            self.assertEqual(counters[name], value, "Wrong zone counter %s" % name)
+        self.assertEqual(len(counters), 20)
+
+    def test_023_oom_badness(self):
+        """Test recalculating the OOM badness score of all processes"""
+        process = {
+            "uid": 0,
+            "rss_pages": 1000,
+            "nr_ptes_pages": 10,
+            "pgtables_bytes": 40960,
+            "swapents_pages": 90,
+            "oom_score_adj": 0,
+        }
+        for kcfg_class, uid, oom_score_adj, expected in [
+            (OOMAnalyser.KernelConfig_3_10, 0, 0, 1067),
+            (OOMAnalyser.KernelConfig_3_10, 1000, 0, 1100),
+            (OOMAnalyser.KernelConfig_3_10, 1000, -1, 1),
+            (OOMAnalyser.KernelConfig_3_10, 1000, -1000, None),
+            (OOMAnalyser.KernelConfig_4_15, 0, 0, 1067),
+            (OOMAnalyser.KernelConfig_4_18, 0, 0, 1067),
+            (OOMAnalyser.KernelConfig_4_19, 0, 0, 1100),
+            (OOMAnalyser.KernelConfig_4_18, 1000, 10, 21100),
+            (OOMAnalyser.KernelConfig_5_8, 1000, -1, 1),
+            (OOMAnalyser.KernelConfig_5_9, 1000, -1, -900),
+            (OOMAnalyser.KernelConfig_6_1, 1000, -1, -900),
+        ]:
+            process["uid"] = uid
+            process["oom_score_adj"] = oom_score_adj
+            kconfig = OOMAnalyser.get_kernel_config(kcfg_class)
+            self.assertEqual(
+                kconfig.oom_badness(process, 2000, 4),
+                expected,
+                "Wrong OOM badness score for %s, uid %d, oom_score_adj %d"
+                % (kcfg_class.__name__, uid, oom_score_adj),
+            )
+
+        # the kernel shows the OOM badness score normalised to 1000
+        with open(os.path.join(OOMAnalyserRegression.CORPUS_DIR, "rhel7.txt")) as fh:
+            analyser = OOMAnalyser.OOMAnalyser(OOMAnalyser.OOMEntity(fh.read()))
+        self.assertTrue(analyser.analyse(), "OOM analysis failed")
+        details = analyser.oom_result.details
+        self.assertTrue(analyser.oom_result.oom_victim_expected)
+        self.assertEqual(details["killed_proc_oom_badness_rank"], 1)
+        self.assertEqual(details["expected_victim_pid"], details["killed_proc_pid"])
+        self.assertAlmostEqual(
+            details["killed_proc_oom_badness"] * 1000 // details["ram_pages"],
+            details["killed_proc_score"],
+            delta=details["killed_proc_score"] // 100,
+        )
+
+        # a process with a higher oom_score_adj should have been killed
+        text = OOMAnalyser.OOMDisplay.example_tumbleweed_noswap.replace(
+            "           200 dbus-daemon", "          1000 dbus-daemon"
+        )
+        analyser = OOMAnalyser.OOMAnalyser(OOMAnalyser.OOMEntity(text))
+        self.assertTrue(analyser.analyse(), "OOM analysis failed")
+        details = analyser.oom_result.details
+        self.assertFalse(analyser.oom_result.oom_victim_expected)
+        self.assertEqual(details["killed_proc_pid"], 1978)
+        self.assertEqual(details["killed_proc_oom_badness"], 896191)
+        self.assertEqual(details["killed_proc_oom_badness_rank"], 2)
+        self.assertEqual(details["expected_victim_pid"], 1237)
+        self.assertEqual(details["expected_victim_name"], "dbus-daemon")
+        self.assertEqual(details["_oom_badness_ranking"][:3], [1237, 1978, 1214])
+        self.assertEqual(details["_pstable"][1237]["notes"], "expected OOM victim")
+        self.assertEqual(len(details["_oom_badness_ranking"]), 10)
+
+    def test_024_slab_unreclaimable(self):
+        """Test extracting the unreclaimable slab caches"""
+        lines = [
+            "[ 1400.080345] Unreclaimable slab info:",
+            "[ 1400.080345] Name                      Used          Total",
+        ]
+        for i in range(2000):
+            lines.append(
+                "[ 1400.080345] kmalloc-{:<9} {:10d}KB {:10d}KB".format(i, i, i + 1)
+            )
+        lines.append("[ 1400.080345] kmalloc-rcl-4k-very-long-name 10KB 300000KB")
+        text = OOMAnalyser.OOMDisplay.example_tumbleweed_noswap.replace(
+            "[ 1400.080346] Tasks state",
+            "\n".join(lines) + "\n[ 1400.080346] Tasks state",
+        )
+        analyser = OOMAnalyser.OOMAnalyser(OOMAnalyser.OOMEntity(text))
+        self.assertTrue(analyser.analyse(), "OOM analysis failed")
+        slab = analyser.oom_result.slab_unreclaimable
+        self.assertEqual(len(slab["name"]), 2001)
+        self.assertEqual(slab["name"][0], "kmalloc-0")
+        self.assertEqual(slab["used_kb"][1999], 1999)
+        self.assertEqual(slab["total_kb"][1999], 2000)
+
+        details = analyser.oom_result.details
+        self.assertEqual(details["slab_unreclaimable_caches"], 2001)
+        self.assertEqual(
+            details["slab_unreclaimable_caches_used_kb"], 1999 * 2000 // 2 + 10
+        )
+        self.assertEqual(
+            details["slab_unreclaimable_caches_total_kb"], 2000 * 2001 // 2 + 300000
+        )
+        self.assertEqual(
+            details["slab_unreclaimable_ram_percent"],
+            int(
+                100
+                * details["slab_unreclaimable_caches_total_kb"]
+                / details["system_total_ram_kb"]
+            ),
+        )
+        self.assertEqual(
+            details["_slab_unreclaimable_ranking"],
+            [2000] + list(range(1999, 1990, -1)),
+        )
+
+        # the section is optional
+        oom = OOMAnalyser.OOMEntity(OOMAnalyser.OOMDisplay.example_tumbleweed_noswap)
+        analyser = OOMAnalyser.OOMAnalyser(oom)
+        self.assertTrue(analyser.analyse(), "OOM analysis failed")
+        self.assertEqual(analyser.oom_result.slab_unreclaimable["name"], [])
+        self.assertNotIn("slab_unreclaimable_caches", analyser.oom_result.details)
+
+    def test_025_hugepages(self):
+        """Test extracting the huge page pools"""
+        oom = OOMAnalyser.OOMEntity(OOMAnalyser.OOMDisplay.example_tumbleweed_noswap)
+        analyser = OOMAnalyser.OOMAnalyser(oom)
+        self.assertTrue(analyser.analyse(), "OOM analysis failed")
+        self.assertEqual(len(analyser.oom_result.hugepages), 2)
+        self.assertEqual(analyser.oom_result.details["hugepages_total_kb"], 0)
+        used_kb = analyser.oom_result.details["system_total_ram_used_kb"]
+
+        text = OOMAnalyser.OOMDisplay.example_tumbleweed_noswap.replace(
+            "hugepages_total=0 hugepages_free=0 hugepages_surp=0 hugepages_size=2048kB",
+            "hugepages_total=512 hugepages_free=100 hugepages_surp=2 "
+            "hugepages_size=2048kB",
+        )
+        analyser = OOMAnalyser.OOMAnalyser(OOMAnalyser.OOMEntity(text))
+        self.assertTrue(analyser.analyse(), "OOM analysis failed")
+        self.assertEqual(
+            analyser.oom_result.hugepages[1],
+            {"node": 0, "size_kb": 2048, "total": 512, "free": 100, "surp": 2},
+        )
+        details = analyser.oom_result.details
+        self.assertEqual(details["hugepages_total_kb"], 512 * 2048)
+        self.assertEqual(details["hugepages_free_kb"], 100 * 2048)
+        self.assertEqual(details["hugepages_used_kb"], 412 * 2048)
+        self.assertEqual(details["system_total_ram_used_kb"], used_kb + 512 * 2048)
+        self.assertEqual(details["accounted_hugepages_kb"], 512 * 2048)
+
+    def test_026_memory_accounting(self):
+        """Test the breakdown of the physical memory"""
+        for text, swap_cache_kb, unaccounted_kb in [
+            (OOMAnalyser.OOMDisplay.example_tumbleweed_noswap, 0, 43672),
+            (OOMAnalyser.OOMDisplay.example_tumbleweed_swap, 1160964, 42560),
+        ]:
+            analyser = OOMAnalyser.OOMAnalyser(OOMAnalyser.OOMEntity(text))
+            self.assertTrue(analyser.analyse(), "OOM analysis failed")
+            details = analyser.oom_result.details
+            self.assertEqual(details["accounted_swap_cache_kb"], swap_cache_kb)
+            self.assertEqual(details["unaccounted_kb"], unaccounted_kb)
+            self.assertEqual(details["unaccounted_percent"], 0)
+            total_kb = details["unaccounted_kb"]
+            for bucket in OOMAnalyser.MEMORY_ACCOUNTING_BUCKETS:
+                total_kb += details["accounted_{}_kb".format(bucket)]
+            self.assertEqual(total_kb, details["system_total_ram_kb"])
+
+        page_size_kb = details["page_size_kb"]
+        self.assertEqual(
+            details["accounted_free_kb"],
+            (details["free_pages"] + details["free_pcp_pages"]) * page_size_kb,
+        )
+        self.assertEqual(
+            details["accounted_reserved_kb"], details["reserved_pages"] * page_size_kb
+        )
+
+    def test_027_memcg(self):
+        """Test analysing memory cgroup OOMs"""
+        header = OOMAnalyser.OOMDisplay.example_tumbleweed_noswap.split(
+            "[ 1400.080213] Mem-Info:"
+        )[0]
+        text = header + (
+            "[ 1400.080214] memory: usage 262144kB, limit 262144kB, failcnt 1234\n"
+            "[ 1400.080215] swap: usage 0kB, limit 0kB, failcnt 0\n"
+            "[ 1400.080216] Memory cgroup stats for /system.slice/docker-1a2b.scope:\n"
+            "[ 1400.080217] anon 262144000\n"
+            "[ 1400.080218] file 4096\n"
+            "[ 1400.080219] kernel_stack 32768\n"
+            "[ 1400.080220] pgfault 65536\n"
+            "[ 1400.080221] Tasks state (memory values in pages):\n"
+            "[ 1400.080222] [  pid  ]   uid  tgid total_vm      rss pgtables_bytes "
+            "swapents oom_score_adj name\n"
+            "[ 1400.080223] [   1900]     0  1900      803       29    45056        0"
+            "             0 sh\n"
+            "[ 1400.080224] [   1978]  1000  1978    70000    64000   241664        0"
+            "             0 MonsterApp\n"
+            "[ 1400.080225] oom-kill:constraint=CONSTRAINT_MEMCG,nodemask=(null),cpuset=/,"
+            "mems_allowed=0,oom_memcg=/system.slice/docker-1a2b.scope,"
+            "task_memcg=/system.slice/docker-1a2b.scope,task=MonsterApp,pid=1978,uid=1000\n"
+            "[ 1400.080226] Memory cgroup out of memory: Killed process 1978 (MonsterApp) "
+            "total-vm:280000kB, anon-rss:256000kB, file-rss:0kB, shmem-rss:0kB, "
+            "UID:1000 pgtables:236kB oom_score_adj:0\n"
+        )
+        analyser = OOMAnalyser.OOMAnalyser(OOMAnalyser.OOMEntity(text))
+        self.assertTrue(analyser.analyse(), "OOM analysis failed")
+        result = analyser.oom_result
+        self.assertEqual(result.oom_constraint, OOMAnalyser.OOMConstraintType.memcg)
+        details = result.details
+        self.assertEqual(details["memcg_name"], "/system.slice/docker-1a2b.scope")
+        self.assertEqual(details["memcg_usage_kb"], 262144)
+        self.assertEqual(details["memcg_limit_kb"], 262144)
+        self.assertEqual(details["memcg_failcnt"], 1234)
+        self.assertEqual(details["memcg_swap_limit_kb"], 0)
+        self.assertEqual(analyser._get_memcg_limit(), (262144, 262144))
+        self.assertEqual(details["memcg_usage_percent"], 100)
+        self.assertEqual(details["killed_proc_pid"], 1978)
+        self.assertEqual(details["killed_proc_rss_percent"], 97)
+        self.assertEqual(
+            result.memcg_stats,
+            {"anon": 262144000, "file": 4096, "kernel_stack": 32768, "pgfault": 65536},
+        )
+        self.assertEqual(details["expected_victim_pid"], 1978)
+        self.assertEqual(len(details["_pstable"]), 2)
+        self.assertNotIn("system_total_ram_kb", details)
+        self.assertEqual(
+            result.mem_alloc_failure, OOMAnalyser.OOMMemoryAllocFailureType.not_started
+        )
+        compact = OOMAnalyserCLI.CompactResult(True, result)
+        self.assertEqual(compact.oom_constraint, result.oom_constraint)
+        self.assertEqual(compact.memcg_stats(), result.memcg_stats)
+
+        # cgroup v2 adds the swap limit to the memory limit
+        analyser = OOMAnalyser.OOMAnalyser(
+            OOMAnalyser.OOMEntity(
+                text.replace(
+                    "swap: usage 0kB, limit 0kB", "swap: usage 65536kB, limit 131072kB"
+                )
+            )
+        )
+        self.assertTrue(analyser.analyse(), "OOM analysis failed")
+        details = analyser.oom_result.details
+        self.assertEqual(analyser._get_memcg_limit(), (393216, 327680))
+        self.assertEqual(details["memcg_usage_percent"], 83)
+        self.assertEqual(details["killed_proc_rss_percent"], 65)
+
+        text = (
+            "[  100.000001] stress invoked oom-killer: gfp_mask=0xd0, order=0, "
+            "oom_score_adj=0\n"
+            "[  100.000002] stress cpuset=docker-1a2b.scope mems_allowed=0\n"
+            "[  100.000003] CPU: 1 PID: 4242 Comm: stress Not tainted "
+            "3.10.0-1160.el7.x86_64 #1\n"
+            "[  100.000004] Call Trace:\n"
+            "[  100.000005]  [<ffffffff81781f9a>] dump_stack+0x19/0x1b\n"
+            "[  100.000006] Task in /system.slice/docker-1a2b.scope killed as a result "
+            "of limit of /system.slice\n"
+            "[  100.000007] memory: usage 524288kB, limit 524288kB, failcnt 17\n"
+            "[  100.000008] memory+swap: usage 524288kB, limit 9007199254740988kB, "
+            "failcnt 0\n"
+            "[  100.000009] kmem: usage 0kB, limit 9007199254740988kB, failcnt 0\n"
+            "[  100.000010] Memory cgroup stats for /system.slice: cache:0KB "
+            "rss:4KB swap:0KB\n"
+            "[  100.000011] Memory cgroup stats for /system.slice/docker-1a2b.scope: "
+            "cache:8KB rss:524280KB swap:0KB\n"
+            "[  100.000012] [ pid ]   uid  tgid total_vm      rss nr_ptes swapents "
+            "oom_score_adj name\n"
+            "[  100.000013] [ 4242]     0  4242   140000   131070     270        0"
+            "             0 stress\n"
+            "[  100.000014] Memory cgroup out of memory: Kill process 4242 (stress) "
+            "score 999 or sacrifice child\n"
+            "[  100.000015] Killed process 4242 (stress) total-vm:560000kB, "
+            "anon-rss:524280kB, file-rss:0kB, shmem-rss:0kB\n"
+        )
+        analyser = OOMAnalyser.OOMAnalyser(OOMAnalyser.OOMEntity(text))
+        self.assertTrue(analyser.analyse(), "OOM analysis failed")
+        result = analyser.oom_result
+        self.assertEqual(result.oom_constraint, OOMAnalyser.OOMConstraintType.memcg)
+        details = result.details
+        self.assertEqual(details["memcg_name"], "/system.slice")
+        self.assertEqual(details["memcg_task"], "/system.slice/docker-1a2b.scope")
+        self.assertEqual(details["memcg_failcnt"], 17)
+        self.assertEqual(details["memcg_swap_counter"], "memory+swap")
+        self.assertEqual(details["memcg_swap_limit_kb"], "unlimited")
+        self.assertEqual(details["memcg_kmem_usage_kb"], 0)
+        self.assertEqual(details["memcg_kmem_limit_kb"], "unlimited")
+        self.assertEqual(analyser._get_memcg_limit(), (524288, 524288))
+        self.assertEqual(details["memcg_usage_percent"], 100)
+        self.assertEqual(details["killed_proc_rss_percent"], 99)
+        self.assertEqual(details["killed_proc_score"], 999)
+        self.assertEqual(result.memcg_stats, {"cache": 0, "rss": 4 * 1024, "swap": 0})
+
+        # the memory+swap limit of cgroup v1 includes the memory limit
+        analyser = OOMAnalyser.OOMAnalyser(
+            OOMAnalyser.OOMEntity(
+                text.replace(
+                    "memory+swap: usage 524288kB, limit 9007199254740988kB",
+                    "memory+swap: usage 786432kB, limit 1048576kB",
+                )
+            )
+        )
+        self.assertTrue(analyser.analyse(), "OOM analysis failed")
+        details = analyser.oom_result.details
+        self.assertEqual(analyser._get_memcg_limit(), (1048576, 786432))
+        self.assertEqual(details["memcg_usage_percent"], 75)
+        self.assertEqual(details["killed_proc_rss_percent"], 49)
+        self.assertEqual(analyser._calc_oom_badness_adj_factor(), 1048576 // 4 // 1000)
+
+        # the memory+swap limit is the effective limit w/o memory limit
+        text = text.replace(
+            "memory: usage 524288kB, limit 524288kB",
+            "memory: usage 524288kB, limit 9007199254740988kB",
+        ).replace(
+            "memory+swap: usage 524288kB, limit 9007199254740988kB",
+            "memory+swap: usage 8589934592kB, limit 8589934592kB",
+        )
+        analyser = OOMAnalyser.OOMAnalyser(OOMAnalyser.OOMEntity(text))
+        self.assertTrue(analyser.analyse(), "OOM analysis failed")
+        details = analyser.oom_result.details
+        self.assertEqual(details["memcg_limit_kb"], "unlimited")
+        self.assertEqual(details["memcg_swap_limit_kb"], 8589934592)
+        self.assertEqual(analyser._get_memcg_limit(), (8589934592, 8589934592))
+        self.assertEqual(details["memcg_usage_percent"], 100)
+        self.assertEqual(details["killed_proc_rss_percent"], 0)
+        self.assertEqual(
+            analyser._calc_oom_badness_adj_factor(), 8589934592 // 4 // 1000
+        )
+
+        # global OOMs
+        for text in [
+            OOMAnalyser.OOMDisplay.example_tumbleweed_noswap,
+            OOMAnalyser.OOMDisplay.example_tumbleweed_swap,
+        ]:
+            analyser = OOMAnalyser.OOMAnalyser(OOMAnalyser.OOMEntity(text))
+            self.assertTrue(analyser.analyse(), "OOM analysis failed")
+            self.assertEqual(
+                analyser.oom_result.oom_constraint, OOMAnalyser.OOMConstraintType.none
+            )
+            self.assertNotIn("memcg_limit_kb", analyser.oom_result.details)
+
+
+class TestCLI(TestBase):
+    def get_log(self):
+        """
+        Return a log with both Tumbleweed examples surrounded by unrelated lines
+
+        @rtype: str
+        """
+        return "\n".join(
+            [
+                "unrelated line before the first OOM",
+                OOMAnalyser.OOMDisplay.example_tumbleweed_swap,
+                "unrelated line between both OOMs",
+                OOMAnalyser.OOMDisplay.example_tumbleweed_noswap,
+                "unrelated line after the last OOM",
+            ]
+        )
+
+    def test_001_scan_multiple_blocks(self):
+        """Test splitting a log into single OOM blocks"""
+        scanner = OOMAnalyserCLI.OOMBlockScanner()
+        blocks = list(scanner.scan(self.get_log().split("\n")))
+        self.assertEqual(len(blocks), 2, "Unexpected number of OOM blocks")
+        for block, example in zip(
+            blocks,
+            [
+                OOMAnalyser.OOMDisplay.example_tumbleweed_swap,
+                OOMAnalyser.OOMDisplay.example_tumbleweed_noswap,
+            ],
+        ):
+            self.assertEqual(block, example.strip())
+
+    def test_002_compressed_input(self):
+        """Test reading gzip, bzip2 and xz compressed logs"""
+        log = self.get_log().encode("utf-8")
+        expected = list(
+            OOMAnalyserCLI.analyse_stream(
+                OOMAnalyserCLI.open_log(io.BytesIO(log)), "plain"
+            )
+        )
+        self.assertEqual(len(expected), 2, "Unexpected number of OOM blocks")
+        self.assertTrue(expected[0]["success"], "OOM analysis failed")
+
+        for name, compress in [
+            ("gzip", gzip.compress),
+            ("bz2", bz2.compress),
+            ("xz", lzma.compress),
+        ]:
+            fileobj = io.BufferedReader(io.BytesIO(compress(log)))
+            detected, unused = OOMAnalyserCLI.detect_compression(fileobj)
+            self.assertEqual(detected, name, "Wrong compression format detected")
+            results = list(
+                OOMAnalyserCLI.analyse_stream(OOMAnalyserCLI.open_log(fileobj), "plain")
+            )
+            self.assertEqual(
+                results, expected, "Results differ for %s compressed input" % name
+            )
+
+    def add_to_tar(self, archive, name, content):
+        """Add a new member with the given content to a tar archive"""
+        info = tarfile.TarInfo(name)
+        info.size = len(content)
+        archive.addfile(info, io.BytesIO(content))
+
+    def test_003_supportconfig_archive(self):
+        """Test reading OOMs from a compressed supportconfig archive"""
+        log = self.get_log().encode("utf-8")
+        buffer = io.BytesIO()
+        with tarfile.open(fileobj=buffer, mode="w:xz") as archive:
+            self.add_to_tar(archive, "scc_myhost_231001_1200/messages.txt", log)
+            self.add_to_tar(archive, "scc_myhost_231001_1200/rpm.txt", log)
+            self.add_to_tar(
+                archive, "scc_myhost_231001_1200/boot.txt", gzip.compress(log)
+            )
+            # system information after the log files
+            self.add_to_tar(
+                archive,
+                "scc_myhost_231001_1200/basic-environment.txt",
+                b"# /bin/uname -a\n"
+                b"Linux myhost 6.0.3-1-default #1 SMP PREEMPT_DYNAMIC x86_64 GNU/Linux\n",
+            )
+        buffer.seek(0)
+
+        results = list(OOMAnalyserCLI.analyse_file(buffer, "scc.txz"))
+        self.assertEqual(len(results), 4, "Unexpected number of OOM blocks")
+        self.assertEqual(
+            [res["member"] for res in results],
+            ["scc_myhost_231001_1200/messages.txt"] * 2
+            + ["scc_myhost_231001_1200/boot.txt"] * 2,
+            "OOMs read from unexpected archive members",
+        )
+        for res in results:
+            self.assertTrue(res["success"], "OOM analysis failed")
+            self.assertEqual(res["hostname"], "myhost")
+            self.assertEqual(res["archive_kernel_version"], "6.0.3-1-default")
+
+    def get_journal_entries(self):
+        """
+        Return the kernel messages of get_log() as journal entries
+
+        The leading timestamps are removed and the continuation lines of the
+        "Mem-Info:" block are merged into a single multi-line message like
+        the kernel does.
+
+        @rtype: List(dict)
+        """
+        entries = []
+        for line in self.get_log().split("\n"):
+            if line.startswith("[ "):
+                message = line.split("] ", 1)[1]
+            elif line.startswith("  ") and entries:
+                entries[-1]["MESSAGE"] += "\n " + line.strip()
+                continue
+            else:
+                message = line
+            entries.append(
+                {
+                    "MESSAGE": message,
+                    "_TRANSPORT": "kernel",
+                    "_HOSTNAME": "myhost",
+                    "__REALTIME_TIMESTAMP": str(1696154400000000 + len(entries)),
+                }
+            )
+        # a message from a different transport between both OOMs
+        entries.insert(
+            1,
+            {
+                "MESSAGE": "Killed process 1 (systemd)",
+                "_TRANSPORT": "syslog",
+                "_HOSTNAME": "myhost",
+                "__REALTIME_TIMESTAMP": "1696154400000001",
+            },
+        )
+        return entries
+
+    def check_journal_results(self, results):
+        """Check the results of the journal based tests against plain text input"""
+        expected = list(
+            OOMAnalyserCLI.analyse_stream(
+                OOMAnalyserCLI.open_log(io.BytesIO(self.get_log().encode("utf-8"))),
+                "plain",
+            )
+        )
+        self.assertEqual(len(results), 2, "Unexpected number of OOM blocks")
+        self.assertEqual(
+            [res["timestamp"] for res in results],
+            ["2023-10-01T10:00:00.000001+00:00", "2023-10-01T10:00:00.000099+00:00"],
+            "Wrong timestamp of the first OOM line",
+        )
+        for res, exp in zip(results, expected):
+            self.assertTrue(res["success"], "OOM analysis failed")
+            self.assertEqual(res["hostname"], "myhost")
+            self.assertEqual(res["details"], exp["details"])
+
+    def test_004_journal_json(self):
+        """Test reading OOMs from the output of "journalctl -o json\" """
+        lines = []
+        for entry in self.get_journal_entries():
+            # non-printable characters are serialised as array of bytes
+            if "\n" in entry["MESSAGE"]:
+                entry["MESSAGE"] = list(entry["MESSAGE"].encode("utf-8"))
+            lines.append(json.dumps(entry))
+        fileobj = io.BytesIO("\n".join(lines).encode("utf-8"))
+
+        results = list(OOMAnalyserCLI.analyse_file(fileobj, "journal.json"))
+        self.check_journal_results(results)
+
+    def test_005_journal_export(self):
+        """Test reading OOMs from the output of "journalctl -o export\" """
+        export = b""
+        for entry in self.get_journal_entries():
+            export += "__CURSOR=s=0;i={}\n".format(len(export)).encode("ascii")
+            for name, value in sorted(entry.items()):
+                value = value.encode("utf-8")
+                if b"\n" in value:
+                    # binary serialisation of fields with line breaks
+                    export += name.encode("ascii") + b"\n"
+                    export += struct.pack("<Q", len(value)) + value + b"\n"
+                else:
+                    export += name.encode("ascii") + b"=" + value + b"\n"
+            export += b"\n"
+        fileobj = io.BytesIO(gzip.compress(export))
+
+        results = list(OOMAnalyserCLI.analyse_file(fileobj, "journal.export.gz"))
+        self.check_journal_results(results)
+
+    def test_006_kmsg(self):
+        """Test reading OOMs from /dev/kmsg records and detecting dropped records"""
+        records = []
+        seq = 100
+        for entry in self.get_journal_entries():
+            seq += 1
+            # drop a record inside the second OOM block
+            if seq == 250:
+                continue
+            # messages from user space have a facility != 0
+            prio = 6 if entry["_TRANSPORT"] == "kernel" else (3 << 3) + 6
+            message = entry["MESSAGE"].replace("\n", "\\x0a")
+            records.append("{},{},{},-;{}".format(prio, seq, seq * 1000, message))
+            records.append(" SUBSYSTEM=memory")
+        fileobj = io.BytesIO("\n".join(records).encode("utf-8"))
+
+        results = list(OOMAnalyserCLI.analyse_file(fileobj, "kmsg"))
+        self.assertEqual(len(results), 2, "Unexpected number of OOM blocks")
+        self.assertEqual([res["kmsg_seq"] for res in results], [103, 201])
+        self.assertEqual([res["uptime"] for res in results], [0.103, 0.201])
+        self.assertEqual([res["dropped_records"] for res in results], [0, 1])
+        self.assertIn(
+            "WARNING: 1 kernel message(s) dropped inside this OOM block, the "
+            "results may be incomplete",
+            results[1]["messages"],
+        )
+        for res in results:
+            self.assertTrue(res["success"], "OOM analysis failed")
+
+        # user space records between kernel records aren't dropped
+        tagged_lines = list(
+            OOMAnalyserCLI.read_kmsg(["6,100,1,-;a", "14,101,2,-;user", "6,102,3,-;b"])
+        )
+        self.assertEqual(tagged_lines, [("a", (100, 1, 0)), ("b", (102, 3, 1))])
+        self.assertEqual(
+            OOMAnalyserCLI.count_dropped_records([tag for line, tag in tagged_lines]),
+            0,
+        )
+        self.assertEqual(
+            OOMAnalyserCLI.count_dropped_records([(100, 1, 0), (103, 3, 1)]), 1
+        )
+
+        # user space records inside both OOM blocks
+        records = []
+        seq = 100
+        for entry in self.get_journal_entries():
+            seq += 1
+            prio = 6 if entry["_TRANSPORT"] == "kernel" else (3 << 3) + 6
+            message = entry["MESSAGE"].replace("\n", "\\x0a")
+            records.append("{},{},{},-;{}".format(prio, seq, seq * 1000, message))
+            seq += 1
+            records.append(
+                "{},{},{},-;systemd-journald[1]: message".format(
+                    (3 << 3) + 6, seq, seq * 1000
+                )
+            )
+        fileobj = io.BytesIO("\n".join(records).encode("utf-8"))
+        results = list(OOMAnalyserCLI.analyse_file(fileobj, "kmsg"))
+        self.assertEqual(len(results), 2, "Unexpected number of OOM blocks")
+        self.assertEqual([res["dropped_records"] for res in results], [0, 0])
+        for res in results:
+            self.assertTrue(res["success"], "OOM analysis failed")
+
+    def test_007_dmesg_raw(self):
+        """Test reading OOMs from the output of "dmesg -r\" """
+        lines = []
+        for entry in self.get_journal_entries():
+            for line in entry["MESSAGE"].split("\n"):
+                lines.append("<6>[ 5907.{:06d}] {}".format(len(lines), line))
+        fileobj = io.BytesIO("\n".join(lines).encode("utf-8"))
+
+        results = list(OOMAnalyserCLI.analyse_file(fileobj, "dmesg"))
+        self.assertEqual(len(results), 2, "Unexpected number of OOM blocks")
+        self.assertEqual(results[0]["uptime"], 5907.000002)
+        for res in results:
+            self.assertTrue(res["success"], "OOM analysis failed")
+            self.assertIsNone(res["kmsg_seq"])
+            self.assertEqual(res["dropped_records"], 0)
+
+    def test_008_profile(self):
+        """Test adding the time and allocated memory of all stages to the results"""
+        original_memory_usage = OOMAnalyser.profile_memory_usage
+        OOMAnalyser.profile_memory_usage = lambda: 4096
+        OOMAnalyserCLI.profiling = True
+        try:
+            results = list(
+                OOMAnalyserCLI.analyse_stream(self.get_log().split("\n"), "plain")
+            )
+        finally:
+            OOMAnalyserCLI.profiling = False
+            OOMAnalyser.profile_memory_usage = original_memory_usage
+        for res in results:
+            self.assertTrue(res["success"], "OOM analysis failed")
+            self.assertEqual(res["profile"][0]["stage"], "analyse")
+            self.assertEqual(res["profile"][0]["allocated_kb"], 0)
+
+    def test_009_compact_result(self):
+        """Test the memory efficient copy of an analysis result"""
+        OOMAnalyser.add_to_notifybox = OOMAnalyserCLI.collect_notification
+        kconfig = OOMAnalyserBench.kernel_configs("KernelConfig_6_1")[0]
+        texts = [
+            OOMAnalyser.OOMDisplay.example_tumbleweed_swap,
+            OOMAnalyserBench.SyntheticOOM(kconfig, 50, 2).text(),
+        ]
+        for text in texts:
+            success, result, messages = OOMAnalyserCLI.analyse_block(text)
+            compact = OOMAnalyserCLI.CompactResult(success, result)
+            self.assertFalse(hasattr(compact, "__dict__"))
+            self.assertEqual(
+                compact.details(),
+                OOMAnalyserCLI.result_to_dict(success, result, messages)["details"],
+            )
+            self.assertEqual(compact.kernel_config, result.kconfig.name)
+            self.assertEqual(compact.max_order, result.max_order)
+            zones = compact.zones()
+            self.assertIn(("Normal", 0), zones)
+            for zone, node in zones:
+                self.assertEqual(
+                    compact.free_chunks(zone, node),
+                    [chunks[node] for chunks in result.buddyinfo[zone]],
+                )
+                self.assertEqual(
+                    compact.watermarks(zone, node), result.watermarks[zone][node]
+                )
+            self.assertEqual(compact.call_trace_frames(), result.call_trace_frames)
+
+        # the second analysis of the same OOM shares keys and interned strings
+        first = OOMAnalyserCLI.CompactResult(*OOMAnalyserCLI.analyse_block(text)[:2])
+        self.assertIs(first._int_keys, compact._int_keys)
+        self.assertIs(first.details()["dist"], compact.details()["dist"])
+
+    def test_010_call_trace_trie(self):
+        """Test the frames of the call trace and the prefix tree of the allocation paths"""
+        OOMAnalyser.add_to_notifybox = OOMAnalyserCLI.collect_notification
+        text = OOMAnalyser.OOMDisplay.example_tumbleweed_noswap.replace(
+            "[ 1400.080168]  __folio_alloc+0x17/0x50",
+            "[ 1400.080168]  [<ffffffffc0a1b2c3>] zram_alloc+0x1a/0x40 [zram]",
+        )
+        success, result, messages = OOMAnalyserCLI.analyse_block(text)
+        self.assertTrue(success, "OOM analysis failed")
+        frames = result.call_trace_frames
+        self.assertEqual(len(frames), 13)
+        self.assertEqual(frames[0], ("dump_stack_lvl", 0x44, None))
+        self.assertEqual(frames[6], ("zram_alloc", 0x1A, "zram"))
+        self.assertNotIn("policy_node", [frame[0] for frame in frames])
+        self.assertIn("policy_node+0x51/0x70", result.details["call_trace"])
+        path = OOMAnalyserCLI.allocation_path(frames)
+        self.assertEqual(
+            path[:3], ["__alloc_pages_slowpath", "__alloc_pages", "zram_alloc"]
+        )
+        self.assertEqual(path[len(path) - 1], "asm_exc_page_fault")
+
+        trie = OOMAnalyserCLI.CallTraceTrie()
+        trie.add(path, "6.0.3-1-default")
+        example = OOMAnalyser.OOMDisplay.example_tumbleweed_swap
+        result = OOMAnalyserCLI.analyse_block(example)[1]
+        other = OOMAnalyserCLI.allocation_path(result.call_trace_frames)
+        trie.add(other, "6.0.3-1-default", 2)
+        trie.add(other, "5.14.21-150400.24.46-default")
+        trie.add(["__alloc_pages_slowpath", "kmalloc"], "4.12.14-122.37-default")
+        # groups don't share nodes, paths of a group share the common prefix
+        self.assertEqual(len(trie), 3 + len(path) + len(other) - 2 + len(other) + 2)
+        self.assertEqual(trie.groups()[0], "4.12.14-122.37-default")
+        self.assertEqual(trie.count(["__alloc_pages_slowpath"]), 5)
+        self.assertEqual(trie.count(["__alloc_pages_slowpath"], "6.*"), 3)
+        self.assertEqual(trie.count(["__alloc_pages", "kmalloc"]), 0)
+        self.assertEqual(trie.top_paths(1), [(3, other)])
+        self.assertEqual(trie.top_paths(5, "6.*"), [(2, other), (1, path)])
+        self.assertEqual(
+            trie.top_paths(5, depth=2),
+            [
+                (4, ["__alloc_pages_slowpath", "__alloc_pages"]),
+                (1, ["__alloc_pages_slowpath", "kmalloc"]),
+            ],
+        )
+        self.assertIs(trie._symbols[0], sys.intern("__alloc_pages_slowpath"))
+
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr), contextlib.redirect_stdout(
+            io.StringIO()
+        ):
+            with tempfile.NamedTemporaryFile("w", suffix=".log") as fh:
+                fh.write(self.get_log())
+                fh.flush()
+                OOMAnalyserCLI.main(["--top-paths", "1", "--path-depth", "3", fh.name])
+        self.assertEqual(
+            stderr.getvalue(),
+            "       2 __alloc_pages_slowpath <- __alloc_pages <- __folio_alloc\n",
+        )
+
+
+class TestBench(TestBase):
+    def test_001_synthetic_oom_all_configs(self):
+        """Test analysing synthetic OOMs for all kernel configurations"""
+        OOMAnalyser.add_to_notifybox = OOMAnalyserCLI.collect_notification
+        for kconfig in OOMAnalyserBench.kernel_configs():
+            for prefix in sorted(OOMAnalyserBench.LOG_PREFIXES):
+                text = OOMAnalyserBench.SyntheticOOM(kconfig, 20, 2, prefix).text()
+                success, result, messages = OOMAnalyserCLI.analyse_block(text)
+                name = "%s / %s" % (type(kconfig).__name__, prefix)
+                self.assertTrue(success, "OOM analysis failed for %s" % name)
+                self.assertIs(
+                    type(result.kconfig),
+                    type(kconfig),
+                    "Wrong kernel configuration chosen for %s" % name,
+                )
+                self.assertEqual(len(result.details["_pstable"]), 20)
+                self.assertEqual(
+                    [msg for level, msg in messages if level.endswith("ERROR")], []
+                )
+
+    def test_002_run_scenario(self):
+        """Test measuring all stages of a scenario"""
+        OOMAnalyser.add_to_notifybox = OOMAnalyserCLI.collect_notification
+        kconfig = OOMAnalyserBench.kernel_configs("KernelConfig_6_1")[0]
+        scenario = OOMAnalyserBench.run_scenario(kconfig, 100, 1, "dmesg", 2)
+        self.assertTrue(scenario["success"])
+        self.assertEqual(scenario["chosen_config"], "KernelConfig_6_1")
+        for stage in [
+            "OOMEntity",
+            "analyse",
+            "total",
+            "_extract_pstable",
+            "_check_for_memory_fragmentation",
+        ]:
+            self.assertIn(stage, scenario["median_ms"])
+        self.assertGreater(scenario["compact_result_bytes"], 0)
+        self.assertLess(scenario["compact_result_bytes"], scenario["result_bytes"])
+
+    def test_003_regression_corpus(self):
+        """Test analysing the regression corpus and comparing with a baseline"""
+        OOMAnalyser.add_to_notifybox = OOMAnalyserCLI.collect_notification
+        corpus = OOMAnalyserRegression.load_corpus(
+            OOMAnalyserRegression.CORPUS_DIR, False
+        )
+        names = [name for name, text in corpus]
+        for name in [
+            "file:memcg_v1",
+            "file:memcg_v2",
+            "file:rhel7",
+            "file:tumbleweed",
+            "file:ubuntu2110",
+            "example:tumbleweed_swap",
+        ]:
+            self.assertIn(name, names)
+
+        current = OOMAnalyserRegression.measure(corpus, 1)
+        self.assertEqual(current["failed"], [])
+        self.assertEqual(sorted(current["entries"]), sorted(names))
+        self.assertEqual(OOMAnalyserRegression.compare(current, current), [])
+
+        baseline = json.loads(json.dumps(current))
+        baseline["peak_rss_kb"] = current["peak_rss_kb"] // 2
+        for values in baseline["entries"].values():
+            values["p50_ms"] /= 2
+            values["p99_ms"] /= 2
+        self.assertEqual(
+            OOMAnalyserRegression.compare(current, baseline, 1.5),
+            [],
+            "Slowdown within the tolerance reported as regression",
+        )
+        regressions = OOMAnalyserRegression.compare(current, baseline, 0.5)
+        self.assertEqual(len(regressions), 2 * len(names) + 1)
+        self.assertIn(
+            "file:rhel7: p50_ms", regressions[2 * sorted(names).index("file:rhel7")]
+        )
+
+        current["failed"] = ["file:rhel7"]
+        self.assertIn(
+            "file:rhel7: analysis failed",
+            OOMAnalyserRegression.compare(current, current),
+        )
+
+    def test_004_parity_diff(self):
+        """Test comparing Python and JavaScript results"""
+        self.assertEqual(
+            OOMAnalyserParity.normalise({"a": (1, 2.0), 3: {"b": 1.5}}),
+            {"a": [1, 2], "3": {"b": 1.5}},
+        )
+        OOMAnalyser.add_to_notifybox = OOMAnalyserCLI.collect_notification
+        corpus = [("example", OOMAnalyser.OOMDisplay.example_tumbleweed_swap)]
+        py_results, durations = OOMAnalyserParity.run_python(corpus)
+        self.assertTrue(py_results[0]["success"])
+        self.assertEqual(len(durations), 1)
+
+        js_result = json.loads(json.dumps(py_results[0]))
+        self.assertEqual(OOMAnalyserParity.diff(py_results[0], js_result), [])
+
+        js_result["details"]["trigger_proc_pid"] = str(
+            js_result["details"]["trigger_proc_pid"]
+        )
+        del js_result["details"]["killed_proc_pid"]
+        js_result["details"]["_pstable_index"].pop()
+        self.assertEqual(
+            OOMAnalyserParity.diff(py_results[0], js_result),
+            [
+                "details._pstable_index: Python {!r} != JS {!r}".format(
+                    py_results[0]["details"]["_pstable_index"],
+                    js_result["details"]["_pstable_index"],
+                ),
+                "details.killed_proc_pid: missing in JS",
+                "details.trigger_proc_pid: Python {0!r} != JS '{0}'".format(
+                    py_results[0]["details"]["trigger_proc_pid"]
+                ),
+            ],
+        )
+
+    @unittest.skipUnless(
+        os.path.exists(OOMAnalyserParity.BUNDLE_FILE) and shutil.which("node"),
+        "JavaScript bundle or Node.js not available",
+    )
+    def test_005_parity_js(self):
+        """Test that Python and JavaScript return the same results"""
+        corpus = OOMAnalyserRegression.load_corpus(
+            OOMAnalyserRegression.CORPUS_DIR, False
+        )
+        py_results, py_durations = OOMAnalyserParity.run_python(corpus)
+        js_results, js_durations = OOMAnalyserParity.run_js(corpus)
+        for (name, text), py_result, js_result in zip(corpus, py_results, js_results):
+            self.assertEqual(
+                OOMAnalyserParity.diff(py_result, js_result),
+                [],
+                "Python and JavaScript results differ for %s" % name,
+            )
+
+    @unittest.skipUnless(
+        os.path.exists(OOMAnalyserParity.TARGET_FILE) and shutil.which("node"),
+        "Transcrypt output or Node.js not available",
+    )
+    def test_006_target_examples(self):
+        """Test analysing the examples with the modules generated by Transcrypt"""
+        corpus = [
+            (name, text)
+            for name, text in OOMAnalyserRegression.load_corpus(
+                OOMAnalyserRegression.CORPUS_DIR, False
+            )
+            if name.startswith("example:")
+        ]
+        self.assertTrue(corpus, "No examples found")
+        py_results, unused = OOMAnalyserParity.run_python(corpus)
+        js_results, unused = OOMAnalyserParity.run_js(
+            corpus, OOMAnalyserParity.TARGET_FILE
+        )
+        for (name, text), py_result, js_result in zip(corpus, py_results, js_results):
+            self.assertTrue(js_result["success"], "JS analysis of %s failed" % name)
+            self.assertEqual(
+                OOMAnalyserParity.diff(py_result, js_result),
+                [],
+                "Python and JavaScript results differ for %s" % name,
+            )
+
+
+class TestWhatIf(TestBase):
+    def get_simulator(self, text=None):
+        """Return a simulator for the Tumbleweed example w/o swap"""
+        if text is None:
+            text = OOMAnalyser.OOMDisplay.example_tumbleweed_noswap
+        analyser = OOMAnalyser.OOMAnalyser(OOMAnalyser.OOMEntity(text))
+        self.assertTrue(analyser.analyse(), "OOM analysis failed")
+        return OOMAnalyserWhatIf.WatermarkSimulator(analyser.oom_result)
+
+    def test_001_simulate(self):
+        """Test simulating the allocation with changed parameters"""
+        simulator = self.get_simulator()
+        self.assertEqual(simulator.zones, [("DMA", 0), ("DMA32", 0), ("Normal", 0)])
+        self.assertEqual(simulator.observed["order"], 0)
+        self.assertFalse(simulator.observed["gfp_high"])
+
+        # the observed state failed
+        self.assertEqual(simulator.simulate().satisfied, [False])
+
+        # Normal: free 50572kB, low 63552kB
+        self.assertEqual(
+            simulator.simulate(extra_ram_kb=[12980, 12981]).satisfied, [False, True]
+        )
+        self.assertEqual(simulator.simulate(gfp_high=[True]).satisfied, [True])
+        self.assertEqual(
+            simulator.simulate(min_free_kbytes=[None, 1024]).satisfied, [False, True]
+        )
+        self.assertEqual(
+            simulator.simulate(
+                extra_ram_kb=[16384], watermark_scale_factor=[None, 1000]
+            ).satisfied,
+            [True, False],
+        )
+        # the added RAM contains free chunks of a high order
+        self.assertEqual(
+            simulator.simulate(extra_ram_kb=[0, 1048576], order=[3]).satisfied,
+            [False, True],
+        )
+
+        simulation = simulator.simulate(
+            extra_ram_kb=range(0, 65537, 4096),
+            min_free_kbytes=[None, 16384],
+            order=[0, 1, 2, 3],
+            gfp_high=[False, True],
+        )
+        self.assertEqual(len(simulation), 17 * 2 * 4 * 2)
+        scenarios = list(simulation.scenarios())
+        self.assertEqual(len(scenarios), len(simulation))
+        self.assertEqual(
+            scenarios[0],
+            {
+                "extra_ram_kb": 0,
+                "min_free_kbytes": None,
+                "watermark_scale_factor": None,
+                "order": 0,
+                "gfp_high": False,
+                "satisfied": False,
+            },
+        )
+        self.assertTrue(scenarios[-1]["satisfied"])
+
+    @unittest.skipUnless(OOMAnalyser.numpy, "NumPy not available")
+    def test_002_simulate_numpy(self):
+        """Test that NumPy and pure Python simulate the same results"""
+        kconfig = OOMAnalyserBench.kernel_configs("KernelConfig_6_1")[0]
+        for text in [
+            OOMAnalyser.OOMDisplay.example_tumbleweed_swap,
+            OOMAnalyserBench.SyntheticOOM(kconfig, 20, 3).text(),
+        ]:
+            simulator = self.get_simulator(text)
+            grid = (
+                range(0, 262145, 16384),
+                [None, 16384, 67584],
+                [None, 10, 100],
+                [0, 1, 3, 9],
+                [False, True],
+            )
+            expected = simulator.simulate(*grid).satisfied
+            original_numpy = OOMAnalyser.numpy
+            OOMAnalyser.numpy = None
+            try:
+                self.assertEqual(simulator.simulate(*grid).satisfied, expected)
+            finally:
+                OOMAnalyser.numpy = original_numpy
+
+    def test_003_main(self):
+        """Test the command line interface of the simulation"""
+        with tempfile.NamedTemporaryFile("w", suffix=".txt") as fh:
+            fh.write(OOMAnalyser.OOMDisplay.example_tumbleweed_noswap)
+            fh.flush()
+            stdout = io.StringIO()
+            with contextlib.redirect_stdout(stdout):
+                rc = OOMAnalyserWhatIf.main(
+                    [fh.name, "--extra-ram", "0:65536:16384", "--gfp-high", "no"]
+                )
+        self.assertEqual(rc, 0)
+        results = json.loads(stdout.getvalue())
+        self.assertEqual(
+            [scenario["satisfied"] for scenario in results["scenarios"]],
+            [False, True, True, True, True],
+        )
+        self.assertEqual(results["satisfied"], 4)
+
+    def test_004_allowed_nodes(self):
+        """Test simulating a node-local OOM with the allowed nodes only"""
+        self.assertEqual(OOMAnalyserWhatIf.parse_nodelist("0-2,4"), {0, 1, 2, 4})
+        self.assertEqual(OOMAnalyserWhatIf.parse_nodelist("1"), {1})
+        self.assertIsNone(OOMAnalyserWhatIf.parse_nodelist("(null)"))
+        self.assertIsNone(OOMAnalyserWhatIf.parse_nodelist("<not found>"))
+
+        for kconfig in OOMAnalyserBench.kernel_configs(
+            "KernelConfig_6_1"
+        ) + OOMAnalyserBench.kernel_configs("KernelConfig_3_10"):
+            text = OOMAnalyserBench.SyntheticOOM(kconfig, 20, 3).text()
+            analyser = OOMAnalyser.OOMAnalyser(OOMAnalyser.OOMEntity(text))
+            self.assertTrue(analyser.analyse(), "OOM analysis failed")
+            self.assertEqual(
+                analyser.oom_result.mem_alloc_failure,
+                OOMAnalyser.OOMMemoryAllocFailureType.failed_below_low_watermark,
+            )
+            simulator = OOMAnalyserWhatIf.WatermarkSimulator(analyser.oom_result)
+            self.assertEqual(simulator.nodes, [0])
+            self.assertEqual(simulator.zones, [("DMA", 0), ("DMA32", 0), ("Normal", 0)])
+            # the observed state failed although the other nodes have enough free memory
+            self.assertEqual(simulator.simulate().satisfied, [False])
+            self.assertEqual(
+                simulator.simulate(extra_ram_kb=[0, 1048576]).satisfied, [False, True]
+            )
+
+            # all nodes are checked w/o nodemask and mems_allowed
+            del analyser.oom_result.details["trigger_proc_mems_allowed"]
+            simulator = OOMAnalyserWhatIf.WatermarkSimulator(analyser.oom_result)
+            self.assertIsNone(simulator.nodes)
+            self.assertEqual(len(simulator.zones), 5)
+            self.assertEqual(simulator.simulate().satisfied, [True])
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)